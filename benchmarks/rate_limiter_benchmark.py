@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Benchmark
+
+Parks 10,000 concurrent waiters on a 100 requests/second limit and compares
+the GCRA RateLimiter against the previous sliding-window implementation:
+- Time to admit/park all waiters
+- Achieved admission rate and FIFO order
+- Scheduling lateness (actual vs. ideal admission time)
+- CPU time burned while waiting (thundering-herd cost)
+- Event-loop lag observed by a heartbeat task
+
+Draining 10k waiters at 100 rps takes 100s, so each limiter is observed for
+``--duration`` seconds and the remaining waiters are then cancelled.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Suppress noisy logging BEFORE any imports
+os.environ["CHUK_LOG_LEVEL"] = "ERROR"
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+logging.basicConfig(level=logging.CRITICAL)
+logging.getLogger("chuk_tool_processor").setLevel(logging.CRITICAL)
+
+from chuk_tool_processor.execution.wrappers.rate_limiting import RateLimiter  # noqa: E402
+
+
+class SlidingWindowLimiter:
+    """The previous list-based sliding-window limiter, kept for comparison."""
+
+    def __init__(self, limit: int, period: float) -> None:
+        self.limit = limit
+        self.period = period
+        self._ts: list[float] = []
+        self._lock = asyncio.Lock()
+
+    async def wait(self, _tool: str) -> None:
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                cutoff = now - self.period
+                self._ts = [t for t in self._ts if t > cutoff]
+                if len(self._ts) < self.limit:
+                    self._ts.append(now)
+                    return
+                wait = (self._ts[0] + self.period) - now
+            await asyncio.sleep(wait)
+
+
+async def _heartbeat(stop: asyncio.Event, lags: list[float], interval: float = 0.01) -> None:
+    """Measure how late the event loop runs a 10ms periodic task."""
+    while not stop.is_set():
+        expected = time.monotonic() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.monotonic() - expected))
+
+
+async def run_scenario(name: str, limiter: Any, waiters: int, rate: int, duration: float) -> dict[str, Any]:
+    """Park ``waiters`` callers on ``limiter`` and observe it for ``duration`` seconds."""
+    print(f"\n  Testing {name}...")
+
+    admitted: list[tuple[int, float]] = []
+
+    async def caller(i: int) -> None:
+        await limiter.wait("bench")
+        admitted.append((i, time.monotonic()))
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    heartbeat = asyncio.create_task(_heartbeat(stop, lags))
+
+    cpu_start = time.process_time()
+    start = time.monotonic()
+    tasks = [asyncio.create_task(caller(i)) for i in range(waiters)]
+    await asyncio.sleep(0)
+    park_time = time.monotonic() - start
+
+    await asyncio.sleep(duration)
+    stop.set()
+    cpu_time = time.process_time() - cpu_start
+    elapsed = time.monotonic() - start
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await heartbeat
+
+    # Admissions after the initial burst should be spaced 1/rate apart
+    first = admitted[0][1] if admitted else start
+    steady = [t for _, t in admitted[rate:]]
+    lateness = [max(0.0, t - (first + (k + 1) / rate)) for k, t in enumerate(steady)]
+    order = [i for i, _ in admitted]
+    fifo = order == sorted(order)
+
+    result = {
+        "admitted": len(admitted),
+        "rate": max(0, len(admitted) - rate) / elapsed,
+        "park_ms": park_time * 1000,
+        "cpu_s": cpu_time,
+        "lateness_ms": statistics.median(lateness) * 1000 if lateness else 0.0,
+        "max_lag_ms": max(lags) * 1000 if lags else 0.0,
+        "fifo": fifo,
+    }
+
+    print(f"    Admitted:         {result['admitted']:,} of {waiters:,}")
+    print(f"    Steady rate:      {result['rate']:.1f} req/s (target {rate})")
+    print(f"    Park {waiters:,}:      {result['park_ms']:.1f}ms")
+    print(f"    CPU while busy:   {result['cpu_s']:.2f}s over {elapsed:.1f}s")
+    print(f"    Median lateness:  {result['lateness_ms']:.2f}ms")
+    print(f"    Max loop lag:     {result['max_lag_ms']:.1f}ms")
+    print(f"    FIFO order:       {'yes' if fifo else 'no'}")
+    return result
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--waiters", type=int, default=10_000)
+    parser.add_argument("--rate", type=int, default=100, help="Requests per second")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds to observe each limiter")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only run the GCRA limiter")
+    args = parser.parse_args()
+
+    print("\n" + "=" * 80)
+    print(f"RATE LIMITER BENCHMARK ({args.waiters:,} waiters, {args.rate} req/s)")
+    print("=" * 80)
+
+    gcra = await run_scenario(
+        "GCRA RateLimiter",
+        # An explicit burst selects GCRA; same initial burst as the sliding-window limiter
+        RateLimiter(global_limit=args.rate, global_period=1.0, global_burst=args.rate),
+        args.waiters,
+        args.rate,
+        args.duration,
+    )
+
+    if args.skip_legacy:
+        return
+
+    legacy = await run_scenario(
+        "Sliding-window (previous)",
+        SlidingWindowLimiter(args.rate, 1.0),
+        args.waiters,
+        args.rate,
+        args.duration,
+    )
+
+    print("\n  📊 Comparison:")
+    print(f"    CPU:        GCRA {gcra['cpu_s']:.2f}s vs sliding-window {legacy['cpu_s']:.2f}s")
+    print(f"    Loop lag:   GCRA {gcra['max_lag_ms']:.1f}ms vs sliding-window {legacy['max_lag_ms']:.1f}ms")
+    print(f"    FIFO:       GCRA {gcra['fifo']} vs sliding-window {legacy['fifo']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Scheduler A/B Benchmark
+
+Plans the same random DAGs of tool calls with both SchedulerPolicy
+implementations and compares them, on two workloads: a mixed DAG over four
+pools, and a long sequential chain sharing a pool with many short calls:
+
+- greedy: ``GreedyDagScheduler`` - ready calls ordered by (priority, est_ms),
+  packed into stages up to the pool limits
+- critical path: ``CriticalPathScheduler`` - calls ranked by upward rank
+  (longest est_ms path to a sink) and list-scheduled onto pool slots
+
+Each plan is then replayed in a discrete-event simulation of how
+``PlanExecutor`` runs it (calls released in stage order as soon as their
+dependencies finish, pool slots granted in plan order, durations = est_ms), so the
+two orderings are compared on the same executor. Also reports the
+stage-by-stage time of the greedy plan and the critical-path scheduler's own
+predicted makespan and slot utilization.
+
+With ``--execute`` the smallest long-chain DAG is also run through ``PlanExecutor``
+with sleeping fake tools (1 est_ms = 0.1 ms of wall time).
+"""
+
+import argparse
+import asyncio
+import heapq
+import logging
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+# Suppress noisy logging BEFORE any imports
+os.environ["CHUK_LOG_LEVEL"] = "ERROR"
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+logging.basicConfig(level=logging.CRITICAL)
+
+from chuk_tool_processor.models.tool_call import ToolCall  # noqa: E402
+from chuk_tool_processor.models.tool_result import ToolResult  # noqa: E402
+from chuk_tool_processor.scheduling import (  # noqa: E402
+    CriticalPathScheduler,
+    ExecutionPlan,
+    GreedyDagScheduler,
+    PlanExecutor,
+    SchedulingConstraints,
+    ToolCallSpec,
+    ToolMetadata,
+)
+
+POOLS = ["web", "db", "llm", "default"]
+POOL_LIMITS = {"web": 4, "db": 2, "llm": 2, "default": 8}
+
+
+def make_mixed(n: int, seed: int = 0) -> list[ToolCallSpec]:
+    """Random DAG over four pools: some chained slow calls, many short ones."""
+    rng = random.Random(seed)
+    calls = []
+    for i in range(n):
+        if i and rng.random() < 0.3:
+            # Extend a chain: depend on one of the last few calls
+            deps = (f"c{rng.randrange(max(0, i - 5), i)}",)
+            est = rng.choice([200, 400, 800])
+        else:
+            deps = tuple({f"c{rng.randrange(i)}" for _ in range(rng.randint(0, 2))}) if i else ()
+            est = rng.choice([20, 50, 100])
+        calls.append(spec(f"c{i}", est, deps, rng.choice(POOLS)))
+    return calls
+
+
+def make_long_chain(n: int, seed: int = 0) -> list[ToolCallSpec]:
+    """One sequential chain (1/6 of the calls) sharing the web pool with short independent fetches."""
+    rng = random.Random(seed)
+    chain_length = max(2, n // 6)
+    calls = [
+        spec(f"chain{i}", rng.randint(80, 120), (f"chain{i - 1}",) if i else (), "web") for i in range(chain_length)
+    ]
+    calls += [spec(f"fetch{i}", rng.randint(30, 70), (), "web") for i in range(n - chain_length)]
+    rng.shuffle(calls)
+    return calls
+
+
+def spec(call_id: str, est: int, deps: tuple[str, ...], pool: str) -> ToolCallSpec:
+    return ToolCallSpec(
+        call_id=call_id,
+        tool_name="work",
+        args={"ms": est},
+        depends_on=deps,
+        metadata=ToolMetadata(pool=pool, est_ms=est, priority=1),
+    )
+
+
+WORKLOADS = {"mixed": make_mixed, "long chain": make_long_chain}
+
+
+def simulate(plan: ExecutionPlan, calls: list[ToolCallSpec], pool_limits: dict[str, int]) -> int:
+    """Makespan of running ``plan`` the way PlanExecutor does, with est_ms durations."""
+    call_map = {c.call_id: c for c in calls}
+    order = [cid for stage in plan.stages for cid in stage]
+    position = {cid: i for i, cid in enumerate(order)}
+    waiting = {cid: sum(dep in position for dep in set(call_map[cid].depends_on)) for cid in order}
+    dependents = defaultdict(list)
+    for cid in order:
+        for dep in set(call_map[cid].depends_on):
+            dependents[dep].append(cid)
+
+    free = {pool: max(1, limit) for pool, limit in pool_limits.items()}
+    queued: dict[str, list[tuple[int, str]]] = defaultdict(list)
+    running: list[tuple[int, int, str]] = []
+    now = 0
+
+    def start(cid: str) -> None:
+        heapq.heappush(running, (now + call_map[cid].metadata.est_ms, position[cid], cid))
+
+    def release(cid: str) -> None:
+        pool = call_map[cid].metadata.pool
+        if pool not in free:
+            start(cid)
+        elif free[pool]:
+            free[pool] -= 1
+            start(cid)
+        else:
+            heapq.heappush(queued[pool], (position[cid], cid))
+
+    for cid in order:
+        if waiting[cid] == 0:
+            release(cid)
+    while running:
+        now, _, cid = heapq.heappop(running)
+        pool = call_map[cid].metadata.pool
+        if pool in free:
+            if queued[pool]:
+                start(heapq.heappop(queued[pool])[1])
+            else:
+                free[pool] += 1
+        for dependent in dependents[cid]:
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0:
+                release(dependent)
+    return now
+
+
+async def execute(plan: ExecutionPlan, calls: list[ToolCallSpec], constraints: SchedulingConstraints) -> float:
+    async def run_call(call: ToolCall, _timeout: float | None) -> ToolResult:
+        await asyncio.sleep(call.arguments["ms"] / 10_000)
+        return ToolResult(tool=call.tool, result=None)
+
+    start = time.perf_counter()
+    async for _ in PlanExecutor(run_call).run(plan, calls, constraints):
+        pass
+    return (time.perf_counter() - start) * 10_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 1_000, 5_000])
+    parser.add_argument("--seeds", type=int, default=5, help="random DAGs per size")
+    parser.add_argument("--execute", action="store_true", help="also run the smallest DAG through PlanExecutor")
+    args = parser.parse_args()
+
+    constraints = SchedulingConstraints(pool_limits=POOL_LIMITS)
+    schedulers = {"greedy": GreedyDagScheduler(), "critical path": CriticalPathScheduler()}
+
+    print("\n" + "=" * 80)
+    print(f"SCHEDULER A/B BENCHMARK (pool limits {POOL_LIMITS})")
+    print("=" * 80)
+
+    for workload, make_calls in WORKLOADS.items():
+        print(f"\nWorkload: {workload}")
+        print(
+            f"{'calls':>6}  {'greedy stages':>13}  {'greedy run':>10}  {'crit. run':>10}  {'predicted':>10}"
+            f"  {'gain':>6}  {'plan ms (g/c)':>14}  slot utilization"
+        )
+        for n in args.sizes:
+            totals: dict[str, float] = defaultdict(float)
+            plan_time: dict[str, float] = defaultdict(float)
+            utilization: dict[str, float] = defaultdict(float)
+            for seed in range(args.seeds):
+                calls = make_calls(n, seed)
+                plans = {}
+                for name, scheduler in schedulers.items():
+                    t0 = time.perf_counter()
+                    plans[name] = scheduler.plan(calls, constraints)
+                    plan_time[name] += time.perf_counter() - t0
+                    totals[name] += simulate(plans[name], calls, POOL_LIMITS)
+                totals["stages"] += plans["greedy"].estimated_total_ms or 0
+                totals["predicted"] += plans["critical path"].estimated_total_ms or 0
+                for pool, value in plans["critical path"].slot_utilization.items():
+                    utilization[pool] += value / args.seeds
+
+            avg = {key: value / args.seeds for key, value in totals.items()}
+            gain = 1 - avg["critical path"] / avg["greedy"]
+            util = " ".join(f"{pool}={value:.0%}" for pool, value in sorted(utilization.items()))
+            plan_ms = (
+                f"{plan_time['greedy'] / args.seeds * 1000:.1f}/{plan_time['critical path'] / args.seeds * 1000:.1f}"
+            )
+            print(
+                f"{n:>6}  {avg['stages']:>11.0f}ms  {avg['greedy']:>8.0f}ms  {avg['critical path']:>8.0f}ms"
+                f"  {avg['predicted']:>8.0f}ms  {gain:>6.1%}  {plan_ms:>14}  {util}"
+            )
+
+    if args.execute:
+        n = min(args.sizes)
+        calls = make_long_chain(n)
+        print(f"\nPlanExecutor wall time, long chain workload with {n} calls (scaled back to est_ms units):")
+        for name, scheduler in schedulers.items():
+            plan = scheduler.plan(calls, constraints)
+            elapsed = asyncio.run(execute(plan, calls, constraints))
+            print(f"  {name:<14} {elapsed:>8.0f}ms  (simulated {simulate(plan, calls, POOL_LIMITS)}ms)")
+
+
+if __name__ == "__main__":
+    main()
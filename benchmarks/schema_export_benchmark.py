@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Schema Export Benchmark
+
+Registers a few hundred ValidatedTool classes (500 by default) and compares
+two ways of producing the tool list sent to the model every turn:
+
+- rebuild: the previous ``openai_functions()`` path - ``to_openai()`` per
+  tool, i.e. one ``model_json_schema()`` call each, then ``json.dumps``
+- cached: ``tool_schemas_json()``, which serializes each tool once per
+  registry generation and hands back the same JSON array bytes afterwards
+
+Also times ``openai_functions()`` (decoded from the cached bytes) and the
+first export after a registration bumps the generation.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+# Suppress noisy logging BEFORE any imports
+os.environ["CHUK_LOG_LEVEL"] = "ERROR"
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+logging.basicConfig(level=logging.CRITICAL)
+
+from pydantic import BaseModel, Field  # noqa: E402
+
+from chuk_tool_processor.models.validated_tool import ValidatedTool  # noqa: E402
+from chuk_tool_processor.registry.provider import ToolRegistryProvider  # noqa: E402
+from chuk_tool_processor.registry.providers.memory import InMemoryToolRegistry  # noqa: E402
+from chuk_tool_processor.registry.tool_export import (  # noqa: E402
+    clear_schema_cache,
+    openai_functions,
+    tool_schemas_json,
+)
+from chuk_tool_processor.utils import fast_json  # noqa: E402
+
+
+def make_tool(i: int) -> type[ValidatedTool]:
+    """A tool class with a nested, documented argument model."""
+
+    class Filter(BaseModel):
+        field: str = Field(..., description="Field to filter on")
+        value: str | int = Field(..., description="Value to compare with")
+        negate: bool = False
+
+    class QueryDatasetTool(ValidatedTool):
+        class Arguments(ValidatedTool.Arguments):
+            query: str = Field(..., description=f"Search query for dataset {i}")
+            limit: int = Field(10, ge=1, le=100, description="Maximum number of rows")
+            filters: list[Filter] = Field(default_factory=list, description="Row filters")
+            fields: list[str] | None = Field(None, description="Columns to return")
+
+        class Result(BaseModel):
+            rows: list[dict[str, str]]
+
+        async def _execute(self, **_kwargs):
+            return self.Result(rows=[])
+
+    QueryDatasetTool.__name__ = f"QueryDataset{i}Tool"
+    QueryDatasetTool.__doc__ = f"Query rows of dataset {i}."
+    return QueryDatasetTool
+
+
+def rebuild_tool_list(tools: list[tuple[str, type[ValidatedTool]]]) -> bytes:
+    """The previous per-turn path: regenerate every JSON Schema and serialize the list."""
+    specs = []
+    for name, tool in tools:
+        spec = tool.to_openai()
+        spec["function"]["name"] = name
+        specs.append(spec)
+    return fast_json.dumps(specs).encode("utf-8")
+
+
+async def best_of(fn, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tools", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    registry = InMemoryToolRegistry()
+    tools = [(f"query_dataset_{i}", make_tool(i)) for i in range(args.tools)]
+    for name, tool in tools:
+        await registry.register_tool(tool, name=name)
+    await ToolRegistryProvider.set_registry(registry)
+
+    print("\n" + "=" * 80)
+    print(f"SCHEMA EXPORT BENCHMARK ({args.tools} tools, fast_json orjson={fast_json.HAS_ORJSON})")
+    print("=" * 80)
+
+    async def rebuild() -> None:
+        rebuild_tool_list(tools)
+
+    async def first_export() -> None:
+        await clear_schema_cache()
+        await tool_schemas_json()
+
+    async def cached() -> None:
+        await tool_schemas_json()
+
+    async def decoded() -> None:
+        await openai_functions()
+
+    rebuilt = await best_of(rebuild, max(1, args.rounds // 4))
+    first = await best_of(first_export, max(1, args.rounds // 4))
+    await tool_schemas_json()
+    hit = await best_of(cached, args.rounds * 10)
+    functions = await best_of(decoded, args.rounds)
+    payload = await tool_schemas_json()
+
+    print(f"\nTool list payload: {len(payload) / 1024:.0f} KiB")
+    print(f"  rebuild every turn (to_openai + dumps)   {rebuilt * 1000:>9.2f} ms")
+    print(f"  first export after a registry change    {first * 1000:>9.2f} ms")
+    print(f"  cached tool_schemas_json()              {hit * 1000:>9.3f} ms  ({rebuilt / hit:,.0f}x)")
+    print(f"  openai_functions() (decode cached)      {functions * 1000:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+SSE Pipelining and Batching Benchmark
+
+Runs the in-process fake MCP-over-SSE server from the test suite and
+measures call throughput of SSETransport with and without JSON-RPC
+batching. Requests are always pipelined (many in flight on one session);
+batching additionally coalesces the requests issued within ``window_ms``
+into one POST, which matters when each POST has a fixed cost
+(``--post-ms``, e.g. a proxy or TLS round trip).
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+# Suppress noisy logging BEFORE any imports
+os.environ["CHUK_LOG_LEVEL"] = "ERROR"
+
+# Add src to path for imports
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+logging.basicConfig(level=logging.CRITICAL)
+logging.getLogger("chuk_tool_processor").setLevel(logging.CRITICAL)
+
+from chuk_tool_processor.mcp.transport import BatchConfig, SSETransport  # noqa: E402
+
+# The fake server lives with the tests; load it by path so the tests
+# directory does not need to be a package on sys.path
+_spec = importlib.util.spec_from_file_location("fake_sse_server", ROOT / "tests/mcp/transport/fake_sse_server.py")
+assert _spec is not None and _spec.loader is not None
+fake_sse_server = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fake_sse_server)
+
+
+async def run_scenario(name: str, batching: BatchConfig | None, args: argparse.Namespace) -> float:
+    """Issue ``--calls`` echo calls with ``--concurrency`` in flight; return calls/second."""
+    async with fake_sse_server.FakeSSEServer(
+        protocol_version="2025-03-26", response_delay=args.post_ms / 1000.0
+    ) as server:
+        transport = SSETransport(server.url, enable_metrics=True, batching=batching)
+        if not await transport.initialize():
+            print(f"  {name}: failed to start")
+            return 0.0
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        errors = 0
+
+        async def one(i: int) -> None:
+            nonlocal errors
+            async with semaphore:
+                result = await transport.call_tool("echo", {"i": i})
+                if result.get("isError"):
+                    errors += 1
+
+        try:
+            await one(-1)  # warm-up
+            posts_before = server.stats["posts"]
+            start = time.perf_counter()
+            await asyncio.gather(*(one(i) for i in range(args.calls)))
+            elapsed = time.perf_counter() - start
+            posts = server.stats["posts"] - posts_before
+        finally:
+            await transport.close()
+
+    rate = args.calls / elapsed
+    print(f"  {name:<28} {rate:>9.1f} calls/s   ({elapsed:.2f}s, {posts} POSTs, {errors} errors)")
+    return rate
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--post-ms", type=float, default=0.0, help="Server-side delay per POST")
+    args = parser.parse_args()
+
+    print("\n" + "=" * 80)
+    print(f"SSE BATCHING BENCHMARK ({args.calls} calls, {args.concurrency} in flight, {args.post_ms}ms per POST)")
+    print("=" * 80)
+
+    baseline = await run_scenario("pipelined", None, args)
+    for window_ms in (1.0, 5.0):
+        rate = await run_scenario(f"batched (window {window_ms:g}ms)", BatchConfig(window_ms=window_ms), args)
+        if baseline:
+            print(f"  {'':<28} speed-up {rate / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+SSE Stream Parsing Benchmark
+
+Feeds multi-MB streamed tool results through an ``httpx.Response`` in
+network-sized chunks and compares two ways of turning them into JSON-RPC
+responses:
+
+- lines: the previous SSETransport loop - ``aiter_lines()``, strip and split
+  every line, log the event type, stdlib ``json.loads`` on ``str``
+- bytes: ``aiter_bytes()`` into :class:`SSEParser`, then ``fast_json.loads``
+  on the event bytes (orjson when installed)
+
+Each scenario reports MB/s over the whole stream, including httpx decoding.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+# Suppress noisy logging BEFORE any imports
+os.environ["CHUK_LOG_LEVEL"] = "ERROR"
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+logging.basicConfig(level=logging.CRITICAL)
+logger = logging.getLogger("sse_parser_benchmark")
+
+import httpx  # noqa: E402
+
+from chuk_tool_processor.mcp.transport.sse_parser import SSEParser  # noqa: E402
+from chuk_tool_processor.utils import fast_json  # noqa: E402
+
+
+def build_stream(result_mb: float, messages: int) -> bytes:
+    """``messages`` SSE events, each a tool result of about ``result_mb`` MB on one data line."""
+    rows = [{"id": i, "name": f"row-{i}", "value": i * 0.5, "tags": ["a", "b", "c"]} for i in range(20000)]
+    text = json.dumps(rows)
+    text = (text * (int(result_mb * 1024 * 1024 / len(text)) + 1))[: int(result_mb * 1024 * 1024)]
+    events = []
+    for i in range(messages):
+        payload = {"jsonrpc": "2.0", "id": str(i), "result": {"content": [{"type": "text", "text": text}]}}
+        events.append(b"event: message\ndata: " + json.dumps(payload).encode() + b"\n\n")
+    return b"".join(events)
+
+
+async def chunked(body: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    for i in range(0, len(body), chunk_size):
+        yield body[i : i + chunk_size]
+
+
+async def parse_lines(response: httpx.Response) -> int:
+    """The previous line-based loop."""
+    parsed = 0
+    current_event = None
+    async for line in response.aiter_lines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("event:"):
+            current_event = line.split(":", 1)[1].strip()
+            logger.debug("SSE event type: %s", current_event)
+            continue
+        if line.startswith("data:"):
+            data_part = line.split(":", 1)[1].strip()
+            json.loads(data_part)
+            parsed += 1
+    return parsed
+
+
+async def parse_bytes(response: httpx.Response) -> int:
+    """The incremental byte parser."""
+    parsed = 0
+    parser = SSEParser()
+    async for chunk in response.aiter_bytes():
+        for event in parser.feed(chunk):
+            fast_json.loads(event.data)
+            parsed += 1
+    return parsed
+
+
+async def run(name: str, parse, body: bytes, chunk_size: int, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        response = httpx.Response(200, content=chunked(body, chunk_size))
+        start = time.perf_counter()
+        await parse(response)
+        best = min(best, time.perf_counter() - start)
+    rate = len(body) / 1024 / 1024 / best
+    print(f"  {name:<8} {rate:>9.1f} MB/s   ({best * 1000:.1f} ms)")
+    return rate
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=4)
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    print("\n" + "=" * 80)
+    print(
+        f"SSE PARSER BENCHMARK ({args.messages} results per stream, {args.chunk_kb}KB chunks, orjson={fast_json.HAS_ORJSON})"
+    )
+    print("=" * 80)
+
+    for result_mb in (1, 4, 16):
+        body = build_stream(result_mb, args.messages)
+        print(f"\n{result_mb}MB results ({len(body) / 1024 / 1024:.1f}MB stream):")
+        baseline = await run("lines", parse_lines, body, args.chunk_kb * 1024, args.rounds)
+        rate = await run("bytes", parse_bytes, body, args.chunk_kb * 1024, args.rounds)
+        print(f"  speed-up {rate / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
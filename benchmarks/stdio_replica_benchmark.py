@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+STDIO Replica Pool Benchmark
+
+Starts a local CPU-bound MCP echo server over stdio and measures call
+throughput for a single StdioTransport versus StdioPoolTransport with
+1..N replicas. Each call burns ``--work-ms`` of CPU in the server process,
+so a single process is limited to one core and the pool should scale
+near-linearly until replicas exceed the available cores. ``--io-ms`` adds
+per-call blocking time instead, which shows the dispatch scaling on
+machines with few cores.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+from typing import Any
+
+# Suppress noisy logging BEFORE any imports
+os.environ["CHUK_LOG_LEVEL"] = "ERROR"
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+logging.basicConfig(level=logging.CRITICAL)
+logging.getLogger("chuk_tool_processor").setLevel(logging.CRITICAL)
+logging.getLogger("chuk_mcp").setLevel(logging.CRITICAL)
+
+from chuk_tool_processor.mcp.transport import StdioPoolTransport, StdioTransport  # noqa: E402
+
+# Minimal newline-delimited JSON-RPC MCP server with one CPU-bound "echo" tool
+ECHO_SERVER = textwrap.dedent(
+    """
+    import json
+    import sys
+    import time
+
+    WORK_S = float(sys.argv[1]) / 1000.0
+    IO_S = float(sys.argv[2]) / 1000.0
+
+    def reply(msg_id, result):
+        sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": msg_id, "result": result}) + "\\n")
+        sys.stdout.flush()
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        msg = json.loads(line)
+        method, msg_id = msg.get("method"), msg.get("id")
+        if msg_id is None:
+            continue
+        if method == "initialize":
+            reply(msg_id, {
+                "protocolVersion": msg["params"]["protocolVersion"],
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "echo", "version": "1.0"},
+            })
+        elif method == "ping":
+            reply(msg_id, {})
+        elif method == "tools/list":
+            reply(msg_id, {"tools": [{"name": "echo", "inputSchema": {"type": "object"}}]})
+        elif method == "tools/call":
+            deadline = time.process_time() + WORK_S
+            while time.process_time() < deadline:
+                pass
+            time.sleep(IO_S)
+            text = json.dumps(msg["params"].get("arguments", {}))
+            reply(msg_id, {"content": [{"type": "text", "text": text}]})
+        else:
+            sys.stdout.write(json.dumps({
+                "jsonrpc": "2.0", "id": msg_id, "error": {"code": -32601, "message": "not found"},
+            }) + "\\n")
+            sys.stdout.flush()
+    """
+)
+
+
+async def run_scenario(name: str, transport: Any, calls: int, concurrency: int) -> float:
+    """Issue ``calls`` echo calls with ``concurrency`` in flight; return calls/second."""
+    if not await transport.initialize():
+        print(f"  {name}: failed to start")
+        return 0.0
+
+    semaphore = asyncio.Semaphore(concurrency)
+    errors = 0
+
+    async def one(i: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            result = await transport.call_tool("echo", {"i": i})
+            if result.get("isError"):
+                errors += 1
+
+    try:
+        await one(-1)  # warm-up
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(calls)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await transport.close()
+
+    rate = calls / elapsed
+    print(f"  {name:<24} {rate:>9.1f} calls/s   ({elapsed:.2f}s, {errors} errors)")
+    return rate
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--work-ms", type=float, default=10.0, help="CPU time each call burns in the server")
+    parser.add_argument("--io-ms", type=float, default=0.0, help="Blocking time each call spends in the server")
+    parser.add_argument("--max-replicas", type=int, default=min(8, os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    print("\n" + "=" * 80)
+    print(
+        f"STDIO REPLICA BENCHMARK ({args.calls} calls, {args.work_ms}ms CPU + {args.io_ms}ms blocking each, "
+        f"{os.cpu_count()} cores)"
+    )
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        server = Path(tmp) / "echo_server.py"
+        server.write_text(ECHO_SERVER)
+        params = {"command": sys.executable, "args": [str(server), str(args.work_ms), str(args.io_ms)]}
+
+        baseline = await run_scenario(
+            "StdioTransport",
+            StdioTransport(params, process_monitor=False),
+            args.calls,
+            concurrency=args.max_replicas * 4,
+        )
+
+        replicas = 1
+        while replicas <= args.max_replicas:
+            rate = await run_scenario(
+                f"StdioPoolTransport x{replicas}",
+                StdioPoolTransport(params, replicas=replicas, process_monitor=False),
+                args.calls,
+                concurrency=args.max_replicas * 4,
+            )
+            if baseline:
+                print(f"  {'':<24} speed-up {rate / baseline:.2f}x (ideal {replicas}x)")
+            replicas *= 2
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Tool Search Benchmark
+
+Builds a synthetic catalogue of tools (10k by default) and compares two ways
+of answering ``ToolSearchEngine.search`` queries:
+
+- scan: the previous per-query loop - tokenize every tool's name,
+  description, namespace and parameters, score it with
+  ``score_token_match`` and detect its domain, for every query
+- index: the postings-list index built once by ``set_tools``, with BM25
+  scoring over the postings of the query terms only
+
+When both miss, the fuzzy fallback is compared too: the scan runs
+``SequenceMatcher`` against every name and description word, the index only
+against the candidates retrieved by character-trigram overlap.
+
+With NumPy installed, also times the optional semantic stage: building the
+hashed TF-IDF matrix, a query, and memory-mapping a saved matrix.
+
+Also times adding and removing one server's worth of tools incrementally
+against rebuilding the index, answering a repeated query from the query
+cache, and ranking a batch of queries with ``search_many``.
+
+Reports index build time and per-query latency for exact-name, prefix,
+natural-language, synonym and typo queries.
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# Suppress noisy logging BEFORE any imports
+os.environ["CHUK_LOG_LEVEL"] = "ERROR"
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+logging.basicConfig(level=logging.CRITICAL)
+
+from chuk_tool_processor.discovery import (  # noqa: E402
+    ToolSearchEngine,
+    compute_domain_penalty,
+    detect_query_domain,
+    detect_tool_domain,
+    expand_with_synonyms,
+    extract_keywords,
+    fuzzy_score,
+    score_token_match,
+    tokenize,
+)
+from chuk_tool_processor.discovery.searchable import get_tool_description, get_tool_parameters  # noqa: E402
+from chuk_tool_processor.discovery.semantic import HAS_NUMPY, SemanticIndex  # noqa: E402
+
+VERBS = ["get", "list", "create", "update", "delete", "search", "fetch", "compute", "convert", "validate", "export"]
+NOUNS = [
+    "file", "user", "order", "invoice", "report", "image", "message", "table", "metric", "event",
+    "ticket", "document", "record", "account", "payment", "schedule", "queue", "cache", "secret", "token",
+]  # fmt: skip
+WORDS = [
+    "data", "value", "remote", "local", "service", "request", "result", "format", "range", "batch",
+    "statistics", "average", "distribution", "network", "storage", "database", "query", "string", "number", "time",
+]  # fmt: skip
+NAMESPACES = ["fs", "crm", "billing", "media", "chat", "db", "monitoring", "support", "docs", "auth"]
+
+QUERIES = {
+    "exact name": "delete_invoice_123",
+    "prefix": "invo",
+    "natural language": "I need to export the monthly report for a billing account",
+    "synonym": "compute the mean of a distribution",
+    "typo (fuzzy)": "delte_invioce",
+}
+
+
+@dataclass
+class SyntheticTool:
+    name: str
+    namespace: str
+    description: str
+    parameters: dict[str, Any]
+
+
+def build_tools(count: int, seed: int = 7) -> list[SyntheticTool]:
+    rng = random.Random(seed)
+    tools = []
+    for i in range(count):
+        verb, noun = rng.choice(VERBS), rng.choice(NOUNS)
+        words = " ".join(rng.sample(WORDS, 6))
+        params = {p: {"type": "string"} for p in rng.sample(["id", "name", "limit", "query", "path", "format"], 2)}
+        tools.append(
+            SyntheticTool(
+                name=f"{verb}_{noun}_{i}",
+                namespace=rng.choice(NAMESPACES),
+                description=f"{verb.capitalize()} a {noun} using {words}",
+                parameters={"type": "object", "properties": params},
+            )
+        )
+    return tools
+
+
+def scan_search(query: str, tools: list[SyntheticTool], limit: int = 10) -> list[tuple[float, str]]:
+    """The previous implementation: two full passes over the tool list per query."""
+    keywords = extract_keywords(query) or tokenize(query)
+    query_domain = detect_query_domain(keywords)
+
+    stage1 = []
+    for tool in tools:
+        name_tokens = set(tokenize(tool.name))
+        score = 0.0
+        for kw in set(keywords):
+            if kw in name_tokens:
+                score += 10
+            elif any(nt.startswith(kw) for nt in name_tokens):
+                score += 5
+        if score > 0:
+            stage1.append((score, tool.name))
+    stage1.sort(reverse=True)
+    if stage1 and stage1[0][0] >= 10:
+        return stage1[:limit]
+
+    query_tokens = expand_with_synonyms(keywords)
+    results = []
+    for tool in tools:
+        description = get_tool_description(tool)
+        params = get_tool_parameters(tool)
+        score, _ = score_token_match(
+            query_tokens, tool.name, description, tool.namespace, list(params["properties"]) if params else None
+        )
+        if query_domain is not None:
+            score *= compute_domain_penalty(query_domain, detect_tool_domain(tool.name, description))
+        if score > 0:
+            results.append((score, tool.name))
+    results.sort(reverse=True)
+    if results:
+        return results[:limit]
+
+    # Fuzzy fallback: compare the query with every name and description word
+    query_lower = query.lower()
+    for tool in tools:
+        name_score = fuzzy_score(query_lower, tool.name.lower(), threshold=0.5)
+        desc_score = max(
+            (fuzzy_score(query_lower, w, threshold=0.6) for w in tool.description.lower().split()), default=0
+        )
+        if name_score or desc_score:
+            results.append((name_score * 10 + desc_score * 3, tool.name))
+    results.sort(reverse=True)
+    return results[:limit]
+
+
+def best_of(fn, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tools", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    tools = build_tools(args.tools)
+
+    print("\n" + "=" * 80)
+    print(f"TOOL SEARCH BENCHMARK ({args.tools:,} synthetic tools)")
+    print("=" * 80)
+
+    engine: ToolSearchEngine[SyntheticTool] = ToolSearchEngine()
+    build = best_of(lambda: engine.set_tools(tools), 1)
+    print(f"\nIndex build: {build * 1000:.1f} ms (once per tool set)")
+
+    # One MCP server's worth of tools coming and going
+    server = [SyntheticTool(f"{t.name}_srv", "server", t.description, t.parameters) for t in build_tools(50, seed=11)]
+    added = best_of(lambda: (engine.add_tools(server), engine.remove_tools(server)), args.rounds)
+    rebuild = best_of(lambda: engine.set_tools(tools + server), 1)
+    print(f"Add + remove 50 tools: {added * 1000:.1f} ms incremental vs {rebuild * 1000:.1f} ms full rebuild\n")
+    engine.set_tools(tools)
+
+    print(f"  {'query':<18} {'scan':>10} {'index':>10} {'speed-up':>10}")
+    uncached: ToolSearchEngine[SyntheticTool] = ToolSearchEngine(query_cache_size=0)
+    uncached.set_tools(tools)
+    for label, query in QUERIES.items():
+        scan = best_of(lambda q=query: scan_search(q, tools), max(1, args.rounds // 2))
+        indexed = best_of(lambda q=query: uncached.search(q, use_session_boost=False), args.rounds)
+        print(f"  {label:<18} {scan * 1000:>8.1f}ms {indexed * 1000:>8.2f}ms {scan / indexed:>9.1f}x")
+
+    cache_benchmark(uncached, engine, args.rounds)
+
+    if HAS_NUMPY:
+        semantic_benchmark(tools, args.rounds)
+    else:
+        print("\nSemantic stage skipped (install numpy)")
+
+
+def cache_benchmark(
+    uncached: ToolSearchEngine[SyntheticTool], engine: ToolSearchEngine[SyntheticTool], rounds: int
+) -> None:
+    """Repeated queries from the LRU cache, and a batch through ``search_many``."""
+    query = QUERIES["natural language"]
+    engine.search(query)
+    miss = best_of(lambda: uncached.search(query), rounds)
+    hit = best_of(lambda: engine.search(query), rounds * 10)
+    print(f"\nRepeated query: {miss * 1000:.2f} ms uncached vs {hit * 1000:.3f} ms from the query cache")
+
+    # An evaluation-style batch: every query several times, with shared terms
+    batch = [f"{verb} {noun} {word}" for verb in VERBS[:5] for noun in NOUNS[:8] for word in WORDS[:5]] * 2
+    looped = best_of(lambda: [uncached.search(q) for q in batch], 1)
+    engine.clear_query_cache()
+    batched = best_of(lambda: (engine.clear_query_cache(), engine.search_many(batch)), 1)
+    print(
+        f"Batch of {len(batch)} queries: {looped * 1000:.0f} ms one by one vs {batched * 1000:.0f} ms with search_many"
+    )
+
+
+def semantic_benchmark(tools: list[SyntheticTool], rounds: int) -> None:
+    """Vectorizing, querying and reloading the hashed TF-IDF matrix."""
+    index: SemanticIndex[SyntheticTool] = SemanticIndex()
+    build = best_of(lambda: index.build(tools), 1)
+    rebuild = best_of(lambda: index.build(tools), 1)
+    query = best_of(lambda: index.search("summarize billing statistics", k=20), rounds * 10)
+    print(f"\nSemantic matrix {index.matrix.shape[0]:,}x{index.matrix.shape[1]} float32:")
+    print(f"  build {build * 1000:.0f} ms, rebuild with unchanged tools {rebuild * 1000:.0f} ms")
+    print(f"  query (mat-vec + argpartition top-20) {query * 1000:.2f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "tools.npy"
+        index.save(path)
+        load = best_of(lambda: SemanticIndex.load(path, tools), rounds)
+        print(f"  memory-map saved matrix (with staleness check) {load * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -171,8 +171,11 @@ from chuk_tool_processor.registry.decorators import register_tool, tool
 
 # Scheduling
 from chuk_tool_processor.scheduling import (
+    CriticalPathScheduler,
     ExecutionPlan,
     GreedyDagScheduler,
+    LatencyModel,
+    PlanExecutor,
     SchedulerPolicy,
     SchedulingConstraints,
     ToolCallSpec,
@@ -226,6 +229,9 @@ __all__ = [
     "ExecutionPlan",
     "SchedulerPolicy",
     "GreedyDagScheduler",
+    "CriticalPathScheduler",
+    "PlanExecutor",
+    "LatencyModel",
     # Registry
     "ToolInfo",
     "initialize",
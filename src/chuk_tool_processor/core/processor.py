@@ -15,6 +15,7 @@ import hashlib
 import inspect
 import json as stdlib_json  # Use stdlib json for consistent hashing
 import time
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
 from chuk_tool_processor.core.context import (
@@ -25,6 +26,10 @@ from chuk_tool_processor.execution.bulkhead import Bulkhead, BulkheadConfig
 from chuk_tool_processor.execution.strategies.inprocess_strategy import (
     InProcessStrategy,
 )
+from chuk_tool_processor.execution.wrappers.adaptive_concurrency import (
+    AdaptiveConcurrencyConfig,
+    AdaptiveConcurrencyExecutor,
+)
 from chuk_tool_processor.execution.wrappers.caching import (
     CachingToolExecutor,
     InMemoryCache,
@@ -33,6 +38,7 @@ from chuk_tool_processor.execution.wrappers.circuit_breaker import (
     CircuitBreakerConfig,
     CircuitBreakerExecutor,
 )
+from chuk_tool_processor.execution.wrappers.latency_tracking import LatencyTrackingExecutor
 from chuk_tool_processor.execution.wrappers.rate_limiting import (
     RateLimitedToolExecutor,
     RateLimiter,
@@ -55,6 +61,13 @@ from chuk_tool_processor.plugins.discovery import (
     plugin_registry,
 )
 from chuk_tool_processor.registry import ToolRegistryInterface, ToolRegistryProvider
+from chuk_tool_processor.scheduling import (
+    ExecutionPlan,
+    LatencyModel,
+    PlanExecutor,
+    SchedulingConstraints,
+    ToolCallSpec,
+)
 from chuk_tool_processor.utils import fast_json as json
 
 
@@ -134,6 +147,9 @@ class ToolProcessor:
         # New: Bulkhead configuration
         bulkhead_config: BulkheadConfig | None = None,
         enable_bulkhead: bool = False,
+        enable_adaptive_concurrency: bool = False,
+        adaptive_concurrency_config: AdaptiveConcurrencyConfig | None = None,
+        latency_model: LatencyModel | None = None,
     ):
         """
         Initialize the tool processor.
@@ -174,6 +190,15 @@ class ToolProcessor:
             bulkhead_config: Configuration for per-tool/namespace concurrency limits.
                 Enables bulkhead pattern for resource isolation. Default: None
             enable_bulkhead: Whether to enable bulkhead pattern. Default: False
+            enable_adaptive_concurrency: Whether to bound per-tool concurrency
+                with limits adjusted from observed latency and errors. Default: False
+            adaptive_concurrency_config: Optional configuration for the adaptive
+                limiter (algorithm, bounds). See AdaptiveConcurrencyConfig.
+            latency_model: Optional LatencyModel that learns per-tool latency
+                from every executed call. Pass the same model to a scheduler
+                (``GreedyDagScheduler(latency_model=model)``) to fill missing
+                ``est_ms``/``timeout_ms``; execute_plan() also uses it for
+                deadline checks. Default: None
 
         Raises:
             ImportError: If required dependencies are not installed.
@@ -219,6 +244,9 @@ class ToolProcessor:
         self.parser_plugin_names = parser_plugins
         self.bulkhead_config = bulkhead_config
         self.enable_bulkhead = enable_bulkhead
+        self.enable_adaptive_concurrency = enable_adaptive_concurrency
+        self.adaptive_concurrency_config = adaptive_concurrency_config
+        self.latency_model = latency_model
 
         # Placeholder for initialized components (typed as Optional for type safety)
         self.registry: ToolRegistryInterface | None = None
@@ -265,7 +293,22 @@ class ToolProcessor:
             executor = self.strategy
 
             # Apply wrappers in reverse order (innermost first)
-            # Circuit breaker goes innermost (closest to actual execution)
+            # Latency tracking wraps the strategy itself so it samples raw tool
+            # latency, not cache hits, retries or limiter queueing
+            if self.latency_model is not None:
+                self.logger.debug("Enabling latency tracking")
+                executor = LatencyTrackingExecutor(executor, self.latency_model)
+
+            # Adaptive concurrency sits just outside latency tracking so it
+            # observes tool latency, not retries or circuit-breaker rejections
+            if self.enable_adaptive_concurrency:
+                self.logger.debug("Enabling adaptive concurrency limiting")
+                executor = AdaptiveConcurrencyExecutor(
+                    executor=executor,
+                    default_config=self.adaptive_concurrency_config,
+                )
+
+            # Circuit breaker goes next (closest to actual execution)
             if self.enable_circuit_breaker:
                 self.logger.debug("Enabling circuit breaker")
                 circuit_config = CircuitBreakerConfig(
@@ -304,6 +347,7 @@ class ToolProcessor:
                     executor=executor,
                     cache=cache,
                     default_ttl=self.cache_ttl,
+                    registry=self.registry,
                 )
 
             self.executor = executor
@@ -651,6 +695,58 @@ class ToolProcessor:
         # Ensure we always return a list (never None)
         return results if results is not None else []
 
+    async def execute_plan(
+        self,
+        plan: ExecutionPlan,
+        calls: Sequence[ToolCallSpec],
+        constraints: SchedulingConstraints | None = None,
+    ) -> AsyncIterator[ToolResult]:
+        """
+        Execute a scheduler's ExecutionPlan, streaming results as calls finish.
+
+        Stages are not barriers: each call starts as soon as its own
+        dependencies have succeeded, within the concurrency limits of its
+        pool. Calls run through the configured executor chain (caching,
+        retries, rate limits, ...) one ToolCall at a time.
+
+        - Pool limits from ``constraints.pool_limits`` are live semaphores
+        - ``plan.per_call_timeout_ms`` applies, capped by the time left to the deadline
+        - Low-priority calls whose ``est_ms`` (or, if unset, the processor's
+          ``latency_model`` estimate) no longer fits before
+          ``constraints.deadline_ms`` are skipped when they would start, and
+          no call starts after the deadline has passed
+        - Dependents of failed or skipped calls are skipped
+
+        Args:
+            plan: Plan produced by a SchedulerPolicy (e.g. GreedyDagScheduler)
+            calls: The ToolCallSpecs the plan was made for
+            constraints: The constraints the plan was made with. Default: None
+
+        Yields:
+            One ToolResult per call, in completion order, with ``call_id`` set
+            to the spec's call_id. Skipped calls yield non-retryable error
+            results (``error_info.details["skip_reason"]``).
+
+        Example:
+            >>> scheduler = GreedyDagScheduler()
+            >>> plan = scheduler.plan(calls, constraints)
+            >>> async with ToolProcessor() as processor:
+            ...     async for result in processor.execute_plan(plan, calls, constraints):
+            ...         print(f"{result.call_id}: {result.result or result.error}")
+        """
+        await self.initialize()
+
+        if self.executor is None:
+            raise RuntimeError("Executor not initialized. Call initialize() first.")
+
+        async def run_call(call: ToolCall, timeout: float | None) -> ToolResult:
+            assert self.executor is not None
+            results = await self.executor.execute([call], timeout=timeout)
+            return results[0] if results else ToolResult.create_error(call.tool, "No result returned", call_id=call.id)
+
+        async for result in PlanExecutor(run_call, self.latency_model).run(plan, calls, constraints):
+            yield result
+
     async def _extract_tool_calls(self, text: str) -> list[ToolCall]:
         """
         Extract tool calls from text using all available parsers.
@@ -8,6 +8,7 @@ This module provides intelligent tool search with:
 - Namespace aliasing ("math.normal_cdf" finds "normal_cdf")
 - Always returns results (fallback to popular tools)
 - Session boosting (recently used tools rank higher)
+- Optional local semantic search (hashed TF-IDF vectors, requires NumPy)
 
 It also provides a base class for dynamic tool providers that allow LLMs
 to discover and execute tools on-demand.
@@ -20,19 +21,24 @@ from chuk_tool_processor.discovery.dynamic_provider import (
 from chuk_tool_processor.discovery.search import (
     SearchResult,
     SessionToolStats,
+    ToolIndex,
     ToolSearchEngine,
+    TrigramIndex,
     extract_keywords,
     find_tool_by_alias,
     find_tool_exact,
     fuzzy_score,
     get_search_engine,
     levenshtein_distance,
+    normalize_query,
     normalize_tool_name,
     score_token_match,
     search_tools,
     tokenize,
+    trigrams,
 )
 from chuk_tool_processor.discovery.searchable import SearchableTool
+from chuk_tool_processor.discovery.semantic import SemanticIndex, SemanticSearchConfig
 from chuk_tool_processor.discovery.synonyms import (
     DOMAIN_INDICATORS,
     STOPWORDS,
@@ -49,14 +55,19 @@ __all__ = [
     "DynamicToolName",
     # Core search
     "ToolSearchEngine",
+    "ToolIndex",
     "SearchResult",
     "SessionToolStats",
     "get_search_engine",
     "search_tools",
     "find_tool_exact",
+    # Semantic search (optional, requires NumPy)
+    "SemanticSearchConfig",
+    "SemanticIndex",
     # Protocol
     "SearchableTool",
     # Token processing
+    "normalize_query",
     "tokenize",
     "extract_keywords",
     "expand_with_synonyms",
@@ -64,6 +75,8 @@ __all__ = [
     "score_token_match",
     "fuzzy_score",
     "levenshtein_distance",
+    "trigrams",
+    "TrigramIndex",
     # Name aliasing
     "normalize_tool_name",
     "find_tool_by_alias",
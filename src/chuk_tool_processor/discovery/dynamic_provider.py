@@ -17,7 +17,7 @@ Subclasses can customize:
 
 from __future__ import annotations
 
-import json
+import inspect
 import logging
 from abc import ABC, abstractmethod
 from enum import StrEnum
@@ -32,6 +32,7 @@ from chuk_tool_processor.discovery.searchable import (
     get_tool_description,
     get_tool_parameters,
 )
+from chuk_tool_processor.discovery.semantic import SemanticSearchConfig
 
 logger = logging.getLogger(__name__)
 
@@ -103,11 +104,22 @@ class BaseDynamicToolProvider(ABC, Generic[T]):
     - Always returns results (never empty)
     """
 
-    def __init__(self) -> None:
-        """Initialize the provider."""
+    def __init__(self, semantic: SemanticSearchConfig | None = None, registry: Any | None = None) -> None:
+        """Initialize the provider.
+
+        Args:
+            semantic: Enables semantic search alongside lexical search (requires NumPy)
+            registry: Optional tool registry whose async get_generation() is used by
+                get_tools_generation() to skip refetching an unchanged tool set
+        """
+        self._registry = registry
         self._tool_cache: dict[str, dict[str, Any]] = {}
-        self._search_engine: ToolSearchEngine[T] = ToolSearchEngine()
+        self._search_engine: ToolSearchEngine[T] = ToolSearchEngine(semantic=semantic)
         self._tools_indexed = False
+        # Tool-set generation the search index was last synced at (None = unknown)
+        self._indexed_generation: int | None = None
+        # Tool-set generation the cached schemas belong to (None = unknown)
+        self._schema_generation: int | None = None
         # Track which tools have had their schema fetched
         self._schema_fetched: set[str] = set()
 
@@ -145,6 +157,24 @@ class BaseDynamicToolProvider(ABC, Generic[T]):
     # Optional hooks for customization
     # =========================================================================
 
+    async def get_tools_generation(self) -> int | None:
+        """Optional hook reporting a counter that changes whenever the tool set changes.
+
+        By default this is the ``get_generation()`` of the registry passed to
+        the constructor; override it to use another version source. While the
+        value is unchanged, searches reuse the index without calling
+        get_all_tools(). None means unknown: tools are fetched and diffed
+        against the index on every search.
+
+        Returns:
+            Current generation, or None if not tracked
+        """
+        get_generation = getattr(self._registry, "get_generation", None)
+        if not inspect.iscoroutinefunction(get_generation):
+            return None
+        generation: int = await get_generation()
+        return generation
+
     def filter_search_results(
         self,
         results: list[SearchResult[T]],
@@ -334,12 +364,24 @@ class BaseDynamicToolProvider(ABC, Generic[T]):
             return []
 
     async def _ensure_tools_indexed(self) -> None:
-        """Ensure tools are indexed for efficient searching."""
+        """Ensure the search index reflects the current tools.
+
+        Skips get_all_tools() while get_tools_generation() reports the
+        generation the index was synced at. Otherwise fetches the tools and
+        applies only the differences (added, removed and changed tools).
+        """
+        generation = await self.get_tools_generation()
+        if self._tools_indexed and generation is not None and generation == self._indexed_generation:
+            return
+
+        all_tools = await self.get_all_tools()
         if not self._tools_indexed:
-            all_tools = await self.get_all_tools()
             self._search_engine.set_tools(all_tools)
-            self._tools_indexed = True
             logger.info(f"Indexed {len(all_tools)} tools for search")
+        elif self._search_engine.sync_tools(all_tools):
+            logger.debug(f"Search index updated (generation {self._search_engine.generation})")
+        self._tools_indexed = True
+        self._indexed_generation = generation
 
     async def search_tools(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
         """Search for tools matching the query.
@@ -358,17 +400,12 @@ class BaseDynamicToolProvider(ABC, Generic[T]):
             List of matching tools with name, description, namespace, and score
         """
         try:
-            all_tools = await self.get_all_tools()
-
             # Update search index if tools changed
-            if not self._tools_indexed or len(all_tools) != len(self._search_engine._tool_cache or []):
-                self._search_engine.set_tools(all_tools)
-                self._tools_indexed = True
+            await self._ensure_tools_indexed()
 
-            # Use intelligent search engine
+            # Use intelligent search engine over the indexed tools
             search_results = self._search_engine.search(
                 query=query,
-                tools=all_tools,
                 limit=limit * 2,  # Fetch extra to allow filtering
             )
 
@@ -414,68 +451,15 @@ class BaseDynamicToolProvider(ABC, Generic[T]):
             Full tool schema in OpenAI function format
         """
         try:
+            await self._sync_schema_cache()
+
             # Check cache first
             if tool_name in self._tool_cache:
                 logger.debug(f"Returning cached schema for {tool_name}")
                 return self._tool_cache[tool_name]
 
             all_tools = await self.get_all_tools()
-
-            # Try exact match first
-            tool = None
-            for t in all_tools:
-                if self.get_tool_name(t) == tool_name:
-                    tool = t
-                    break
-
-            # If not found, try alias resolution
-            if tool is None:
-                tool = find_tool_by_alias(tool_name, all_tools)
-                if tool:
-                    logger.info(f"Resolved '{tool_name}' to '{self.get_tool_name(tool)}' via alias")
-
-            if tool:
-                actual_name = self.get_tool_name(tool)
-                desc = get_tool_description(tool) or "No description provided"
-                params = get_tool_parameters(tool) or {
-                    "type": "object",
-                    "properties": {},
-                }
-
-                schema = {
-                    "type": "function",
-                    "function": {
-                        "name": actual_name,
-                        "description": desc,
-                        "parameters": params,
-                    },
-                }
-
-                # Cache it under both names
-                self._tool_cache[tool_name] = schema
-                if actual_name != tool_name:
-                    self._tool_cache[actual_name] = schema
-
-                # Mark this tool as having its schema fetched
-                self._schema_fetched.add(actual_name)
-                self._schema_fetched.add(tool_name)
-                # Also add without namespace prefix
-                base_name = actual_name.split(".")[-1] if "." in actual_name else actual_name
-                self._schema_fetched.add(base_name)
-
-                logger.info(f"get_tool_schema('{tool_name}') returned {len(json.dumps(schema))} chars")
-                return schema
-
-            # Not found - try to suggest similar tools
-            similar = self._search_engine.search(tool_name, all_tools, limit=3)
-            suggestions = [self.get_tool_name(s.tool) for s in similar if s.score > 0]
-
-            error_msg = f"Tool '{tool_name}' not found"
-            if suggestions:
-                error_msg += f". Did you mean: {', '.join(suggestions)}?"
-
-            logger.warning(error_msg)
-            return _error_response(error_msg, suggestions=suggestions)
+            return self._resolve_schema(tool_name, all_tools, self._tools_by_name(all_tools))
 
         except Exception as e:
             logger.error(f"Error in get_tool_schema: {e}")
@@ -485,7 +469,8 @@ class BaseDynamicToolProvider(ABC, Generic[T]):
         """Get schemas for multiple tools in a single call.
 
         More efficient than calling get_tool_schema multiple times when you
-        need schemas for several tools (e.g., after a search).
+        need schemas for several tools (e.g., after a search): the tools are
+        fetched at most once for the whole batch.
 
         Args:
             tool_names: List of tool names to get schemas for
@@ -496,9 +481,21 @@ class BaseDynamicToolProvider(ABC, Generic[T]):
         """
         schemas: list[dict[str, Any]] = []
         errors: list[dict[str, Any]] = []
+        lookup: tuple[list[T], dict[str, T]] | None = None
 
         for name in tool_names:
-            schema = await self.get_tool_schema(name)
+            try:
+                await self._sync_schema_cache()
+                schema = self._tool_cache.get(name)
+                if schema is None:
+                    if lookup is None:
+                        all_tools = await self.get_all_tools()
+                        lookup = (all_tools, self._tools_by_name(all_tools))
+                    schema = self._resolve_schema(name, *lookup)
+            except Exception as e:
+                logger.error(f"Error in get_tool_schemas: {e}")
+                schema = _error_response(str(e))
+
             # Check for error using the unified format (success=False)
             if schema.get("success") is False or "error" in schema:
                 error_msg = schema.get("error", "Unknown error")
@@ -515,6 +512,75 @@ class BaseDynamicToolProvider(ABC, Generic[T]):
             "count": len(schemas),
         }
 
+    async def _sync_schema_cache(self) -> None:
+        """Drop cached schemas when get_tools_generation() reports a new tool set."""
+        generation = await self.get_tools_generation()
+        if generation is not None and generation != self._schema_generation:
+            self._tool_cache.clear()
+            self._schema_generation = generation
+
+    def _tools_by_name(self, all_tools: list[T]) -> dict[str, T]:
+        """Map tool names to tools; the first tool wins for duplicate names."""
+        by_name: dict[str, T] = {}
+        for tool in all_tools:
+            by_name.setdefault(self.get_tool_name(tool), tool)
+        return by_name
+
+    def _resolve_schema(self, tool_name: str, all_tools: list[T], by_name: dict[str, T]) -> dict[str, Any]:
+        """Build (and cache) the schema for ``tool_name``, or an error with suggestions."""
+        # Try exact match first
+        tool = by_name.get(tool_name)
+
+        # If not found, try alias resolution
+        if tool is None:
+            tool = find_tool_by_alias(tool_name, all_tools)
+            if tool:
+                logger.info(f"Resolved '{tool_name}' to '{self.get_tool_name(tool)}' via alias")
+
+        if tool:
+            actual_name = self.get_tool_name(tool)
+            schema = self._tool_cache.get(actual_name)
+            if schema is None:
+                desc = get_tool_description(tool) or "No description provided"
+                params = get_tool_parameters(tool) or {
+                    "type": "object",
+                    "properties": {},
+                }
+
+                schema = {
+                    "type": "function",
+                    "function": {
+                        "name": actual_name,
+                        "description": desc,
+                        "parameters": params,
+                    },
+                }
+                self._tool_cache[actual_name] = schema
+
+            # Cache it under the requested name too
+            self._tool_cache[tool_name] = schema
+
+            # Mark this tool as having its schema fetched
+            self._schema_fetched.add(actual_name)
+            self._schema_fetched.add(tool_name)
+            # Also add without namespace prefix
+            base_name = actual_name.split(".")[-1] if "." in actual_name else actual_name
+            self._schema_fetched.add(base_name)
+
+            logger.info(f"get_tool_schema('{tool_name}') resolved to '{actual_name}'")
+            return schema
+
+        # Not found - try to suggest similar tools
+        similar = self._search_engine.search(tool_name, all_tools, limit=3)
+        suggestions = [self.get_tool_name(s.tool) for s in similar if s.score > 0]
+
+        error_msg = f"Tool '{tool_name}' not found"
+        if suggestions:
+            error_msg += f". Did you mean: {', '.join(suggestions)}?"
+
+        logger.warning(error_msg)
+        return _error_response(error_msg, suggestions=suggestions)
+
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Execute a tool by name with given arguments.
 
@@ -624,6 +690,8 @@ class BaseDynamicToolProvider(ABC, Generic[T]):
         Call this when tools may have changed.
         """
         self._tool_cache.clear()
+        self._schema_generation = None
         self._tools_indexed = False
+        self._indexed_generation = None
         self._schema_fetched.clear()
         logger.debug("Tool cache invalidated")
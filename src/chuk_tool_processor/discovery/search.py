@@ -12,16 +12,24 @@ Key features:
 5. Namespace aliasing - "math.normal_cdf" finds "normal_cdf"
 6. Two-stage search - high precision first, then expand if needed
 7. Session boosting - recently used tools rank higher
+8. Inverted index - BM25 scoring over postings lists built once per tool set
+9. Query cache - LRU of ranked results per tool-set generation, plus batched search
 """
 
 from __future__ import annotations
 
+import heapq
 import logging
 import math
 import re
-from dataclasses import dataclass, field
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from difflib import SequenceMatcher
-from typing import Any, Generic, TypeVar
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from chuk_tool_processor.discovery.searchable import (
     get_tool_description,
@@ -35,6 +43,9 @@ from chuk_tool_processor.discovery.synonyms import (
     expand_with_synonyms,
 )
 
+if TYPE_CHECKING:
+    from chuk_tool_processor.discovery.semantic import SemanticIndex, SemanticSearchConfig
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,6 +89,10 @@ class SearchResult(Generic[T]):
 # Token Processing
 # ============================================================================
 
+_SEPARATORS = re.compile(r"[_\-.\s]+")
+_CAMEL_BOUNDARY = re.compile(r"([a-z])([A-Z])")
+_DIGITS = re.compile(r"(\d+)")
+
 
 def tokenize(text: str) -> list[str]:
     """Tokenize text into searchable terms.
@@ -102,7 +117,7 @@ def tokenize(text: str) -> list[str]:
     text = text.lower()
 
     # Split on common separators (underscore, dash, dot, space)
-    parts = re.split(r"[_\-.\s]+", text)
+    parts = _SEPARATORS.split(text)
 
     tokens = []
     for part in parts:
@@ -110,10 +125,10 @@ def tokenize(text: str) -> list[str]:
             continue
 
         # Split camelCase: normalCdf -> normal, Cdf
-        camel_split = re.sub(r"([a-z])([A-Z])", r"\1 \2", part).lower().split()
+        camel_split = _CAMEL_BOUNDARY.sub(r"\1 \2", part).lower().split()
         for token in camel_split:
             # Further split on number boundaries: sin2 -> sin, 2
-            number_split = re.split(r"(\d+)", token)
+            number_split = _DIGITS.split(token)
             for t in number_split:
                 if t and len(t) >= 2:  # Minimum token length
                     tokens.append(t)
@@ -121,6 +136,11 @@ def tokenize(text: str) -> list[str]:
     return tokens
 
 
+def normalize_query(query: str) -> str:
+    """Collapse runs of whitespace and trim, so equivalent queries share cache entries."""
+    return " ".join(query.split())
+
+
 def extract_keywords(query: str) -> list[str]:
     """Extract meaningful keywords from a natural language query.
 
@@ -350,6 +370,374 @@ class SessionToolStats:
         return self.success_count / self.call_count if self.call_count > 0 else 0.0
 
 
+# ============================================================================
+# Inverted Index
+# ============================================================================
+
+# Indexed fields, in the order of the per-tool length tuple
+FIELD_NAME = 0
+FIELD_DESC = 1
+FIELD_NAMESPACE = 2
+FIELD_PARAM = 3
+
+
+@dataclass(slots=True)
+class IndexedTool(Generic[T]):
+    """Per-tool data computed once when a tool set is indexed."""
+
+    tool: T
+    name: str
+    description: str | None
+    name_tokens: frozenset[str]
+    desc_words: tuple[str, ...]
+    domain: str | None
+    field_lengths: tuple[int, int, int, int]
+    # Distinct terms per field, to drop the tool's postings when it is removed
+    terms: tuple[frozenset[str], ...]
+
+
+def trigrams(text: str) -> set[str]:
+    """Character trigrams of ``text``, padded so short strings still produce some."""
+    padded = f"${text}$"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Character-trigram postings over a list of strings, for typo-tolerant lookup.
+
+    Candidates are ranked by trigram overlap (Dice coefficient) so that only a
+    handful need an exact similarity check.
+    """
+
+    def __init__(self, keys: list[str]) -> None:
+        self.keys = keys
+        self._gram_counts: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        for key_id, key in enumerate(keys):
+            grams = trigrams(key)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(key_id)
+
+    def candidates(self, query: str, min_ratio: float, limit: int) -> list[int]:
+        """Ids of up to ``limit`` keys most likely to reach ``min_ratio`` similarity with ``query``.
+
+        Keys whose length alone rules out a ``SequenceMatcher`` ratio of
+        ``min_ratio`` (``2 * min(len) / (len_a + len_b)``) are skipped.
+        """
+        query_grams = trigrams(query)
+        shared: dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for key_id in self._postings.get(gram, ()):
+                shared[key_id] += 1
+
+        keys = self.keys
+        min_len = len(query) * min_ratio / (2 - min_ratio)
+        max_len = len(query) * (2 - min_ratio) / min_ratio
+        gram_counts = self._gram_counts
+        query_count = len(query_grams)
+        return heapq.nlargest(
+            limit,
+            (key_id for key_id in shared if min_len <= len(keys[key_id]) <= max_len),
+            key=lambda key_id: shared[key_id] / (query_count + gram_counts[key_id]),
+        )
+
+
+def tool_key(tool: Any) -> tuple[str, str]:
+    """Identity of a tool within an index: ``(namespace, name)``."""
+    return getattr(tool, "namespace", ""), getattr(tool, "name", "")
+
+
+def _same_tool(indexed: Any, tool: Any) -> bool:
+    """True if ``tool`` needs no re-indexing over ``indexed``."""
+    return indexed is tool or (indexed is not None and indexed == tool)
+
+
+class ToolIndex(Generic[T]):
+    """Postings-list index over a set of tools.
+
+    Each field (name, description, namespace, parameters) maps a term to the
+    ids of the tools containing it and the term frequency in that field.
+    Queries only touch the postings of their own terms, so the cost of a
+    search grows with the number of matching tools rather than the size of
+    the tool set.
+
+    Scores use BM25 per field, scaled by the engine's field weights::
+
+        weight * idf(term) * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len / avg_len))
+
+    Tools are identified by :func:`tool_key` and can be added, replaced and
+    removed one at a time; each change only updates the postings of that
+    tool's own terms. Removed tools leave unused ids behind until enough
+    accumulate to compact the index.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    # Candidates re-scored exactly per fuzzy lookup (names and description words each)
+    FUZZY_CANDIDATES = 64
+
+    def __init__(self, tools: Iterable[T] = ()) -> None:
+        # Lookups shared by a batch of queries, see memoized()
+        self._memo: dict[tuple[Any, ...], Any] | None = None
+        self._reset()
+        for tool in tools:
+            self._index_tool(tool)
+
+    def _reset(self) -> None:
+        self.entries: list[IndexedTool[T] | None] = []
+        self.postings: tuple[dict[str, dict[int, int]], ...] = ({}, {}, {}, {})
+        self._doc_ids: dict[tuple[str, str], int] = {}
+        self._live = 0
+        # Field lengths per tool id (kept for removed ids too), and their totals over live tools
+        self._lengths: list[tuple[int, int, int, int]] = []
+        self._totals = [0, 0, 0, 0]
+        self._tools: list[T] | None = None
+        self._name_vocab: list[str] | None = None
+        # Built on first fuzzy lookup: trigram indexes over names and description words
+        self._name_grams: TrigramIndex | None = None
+        self._word_grams: TrigramIndex | None = None
+        self._name_doc_ids: list[int] = []
+        self._word_docs: list[list[int]] = []
+
+    def __len__(self) -> int:
+        return self._live
+
+    @property
+    def tools(self) -> list[T]:
+        """The indexed tools, in id order."""
+        if self._tools is None:
+            self._tools = [entry.tool for entry in self.entries if entry is not None]
+        return self._tools
+
+    def get(self, key: tuple[str, str]) -> T | None:
+        """The indexed tool with ``key``, if any."""
+        doc_id = self._doc_ids.get(key)
+        entry = self.entries[doc_id] if doc_id is not None else None
+        return entry.tool if entry is not None else None
+
+    def entry(self, doc_id: int) -> IndexedTool[T]:
+        """Indexed data for a live tool id, as found in the postings."""
+        entry = self.entries[doc_id]
+        if entry is None:
+            raise KeyError(doc_id)
+        return entry
+
+    def tool_keys(self) -> list[tuple[str, str]]:
+        """Keys of the indexed tools."""
+        return list(self._doc_ids)
+
+    # ------------------------------------------------------------------ #
+    # Updates                                                            #
+    # ------------------------------------------------------------------ #
+
+    def add(self, tool: T) -> None:
+        """Index ``tool``, replacing an indexed tool with the same key."""
+        doc_id = self._doc_ids.get(tool_key(tool))
+        if doc_id is not None:
+            self._unindex_tool(doc_id)
+        self._index_tool(tool)
+        self._maybe_compact()
+
+    def remove(self, key: tuple[str, str]) -> bool:
+        """Drop the tool with ``key``; returns False if it was not indexed."""
+        doc_id = self._doc_ids.get(key)
+        if doc_id is None:
+            return False
+        self._unindex_tool(doc_id)
+        self._maybe_compact()
+        return True
+
+    def _index_tool(self, tool: T) -> None:
+        doc_id = len(self.entries)
+        name = getattr(tool, "name", "")
+        description = get_tool_description(tool)
+        params = get_tool_parameters(tool)
+
+        param_tokens: list[str] = []
+        if params and "properties" in params:
+            for param_name in params["properties"]:
+                param_tokens.extend(tokenize(param_name))
+
+        fields = (
+            tokenize(name),
+            tokenize(description or ""),
+            tokenize(getattr(tool, "namespace", "")),
+            param_tokens,
+        )
+        for field_id, tokens in enumerate(fields):
+            postings = self.postings[field_id]
+            for token in tokens:
+                doc_tfs = postings.get(token)
+                if doc_tfs is None:
+                    doc_tfs = postings[token] = {}
+                    if field_id == FIELD_NAME:
+                        self._name_vocab = None
+                doc_tfs[doc_id] = doc_tfs.get(doc_id, 0) + 1
+            self._totals[field_id] += len(tokens)
+
+        lengths = (len(fields[0]), len(fields[1]), len(fields[2]), len(fields[3]))
+        self._lengths.append(lengths)
+        self.entries.append(
+            IndexedTool(
+                tool=tool,
+                name=name,
+                description=description,
+                name_tokens=frozenset(fields[FIELD_NAME]),
+                desc_words=tuple(dict.fromkeys(description.lower().split())) if description else (),
+                domain=detect_tool_domain(name, description),
+                field_lengths=lengths,
+                terms=tuple(frozenset(tokens) for tokens in fields),
+            )
+        )
+        self._doc_ids[tool_key(tool)] = doc_id
+        self._live += 1
+        self._changed()
+
+    def _unindex_tool(self, doc_id: int) -> None:
+        entry = self.entries[doc_id]
+        if entry is None:
+            return
+        for field_id, terms in enumerate(entry.terms):
+            postings = self.postings[field_id]
+            for term in terms:
+                doc_tfs = postings[term]
+                del doc_tfs[doc_id]
+                if not doc_tfs:
+                    del postings[term]
+                    if field_id == FIELD_NAME:
+                        self._name_vocab = None
+            self._totals[field_id] -= entry.field_lengths[field_id]
+
+        self.entries[doc_id] = None
+        key = tool_key(entry.tool)
+        if self._doc_ids.get(key) == doc_id:
+            del self._doc_ids[key]
+        self._live -= 1
+        self._changed()
+
+    def _changed(self) -> None:
+        self._tools = None
+        self._name_grams = self._word_grams = None
+
+    def _maybe_compact(self) -> None:
+        """Re-number tool ids once most of them belong to removed tools."""
+        if len(self.entries) > 2 * self._live + 64:
+            tools = self.tools
+            self._reset()
+            for tool in tools:
+                self._index_tool(tool)
+
+    # ------------------------------------------------------------------ #
+    # Lookups                                                            #
+    # ------------------------------------------------------------------ #
+
+    def covers(self, tools: list[T]) -> bool:
+        """True if ``tools`` holds the same tool objects, in the same order, as this index."""
+        indexed = self.tools
+        if tools is indexed:
+            return True
+        return len(tools) == len(indexed) and all(a is b for a, b in zip(tools, indexed, strict=True))
+
+    @contextmanager
+    def memoized(self) -> Iterator[None]:
+        """Share term scores and prefix lookups between the queries of a batch.
+
+        The index must not change while the context is active.
+        """
+        self._memo = {}
+        try:
+            yield
+        finally:
+            self._memo = None
+
+    def idf(self, doc_freq: int) -> float:
+        """BM25 inverse document frequency; always positive."""
+        n = self._live
+        return math.log(1.0 + (n - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def term_scores(self, field_id: int, term: str, weight: float) -> dict[int, float]:
+        """Weighted BM25 contribution of ``term`` in one field, for each tool containing it."""
+        doc_tfs = self.postings[field_id].get(term)
+        if not doc_tfs:
+            return {}
+        memo = self._memo
+        if memo is not None and (cached := memo.get((field_id, term, weight))) is not None:
+            return cached  # type: ignore[no-any-return]
+        k1, b = self.K1, self.B
+        avg_len = max(self._totals[field_id] / max(self._live, 1), 1.0)
+        base = weight * self.idf(len(doc_tfs))
+        lengths = self._lengths
+        scores = {
+            doc_id: base * tf * (k1 + 1) / (tf + k1 * (1 - b + b * lengths[doc_id][field_id] / avg_len))
+            for doc_id, tf in doc_tfs.items()
+        }
+        if memo is not None:
+            memo[(field_id, term, weight)] = scores
+        return scores
+
+    def name_prefix_docs(self, token: str, either_direction: bool = False) -> set[int]:
+        """Tools with a name token that extends ``token`` (or, optionally, is a prefix of it).
+
+        Exact name-token matches are included; callers score those separately.
+        """
+        memo = self._memo
+        if memo is not None and (cached := memo.get(("prefix", token, either_direction))) is not None:
+            return cached  # type: ignore[no-any-return]
+        postings = self.postings[FIELD_NAME]
+        if self._name_vocab is None:
+            self._name_vocab = sorted(postings)
+        vocab = self._name_vocab
+        docs: set[int] = set()
+        start = bisect_left(vocab, token)
+        for term in islice(vocab, start, None):
+            if not term.startswith(token):
+                break
+            docs.update(postings[term])
+        if either_direction:
+            for end in range(2, len(token)):
+                docs.update(postings.get(token[:end], ()))
+        if memo is not None:
+            memo[("prefix", token, either_direction)] = docs
+        return docs
+
+    def fuzzy_candidates(
+        self, query: str, name_ratio: float, word_ratio: float
+    ) -> tuple[list[int], list[tuple[str, list[int]]]]:
+        """Names and description words most likely to be close matches for ``query``.
+
+        Returns the candidate tool ids by name, and the candidate description
+        words with the ids of the tools using them. Callers compute the exact
+        similarity for these only.
+        """
+        if self._name_grams is None or self._word_grams is None:
+            doc_ids: list[int] = []
+            names: list[str] = []
+            word_docs: dict[str, list[int]] = {}
+            for doc_id, entry in enumerate(self.entries):
+                if entry is None:
+                    continue
+                doc_ids.append(doc_id)
+                names.append(entry.name.lower())
+                for word in entry.desc_words:
+                    word_docs.setdefault(word, []).append(doc_id)
+            self._name_doc_ids = doc_ids
+            self._name_grams = TrigramIndex(names)
+            self._word_grams = TrigramIndex(list(word_docs))
+            self._word_docs = list(word_docs.values())
+
+        name_ids = [
+            self._name_doc_ids[key_id]
+            for key_id in self._name_grams.candidates(query, name_ratio, self.FUZZY_CANDIDATES)
+        ]
+        words = [
+            (self._word_grams.keys[word_id], self._word_docs[word_id])
+            for word_id in self._word_grams.candidates(query, word_ratio, self.FUZZY_CANDIDATES)
+        ]
+        return name_ids, words
+
+
 # ============================================================================
 # Main Search Engine
 # ============================================================================
@@ -364,6 +752,10 @@ class ToolSearchEngine(Generic[T]):
     - Two-stage search: high precision first, then expand
     - Session boosting: recently/successfully used tools rank higher
     - Configurable scoring weights
+    - Optional semantic stage (hashed TF-IDF vectors, needs NumPy) blended
+      with the lexical scores
+    - LRU cache of ranked results per (query, limit, tool-set generation),
+      taken before session boosting so boosts stay per-session
     """
 
     # Scoring weights (can be tuned)
@@ -379,9 +771,41 @@ class ToolSearchEngine(Generic[T]):
     BOOST_CALL_COUNT = 0.5  # Small boost per successful call
     BOOST_DECAY_TURNS = 5  # How many turns before boost decays
 
-    def __init__(self) -> None:
+    # Default number of queries whose ranked results are cached
+    QUERY_CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        semantic: SemanticSearchConfig | None = None,
+        query_cache_size: int | None = None,
+    ) -> None:
+        """Create a search engine.
+
+        Args:
+            semantic: Enables the semantic search stage (requires NumPy)
+            query_cache_size: Queries to cache results for (default QUERY_CACHE_SIZE, 0 disables)
+        """
         self._tool_cache: list[T] | None = None
-        self._search_index: dict[str, set[str]] | None = None  # tool_name -> searchable tokens
+        self._index: ToolIndex[T] | None = None
+        # Index for the last tool list passed to search() that differed from the cache
+        self._adhoc_index: ToolIndex[T] | None = None
+        self._generation = 0
+
+        # Semantic stage, rebuilt lazily when the generation moves on
+        self._semantic_config = semantic
+        self._semantic: SemanticIndex[T] | None = None
+        self._semantic_generation = -1
+        if semantic is not None:
+            from chuk_tool_processor.discovery.semantic import SemanticIndex
+
+            self._semantic = SemanticIndex(dimensions=semantic.dimensions)
+
+        # (normalized query, limit, min_score, generation) -> ranked results before
+        # session boosting, or None when the query falls back to popular tools
+        self._query_cache: OrderedDict[tuple[str, int, float, int], tuple[SearchResult[T], ...] | None] = OrderedDict()
+        self._query_cache_size = self.QUERY_CACHE_SIZE if query_cache_size is None else query_cache_size
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
 
         # Session tracking
         self._session_stats: dict[str, SessionToolStats] = {}
@@ -393,8 +817,106 @@ class ToolSearchEngine(Generic[T]):
         Args:
             tools: List of tools to index
         """
-        self._tool_cache = tools
-        self._build_search_index()
+        self._index_changed(ToolIndex(tools))
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented whenever the indexed tool set changes."""
+        return self._generation
+
+    def add_tools(self, tools: Iterable[T]) -> None:
+        """Index additional tools, replacing indexed tools with the same namespace and name.
+
+        Only the postings of the added (and replaced) tools are touched.
+
+        Args:
+            tools: Tools to add
+        """
+        index = self._index if self._index is not None else ToolIndex()
+        for tool in tools:
+            index.add(tool)
+        self._index_changed(index)
+
+    def update_tool(self, tool: T) -> None:
+        """Re-index a tool whose description, parameters or namespace changed.
+
+        Args:
+            tool: New version of the tool, matched by namespace and name
+        """
+        self.add_tools([tool])
+
+    def remove_tools(self, tools: Iterable[T]) -> int:
+        """Drop tools from the index, matched by namespace and name.
+
+        Args:
+            tools: Tools to remove
+
+        Returns:
+            Number of tools that were indexed and are now removed
+        """
+        if self._index is None:
+            return 0
+        removed = sum(self._index.remove(tool_key(tool)) for tool in tools)
+        if removed:
+            self._index_changed(self._index)
+        return removed
+
+    def sync_tools(self, tools: list[T]) -> bool:
+        """Bring the index in line with ``tools`` using incremental updates.
+
+        Tools missing from ``tools`` are removed; new tools, and tools that
+        are no longer equal to their indexed version, are (re-)indexed.
+
+        Args:
+            tools: The current tool set
+
+        Returns:
+            True if the index changed
+        """
+        index = self._index
+        if index is None:
+            self.set_tools(tools)
+            return True
+        if index.covers(tools):
+            return False
+
+        current = {tool_key(tool): tool for tool in tools}
+        removed = [key for key in index.tool_keys() if key not in current]
+        changed = [tool for key, tool in current.items() if not _same_tool(index.get(key), tool)]
+        for key in removed:
+            index.remove(key)
+        for tool in changed:
+            index.add(tool)
+        if not (removed or changed):
+            return False
+
+        logger.debug(f"Search index synced: {len(changed)} added/updated, {len(removed)} removed")
+        self._index_changed(index)
+        return True
+
+    def _index_changed(self, index: ToolIndex[T]) -> None:
+        self._index = index
+        self._tool_cache = index.tools
+        self._adhoc_index = None
+        self._generation += 1
+        self._query_cache.clear()
+
+    # =========================================================================
+    # Query Cache
+    # =========================================================================
+
+    def clear_query_cache(self) -> None:
+        """Drop all cached query results."""
+        self._query_cache.clear()
+
+    def get_query_cache_stats(self) -> dict[str, int]:
+        """Hit/miss counters and occupancy of the query cache."""
+        return {
+            "hits": self._query_cache_hits,
+            "misses": self._query_cache_misses,
+            "size": len(self._query_cache),
+            "max_size": self._query_cache_size,
+        }
 
     # =========================================================================
     # Session Tracking
@@ -490,45 +1012,13 @@ class ToolSearchEngine(Generic[T]):
         """
         return self._session_stats.get(tool_name)
 
-    def _build_search_index(self) -> None:
-        """Build inverted index for fast searching."""
-        if not self._tool_cache:
-            self._search_index = {}
-            return
-
-        self._search_index = {}
-        for tool in self._tool_cache:
-            tool_name = getattr(tool, "name", "")
-            tool_desc = get_tool_description(tool)
-            tool_ns = getattr(tool, "namespace", "")
-            tool_params = get_tool_parameters(tool)
-
-            # Collect all searchable tokens for this tool
-            tokens: set[str] = set()
-
-            # Name tokens (with synonyms)
-            name_tokens = tokenize(tool_name)
-            tokens.update(name_tokens)
-            tokens.update(expand_with_synonyms(name_tokens))
-
-            # Description tokens (with synonyms)
-            if tool_desc:
-                desc_tokens = tokenize(tool_desc)
-                tokens.update(desc_tokens)
-                tokens.update(expand_with_synonyms(desc_tokens))
-
-            # Namespace tokens
-            tokens.update(tokenize(tool_ns))
-
-            # Parameter names
-            if tool_params and "properties" in tool_params:
-                for param_name in tool_params["properties"]:
-                    tokens.update(tokenize(param_name))
-
-            # Name variants (aliases)
-            tokens.update(normalize_tool_name(tool_name))
-
-            self._search_index[tool_name] = tokens
+    def _index_for(self, tools: list[T]) -> ToolIndex[T]:
+        """Return an index over ``tools``, reusing the cached one when the tool set is unchanged."""
+        for index in (self._index, self._adhoc_index):
+            if index is not None and index.covers(tools):
+                return index
+        self._adhoc_index = ToolIndex(tools)
+        return self._adhoc_index
 
     def search(
         self,
@@ -555,23 +1045,110 @@ class ToolSearchEngine(Generic[T]):
         Returns:
             List of SearchResult sorted by score (highest first)
         """
-        if tools is not None:
-            search_tools = tools
-        elif self._tool_cache is not None:
-            search_tools = self._tool_cache
-        else:
+        search_tools = tools if tools is not None else self._tool_cache
+        if not search_tools:
             return []
 
+        query = normalize_query(query)
+        index = self._index_for(search_tools)
+        results = self._cached_rank(query, index, limit, min_score)
+        return self._finish(results, search_tools, limit, use_session_boost)
+
+    def search_many(
+        self,
+        queries: Iterable[str],
+        tools: list[T] | None = None,
+        limit: int = 10,
+        min_score: float = 0.0,
+        use_session_boost: bool = True,
+    ) -> list[list[SearchResult[T]]]:
+        """Search for several queries at once, e.g. for offline evaluation or to pre-warm the cache.
+
+        Equivalent to calling :meth:`search` for each query, but duplicate
+        queries are ranked once, term and prefix lookups are shared between
+        queries, and semantic similarities for all queries come from one
+        matrix product.
+
+        Args:
+            queries: Natural language search queries
+            tools: Tools to search (uses cache if None)
+            limit: Maximum results to return per query
+            min_score: Minimum score threshold (0 = return everything)
+            use_session_boost: Whether to apply session-based boosting
+
+        Returns:
+            One list of SearchResult per query, in query order
+        """
+        normalized = [normalize_query(query) for query in queries]
+        search_tools = tools if tools is not None else self._tool_cache
         if not search_tools:
-            return []
+            return [[] for _ in normalized]
+
+        index = self._index_for(search_tools)
+        unique = list(dict.fromkeys(normalized))
+        semantic_hits: dict[str, list[tuple[T, float]]] = {}
+        if self._semantic_config is not None and self._semantic_config.weight > 0 and index is self._index:
+            pending = [query for query in unique if self._cache_key(query, limit, min_score) not in self._query_cache]
+            if pending:
+                config = self._semantic_config
+                batch = self._semantic_index().search_many(pending, self._semantic_k(limit), config.min_similarity)
+                semantic_hits = dict(zip(pending, batch, strict=True))
+
+        with index.memoized():
+            ranked = {
+                query: self._cached_rank(query, index, limit, min_score, semantic_hits.get(query)) for query in unique
+            }
+        return [self._finish(ranked[query], search_tools, limit, use_session_boost) for query in normalized]
+
+    def _cache_key(self, query: str, limit: int, min_score: float) -> tuple[str, int, float, int]:
+        return (query, limit, min_score, self._generation)
+
+    def _cached_rank(
+        self,
+        query: str,
+        index: ToolIndex[T],
+        limit: int,
+        min_score: float,
+        semantic_hits: list[tuple[T, float]] | None = None,
+    ) -> tuple[SearchResult[T], ...] | None:
+        """Ranked results for a normalized query, from the cache when searching the cached tools."""
+        cacheable = self._query_cache_size > 0 and index is self._index
+        if not cacheable:
+            return self._rank(query, index, limit, min_score, semantic_hits)
+
+        cache = self._query_cache
+        key = self._cache_key(query, limit, min_score)
+        if key in cache:
+            cache.move_to_end(key)
+            self._query_cache_hits += 1
+            return cache[key]
+
+        self._query_cache_misses += 1
+        results = self._rank(query, index, limit, min_score, semantic_hits)
+        cache[key] = results
+        while len(cache) > self._query_cache_size:
+            cache.popitem(last=False)
+        return results
+
+    def _rank(
+        self,
+        query: str,
+        index: ToolIndex[T],
+        limit: int,
+        min_score: float,
+        semantic_hits: list[tuple[T, float]] | None = None,
+    ) -> tuple[SearchResult[T], ...] | None:
+        """Run the search stages; results are best first, before session boosting.
 
+        Returns None when nothing matched and the fallback results apply.
+        """
         # Extract keywords from query
         keywords = extract_keywords(query)
         if not keywords:
             keywords = tokenize(query)
 
         if not keywords:
-            return self._fallback_results(search_tools, limit, use_session_boost)
+            return None
 
         logger.debug(f"Search query='{query}' -> keywords={keywords}")
 
@@ -581,74 +1158,105 @@ class ToolSearchEngine(Generic[T]):
             logger.debug(f"Detected query domain: {query_domain}")
 
         # Stage 1: High precision search (no synonym expansion)
-        stage1_results = self._stage1_search(keywords, search_tools, min_score)
+        stage1_results, confident = self._stage1_search(keywords, index, min_score)
 
         # If Stage 1 found good results, use them
-        if stage1_results and stage1_results[0].score >= self.WEIGHT_NAME_EXACT:
+        if confident:
             logger.debug(f"Stage 1 found {len(stage1_results)} high-quality results")
             results = stage1_results
         else:
             # Stage 2: Expanded search with synonyms
             query_tokens = expand_with_synonyms(keywords)
             logger.debug(f"Stage 2: expanding to {query_tokens}")
-            results = self._stage2_search(query_tokens, search_tools, min_score, query_domain)
+            results = self._stage2_search(query_tokens, index, min_score, query_domain)
+
+            # Blend in semantic similarity, which also catches paraphrases
+            if self._semantic is not None and index is self._index:
+                results = self._blend_semantic(query, results, limit, semantic_hits)
 
             # If Stage 2 fails, try fuzzy matching
             if not results:
-                results = self._fuzzy_search(query, search_tools, limit)
+                results = self._fuzzy_search(query, index, limit)
 
-        # If still no results, return fallback
-        if not results:
-            return self._fallback_results(search_tools, limit, use_session_boost)
+        # If still no results, the fallback applies
+        return tuple(results) if results else None
 
-        # Apply session boosting
-        if use_session_boost:
-            results = self._apply_session_boost(results)
+    def _finish(
+        self,
+        results: tuple[SearchResult[T], ...] | None,
+        tools: list[T],
+        limit: int,
+        use_session_boost: bool,
+    ) -> list[SearchResult[T]]:
+        """Apply session boosting to ranked (possibly cached) results and cut them to ``limit``."""
+        if results is None:
+            return self._fallback_results(tools, limit, use_session_boost)
+
+        if use_session_boost and self._session_stats:
+            # Apply session boosting, then sort by final score
+            ranked = self._apply_session_boost(list(results))
+            ranked.sort(key=lambda r: r.score, reverse=True)
+        else:
+            # Already best first
+            ranked = list(results[:limit])
 
-        # Sort by final score
-        results.sort(key=lambda r: r.score, reverse=True)
+        # Cached results are shared between calls, so hand out copies
+        return [replace(r, match_reasons=list(r.match_reasons)) for r in ranked[:limit]]
 
-        return results[:limit]
+    def _results(
+        self,
+        index: ToolIndex[T],
+        scores: dict[int, float],
+        reasons: dict[int, list[str]],
+        min_score: float,
+    ) -> list[SearchResult[T]]:
+        """Build results for scored tools, best first (ties keep tool order)."""
+        return [
+            SearchResult(tool=index.entry(doc_id).tool, score=score, match_reasons=reasons[doc_id])
+            for doc_id, score in sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+            if score > min_score
+        ]
 
     def _stage1_search(
         self,
         keywords: list[str],
-        tools: list[T],
+        index: ToolIndex[T],
         min_score: float,
-    ) -> list[SearchResult[T]]:
+    ) -> tuple[list[SearchResult[T]], bool]:
         """Stage 1: High precision search without synonym expansion.
 
-        Only matches exact tokens and prefixes in tool names.
+        Only matches exact tokens and prefixes in tool names. Returns the
+        results and whether the best tool is a confident match: an exact
+        name token, or prefix matches worth as much.
         """
-        results: list[SearchResult[T]] = []
-        keyword_set = set(keywords)
-
-        for tool in tools:
-            tool_name = getattr(tool, "name", "")
-            name_tokens = set(tokenize(tool_name))
-            score = 0.0
-            reasons = []
-
-            for kw in keyword_set:
-                # Exact name match
-                if kw in name_tokens:
-                    score += self.WEIGHT_NAME_EXACT
-                    reasons.append(f"name:'{kw}'")
-                # Prefix match
-                elif any(nt.startswith(kw) for nt in name_tokens):
-                    score += self.WEIGHT_NAME_PREFIX
-                    reasons.append(f"name_prefix:'{kw}'")
-
-            if score > min_score:
-                results.append(SearchResult(tool=tool, score=score, match_reasons=reasons))
-
-        results.sort(key=lambda r: r.score, reverse=True)
-        return results
+        scores: dict[int, float] = defaultdict(float)
+        points: dict[int, float] = defaultdict(float)
+        reasons: dict[int, list[str]] = defaultdict(list)
+
+        for kw in dict.fromkeys(keywords):
+            # Exact name match
+            exact = index.term_scores(FIELD_NAME, kw, self.WEIGHT_NAME_EXACT)
+            for doc_id, score in exact.items():
+                scores[doc_id] += score
+                points[doc_id] += self.WEIGHT_NAME_EXACT
+                reasons[doc_id].append(f"name:'{kw}'")
+
+            # Prefix match
+            prefixed = index.name_prefix_docs(kw) - exact.keys()
+            if prefixed:
+                score = self.WEIGHT_NAME_PREFIX * index.idf(len(prefixed))
+                for doc_id in prefixed:
+                    scores[doc_id] += score
+                    points[doc_id] += self.WEIGHT_NAME_PREFIX
+                    reasons[doc_id].append(f"name_prefix:'{kw}'")
+
+        confident = bool(points) and max(points.values()) >= self.WEIGHT_NAME_EXACT
+        return self._results(index, scores, reasons, min_score), confident
 
     def _stage2_search(
         self,
         query_tokens: set[str],
-        tools: list[T],
+        index: ToolIndex[T],
         min_score: float,
         query_domain: str | None = None,
     ) -> list[SearchResult[T]]:
@@ -657,39 +1265,110 @@ class ToolSearchEngine(Generic[T]):
         Includes description, namespace, and parameter matching.
         Applies domain penalty for tools from mismatched domains.
         """
-        results: list[SearchResult[T]] = []
-
-        for tool in tools:
-            tool_name = getattr(tool, "name", "")
-            tool_desc = get_tool_description(tool)
-            tool_ns = getattr(tool, "namespace", "")
-            tool_params = get_tool_parameters(tool)
-
-            param_names = None
-            if tool_params and "properties" in tool_params:
-                param_names = list(tool_params["properties"].keys())
-
-            score, reasons = score_token_match(
-                query_tokens,
-                tool_name,
-                tool_desc,
-                tool_ns,
-                param_names,
-            )
-
-            # Apply domain penalty for mismatched domains
-            if query_domain is not None:
-                tool_domain = detect_tool_domain(tool_name, tool_desc)
-                penalty = compute_domain_penalty(query_domain, tool_domain)
+        scores: dict[int, float] = defaultdict(float)
+        reasons: dict[int, list[str]] = defaultdict(list)
+
+        def add(field_id: int, term: str, weight: float, label: str) -> dict[int, float]:
+            matched = index.term_scores(field_id, term, weight)
+            for doc_id, score in matched.items():
+                scores[doc_id] += score
+                reasons[doc_id].append(f"{label}:'{term}'")
+            return matched
+
+        for qt in query_tokens:
+            # Exact name match, else prefix match in either direction ("norm" <-> "normal")
+            exact = add(FIELD_NAME, qt, self.WEIGHT_NAME_EXACT, "name")
+            prefixed = index.name_prefix_docs(qt, either_direction=True) - exact.keys()
+            if prefixed:
+                score = self.WEIGHT_NAME_PREFIX * index.idf(len(prefixed))
+                for doc_id in prefixed:
+                    scores[doc_id] += score
+                    reasons[doc_id].append(f"name_prefix:'{qt}'")
+
+            add(FIELD_DESC, qt, self.WEIGHT_DESC, "desc")
+            add(FIELD_NAMESPACE, qt, self.WEIGHT_NAMESPACE, "ns")
+            add(FIELD_PARAM, qt, self.WEIGHT_PARAM, "param")
+
+        # Apply domain penalty for mismatched domains
+        if query_domain is not None:
+            penalties: dict[str | None, float] = {}
+            for doc_id in scores:
+                tool_domain = index.entry(doc_id).domain
+                if tool_domain not in penalties:
+                    penalties[tool_domain] = compute_domain_penalty(query_domain, tool_domain)
+                penalty = penalties[tool_domain]
                 if penalty < 1.0:
-                    score *= penalty
-                    reasons.append(f"domain_penalty:{penalty:.1f}x({tool_domain})")
+                    scores[doc_id] *= penalty
+                    reasons[doc_id].append(f"domain_penalty:{penalty:.1f}x({tool_domain})")
+
+        return self._results(index, scores, reasons, min_score)
+
+    def _semantic_index(self) -> SemanticIndex[T]:
+        """The semantic index for the cached tools, loaded or rebuilt if the tool set changed."""
+        semantic, config = self._semantic, self._semantic_config
+        assert semantic is not None and config is not None
+        if self._semantic_generation == self._generation:
+            return semantic
+
+        tools = self._tool_cache or []
+        loaded = semantic.load(config.index_path, tools) if config.index_path else None
+        if loaded is not None and loaded.dimensions == config.dimensions:
+            semantic = loaded
+            logger.debug(f"Memory-mapped semantic index from {config.index_path}")
+        else:
+            semantic.build(tools)
+            if config.index_path:
+                semantic.save(config.index_path)
+        self._semantic = semantic
+        self._semantic_generation = self._generation
+        return semantic
+
+    @staticmethod
+    def _semantic_k(limit: int) -> int:
+        """Number of nearest tools to blend in for a search returning ``limit`` results."""
+        return max(limit, 10) * 2
+
+    def _blend_semantic(
+        self,
+        query: str,
+        results: list[SearchResult[T]],
+        limit: int,
+        hits: list[tuple[T, float]] | None = None,
+    ) -> list[SearchResult[T]]:
+        """Blend cosine similarity into lexical results and add tools only found semantically.
 
-            if score > min_score:
-                results.append(SearchResult(tool=tool, score=score, match_reasons=reasons))
+        Similarities are scaled to the best lexical score so that both parts
+        are comparable: ``(1 - w) * lexical + w * similarity * best``.
+        ``hits`` are the precomputed nearest tools for ``query``, if any.
+        """
+        config = self._semantic_config
+        assert config is not None
+        if config.weight <= 0:
+            return results
+        if hits is None:
+            hits = self._semantic_index().search(query, k=self._semantic_k(limit), min_similarity=config.min_similarity)
+        if not hits:
+            return results
+
+        weight = config.weight
+        scale = max((r.score for r in results), default=self.WEIGHT_NAME_EXACT)
+        similarity = {id(tool): sim for tool, sim in hits}
+
+        blended = []
+        for r in results:
+            sim = similarity.pop(id(r.tool), 0.0)
+            reasons = [*r.match_reasons, f"semantic:{sim:.2f}"] if sim else r.match_reasons
+            blended.append(
+                SearchResult(tool=r.tool, score=(1 - weight) * r.score + weight * sim * scale, match_reasons=reasons)
+            )
+        for tool, sim in hits:
+            if id(tool) in similarity:
+                blended.append(
+                    SearchResult(tool=tool, score=weight * sim * scale, match_reasons=[f"semantic:{sim:.2f}"])
+                )
 
-        results.sort(key=lambda r: r.score, reverse=True)
-        return results
+        blended.sort(key=lambda r: r.score, reverse=True)
+        return blended
 
     def _apply_session_boost(self, results: list[SearchResult[T]]) -> list[SearchResult[T]]:
         """Apply session-based boosting to search results.
@@ -717,7 +1396,7 @@ class ToolSearchEngine(Generic[T]):
     def _fuzzy_search(
         self,
         query: str,
-        tools: list[T],
+        index: ToolIndex[T],
         limit: int,
     ) -> list[SearchResult[T]]:
         """Fuzzy search as fallback when token matching fails."""
@@ -725,32 +1404,37 @@ class ToolSearchEngine(Generic[T]):
 
         query_lower = query.lower()
 
-        for tool in tools:
-            tool_name = getattr(tool, "name", "")
-            tool_desc = get_tool_description(tool)
-
-            # Check fuzzy match against name
-            name_score = fuzzy_score(query_lower, tool_name.lower(), threshold=0.5)
-
-            # Check fuzzy match against description words
-            desc_score = 0.0
-            if tool_desc:
-                desc_words = tool_desc.lower().split()
-                for word in desc_words:
-                    word_score = fuzzy_score(query_lower, word, threshold=0.6)
-                    if word_score > desc_score:
-                        desc_score = word_score
-
+        # Only names and description words sharing the most trigrams with the query are compared
+        name_candidates, word_candidates = index.fuzzy_candidates(query_lower, name_ratio=0.5, word_ratio=0.6)
+
+        # Check fuzzy match against name
+        name_scores: dict[int, float] = {}
+        for doc_id in name_candidates:
+            name_score = fuzzy_score(query_lower, index.entry(doc_id).name.lower(), threshold=0.5)
+            if name_score > 0:
+                name_scores[doc_id] = name_score
+
+        # Check fuzzy match against description words
+        desc_scores: dict[int, float] = {}
+        for word, doc_ids in word_candidates:
+            word_score = fuzzy_score(query_lower, word, threshold=0.6)
+            if word_score > 0:
+                for doc_id in doc_ids:
+                    if word_score > desc_scores.get(doc_id, 0.0):
+                        desc_scores[doc_id] = word_score
+
+        for doc_id in sorted(name_scores.keys() | desc_scores.keys()):
+            name_score = name_scores.get(doc_id, 0.0)
+            desc_score = desc_scores.get(doc_id, 0.0)
             total_score = (name_score * 10) + (desc_score * 3)
 
-            if total_score > 0:
-                reasons = []
-                if name_score > 0:
-                    reasons.append(f"fuzzy_name:{name_score:.2f}")
-                if desc_score > 0:
-                    reasons.append(f"fuzzy_desc:{desc_score:.2f}")
+            reasons = []
+            if name_score > 0:
+                reasons.append(f"fuzzy_name:{name_score:.2f}")
+            if desc_score > 0:
+                reasons.append(f"fuzzy_desc:{desc_score:.2f}")
 
-                results.append(SearchResult(tool=tool, score=total_score, match_reasons=reasons))
+            results.append(SearchResult(tool=index.entry(doc_id).tool, score=total_score, match_reasons=reasons))
 
         results.sort(key=lambda r: r.score, reverse=True)
         return results[:limit]
@@ -0,0 +1,281 @@
+# chuk_tool_processor/discovery/semantic.py
+"""Local vector-space tool search with a hashing TF-IDF vectorizer.
+
+The lexical stages of :class:`~chuk_tool_processor.discovery.search.ToolSearchEngine`
+only match query tokens (and their hand-maintained synonyms) exactly or by
+prefix, so paraphrases and inflections ("computing statistics" vs.
+"compute_stats") can miss. This module adds an optional semantic stage that
+needs no network, model download or GPU:
+
+- Each tool's name, description, namespace and parameter names are turned
+  into word and character-trigram features, hashed into a fixed number of
+  dimensions (the hashing trick), weighted by TF-IDF and L2-normalised.
+- The tool vectors live in one contiguous ``float32`` NumPy matrix, so a
+  query is a single matrix-vector product followed by ``argpartition`` top-k.
+- The matrix can be saved as an ``.npy`` file (with a small JSON sidecar)
+  and memory-mapped at startup instead of being recomputed.
+
+Requires NumPy (``pip install chuk-tool-processor[semantic]``).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import zlib
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+from chuk_tool_processor.discovery.search import tokenize, tool_key
+from chuk_tool_processor.discovery.searchable import get_tool_description, get_tool_parameters
+from chuk_tool_processor.discovery.synonyms import STOPWORDS
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+__all__ = ["HAS_NUMPY", "SemanticIndex", "SemanticSearchConfig"]
+
+# Relative weight of whole-word features over character trigrams
+_WORD_WEIGHT = 1.0
+_TRIGRAM_WEIGHT = 0.5
+# Name tokens count this many times as much as description tokens
+_NAME_BOOST = 2
+
+
+@dataclass(frozen=True)
+class SemanticSearchConfig:
+    """Settings for the optional semantic stage of ToolSearchEngine."""
+
+    # Share of the blended score given to semantic similarity (0 disables blending)
+    weight: float = 0.5
+    # Number of hashed feature dimensions (columns of the tool matrix)
+    dimensions: int = 1024
+    # Cosine similarity below which a tool is not considered a semantic match
+    min_similarity: float = 0.15
+    # Optional .npy file to persist the tool matrix to and memory-map it from
+    index_path: str | Path | None = None
+
+
+def _tool_text(tool: Any) -> tuple[list[str], list[str]]:
+    """Name tokens and other tokens (description, namespace, parameters) of a tool."""
+    name_tokens = tokenize(getattr(tool, "name", ""))
+    other = tokenize(get_tool_description(tool) or "") + tokenize(getattr(tool, "namespace", ""))
+    params = get_tool_parameters(tool)
+    if params and "properties" in params:
+        for param_name in params["properties"]:
+            other.extend(tokenize(param_name))
+    return name_tokens, other
+
+
+def _fingerprint(name_tokens: list[str], other: list[str]) -> int:
+    """Checksum of a tool's indexed text, to detect changed tools and stale files."""
+    return zlib.crc32(" ".join([*name_tokens, "|", *other]).encode())
+
+
+def _features(tokens: Iterable[str], dimensions: int, counts: dict[int, float], repeat: int = 1) -> None:
+    """Add hashed word and character-trigram features of ``tokens`` to ``counts``.
+
+    Uses CRC32 rather than ``hash()`` so that buckets are stable across
+    processes and persisted matrices stay valid. The top hash bit picks the
+    sign, which keeps collisions from only ever adding up.
+    """
+    for token in tokens:
+        if token in STOPWORDS:
+            continue
+        padded = f"<{token}>"
+        features = [(f"w:{token}", _WORD_WEIGHT)]
+        features.extend((padded[i : i + 3], _TRIGRAM_WEIGHT) for i in range(len(padded) - 2))
+        for feature, weight in features:
+            h = zlib.crc32(feature.encode())
+            bucket = h % dimensions
+            counts[bucket] = counts.get(bucket, 0.0) + (weight if h >> 31 else -weight) * repeat
+
+
+class SemanticIndex(Generic[T]):
+    """Hashed TF-IDF vectors of a tool set in one contiguous matrix.
+
+    Row ``i`` of :attr:`matrix` belongs to ``tools[i]``. Per-tool feature
+    counts are cached by tool key and a fingerprint of the tool's text, so
+    rebuilding after the tool set changes only re-vectorizes changed tools.
+    """
+
+    def __init__(self, dimensions: int = 1024) -> None:
+        if not HAS_NUMPY:
+            raise ImportError(
+                "NumPy is required for semantic tool search. Install it with: pip install chuk-tool-processor[semantic]"
+            )
+        self.dimensions = dimensions
+        self.tools: list[T] = []
+        self.matrix: Any = np.zeros((0, dimensions), dtype=np.float32)
+        self.idf: Any = np.ones(dimensions, dtype=np.float32)
+        # tool key -> (tool, fingerprint, sparse feature counts)
+        self._features: dict[tuple[str, str], tuple[T, int, dict[int, float]]] = {}
+        self._fingerprints: list[int] = []
+
+    # ------------------------------------------------------------------ #
+    # Building                                                           #
+    # ------------------------------------------------------------------ #
+
+    def _tool_features(self, tool: T) -> tuple[T, int, dict[int, float]]:
+        cached = self._features.get(tool_key(tool))
+        if cached is not None and cached[0] is tool:
+            return cached
+        name_tokens, other = _tool_text(tool)
+        fingerprint = _fingerprint(name_tokens, other)
+        if cached is not None and cached[1] == fingerprint:
+            return tool, fingerprint, cached[2]
+        counts: dict[int, float] = {}
+        _features(name_tokens, self.dimensions, counts, repeat=_NAME_BOOST)
+        _features(other, self.dimensions, counts)
+        return tool, fingerprint, counts
+
+    def build(self, tools: list[T]) -> None:
+        """(Re)compute the matrix for ``tools``, re-vectorizing only tools that changed."""
+        features = [self._tool_features(tool) for tool in tools]
+        self._features = {tool_key(tool): feats for tool, feats in zip(tools, features, strict=True)}
+        self._fingerprints = [fingerprint for _, fingerprint, _ in features]
+        self.tools = list(tools)
+
+        rows = np.repeat(np.arange(len(features)), [len(counts) for _, _, counts in features])
+        cols = np.fromiter((b for _, _, counts in features for b in counts), dtype=np.int64, count=len(rows))
+        vals = np.fromiter((v for _, _, counts in features for v in counts.values()), dtype=np.float32, count=len(rows))
+
+        # Smoothed idf over the buckets each tool uses
+        doc_freq = np.bincount(cols, minlength=self.dimensions).astype(np.float32)
+        self.idf = (np.log((1.0 + len(tools)) / (1.0 + doc_freq)) + 1.0).astype(np.float32)
+
+        matrix = np.zeros((len(tools), self.dimensions), dtype=np.float32)
+        matrix[rows, cols] = vals * self.idf[cols]
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        self.matrix = matrix
+
+    def matches(self, tools: list[T]) -> bool:
+        """True if the matrix was built for exactly these tools (by key and text)."""
+        if len(tools) != len(self.tools):
+            return False
+        for tool, fingerprint in zip(tools, self._fingerprints, strict=True):
+            if _fingerprint(*_tool_text(tool)) != fingerprint:
+                return False
+        return True
+
+    # ------------------------------------------------------------------ #
+    # Querying                                                           #
+    # ------------------------------------------------------------------ #
+
+    def query_vector(self, query: str) -> Any:
+        """Normalised TF-IDF vector of ``query`` in the tool space."""
+        counts: dict[int, float] = {}
+        _features(tokenize(query), self.dimensions, counts)
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        if counts:
+            buckets = np.fromiter(counts, dtype=np.int64, count=len(counts))
+            vector[buckets] = np.fromiter(counts.values(), dtype=np.float32, count=len(counts)) * self.idf[buckets]
+            norm = float(np.linalg.norm(vector))
+            if norm > 0:
+                vector /= norm
+        return vector
+
+    def search(self, query: str, k: int, min_similarity: float = 0.0) -> list[tuple[T, float]]:
+        """Top ``k`` tools by cosine similarity to ``query``, best first."""
+        if not self.tools or k <= 0:
+            return []
+        return self._top(self.matrix @ self.query_vector(query), k, min_similarity)
+
+    def search_many(self, queries: list[str], k: int, min_similarity: float = 0.0) -> list[list[tuple[T, float]]]:
+        """:meth:`search` for several queries, scored with a single matrix product."""
+        if not self.tools or k <= 0 or not queries:
+            return [[] for _ in queries]
+        vectors = np.stack([self.query_vector(query) for query in queries])
+        scores = vectors @ self.matrix.T
+        return [self._top(row, k, min_similarity) for row in scores]
+
+    def _top(self, scores: Any, k: int, min_similarity: float) -> list[tuple[T, float]]:
+        n = len(self.tools)
+        k = min(k, n)
+        top = np.argpartition(-scores, k - 1)[:k] if k < n else np.arange(n)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.tools[i], float(scores[i])) for i in top if scores[i] > min_similarity]
+
+    # ------------------------------------------------------------------ #
+    # Persistence                                                        #
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _npy_path(path: str | Path) -> Path:
+        """``path`` with the ``.npy`` suffix that ``np.save`` would add to it."""
+        path = Path(path)
+        return path if path.suffix == ".npy" else path.with_name(path.name + ".npy")
+
+    @staticmethod
+    def _meta_path(path: Path) -> Path:
+        return path.with_suffix(".json")
+
+    @staticmethod
+    def _write_atomic(path: Path, write: Callable[[Any], None]) -> None:
+        """Write ``path`` through ``write(fh)`` atomically (temp file + rename)."""
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                write(fh)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    def save(self, path: str | Path) -> None:
+        """Write the matrix to ``path`` (``.npy``) and keys, fingerprints and idf next to it."""
+        path = self._npy_path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "dimensions": self.dimensions,
+            "keys": [list(tool_key(tool)) for tool in self.tools],
+            "fingerprints": self._fingerprints,
+            "idf": [float(x) for x in self.idf],
+        }
+        self._write_atomic(path, lambda fh: np.save(fh, self.matrix, allow_pickle=False))
+        self._write_atomic(self._meta_path(path), lambda fh: fh.write(json.dumps(meta).encode()))
+
+    @classmethod
+    def load(cls, path: str | Path, tools: list[T]) -> SemanticIndex[T] | None:
+        """Memory-map a saved matrix if it was built for ``tools``; None if missing or stale."""
+        path = cls._npy_path(path)
+        meta_path = cls._meta_path(path)
+        if not path.exists() or not meta_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text())
+            matrix = np.load(path, mmap_mode="r", allow_pickle=False)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable semantic index {path}: {e}")
+            return None
+
+        index: SemanticIndex[T] = cls(dimensions=int(meta["dimensions"]))
+        index.tools = list(tools)
+        index._fingerprints = [int(f) for f in meta["fingerprints"]]
+        keys = [tuple(key) for key in meta["keys"]]
+        if (
+            matrix.shape != (len(keys), index.dimensions)
+            or keys != [tool_key(tool) for tool in tools]
+            or not index.matches(tools)
+        ):
+            logger.debug(f"Semantic index {path} is stale; rebuilding")
+            return None
+
+        index.matrix = matrix
+        index.idf = np.asarray(meta["idf"], dtype=np.float32)
+        return index
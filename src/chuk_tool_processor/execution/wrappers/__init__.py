@@ -1,6 +1,13 @@
 # chuk_tool_processor/execution/wrappers/__init__.py
 """Execution wrappers for adding production features to tool execution."""
 
+from chuk_tool_processor.execution.wrappers.adaptive_concurrency import (
+    AdaptiveConcurrencyConfig,
+    AdaptiveConcurrencyExecutor,
+    AdaptiveLimiter,
+    AdaptiveLimiterStats,
+    ConcurrencyLimitAlgorithm,
+)
 from chuk_tool_processor.execution.wrappers.caching import (
     CacheInterface,
     CachingToolExecutor,
@@ -24,6 +31,7 @@ from chuk_tool_processor.execution.wrappers.factory import (
     create_production_executor,
     create_rate_limiter,
 )
+from chuk_tool_processor.execution.wrappers.latency_tracking import LatencyTrackingExecutor
 from chuk_tool_processor.execution.wrappers.observable import (
     ObservableExecutor,
     TracingExecutorMixin,
@@ -67,6 +75,12 @@ except ImportError:
     _redis_available = False
 
 __all__ = [
+    # Adaptive concurrency
+    "AdaptiveConcurrencyConfig",
+    "AdaptiveConcurrencyExecutor",
+    "AdaptiveLimiter",
+    "AdaptiveLimiterStats",
+    "ConcurrencyLimitAlgorithm",
     # Caching
     "CacheInterface",
     "CachingToolExecutor",
@@ -76,6 +90,8 @@ __all__ = [
     "CircuitBreakerConfig",
     "CircuitBreakerExecutor",
     "CircuitState",
+    # Latency tracking
+    "LatencyTrackingExecutor",
     # Rate limiting
     "RateLimitedToolExecutor",
     "RateLimiter",
@@ -0,0 +1,411 @@
+# chuk_tool_processor/execution/wrappers/adaptive_concurrency.py
+"""
+Adaptive concurrency limiting for tool execution.
+
+A static ``max_concurrency`` is either too low when downstreams are idle or
+too high when they slow down.  This wrapper keeps a per-tool in-flight limit
+that is continuously adjusted from observed latency and errors, in the style
+of Netflix *concurrency-limits*:
+
+* **AIMD** - additive increase while calls succeed, multiplicative decrease
+  on errors or latency above ``latency_threshold``.
+* **Gradient** - compares short-term latency against a long-term baseline
+  and shrinks the limit as queueing delay builds up.
+
+Callers above the current limit wait in a FIFO queue and are admitted as soon
+as a slot frees up.  The current limit, in-flight count and queue depth are
+exported through :meth:`AdaptiveConcurrencyExecutor.get_limiter_stats` and
+Prometheus gauges.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from chuk_tool_processor.logging import get_logger
+from chuk_tool_processor.models.tool_call import ToolCall
+from chuk_tool_processor.models.tool_result import ToolResult
+
+logger = get_logger("chuk_tool_processor.execution.wrappers.adaptive_concurrency")
+
+# Optional observability imports
+try:
+    from chuk_tool_processor.observability.metrics import get_metrics
+
+    _observability_available = True
+except ImportError:
+    _observability_available = False
+
+    # No-op function when observability not available
+    def get_metrics():
+        return None
+
+
+# --------------------------------------------------------------------------- #
+# Configuration
+# --------------------------------------------------------------------------- #
+class ConcurrencyLimitAlgorithm(StrEnum):
+    """Algorithms for adjusting the concurrency limit."""
+
+    AIMD = "aimd"  # Additive increase, multiplicative decrease
+    GRADIENT = "gradient"  # Latency-gradient based (Netflix Gradient2)
+
+
+class AdaptiveConcurrencyConfig(BaseModel):
+    """
+    Configuration for adaptive concurrency limiting.
+
+    Attributes:
+        algorithm: Limit adjustment algorithm
+        initial_limit: Starting in-flight limit per tool
+        min_limit: Lower bound for the limit
+        max_limit: Upper bound for the limit
+        backoff_ratio: Multiplier applied to the limit on errors (and, for AIMD,
+            on latency above ``latency_threshold``)
+        latency_threshold: AIMD only - latency (s) treated as overload (None = errors only)
+        tolerance: Gradient only - accepted ratio of short to long latency before shrinking
+        smoothing: Gradient only - weight of each new limit estimate (0-1]
+        long_window: Gradient only - number of samples in the long-term latency average
+    """
+
+    model_config = ConfigDict(extra="forbid", validate_default=True)
+
+    algorithm: ConcurrencyLimitAlgorithm = Field(
+        default=ConcurrencyLimitAlgorithm.AIMD,
+        description="Limit adjustment algorithm",
+    )
+    initial_limit: int = Field(default=10, ge=1, description="Starting in-flight limit per tool")
+    min_limit: int = Field(default=1, ge=1, description="Lower bound for the limit")
+    max_limit: int = Field(default=200, ge=1, description="Upper bound for the limit")
+    backoff_ratio: float = Field(
+        default=0.9,
+        gt=0.0,
+        lt=1.0,
+        description="Multiplier applied to the limit when a call is dropped",
+    )
+    latency_threshold: float | None = Field(
+        default=None,
+        gt=0.0,
+        description="AIMD: latency in seconds treated as overload (None = errors only)",
+    )
+    tolerance: float = Field(
+        default=1.5,
+        ge=1.0,
+        description="Gradient: accepted ratio of short-term to long-term latency",
+    )
+    smoothing: float = Field(
+        default=0.2,
+        gt=0.0,
+        le=1.0,
+        description="Gradient: weight given to each new limit estimate",
+    )
+    long_window: int = Field(
+        default=600,
+        ge=1,
+        description="Gradient: number of samples in the long-term latency average",
+    )
+
+    @model_validator(mode="after")
+    def _check_bounds(self) -> AdaptiveConcurrencyConfig:
+        if not self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError("Limits must satisfy min_limit <= initial_limit <= max_limit")
+        return self
+
+
+class AdaptiveLimiterStats(BaseModel):
+    """Point-in-time statistics for one adaptive limiter."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    tool: str = Field(description="Tool name")
+    algorithm: ConcurrencyLimitAlgorithm = Field(description="Limit adjustment algorithm")
+    limit: int = Field(ge=1, description="Current in-flight limit")
+    in_flight: int = Field(ge=0, description="Calls currently executing")
+    queue_depth: int = Field(ge=0, description="Calls waiting for a slot")
+    samples: int = Field(default=0, ge=0, description="Completed calls observed")
+    drops: int = Field(default=0, ge=0, description="Calls counted as errors or overload")
+    long_latency: float | None = Field(default=None, description="Long-term latency baseline in seconds")
+
+
+# --------------------------------------------------------------------------- #
+# Per-tool limiter
+# --------------------------------------------------------------------------- #
+class AdaptiveLimiter:
+    """
+    Per-tool adaptive concurrency limiter with a FIFO wait queue.
+
+    All state changes happen synchronously between ``await`` points, so no
+    lock is needed on a single event loop.
+    """
+
+    def __init__(self, tool: str, config: AdaptiveConcurrencyConfig):
+        self.tool = tool
+        self.config = config
+        self._limit = float(config.initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._queued = 0
+        self._long_latency: float | None = None
+        self._samples = 0
+        self._drops = 0
+
+    @property
+    def limit(self) -> int:
+        """Current in-flight limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers waiting for a slot."""
+        return self._queued
+
+    async def acquire(self) -> None:
+        """Wait for an in-flight slot, queuing FIFO behind earlier callers."""
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._queued += 1
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was granted as we were cancelled - hand it on
+                self._in_flight -= 1
+                self._wake_waiters()
+            else:
+                # Still queued; the entry is skipped when it reaches the front
+                self._queued -= 1
+            raise
+
+    def release(self, latency: float | None, *, dropped: bool = False) -> None:
+        """
+        Release a slot and feed the observation into the limit algorithm.
+
+        Args:
+            latency: Observed call latency in seconds (None = ignore the sample)
+            dropped: Whether the call failed or timed out
+        """
+        if latency is not None:
+            self._on_sample(latency, dropped)
+        self._in_flight = max(0, self._in_flight - 1)
+        self._wake_waiters()
+
+    def get_stats(self) -> AdaptiveLimiterStats:
+        """Get current limiter statistics."""
+        return AdaptiveLimiterStats(
+            tool=self.tool,
+            algorithm=self.config.algorithm,
+            limit=self.limit,
+            in_flight=self._in_flight,
+            queue_depth=self.queue_depth,
+            samples=self._samples,
+            drops=self._drops,
+            long_latency=self._long_latency,
+        )
+
+    # ------------------------------------------------------------------ #
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            self._queued -= 1
+            waiter.set_result(None)
+
+    def _on_sample(self, latency: float, dropped: bool) -> None:
+        self._samples += 1
+        if self.config.algorithm == ConcurrencyLimitAlgorithm.GRADIENT:
+            new_limit = self._gradient(latency, dropped)
+        else:
+            new_limit = self._aimd(latency, dropped)
+
+        old_limit = self.limit
+        self._limit = min(float(self.config.max_limit), max(float(self.config.min_limit), new_limit))
+        if self.limit != old_limit:
+            logger.debug(f"Adaptive limit for '{self.tool}': {old_limit} -> {self.limit}")
+
+    def _aimd(self, latency: float, dropped: bool) -> float:
+        threshold = self.config.latency_threshold
+        if dropped or (threshold is not None and latency > threshold):
+            self._drops += 1
+            return self._limit * self.config.backoff_ratio
+
+        # Only grow when the current limit is actually being used
+        if self._in_flight * 2 >= self.limit:
+            return self._limit + 1.0
+        return self._limit
+
+    def _gradient(self, latency: float, dropped: bool) -> float:
+        if dropped:
+            self._drops += 1
+            return self._limit * self.config.backoff_ratio
+
+        latency = max(latency, 1e-6)
+        if self._long_latency is None:
+            self._long_latency = latency
+        else:
+            alpha = 2.0 / (self.config.long_window + 1)
+            self._long_latency += alpha * (latency - self._long_latency)
+            # Let the baseline recover quickly after a sustained slowdown ends
+            if self._long_latency / latency > 2.0:
+                self._long_latency *= 0.95
+
+        # Application-limited: not enough load to learn anything about the limit
+        if self._in_flight * 2 < self.limit:
+            return self._limit
+
+        gradient = max(0.5, min(1.0, self.config.tolerance * self._long_latency / latency))
+        estimate = self._limit * gradient + math.sqrt(self._limit)
+        return self._limit * (1.0 - self.config.smoothing) + estimate * self.config.smoothing
+
+
+# --------------------------------------------------------------------------- #
+# Executor wrapper
+# --------------------------------------------------------------------------- #
+class AdaptiveConcurrencyExecutor:
+    """
+    Executor wrapper that bounds per-tool concurrency with adaptive limits.
+
+    Calls in a batch are dispatched concurrently; each waits for a slot on its
+    tool's limiter before being forwarded to the wrapped executor.  Results are
+    returned in the same order as the input calls.
+    """
+
+    def __init__(
+        self,
+        executor: Any,
+        *,
+        default_config: AdaptiveConcurrencyConfig | None = None,
+        tool_configs: dict[str, AdaptiveConcurrencyConfig] | None = None,
+    ):
+        """
+        Initialize the adaptive concurrency executor.
+
+        Args:
+            executor: Underlying executor to wrap
+            default_config: Default limiter configuration
+            tool_configs: Per-tool limiter configurations
+        """
+        self.executor = executor
+        self.default_config = default_config or AdaptiveConcurrencyConfig()
+        self.tool_configs = tool_configs or {}
+        self._limiters: dict[str, AdaptiveLimiter] = {}
+
+    def _get_limiter(self, tool: str) -> AdaptiveLimiter:
+        """Get or create the limiter for a tool."""
+        limiter = self._limiters.get(tool)
+        if limiter is None:
+            limiter = AdaptiveLimiter(tool, self.tool_configs.get(tool, self.default_config))
+            self._limiters[tool] = limiter
+        return limiter
+
+    async def execute(
+        self,
+        calls: list[ToolCall],
+        *,
+        timeout: float | None = None,
+        use_cache: bool = True,
+    ) -> list[ToolResult]:
+        """
+        Execute tool calls under adaptive per-tool concurrency limits.
+
+        Args:
+            calls: List of tool calls to execute
+            timeout: Optional timeout for execution
+            use_cache: Whether to use cached results
+
+        Returns:
+            List of tool results in input order
+        """
+        if not calls:
+            return []
+
+        results = await asyncio.gather(*(self._execute_single(call, timeout, use_cache) for call in calls))
+        return list(results)
+
+    async def _execute_single(self, call: ToolCall, timeout: float | None, use_cache: bool) -> ToolResult:
+        limiter = self._get_limiter(call.tool)
+        try:
+            # Waiting for a slot is bounded by the call's own timeout
+            await asyncio.wait_for(limiter.acquire(), timeout)
+        except TimeoutError:
+            logger.debug(f"'{call.tool}' timed out after {timeout}s waiting for a concurrency slot")
+            now = datetime.now(UTC)
+            return ToolResult.create_error(
+                tool=call.tool,
+                error=f"Timeout after {timeout}s waiting for a concurrency slot",
+                call_id=call.id,
+                start_time=now,
+                end_time=now,
+                machine="adaptive_concurrency",
+                pid=0,
+            )
+        self._record_metrics(limiter)
+
+        start = time.monotonic()
+        latency: float | None = None
+        dropped = True
+        try:
+            executor_kwargs: dict[str, Any] = {"timeout": timeout}
+            if hasattr(self.executor, "use_cache"):
+                executor_kwargs["use_cache"] = use_cache
+
+            result_list = await self.executor.execute([call], **executor_kwargs)
+            result: ToolResult = result_list[0]
+            latency = time.monotonic() - start
+            dropped = result.error is not None
+            return result
+
+        except Exception as e:
+            latency = time.monotonic() - start
+            now = datetime.now(UTC)
+            return ToolResult.create_error(
+                tool=call.tool,
+                error=e,
+                call_id=call.id,
+                start_time=now,
+                end_time=now,
+                machine="adaptive_concurrency",
+                pid=0,
+            )
+
+        finally:
+            # Cancelled calls leave latency unset and are not sampled
+            limiter.release(latency, dropped=dropped)
+            self._record_metrics(limiter)
+
+    def _record_metrics(self, limiter: AdaptiveLimiter) -> None:
+        metrics = get_metrics()
+        if metrics:
+            metrics.record_concurrency_limit(
+                limiter.tool,
+                limit=limiter.limit,
+                in_flight=limiter.in_flight,
+                queue_depth=limiter.queue_depth,
+            )
+
+    def get_limiter_stats(self) -> dict[str, AdaptiveLimiterStats]:
+        """
+        Get current statistics of all adaptive limiters.
+
+        Returns:
+            Dict mapping tool name to limiter statistics
+        """
+        return {tool: limiter.get_stats() for tool, limiter in self._limiters.items()}
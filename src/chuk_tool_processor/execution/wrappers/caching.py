@@ -16,10 +16,11 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import inspect
 import json as stdlib_json  # Use stdlib json for consistent hashing
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
@@ -27,6 +28,9 @@ from chuk_tool_processor.logging import get_logger
 from chuk_tool_processor.models.tool_call import ToolCall
 from chuk_tool_processor.models.tool_result import ToolResult
 
+if TYPE_CHECKING:
+    from chuk_tool_processor.registry.interface import ToolRegistryInterface
+
 logger = get_logger("chuk_tool_processor.execution.wrappers.caching")
 
 # Optional observability imports
@@ -325,6 +329,17 @@ class InMemoryCache(CacheInterface):
             return stats
 
 
+def _reports_unavailable(value: Any) -> bool:
+    """
+    True for the structured failure payloads resilient tools return instead of raising.
+
+    :class:`~chuk_tool_processor.mcp.mcp_tool.MCPTool` reports timeouts and
+    unhealthy connections as ``{"error": ..., "available": False}`` results;
+    caching those would pin the failure for the whole TTL.
+    """
+    return isinstance(value, dict) and value.get("available") is False and "error" in value
+
+
 # --------------------------------------------------------------------------- #
 # Executor wrapper
 # --------------------------------------------------------------------------- #
@@ -335,6 +350,12 @@ class CachingToolExecutor:
     This wrapper intercepts tool calls, checks if results are available in cache,
     and only executes uncached calls. Successful results are automatically stored
     in the cache for future use.
+
+    Caching is opt-in: a tool is cached if it is listed in ``cacheable_tools``
+    or, when a ``registry`` is given, if its :class:`ToolMetadata` has
+    ``cacheable=True`` (its ``cache_ttl`` then overrides the default TTL).
+    Registry decisions are memoized per tool until the registry's
+    ``get_generation()`` changes; registries without one are asked every call.
     """
 
     def __init__(
@@ -345,6 +366,7 @@ class CachingToolExecutor:
         default_ttl: int | None = None,
         tool_ttls: dict[str, int] | None = None,
         cacheable_tools: list[str] | None = None,
+        registry: ToolRegistryInterface | None = None,
     ) -> None:
         """
         Initialize the caching executor.
@@ -355,12 +377,17 @@ class CachingToolExecutor:
             default_ttl: Default time-to-live in seconds
             tool_ttls: Dict mapping tool names to custom TTL values
             cacheable_tools: List of tool names that should be cached. If None, no tools are cacheable (opt-in).
+            registry: Optional registry whose tool metadata (``cacheable``, ``cache_ttl``) also marks tools cacheable
         """
         self.executor = executor
         self.cache = cache
         self.default_ttl = default_ttl
         self.tool_ttls = tool_ttls or {}
         self.cacheable_tools = set(cacheable_tools) if cacheable_tools else None
+        self.registry = registry
+        # (tool, namespace) -> (cacheable, ttl), valid for _policy_generation
+        self._policies: dict[tuple[str, str], tuple[bool, int | None]] = {}
+        self._policy_generation: int | None = None
 
         logger.debug(
             f"Initialized CachingToolExecutor with {len(self.tool_ttls)} custom TTLs, default TTL={default_ttl}s"
@@ -412,6 +439,71 @@ class CachingToolExecutor:
         """
         return self.tool_ttls.get(tool, self.default_ttl)
 
+    @staticmethod
+    async def _lookup_metadata(registry: ToolRegistryInterface, call: ToolCall) -> Any:
+        """Find the registry metadata for ``call``'s tool, or None."""
+        if "." in call.tool:
+            namespace, name = call.tool.split(".", 1)
+            metadata = await registry.get_metadata(name, namespace)
+            if metadata is not None:
+                return metadata
+
+        metadata = await registry.get_metadata(call.tool, call.namespace)
+        if metadata is None and call.namespace != "default":
+            metadata = await registry.get_metadata(call.tool, "default")
+        if metadata is None:
+            for namespace in await registry.list_namespaces():
+                metadata = await registry.get_metadata(call.tool, namespace)
+                if metadata is not None:
+                    break
+        return metadata
+
+    async def _cache_policy(self, call: ToolCall) -> tuple[bool, int | None]:
+        """
+        Resolve whether ``call`` is cacheable and with which TTL.
+
+        Explicit ``cacheable_tools`` win; otherwise the registry metadata is
+        consulted, resolving the tool the way the execution strategies do
+        (dotted name, call namespace, ``default``, then any namespace).
+
+        Returns:
+            Tuple of (cacheable, ttl)
+        """
+        if self._is_cacheable(call.tool):
+            return True, self._ttl_for(call.tool)
+        if self.registry is None:
+            return False, None
+
+        key = (call.tool, call.namespace)
+        policy = self._policies.get(key)
+        if policy is not None:
+            return policy
+
+        try:
+            metadata = await self._lookup_metadata(self.registry, call)
+        except Exception as e:
+            logger.debug(f"Cache policy lookup failed for {call.tool}: {e}")
+            return False, None
+
+        if metadata is None or metadata.cacheable is not True:
+            policy = (False, None)
+        else:
+            ttl = metadata.cache_ttl if metadata.cache_ttl is not None else self._ttl_for(call.tool)
+            policy = (True, ttl)
+        if self._policy_generation is not None:
+            self._policies[key] = policy
+        return policy
+
+    async def _refresh_policies(self) -> None:
+        """Drop memoized cache policies if the registry changed since they were resolved."""
+        get_generation = getattr(self.registry, "get_generation", None)
+        generation = await get_generation() if inspect.iscoroutinefunction(get_generation) else None
+        if not isinstance(generation, int):
+            generation = None
+        if generation is None or generation != self._policy_generation:
+            self._policies.clear()
+        self._policy_generation = generation
+
     # ------------------------------ API ------------------------------- #
     async def execute(
         self,
@@ -440,10 +532,14 @@ class CachingToolExecutor:
         # ------------------------------------------------------------------
         cached_hits: list[tuple[int, ToolResult]] = []
         uncached: list[tuple[int, ToolCall]] = []
+        ttls: dict[int, int | None] = {}
 
         if use_cache:
+            if self.registry is not None:
+                await self._refresh_policies()
             for idx, call in enumerate(calls):
-                if not self._is_cacheable(call.tool):
+                cacheable, ttl = await self._cache_policy(call)
+                if not cacheable:
                     logger.debug(f"Tool {call.tool} is not cacheable, executing directly")
                     uncached.append((idx, call))
                     continue
@@ -451,6 +547,7 @@ class CachingToolExecutor:
                 # Use idempotency_key if available, otherwise hash arguments
                 # PERFORMANCE: Only compute idempotency key when caching is actually used
                 cache_key = call.get_idempotency_key()
+                ttls[idx] = ttl
 
                 # Trace cache lookup operation
                 with trace_cache_operation("lookup", call.tool):
@@ -512,9 +609,9 @@ class CachingToolExecutor:
             cache_tasks = []
             metrics = get_metrics()
 
-            for (_idx, call), result in zip(uncached, uncached_results, strict=False):
-                if result.error is None and self._is_cacheable(call.tool):
-                    ttl = self._ttl_for(call.tool)
+            for (idx, call), result in zip(uncached, uncached_results, strict=False):
+                if result.error is None and idx in ttls and not _reports_unavailable(result.result):
+                    ttl = ttls[idx]
                     logger.debug(f"Caching result for {call.tool} with TTL={ttl}s")
 
                     # Use idempotency_key if available, otherwise hash arguments
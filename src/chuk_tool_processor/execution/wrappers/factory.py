@@ -212,6 +212,7 @@ async def create_circuit_breaker(
             default_config=config,
             tool_configs=tool_configs,
             key_prefix=key_prefix,
+            local_cache=settings.get("local_cache", False),
         )
         logger.info(f"Created Redis circuit breaker: {redis_url}")
         return breaker
@@ -286,7 +287,8 @@ async def create_rate_limiter(
         backend: Backend type (MEMORY, REDIS, or AUTO)
         redis_url: Redis connection URL (only used for REDIS backend)
         key_prefix: Key prefix for Redis storage (only used for REDIS backend)
-        **settings: Rate limiter settings (global_limit, global_period, tool_limits)
+        **settings: Rate limiter settings (global_limit, global_period, tool_limits;
+            the REDIS backend also accepts lease_size and lease_ttl)
 
     Returns:
         Rate limiter instance implementing RateLimiterInterface
@@ -328,6 +330,8 @@ async def create_rate_limiter(
             global_period=settings.get("global_period", 60.0),
             tool_limits=settings.get("tool_limits"),
             key_prefix=key_prefix,
+            lease_size=settings.get("lease_size", 1),
+            lease_ttl=settings.get("lease_ttl", 1.0),
         )
         logger.info(f"Created Redis rate limiter: {redis_url}")
         return limiter
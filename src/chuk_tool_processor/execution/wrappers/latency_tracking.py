@@ -0,0 +1,93 @@
+# chuk_tool_processor/execution/wrappers/latency_tracking.py
+"""
+Feed observed tool latencies into a LatencyModel.
+
+The wrapper forwards calls unchanged and records the duration of every
+completed call in a :class:`~chuk_tool_processor.scheduling.latency_model.LatencyModel`,
+which can then fill ``ToolMetadata.est_ms`` for scheduling. It should sit
+directly on the execution strategy so that cache hits, retries and queueing in
+outer wrappers do not distort the samples:
+
+* Successful calls are recorded with their duration.
+* Calls that hit the timeout are recorded at the time they ran for - a lower
+  bound on their real latency, but dropping them would bias estimates low
+  for exactly the slow tools.
+* Other failures (and cached results) are not recorded.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from chuk_tool_processor.logging import get_logger
+from chuk_tool_processor.models.tool_call import ToolCall
+from chuk_tool_processor.models.tool_result import ToolResult
+from chuk_tool_processor.scheduling.latency_model import LatencyModel
+
+logger = get_logger("chuk_tool_processor.execution.wrappers.latency_tracking")
+
+
+class LatencyTrackingExecutor:
+    """
+    Executor wrapper that records per-call latency in a LatencyModel.
+
+    Example:
+        >>> model = LatencyModel(by_arg_shape=True)
+        >>> executor = LatencyTrackingExecutor(InProcessStrategy(registry), model)
+        >>> await executor.execute(calls)
+        >>> model.estimate_ms("search")
+        182
+    """
+
+    def __init__(self, executor: Any, model: LatencyModel):
+        """
+        Initialize the latency tracking executor.
+
+        Args:
+            executor: Underlying executor to wrap
+            model: Latency model that receives the observations
+        """
+        self.executor = executor
+        self.model = model
+
+    async def execute(
+        self,
+        calls: list[ToolCall],
+        *,
+        timeout: float | None = None,
+        use_cache: bool = True,
+    ) -> list[ToolResult]:
+        """
+        Execute tool calls and record their latencies.
+
+        Args:
+            calls: List of tool calls to execute
+            timeout: Optional timeout for execution
+            use_cache: Whether to use cached results
+
+        Returns:
+            The wrapped executor's results, unchanged
+        """
+        if not calls:
+            return []
+
+        executor_kwargs: dict[str, Any] = {"timeout": timeout}
+        if hasattr(self.executor, "use_cache"):
+            executor_kwargs["use_cache"] = use_cache
+        results: list[ToolResult] = await self.executor.execute(calls, **executor_kwargs)
+
+        calls_by_id = {call.id: call for call in calls}
+        for result in results:
+            call = calls_by_id.get(result.call_id or "")
+            if call is not None:
+                self._record(call, result, timeout)
+        return results
+
+    def _record(self, call: ToolCall, result: ToolResult, timeout: float | None) -> None:
+        if result.cached:
+            return
+        duration = result.duration
+        # Allow for clock granularity between the strategy's timestamps and its timer
+        timed_out = result.error is not None and timeout is not None and duration >= timeout * 0.95
+        if result.error is None or timed_out:
+            self.model.observe(call.tool, duration * 1000, call.arguments)
@@ -7,9 +7,18 @@ Two layers of limits are enforced:
 * **Global** - ``<N requests> / <period>`` over *all* tools.
 * **Per-tool** - independent ``<N requests> / <period>`` windows.
 
-A simple sliding-window algorithm with timestamp queues is used.
-`asyncio.Lock` guards shared state so the wrapper can be used safely from
-multiple coroutines.
+By default each limit is a sliding window: the first ``limit`` calls pass
+immediately and no window of length ``period`` admits more than ``limit``.
+The window keeps the start times of the last ``limit`` slots in a fixed-size
+ring, so acquisition is O(1).  With an explicit ``burst`` a limit is enforced
+with GCRA (Generic Cell Rate Algorithm) instead: ``limit / period`` becomes a
+sustained rate, ``burst`` calls may pass back-to-back, and a single window can
+admit up to ``limit + burst - 1`` calls.
+
+Either way, callers that must wait reserve the next slot in arrival order and
+sleep exactly until it is due, giving FIFO fairness without a thundering herd
+of re-contending waiters.  State is only touched between ``await`` points, so
+no lock is needed within an event loop.
 """
 
 from __future__ import annotations
@@ -17,6 +26,7 @@ from __future__ import annotations
 import asyncio
 import inspect
 import time
+from collections import deque
 from typing import Any
 
 from chuk_tool_processor.logging import get_logger
@@ -44,6 +54,113 @@ except ImportError:
         return nullcontext()
 
 
+# --------------------------------------------------------------------------- #
+# Buckets
+# --------------------------------------------------------------------------- #
+class _WindowBucket:
+    """
+    Sliding-window state for a single ``limit / period`` window.
+
+    ``slots`` holds the start times of the last ``limit`` reservations, oldest
+    first.  A new reservation starts once the oldest of them has left the
+    window, so every operation is O(1).  Reservations are handed out in call
+    order, which forms an implicit FIFO queue.
+    """
+
+    __slots__ = ("limit", "period", "slots", "seq")
+
+    def __init__(self, limit: int, period: float) -> None:
+        if limit < 1:
+            raise ValueError(f"Rate limit must be >= 1, got {limit}")
+        self.limit = limit
+        self.period = period
+        self.slots: deque[float] = deque(maxlen=limit)
+        self.seq = 0
+
+    def reserve(self, now: float) -> tuple[float, tuple[int, float | None]]:
+        """
+        Reserve the next slot.
+
+        Returns:
+            Tuple of (seconds to wait, token for :meth:`cancel`)
+        """
+        start = now
+        evicted: float | None = None
+        if len(self.slots) == self.limit:
+            evicted = self.slots[0]
+            start = max(now, evicted + self.period)
+        self.slots.append(start)
+        self.seq += 1
+        return start - now, (self.seq, evicted)
+
+    def cancel(self, token: tuple[int, float | None]) -> None:
+        """Give back a reservation if no later caller has reserved after it."""
+        seq, evicted = token
+        if seq != self.seq:
+            return
+        self.slots.pop()
+        if evicted is not None:
+            self.slots.appendleft(evicted)
+        self.seq -= 1
+
+    def is_limited(self, now: float) -> bool:
+        """Whether a request arriving now would have to wait."""
+        return len(self.slots) == self.limit and self.slots[0] + self.period > now
+
+
+class _GcraBucket:
+    """
+    Generic Cell Rate Algorithm state for a ``limit / period`` rate with a burst.
+
+    Only the *theoretical arrival time* (TAT) of the next request is stored,
+    so every operation is O(1).  Callers reserve a slot and are told exactly
+    how long to wait for it; reservations are handed out in call order, which
+    forms an implicit FIFO queue without any re-contention on wake-up.
+    """
+
+    __slots__ = ("emission_interval", "tolerance", "tat")
+
+    def __init__(self, limit: int, period: float, burst: int) -> None:
+        if limit < 1:
+            raise ValueError(f"Rate limit must be >= 1, got {limit}")
+        if burst < 1:
+            raise ValueError(f"Burst must be >= 1, got {burst}")
+
+        self.emission_interval = period / limit
+        self.tolerance = self.emission_interval * (burst - 1)
+        self.tat = 0.0
+
+    def reserve(self, now: float) -> tuple[float, float]:
+        """
+        Reserve the next slot.
+
+        Returns:
+            Tuple of (seconds to wait, TAT after this reservation)
+        """
+        tat = max(self.tat, now)
+        self.tat = tat + self.emission_interval
+        return max(0.0, tat - self.tolerance - now), self.tat
+
+    def cancel(self, reserved_tat: float) -> None:
+        """Give back a reservation if no later caller has reserved after it."""
+        if self.tat == reserved_tat:
+            self.tat -= self.emission_interval
+
+    def is_limited(self, now: float) -> bool:
+        """Whether a request arriving now would have to wait."""
+        return max(self.tat, now) - self.tolerance > now
+
+
+_Bucket = _WindowBucket | _GcraBucket
+
+
+def _make_bucket(limit: int, period: float, burst: int | None) -> _Bucket:
+    """Sliding window by default; GCRA when a burst is configured."""
+    if burst is None:
+        return _WindowBucket(limit, period)
+    return _GcraBucket(limit, period, burst)
+
+
 # --------------------------------------------------------------------------- #
 # Core limiter
 # --------------------------------------------------------------------------- #
@@ -51,8 +168,13 @@ class RateLimiter:
     """
     Async-native rate limiter for controlling execution frequency.
 
-    Implements a sliding window algorithm to enforce rate limits both globally
-    and per-tool. All operations are thread-safe using asyncio locks.
+    Enforces rate limits both globally and per-tool.  By default each limit
+    is a sliding window: the first ``limit`` requests pass immediately and at
+    most ``limit`` are admitted in any ``period``.  Configuring a burst
+    switches that limit to GCRA (a token bucket expressed as a single
+    timestamp): ``burst`` requests may pass back-to-back and ``limit / period``
+    becomes the sustained rate.  Acquisition is O(1) and blocked callers are
+    admitted in FIFO order, each sleeping exactly until its own slot.
     """
 
     def __init__(
@@ -61,6 +183,8 @@ class RateLimiter:
         global_limit: int | None = None,
         global_period: float = 60.0,
         tool_limits: dict[str, tuple[int, float]] | None = None,
+        global_burst: int | None = None,
+        tool_bursts: dict[str, int] | None = None,
     ) -> None:
         """
         Initialize the rate limiter.
@@ -69,18 +193,21 @@ class RateLimiter:
             global_limit: Maximum global requests per period (None = no limit)
             global_period: Time period in seconds for the global limit
             tool_limits: Dict mapping tool names to (limit, period) tuples
+            global_burst: Requests allowed back-to-back globally; enables GCRA with
+                global_limit/global_period as the sustained rate (None = sliding window)
+            tool_bursts: Dict mapping tool names to burst sizes; enables GCRA for those
+                tools (default: sliding window)
         """
         self.global_limit = global_limit
         self.global_period = global_period
         self.tool_limits = tool_limits or {}
+        self.global_burst = global_burst
+        self.tool_bursts = tool_bursts or {}
 
-        # Timestamp queues
-        self._global_ts: list[float] = []
-        self._tool_ts: dict[str, list[float]] = {}
-
-        # Locks for thread safety
-        self._global_lock = asyncio.Lock()
-        self._tool_locks: dict[str, asyncio.Lock] = {}
+        self._global_bucket = (
+            _make_bucket(global_limit, global_period, global_burst) if global_limit is not None else None
+        )
+        self._tool_buckets: dict[str, _Bucket] = {}
 
         logger.debug(
             f"Initialized rate limiter: global={global_limit}/{global_period}s, "
@@ -88,57 +215,39 @@ class RateLimiter:
         )
 
     # --------------------- helpers -------------------- #
-    async def _acquire_global(self) -> None:
-        """Block until a global slot is available."""
-        if self.global_limit is None:
+    def _get_tool_bucket(self, tool: str) -> _Bucket | None:
+        """Get or lazily create the bucket for a tool (None if unlimited)."""
+        bucket = self._tool_buckets.get(tool)
+        if bucket is None and tool in self.tool_limits:
+            limit, period = self.tool_limits[tool]
+            bucket = _make_bucket(limit, period, self.tool_bursts.get(tool))
+            self._tool_buckets[tool] = bucket
+        return bucket
+
+    @staticmethod
+    async def _acquire(bucket: _Bucket | None, scope: str) -> None:
+        """Reserve a slot in ``bucket`` and sleep until it is due."""
+        if bucket is None:
             return
 
-        while True:
-            async with self._global_lock:
-                now = time.monotonic()
-                cutoff = now - self.global_period
-
-                # Prune expired timestamps
-                self._global_ts = [t for t in self._global_ts if t > cutoff]
-
-                # Check if we're under the limit
-                if len(self._global_ts) < self.global_limit:
-                    self._global_ts.append(now)
-                    return
-
-                # Calculate wait time until a slot becomes available
-                wait = (self._global_ts[0] + self.global_period) - now
+        wait, reservation = bucket.reserve(time.monotonic())
+        if wait <= 0:
+            return
 
-            logger.debug(f"Global rate limit reached, waiting {wait:.2f}s")
+        logger.debug(f"{scope} rate limit reached, waiting {wait:.2f}s")
+        try:
             await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            bucket.cancel(reservation)
+            raise
+
+    async def _acquire_global(self) -> None:
+        """Block until a global slot is available."""
+        await self._acquire(self._global_bucket, "Global")
 
     async def _acquire_tool(self, tool: str) -> None:
         """Block until a per-tool slot is available (if the tool has a limit)."""
-        if tool not in self.tool_limits:
-            return
-
-        limit, period = self.tool_limits[tool]
-        lock = self._tool_locks.setdefault(tool, asyncio.Lock())
-        buf = self._tool_ts.setdefault(tool, [])
-
-        while True:
-            async with lock:
-                now = time.monotonic()
-                cutoff = now - period
-
-                # Prune expired timestamps in-place
-                buf[:] = [t for t in buf if t > cutoff]
-
-                # Check if we're under the limit
-                if len(buf) < limit:
-                    buf.append(now)
-                    return
-
-                # Calculate wait time until a slot becomes available
-                wait = (buf[0] + period) - now
-
-            logger.debug(f"Tool '{tool}' rate limit reached, waiting {wait:.2f}s")
-            await asyncio.sleep(wait)
+        await self._acquire(self._get_tool_bucket(tool), f"Tool '{tool}'")
 
     # ----------------------- public -------------------- #
     async def wait(self, tool: str) -> None:
@@ -167,27 +276,10 @@ class RateLimiter:
         Returns:
             Tuple of (global_limit_reached, tool_limit_reached)
         """
-        global_limited = False
-        tool_limited = False
-
-        # Check global limit
-        if self.global_limit is not None:
-            async with self._global_lock:
-                now = time.monotonic()
-                cutoff = now - self.global_period
-                active_ts = [t for t in self._global_ts if t > cutoff]
-                global_limited = len(active_ts) >= self.global_limit
-
-        # Check tool limit
-        if tool in self.tool_limits:
-            limit, period = self.tool_limits[tool]
-            async with self._tool_locks.setdefault(tool, asyncio.Lock()):
-                now = time.monotonic()
-                cutoff = now - period
-                buf = self._tool_ts.get(tool, [])
-                active_ts = [t for t in buf if t > cutoff]
-                tool_limited = len(active_ts) >= limit
-
+        now = time.monotonic()
+        global_limited = self._global_bucket is not None and self._global_bucket.is_limited(now)
+        tool_bucket = self._get_tool_bucket(tool)
+        tool_limited = tool_bucket is not None and tool_bucket.is_limited(now)
         return global_limited, tool_limited
 
 
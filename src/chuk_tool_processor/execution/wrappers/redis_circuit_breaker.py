@@ -35,10 +35,14 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
 import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from chuk_tool_processor.execution.wrappers.redis_rate_limiting import _evalsha, _is_noscript_error
 from chuk_tool_processor.logging import get_logger
 
 if TYPE_CHECKING:
@@ -67,6 +71,146 @@ class RedisCircuitBreakerConfig:
     """Time window in seconds for counting failures."""
 
 
+# Lua scripts, invoked by SHA. Every state transition is PUBLISHed as
+# "<tool>:<state>" on the breaker's event channel so other processes can update
+# their local mirrors.
+_CAN_EXECUTE_SCRIPT = """
+local state_key = KEYS[1]
+local now = tonumber(ARGV[1])
+local reset_timeout = tonumber(ARGV[2])
+local half_open_max = tonumber(ARGV[3])
+local channel = ARGV[4]
+local tool = ARGV[5]
+
+-- Get current state
+local state = redis.call('HGET', state_key, 'state') or 'closed'
+local opened_at = tonumber(redis.call('HGET', state_key, 'opened_at') or '0')
+local half_open_calls = tonumber(redis.call('HGET', state_key, 'half_open_calls') or '0')
+
+if state == 'closed' then
+    return 2  -- Allow (closed, safe to cache locally)
+end
+
+if state == 'half_open' then
+    if half_open_calls < half_open_max then
+        redis.call('HINCRBY', state_key, 'half_open_calls', 1)
+        return 1  -- Allow
+    end
+    return 0  -- Reject
+end
+
+-- OPEN state: check if we should transition to HALF_OPEN
+if state == 'open' and opened_at > 0 then
+    local elapsed = now - opened_at
+    if elapsed >= reset_timeout then
+        -- Transition to HALF_OPEN
+        redis.call('HSET', state_key, 'state', 'half_open')
+        redis.call('HSET', state_key, 'half_open_calls', 1)
+        redis.call('HSET', state_key, 'success_count', 0)
+        if channel then
+            redis.call('PUBLISH', channel, tool .. ':half_open')
+        end
+        return 1  -- Allow test request
+    end
+end
+
+return 0  -- Reject
+"""
+
+_RECORD_SUCCESS_SCRIPT = """
+local state_key = KEYS[1]
+local failures_key = KEYS[2]
+local success_threshold = tonumber(ARGV[1])
+local channel = ARGV[2]
+local tool = ARGV[3]
+
+local state = redis.call('HGET', state_key, 'state') or 'closed'
+
+if state == 'half_open' then
+    local success_count = redis.call('HINCRBY', state_key, 'success_count', 1)
+    local half_open_calls = tonumber(redis.call('HGET', state_key, 'half_open_calls') or '1')
+    redis.call('HSET', state_key, 'half_open_calls', math.max(0, half_open_calls - 1))
+
+    if success_count >= success_threshold then
+        -- Close the circuit
+        redis.call('HSET', state_key, 'state', 'closed')
+        redis.call('HSET', state_key, 'failure_count', 0)
+        redis.call('HSET', state_key, 'success_count', 0)
+        redis.call('HSET', state_key, 'opened_at', 0)
+        redis.call('HSET', state_key, 'half_open_calls', 0)
+        redis.call('DEL', failures_key)
+        if channel then
+            redis.call('PUBLISH', channel, tool .. ':closed')
+        end
+        return 'closed'
+    end
+    return 'half_open'
+else
+    -- In CLOSED state, just reset failure count
+    redis.call('HSET', state_key, 'failure_count', 0)
+    redis.call('DEL', failures_key)
+    return 'closed'
+end
+"""
+
+_RECORD_FAILURE_SCRIPT = """
+local state_key = KEYS[1]
+local failures_key = KEYS[2]
+local now = tonumber(ARGV[1])
+local failure_window = tonumber(ARGV[2])
+local failure_threshold = tonumber(ARGV[3])
+local channel = ARGV[4]
+local tool = ARGV[5]
+
+local state = redis.call('HGET', state_key, 'state') or 'closed'
+
+-- Add failure timestamp
+redis.call('ZADD', failures_key, now, now .. ':' .. math.random())
+
+-- Remove old failures outside the window
+local cutoff = now - failure_window
+redis.call('ZREMRANGEBYSCORE', failures_key, '-inf', cutoff)
+
+-- Count failures in window
+local failure_count = redis.call('ZCARD', failures_key)
+redis.call('HSET', state_key, 'failure_count', failure_count)
+
+-- Set key expiry
+redis.call('EXPIRE', failures_key, math.ceil(failure_window) + 60)
+redis.call('EXPIRE', state_key, math.ceil(failure_window) + 3600)
+
+if state == 'closed' then
+    if failure_count >= failure_threshold then
+        -- Open the circuit
+        redis.call('HSET', state_key, 'state', 'open')
+        redis.call('HSET', state_key, 'opened_at', now)
+        if channel then
+            redis.call('PUBLISH', channel, tool .. ':open')
+        end
+        return 'open'
+    end
+    return 'closed'
+elseif state == 'half_open' then
+    -- Failed during test, back to OPEN
+    redis.call('HSET', state_key, 'state', 'open')
+    redis.call('HSET', state_key, 'opened_at', now)
+    redis.call('HSET', state_key, 'success_count', 0)
+    local half_open_calls = tonumber(redis.call('HGET', state_key, 'half_open_calls') or '1')
+    redis.call('HSET', state_key, 'half_open_calls', math.max(0, half_open_calls - 1))
+    if channel then
+        redis.call('PUBLISH', channel, tool .. ':open')
+    end
+    return 'open'
+else
+    return 'open'
+end
+"""
+
+_CAN_EXECUTE_SHA = hashlib.sha1(_CAN_EXECUTE_SCRIPT.encode(), usedforsecurity=False).hexdigest()
+_RECORD_SUCCESS_SHA = hashlib.sha1(_RECORD_SUCCESS_SCRIPT.encode(), usedforsecurity=False).hexdigest()
+_RECORD_FAILURE_SHA = hashlib.sha1(_RECORD_FAILURE_SCRIPT.encode(), usedforsecurity=False).hexdigest()
+
+
 class RedisCircuitBreaker:
     """
     Distributed circuit breaker using Redis for state management.
@@ -76,6 +220,15 @@ class RedisCircuitBreaker:
     - Sorted set for failure timestamps (for sliding window)
 
     All operations use Lua scripts for atomicity across multiple Redis commands.
+    Scripts are invoked by SHA (``EVALSHA``) and loaded on the first NOSCRIPT.
+
+    With ``local_cache=True`` each process keeps a mirror of which circuits
+    are CLOSED. ``can_execute`` answers from the mirror without touching
+    Redis, and CLOSED-state successes are coalesced and flushed in the
+    background. The mirror is kept current by the transitions each script
+    publishes on ``{key_prefix}:events`` (see ``start_listener``), and every
+    entry expires after ``local_state_ttl`` seconds as a safety net for
+    missed messages. OPEN and HALF_OPEN circuits always consult Redis.
     """
 
     def __init__(
@@ -85,6 +238,9 @@ class RedisCircuitBreaker:
         default_config: RedisCircuitBreakerConfig | None = None,
         tool_configs: dict[str, RedisCircuitBreakerConfig] | None = None,
         key_prefix: str = "circuitbreaker",
+        local_cache: bool = False,
+        local_state_ttl: float = 1.0,
+        success_flush_interval: float = 0.1,
     ) -> None:
         """
         Initialize the Redis circuit breaker.
@@ -94,16 +250,28 @@ class RedisCircuitBreaker:
             default_config: Default circuit breaker configuration
             tool_configs: Per-tool circuit breaker configurations
             key_prefix: Prefix for Redis keys
+            local_cache: Serve CLOSED circuits from a local mirror and batch successes
+            local_state_ttl: Seconds a mirrored CLOSED state is trusted
+            success_flush_interval: Seconds to coalesce CLOSED-state successes
         """
         self._redis = redis
         self.default_config = default_config or RedisCircuitBreakerConfig()
         self.tool_configs = tool_configs or {}
         self._key_prefix = key_prefix
+        self.local_cache = local_cache
+        self.local_state_ttl = local_state_ttl
+        self.success_flush_interval = success_flush_interval
+
+        # Tool -> monotonic time its CLOSED state was last confirmed
+        self._closed_at: dict[str, float] = {}
+        self._pending_successes: set[str] = set()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._listener_task: asyncio.Task[None] | None = None
 
         logger.debug(
             f"Initialized Redis circuit breaker: "
             f"default_threshold={self.default_config.failure_threshold}, "
-            f"tool-specific={len(self.tool_configs)} tools"
+            f"tool-specific={len(self.tool_configs)} tools, local_cache={local_cache}"
         )
 
     def _state_key(self, tool: str) -> str:
@@ -114,10 +282,85 @@ class RedisCircuitBreaker:
         """Get the Redis key for failure timestamps."""
         return f"{self._key_prefix}:{tool}:failures"
 
+    def _channel(self) -> str:
+        """Get the pub/sub channel that carries state transitions."""
+        return f"{self._key_prefix}:events"
+
     def _get_config(self, tool: str) -> RedisCircuitBreakerConfig:
         """Get configuration for a specific tool."""
         return self.tool_configs.get(tool, self.default_config)
 
+    # ------------------------------------------------------------------ #
+    # Local mirror
+    # ------------------------------------------------------------------ #
+    def _is_cached_closed(self, tool: str) -> bool:
+        """Return True if the local mirror holds a fresh CLOSED state for ``tool``."""
+        confirmed = self._closed_at.get(tool)
+        return confirmed is not None and time.monotonic() - confirmed < self.local_state_ttl
+
+    def _mirror(self, tool: str, state: str) -> None:
+        """Record a state observed for ``tool``; only CLOSED is cached."""
+        if not self.local_cache:
+            return
+        if state == "closed":
+            self._closed_at[tool] = time.monotonic()
+        else:
+            self._closed_at.pop(tool, None)
+
+    def _apply_event(self, data: bytes | str) -> None:
+        """Apply a ``<tool>:<state>`` transition message to the local mirror."""
+        text = data.decode() if isinstance(data, bytes) else data
+        tool, _, state = text.rpartition(":")
+        if tool:
+            self._mirror(tool, state)
+
+    async def start_listener(self) -> None:
+        """
+        Subscribe to state transitions published by every process.
+
+        Without the listener the mirror still works, but a circuit opened by
+        another process is only noticed once the local entry expires.
+        """
+        if self._listener_task is not None and not self._listener_task.done():
+            return
+
+        pubsub = self._redis.pubsub()  # type: ignore[union-attr]
+        await pubsub.subscribe(self._channel())
+        self._listener_task = asyncio.create_task(self._listen(pubsub))
+
+    async def _listen(self, pubsub: Any) -> None:
+        """Background loop feeding pub/sub messages into the local mirror."""
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    self._apply_event(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Drop the whole mirror: without events it can no longer be trusted
+            logger.warning(f"Circuit breaker event listener stopped: {e}")
+            self._closed_at.clear()
+        finally:
+            try:
+                await pubsub.unsubscribe(self._channel())
+                await pubsub.aclose()
+            except Exception:  # pragma: no cover - best effort cleanup
+                pass
+
+    async def close(self) -> None:
+        """Stop the event listener and flush any pending successes."""
+        for task in (self._listener_task, self._flush_task):
+            if task is not None and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._listener_task = None
+        self._flush_task = None
+        await self.flush()
+
+    # ------------------------------------------------------------------ #
+    # State machine
+    # ------------------------------------------------------------------ #
     async def can_execute(self, tool: str) -> bool:
         """
         Check if a call should be allowed through.
@@ -127,108 +370,106 @@ class RedisCircuitBreaker:
         - Returns False (OPEN or HALF_OPEN at capacity)
         - Transitions from OPEN to HALF_OPEN if timeout elapsed
 
+        With ``local_cache`` enabled, a recently confirmed CLOSED circuit is
+        answered locally without a Redis round trip.
+
         Args:
             tool: Name of the tool to check
 
         Returns:
             True if execution is allowed, False otherwise
         """
-        config = self._get_config(tool)
-        state_key = self._state_key(tool)
-
-        lua_script = """
-        local state_key = KEYS[1]
-        local now = tonumber(ARGV[1])
-        local reset_timeout = tonumber(ARGV[2])
-        local half_open_max = tonumber(ARGV[3])
-
-        -- Get current state
-        local state = redis.call('HGET', state_key, 'state') or 'closed'
-        local opened_at = tonumber(redis.call('HGET', state_key, 'opened_at') or '0')
-        local half_open_calls = tonumber(redis.call('HGET', state_key, 'half_open_calls') or '0')
-
-        if state == 'closed' then
-            return 1  -- Allow
-        end
-
-        if state == 'half_open' then
-            if half_open_calls < half_open_max then
-                redis.call('HINCRBY', state_key, 'half_open_calls', 1)
-                return 1  -- Allow
-            end
-            return 0  -- Reject
-        end
+        if self.local_cache and self._is_cached_closed(tool):
+            return True
 
-        -- OPEN state: check if we should transition to HALF_OPEN
-        if state == 'open' and opened_at > 0 then
-            local elapsed = now - opened_at
-            if elapsed >= reset_timeout then
-                -- Transition to HALF_OPEN
-                redis.call('HSET', state_key, 'state', 'half_open')
-                redis.call('HSET', state_key, 'half_open_calls', 1)
-                redis.call('HSET', state_key, 'success_count', 0)
-                return 1  -- Allow test request
-            end
-        end
+        config = self._get_config(tool)
+        result = await _evalsha(
+            self._redis,
+            _CAN_EXECUTE_SCRIPT,
+            _CAN_EXECUTE_SHA,
+            [self._state_key(tool)],
+            [str(time.time()), str(config.reset_timeout), str(config.half_open_max_calls), self._channel(), tool],
+        )
 
-        return 0  -- Reject
-        """
+        self._mirror(tool, "closed" if result == 2 else "not_closed")
+        return result in (1, 2)
 
-        result = await self._redis.eval(  # type: ignore[union-attr]
-            lua_script, 1, state_key, str(time.time()), str(config.reset_timeout), str(config.half_open_max_calls)
+    def _success_args(self, tool: str) -> tuple[list[str], list[str]]:
+        """Build the (keys, args) for the record-success script."""
+        config = self._get_config(tool)
+        return (
+            [self._state_key(tool), self._failures_key(tool)],
+            [str(config.success_threshold), self._channel(), tool],
         )
 
-        return result == 1
+    async def _record_success_now(self, tool: str) -> None:
+        """Run the record-success script for ``tool`` immediately."""
+        keys, args = self._success_args(tool)
+        new_state = await _evalsha(self._redis, _RECORD_SUCCESS_SCRIPT, _RECORD_SUCCESS_SHA, keys, args)
+        self._handle_success_result(tool, new_state)
+
+    def _handle_success_result(self, tool: str, new_state: Any) -> None:
+        """Log and mirror the state returned by the record-success script."""
+        if new_state == b"closed":
+            logger.info(f"Circuit breaker for '{tool}' transitioned to CLOSED (recovered)")
+            self._mirror(tool, "closed")
 
     async def record_success(self, tool: str) -> None:
         """
         Record a successful call.
 
         In HALF_OPEN state, counts towards closing the circuit.
-        In CLOSED state, maintains healthy status.
+        In CLOSED state, maintains healthy status. With ``local_cache``
+        enabled, CLOSED-state successes are coalesced per tool and written
+        in one pipelined batch every ``success_flush_interval`` seconds.
 
         Args:
             tool: Name of the tool
         """
-        config = self._get_config(tool)
-        state_key = self._state_key(tool)
-        failures_key = self._failures_key(tool)
+        if self.local_cache and self._is_cached_closed(tool):
+            self._pending_successes.add(tool)
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_later())
+            return
 
-        lua_script = """
-        local state_key = KEYS[1]
-        local failures_key = KEYS[2]
-        local success_threshold = tonumber(ARGV[1])
-
-        local state = redis.call('HGET', state_key, 'state') or 'closed'
-
-        if state == 'half_open' then
-            local success_count = redis.call('HINCRBY', state_key, 'success_count', 1)
-            local half_open_calls = tonumber(redis.call('HGET', state_key, 'half_open_calls') or '1')
-            redis.call('HSET', state_key, 'half_open_calls', math.max(0, half_open_calls - 1))
-
-            if success_count >= success_threshold then
-                -- Close the circuit
-                redis.call('HSET', state_key, 'state', 'closed')
-                redis.call('HSET', state_key, 'failure_count', 0)
-                redis.call('HSET', state_key, 'success_count', 0)
-                redis.call('HSET', state_key, 'opened_at', 0)
-                redis.call('HSET', state_key, 'half_open_calls', 0)
-                redis.call('DEL', failures_key)
-                return 'closed'
-            end
-            return 'half_open'
-        else
-            -- In CLOSED state, just reset failure count
-            redis.call('HSET', state_key, 'failure_count', 0)
-            redis.call('DEL', failures_key)
-            return 'closed'
-        end
-        """
+        await self._record_success_now(tool)
 
-        new_state = await self._redis.eval(lua_script, 2, state_key, failures_key, str(config.success_threshold))  # type: ignore[union-attr]
+    async def _flush_later(self) -> None:
+        """Flush pending successes after the coalescing interval."""
+        await asyncio.sleep(self.success_flush_interval)
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush batched circuit breaker successes: {e}")
 
-        if new_state == b"closed":
-            logger.info(f"Circuit breaker for '{tool}' transitioned to CLOSED (recovered)")
+    async def flush(self) -> None:
+        """Write all pending CLOSED-state successes in one pipelined round trip."""
+        if not self._pending_successes:
+            return
+
+        tools = list(self._pending_successes)
+        self._pending_successes.clear()
+
+        try:
+            results = await self._run_success_batch(tools)
+        except Exception as exc:
+            # Every command in the batch runs the same script, so NOSCRIPT
+            # means none of them ran: load it and send the batch again.
+            if not _is_noscript_error(exc):
+                raise
+            await self._redis.script_load(_RECORD_SUCCESS_SCRIPT)  # type: ignore[union-attr]
+            results = await self._run_success_batch(tools)
+
+        for tool, new_state in zip(tools, results, strict=True):
+            self._handle_success_result(tool, new_state)
+
+    async def _run_success_batch(self, tools: list[str]) -> list[Any]:
+        """Send one pipelined EVALSHA of the record-success script per tool."""
+        pipe = self._redis.pipeline(transaction=False)  # type: ignore[union-attr]
+        for tool in tools:
+            keys, args = self._success_args(tool)
+            pipe.evalsha(_RECORD_SUCCESS_SHA, len(keys), *keys, *args)
+        return list(await pipe.execute())
 
     async def record_failure(self, tool: str) -> None:
         """
@@ -240,68 +481,24 @@ class RedisCircuitBreaker:
         Args:
             tool: Name of the tool
         """
-        config = self._get_config(tool)
-        state_key = self._state_key(tool)
-        failures_key = self._failures_key(tool)
-        now = time.time()
-
-        lua_script = """
-        local state_key = KEYS[1]
-        local failures_key = KEYS[2]
-        local now = tonumber(ARGV[1])
-        local failure_window = tonumber(ARGV[2])
-        local failure_threshold = tonumber(ARGV[3])
-
-        local state = redis.call('HGET', state_key, 'state') or 'closed'
-
-        -- Add failure timestamp
-        redis.call('ZADD', failures_key, now, now .. ':' .. math.random())
-
-        -- Remove old failures outside the window
-        local cutoff = now - failure_window
-        redis.call('ZREMRANGEBYSCORE', failures_key, '-inf', cutoff)
-
-        -- Count failures in window
-        local failure_count = redis.call('ZCARD', failures_key)
-        redis.call('HSET', state_key, 'failure_count', failure_count)
-
-        -- Set key expiry
-        redis.call('EXPIRE', failures_key, math.ceil(failure_window) + 60)
-        redis.call('EXPIRE', state_key, math.ceil(failure_window) + 3600)
-
-        if state == 'closed' then
-            if failure_count >= failure_threshold then
-                -- Open the circuit
-                redis.call('HSET', state_key, 'state', 'open')
-                redis.call('HSET', state_key, 'opened_at', now)
-                return 'open'
-            end
-            return 'closed'
-        elseif state == 'half_open' then
-            -- Failed during test, back to OPEN
-            redis.call('HSET', state_key, 'state', 'open')
-            redis.call('HSET', state_key, 'opened_at', now)
-            redis.call('HSET', state_key, 'success_count', 0)
-            local half_open_calls = tonumber(redis.call('HGET', state_key, 'half_open_calls') or '1')
-            redis.call('HSET', state_key, 'half_open_calls', math.max(0, half_open_calls - 1))
-            return 'open'
-        else
-            return 'open'
-        end
-        """
+        # A batched success that happened before this failure must land first,
+        # otherwise flushing it later would wipe this failure from the window.
+        if tool in self._pending_successes:
+            self._pending_successes.discard(tool)
+            await self._record_success_now(tool)
 
-        new_state = await self._redis.eval(  # type: ignore[union-attr]
-            lua_script,
-            2,
-            state_key,
-            failures_key,
-            str(now),
-            str(config.failure_window),
-            str(config.failure_threshold),
+        config = self._get_config(tool)
+        new_state = await _evalsha(
+            self._redis,
+            _RECORD_FAILURE_SCRIPT,
+            _RECORD_FAILURE_SHA,
+            [self._state_key(tool), self._failures_key(tool)],
+            [str(time.time()), str(config.failure_window), str(config.failure_threshold), self._channel(), tool],
         )
 
         if new_state == b"open":
             logger.warning(f"Circuit breaker for '{tool}' transitioned to OPEN")
+            self._mirror(tool, "open")
 
     async def get_state(self, tool: str) -> dict[str, Any]:
         """
@@ -379,6 +576,7 @@ class RedisCircuitBreaker:
         state_key = self._state_key(tool)
         failures_key = self._failures_key(tool)
 
+        self._pending_successes.discard(tool)
         await self._redis.delete(state_key, failures_key)  # type: ignore[union-attr]
 
         logger.info(f"Manually reset circuit breaker for '{tool}'")
@@ -407,6 +605,9 @@ async def create_redis_circuit_breaker(
     default_config: RedisCircuitBreakerConfig | None = None,
     tool_configs: dict[str, RedisCircuitBreakerConfig] | None = None,
     key_prefix: str = "circuitbreaker",
+    local_cache: bool = False,
+    local_state_ttl: float = 1.0,
+    success_flush_interval: float = 0.1,
 ) -> RedisCircuitBreaker:
     """
     Create a Redis-backed circuit breaker.
@@ -416,6 +617,9 @@ async def create_redis_circuit_breaker(
         default_config: Default circuit breaker configuration
         tool_configs: Per-tool circuit breaker configurations
         key_prefix: Prefix for Redis keys
+        local_cache: Mirror CLOSED states locally and subscribe to transitions
+        local_state_ttl: Seconds a mirrored CLOSED state is trusted
+        success_flush_interval: Seconds to coalesce CLOSED-state successes
 
     Returns:
         Configured RedisCircuitBreaker instance
@@ -424,12 +628,18 @@ async def create_redis_circuit_breaker(
 
     redis = Redis.from_url(redis_url, decode_responses=False)
 
-    return RedisCircuitBreaker(
+    breaker = RedisCircuitBreaker(
         redis,
         default_config=default_config,
         tool_configs=tool_configs,
         key_prefix=key_prefix,
+        local_cache=local_cache,
+        local_state_ttl=local_state_ttl,
+        success_flush_interval=success_flush_interval,
     )
+    if local_cache:
+        await breaker.start_listener()
+    return breaker
 
 
 class RedisCircuitBreakerExecutor:
@@ -573,6 +783,20 @@ class RedisCircuitBreakerExecutor:
         """
         await self.circuit_breaker.reset(tool)
 
+    async def close(self) -> None:
+        """
+        Flush batched successes and stop the circuit breaker's event listener.
+
+        With ``local_cache`` enabled, successes recorded since the last flush
+        are only written to Redis here, so call this (or ``aclose``) before
+        discarding the executor.
+        """
+        await self.circuit_breaker.close()
+
+    async def aclose(self) -> None:
+        """Alias for :meth:`close`."""
+        await self.close()
+
 
 async def create_redis_circuit_breaker_executor(
     executor: Any,
@@ -581,6 +805,7 @@ async def create_redis_circuit_breaker_executor(
     default_config: RedisCircuitBreakerConfig | None = None,
     tool_configs: dict[str, RedisCircuitBreakerConfig] | None = None,
     key_prefix: str = "circuitbreaker",
+    local_cache: bool = False,
 ) -> RedisCircuitBreakerExecutor:
     """
     Create a Redis-backed circuit breaker executor.
@@ -594,6 +819,7 @@ async def create_redis_circuit_breaker_executor(
         default_config: Default circuit breaker configuration
         tool_configs: Per-tool circuit breaker configurations
         key_prefix: Prefix for Redis keys
+        local_cache: Mirror CLOSED states locally and batch successes
 
     Returns:
         Configured RedisCircuitBreakerExecutor instance
@@ -620,6 +846,7 @@ async def create_redis_circuit_breaker_executor(
         default_config=default_config,
         tool_configs=tool_configs,
         key_prefix=key_prefix,
+        local_cache=local_cache,
     )
 
     return RedisCircuitBreakerExecutor(executor, circuit_breaker)
@@ -6,7 +6,13 @@ This module provides a rate limiter that uses Redis for distributed state,
 allowing rate limits to be enforced across multiple application instances.
 
 Uses Redis sorted sets with timestamps for a sliding window algorithm that
-is both accurate and efficient.
+is both accurate and efficient. Round trips are kept to a minimum:
+
+- The acquire script is loaded once and invoked by SHA (``EVALSHA``)
+- Global and per-tool slots are checked and taken in one atomic script call
+- ``check_limits``/``get_usage`` pipeline their reads into one round trip
+- Optional lease mode reserves a block of tokens per process and spends them
+  locally, trading a bounded amount of over-admission for far fewer calls
 
 Example:
     from chuk_tool_processor.execution.wrappers.redis_rate_limiting import (
@@ -28,6 +34,8 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import time
 from typing import TYPE_CHECKING, Any
 
@@ -38,6 +46,81 @@ if TYPE_CHECKING:
 
 logger = get_logger("chuk_tool_processor.execution.wrappers.redis_rate_limiting")
 
+# KEYS = one sorted set per scope (global and/or tool)
+# ARGV = now, request_id, requested, then (limit, period) per key
+# Returns {granted, wait}: the number of slots taken from every scope, or 0
+# and the seconds until the most constrained scope frees a slot. The wait is
+# returned as a string because Redis truncates Lua numbers to integers.
+_ACQUIRE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local request_id = ARGV[2]
+local grant = tonumber(ARGV[3])
+local wait = 0
+
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[2 + 2 * i])
+    local period = tonumber(ARGV[3 + 2 * i])
+
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - period)
+    local count = redis.call('ZCARD', key)
+    local free = limit - count
+
+    if free < 1 then
+        -- Slot frees once the entry that pushes us over the limit expires
+        local entry = redis.call('ZRANGE', key, count - limit, count - limit, 'WITHSCORES')
+        local key_wait = period
+        if #entry >= 2 then
+            key_wait = tonumber(entry[2]) + period - now
+        end
+        if key_wait > wait then
+            wait = key_wait
+        end
+    end
+    if free < grant then
+        grant = free
+    end
+end
+
+if grant < 1 then
+    return {0, tostring(wait)}
+end
+
+for i, key in ipairs(KEYS) do
+    local period = tonumber(ARGV[3 + 2 * i])
+    for n = 1, grant do
+        redis.call('ZADD', key, now, request_id .. ':' .. n)
+    end
+    redis.call('EXPIRE', key, math.ceil(period) + 1)
+end
+return {grant, '0'}
+"""
+_ACQUIRE_SHA = hashlib.sha1(_ACQUIRE_SCRIPT.encode(), usedforsecurity=False).hexdigest()
+
+
+def _is_noscript_error(exc: Exception) -> bool:
+    """Return True if ``exc`` means Redis has no script cached for the SHA."""
+    try:
+        from redis.exceptions import NoScriptError
+    except ImportError:  # pragma: no cover - redis is required to get here
+        return "NOSCRIPT" in str(exc)
+    return isinstance(exc, NoScriptError) or "NOSCRIPT" in str(exc)
+
+
+async def _evalsha(redis: Any, script: str, sha: str, keys: list[str], args: list[str]) -> Any:
+    """
+    Run a Lua script by SHA, loading it once if Redis does not know it.
+
+    The script body is only sent on the first call (or after a Redis
+    restart/SCRIPT FLUSH); every other call ships just the 40-byte digest.
+    """
+    try:
+        return await redis.evalsha(sha, len(keys), *keys, *args)
+    except Exception as exc:
+        if not _is_noscript_error(exc):
+            raise
+        await redis.script_load(script)
+        return await redis.evalsha(sha, len(keys), *keys, *args)
+
 
 class RedisRateLimiter:
     """
@@ -49,6 +132,13 @@ class RedisRateLimiter:
     - The set is trimmed to only contain requests within the window
 
     This provides accurate rate limiting across multiple application instances.
+
+    With ``lease_size > 1`` each process reserves up to ``lease_size`` slots
+    per Redis call and hands them out locally. Reserved slots count against
+    the shared limit as soon as they are taken, and a lease expires after
+    ``lease_ttl`` seconds (never longer than the scope's period). This lets
+    each process admit at most ``lease_size - 1`` calls beyond the limit in
+    any one window, so keep it small relative to the limit.
     """
 
     def __init__(
@@ -59,6 +149,8 @@ class RedisRateLimiter:
         global_period: float = 60.0,
         tool_limits: dict[str, tuple[int, float]] | None = None,
         key_prefix: str = "ratelimit",
+        lease_size: int = 1,
+        lease_ttl: float = 1.0,
     ) -> None:
         """
         Initialize the Redis rate limiter.
@@ -69,17 +161,34 @@ class RedisRateLimiter:
             global_period: Time period in seconds for the global limit
             tool_limits: Dict mapping tool names to (limit, period) tuples
             key_prefix: Prefix for Redis keys
+            lease_size: Slots reserved per Redis call and spent locally
+                (1 disables leasing; also bounds per-process over-admission)
+            lease_ttl: Seconds an unspent lease stays valid
+
+        Raises:
+            ValueError: If lease_size is below 1 or lease_ttl is not positive
         """
+        if lease_size < 1:
+            raise ValueError(f"lease_size must be >= 1, got {lease_size}")
+        if lease_ttl <= 0:
+            raise ValueError(f"lease_ttl must be > 0, got {lease_ttl}")
+
         self._redis = redis
         self.global_limit = global_limit
         self.global_period = global_period
         self.tool_limits = tool_limits or {}
+        self.lease_size = lease_size
+        self.lease_ttl = lease_ttl
         self._key_prefix = key_prefix
         self._request_counter = 0
 
+        # Lease key (tool name, or None for global-only) -> [remaining, expires_at]
+        self._leases: dict[str | None, list[float]] = {}
+        self._lease_locks: dict[str | None, asyncio.Lock] = {}
+
         logger.debug(
             f"Initialized Redis rate limiter: global={global_limit}/{global_period}s, "
-            f"tool-specific={len(self.tool_limits)} tools"
+            f"tool-specific={len(self.tool_limits)} tools, lease_size={lease_size}"
         )
 
     def _global_key(self) -> str:
@@ -95,97 +204,75 @@ class RedisRateLimiter:
         self._request_counter += 1
         return f"{time.time_ns()}:{self._request_counter}"
 
-    async def _acquire_slot(self, key: str, limit: int, period: float) -> float | None:
-        """
-        Try to acquire a rate limit slot.
+    def _scopes(self, tool: str | None) -> list[tuple[str, int, float]]:
+        """Return the ``(key, limit, period)`` scopes that apply to ``tool``."""
+        scopes: list[tuple[str, int, float]] = []
+        if self.global_limit is not None:
+            scopes.append((self._global_key(), self.global_limit, self.global_period))
+        if tool is not None and tool in self.tool_limits:
+            limit, period = self.tool_limits[tool]
+            scopes.append((self._tool_key(tool), limit, period))
+        return scopes
 
-        Uses a Lua script for atomic check-and-increment to avoid race conditions.
+    async def _evalsha(self, keys: list[str], args: list[str]) -> Any:
+        """Run the acquire script by SHA, loading it once if Redis does not know it."""
+        return await _evalsha(self._redis, _ACQUIRE_SCRIPT, _ACQUIRE_SHA, keys, args)
 
-        Args:
-            key: Redis key for this rate limit
-            limit: Maximum requests allowed
-            period: Time period in seconds
+    async def _try_acquire(self, scopes: list[tuple[str, int, float]], count: int) -> tuple[int, float]:
+        """
+        Atomically take up to ``count`` slots from every scope in one round trip.
 
         Returns:
-            None if slot acquired, otherwise seconds to wait
-        """
-        now = time.time()
-        cutoff = now - period
-        request_id = self._generate_request_id()
-
-        # Use a Lua script for atomic operation
-        lua_script = """
-        local key = KEYS[1]
-        local now = tonumber(ARGV[1])
-        local cutoff = tonumber(ARGV[2])
-        local limit = tonumber(ARGV[3])
-        local request_id = ARGV[4]
-        local period = tonumber(ARGV[5])
-
-        -- Remove expired entries
-        redis.call('ZREMRANGEBYSCORE', key, '-inf', cutoff)
-
-        -- Count current entries
-        local count = redis.call('ZCARD', key)
-
-        if count < limit then
-            -- Add new request
-            redis.call('ZADD', key, now, request_id)
-            -- Set expiry on the key
-            redis.call('EXPIRE', key, math.ceil(period) + 1)
-            return -1  -- Success
-        else
-            -- Get oldest entry to calculate wait time
-            local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
-            if #oldest >= 2 then
-                return oldest[2] + period - now  -- Wait time
-            end
-            return period  -- Default wait time
-        end
+            Tuple of (slots granted, seconds to wait when nothing was granted)
         """
+        keys = [key for key, _, _ in scopes]
+        args = [str(time.time()), self._generate_request_id(), str(count)]
+        for _, limit, period in scopes:
+            args.extend((str(limit), str(period)))
 
-        result = await self._redis.eval(  # type: ignore[union-attr]
-            lua_script, 1, key, str(now), str(cutoff), str(limit), request_id, str(period)
-        )
-
-        if result == -1:
-            return None  # Slot acquired
-        return float(result)  # Wait time
-
-    async def _acquire_global(self) -> None:
-        """Block until a global slot is available."""
-        if self.global_limit is None:
-            return
+        granted, wait = await self._evalsha(keys, args)
+        return int(granted), float(wait)
 
+    async def _acquire(self, scopes: list[tuple[str, int, float]], count: int = 1) -> int:
+        """Block until at least one slot is granted in every scope; return how many."""
         while True:
-            wait_time = await self._acquire_slot(self._global_key(), self.global_limit, self.global_period)
-
-            if wait_time is None:
-                return  # Slot acquired
+            granted, wait_time = await self._try_acquire(scopes, count)
+            if granted > 0:
+                return granted
 
-            logger.debug(f"Global rate limit reached, waiting {wait_time:.2f}s")
-            await self._async_sleep(max(0.01, wait_time))
+            logger.debug(f"Rate limit reached for {[key for key, _, _ in scopes]}, waiting {wait_time:.3f}s")
+            await self._async_sleep(max(0.001, wait_time))
 
-    async def _acquire_tool(self, tool: str) -> None:
-        """Block until a per-tool slot is available."""
-        if tool not in self.tool_limits:
-            return
-
-        limit, period = self.tool_limits[tool]
+    async def _acquire_leased(self, tool: str, scopes: list[tuple[str, int, float]]) -> None:
+        """
+        Spend a locally leased token, refilling the lease from Redis when empty.
 
+        Tools with their own limit get their own lease; all other tools share
+        the global-only lease. Refills are single-flight per lease so a burst
+        of callers costs one round trip rather than one each.
+        """
+        lease_key = tool if tool in self.tool_limits else None
         while True:
-            wait_time = await self._acquire_slot(self._tool_key(tool), limit, period)
-
-            if wait_time is None:
-                return  # Slot acquired
-
-            logger.debug(f"Tool '{tool}' rate limit reached, waiting {wait_time:.2f}s")
-            await self._async_sleep(max(0.01, wait_time))
+            lease = self._leases.get(lease_key)
+            if lease is not None and lease[0] > 0 and lease[1] > time.monotonic():
+                lease[0] -= 1
+                return
+
+            lock = self._lease_locks.setdefault(lease_key, asyncio.Lock())
+            async with lock:
+                lease = self._leases.get(lease_key)
+                if lease is not None and lease[0] > 0 and lease[1] > time.monotonic():
+                    continue  # Another waiter refilled while we queued on the lock
+
+                granted = await self._acquire(scopes, self.lease_size)
+                # A lease never outlives the shortest window it was drawn from,
+                # so unspent tokens cannot be carried into a later window.
+                ttl = min(self.lease_ttl, *(period for _, _, period in scopes))
+                self._leases[lease_key] = [granted - 1, time.monotonic() + ttl]
+                return
 
     async def _async_sleep(self, seconds: float) -> None:
         """Async sleep helper."""
-        import asyncio
-
         await asyncio.sleep(seconds)
 
     async def wait(self, tool: str) -> None:
@@ -193,13 +280,31 @@ class RedisRateLimiter:
         Block until rate limits allow execution.
 
         This method blocks until both global and tool-specific rate limits
-        allow one more execution of the specified tool.
+        allow one more execution of the specified tool. Both limits are
+        checked and consumed atomically in a single Redis round trip.
 
         Args:
             tool: Name of the tool being executed
         """
-        await self._acquire_global()
-        await self._acquire_tool(tool)
+        scopes = self._scopes(tool)
+        if not scopes:
+            return
+
+        if self.lease_size > 1:
+            await self._acquire_leased(tool, scopes)
+        else:
+            await self._acquire(scopes)
+
+    async def _counts(self, scopes: list[tuple[str, int, float]]) -> list[int]:
+        """Count live entries for every scope in a single pipelined round trip."""
+        if not scopes:
+            return []
+
+        now = time.time()
+        pipe = self._redis.pipeline(transaction=False)  # type: ignore[union-attr]
+        for key, _, period in scopes:
+            pipe.zcount(key, f"({now - period}", "+inf")
+        return [int(count) for count in await pipe.execute()]
 
     async def check_limits(self, tool: str) -> tuple[bool, bool]:
         """
@@ -211,26 +316,16 @@ class RedisRateLimiter:
         Returns:
             Tuple of (global_limit_reached, tool_limit_reached)
         """
+        scopes = self._scopes(tool)
+        counts = await self._counts(scopes)
+
         global_limited = False
         tool_limited = False
-
-        now = time.time()
-
-        # Check global limit
-        if self.global_limit is not None:
-            cutoff = now - self.global_period
-            await self._redis.zremrangebyscore(self._global_key(), "-inf", cutoff)  # type: ignore[union-attr]
-            count = await self._redis.zcard(self._global_key())  # type: ignore[union-attr]
-            global_limited = count >= self.global_limit
-
-        # Check tool limit
-        if tool in self.tool_limits:
-            limit, period = self.tool_limits[tool]
-            cutoff = now - period
-            key = self._tool_key(tool)
-            await self._redis.zremrangebyscore(key, "-inf", cutoff)  # type: ignore[union-attr]
-            count = await self._redis.zcard(key)  # type: ignore[union-attr]
-            tool_limited = count >= limit
+        for (key, limit, _), count in zip(scopes, counts, strict=True):
+            if key == self._global_key():
+                global_limited = count >= limit
+            else:
+                tool_limited = count >= limit
 
         return global_limited, tool_limited
 
@@ -244,29 +339,13 @@ class RedisRateLimiter:
         Returns:
             Dict with usage statistics
         """
-        now = time.time()
-        result: dict[str, Any] = {}
-
-        # Global usage
-        if self.global_limit is not None:
-            cutoff = now - self.global_period
-            await self._redis.zremrangebyscore(self._global_key(), "-inf", cutoff)  # type: ignore[union-attr]
-            count = await self._redis.zcard(self._global_key())  # type: ignore[union-attr]
-            result["global"] = {
-                "used": count,
-                "limit": self.global_limit,
-                "period": self.global_period,
-                "remaining": max(0, self.global_limit - count),
-            }
+        scopes = self._scopes(tool or None)
+        counts = await self._counts(scopes)
 
-        # Tool usage
-        if tool and tool in self.tool_limits:
-            limit, period = self.tool_limits[tool]
-            cutoff = now - period
-            key = self._tool_key(tool)
-            await self._redis.zremrangebyscore(key, "-inf", cutoff)  # type: ignore[union-attr]
-            count = await self._redis.zcard(key)  # type: ignore[union-attr]
-            result[tool] = {
+        result: dict[str, Any] = {}
+        for (key, limit, period), count in zip(scopes, counts, strict=True):
+            name = "global" if key == self._global_key() else str(tool)
+            result[name] = {
                 "used": count,
                 "limit": limit,
                 "period": period,
@@ -291,6 +370,12 @@ class RedisRateLimiter:
         elif tool in self.tool_limits:
             await self._redis.delete(self._tool_key(tool))  # type: ignore[union-attr]
 
+        # Unspent local leases were drawn against the counters just cleared
+        if tool is None:
+            self._leases.clear()
+        else:
+            self._leases.pop(tool, None)
+
         logger.debug(f"Reset rate limits for: {tool or 'all'}")
 
 
@@ -301,6 +386,8 @@ async def create_redis_rate_limiter(
     global_period: float = 60.0,
     tool_limits: dict[str, tuple[int, float]] | None = None,
     key_prefix: str = "ratelimit",
+    lease_size: int = 1,
+    lease_ttl: float = 1.0,
 ) -> RedisRateLimiter:
     """
     Create a Redis-backed rate limiter.
@@ -311,6 +398,8 @@ async def create_redis_rate_limiter(
         global_period: Time period in seconds for global limit
         tool_limits: Dict mapping tool names to (limit, period) tuples
         key_prefix: Prefix for Redis keys
+        lease_size: Slots reserved per Redis call and spent locally (1 disables)
+        lease_ttl: Seconds an unspent lease stays valid
 
     Returns:
         Configured RedisRateLimiter instance
@@ -325,4 +414,6 @@ async def create_redis_rate_limiter(
         global_period=global_period,
         tool_limits=tool_limits,
         key_prefix=key_prefix,
+        lease_size=lease_size,
+        lease_ttl=lease_ttl,
     )
@@ -2,6 +2,10 @@
 """Output size guard to prevent pathological payloads.
 
 Caps bytes, tokens, array lengths, and nesting depth.
+
+Lazily decoded MCP content (:class:`LazyContent`) is measured by its raw
+length, and is only decoded for the array and depth checks when its text
+could exceed those limits.
 """
 
 from __future__ import annotations
@@ -13,6 +17,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from chuk_tool_processor.guards.base import BaseGuard, GuardResult
+from chuk_tool_processor.models.lazy_content import LazyContent
 
 
 class TruncationMode(StrEnum):
@@ -128,7 +133,12 @@ class OutputSizeGuard(BaseGuard):
             )
 
         # Truncate or paginate
-        truncated = self._truncate_result(result, violations)
+        if isinstance(result, LazyContent):
+            original_size = result.raw_size
+            truncated = self._truncate_result(result.value, violations)
+            truncated.original_size = original_size
+        else:
+            truncated = self._truncate_result(result, violations)
         return self.repair(
             reason="Output truncated due to size limits",
             repaired_args=arguments,
@@ -139,33 +149,18 @@ class OutputSizeGuard(BaseGuard):
         """Check for all size violations."""
         violations: list[SizeViolation] = []
 
-        # Check byte size
-        try:
-            serialized = json.dumps(result, default=str)
-            byte_size = len(serialized.encode("utf-8"))
-
-            if byte_size > self.config.max_bytes:
-                violations.append(
-                    SizeViolation(
-                        violation_type=SizeViolationType.BYTES_EXCEEDED,
-                        limit=self.config.max_bytes,
-                        actual=byte_size,
-                    )
-                )
-
-            # Check token estimate
-            if self.config.max_tokens is not None:
-                token_estimate = len(serialized) // self.config.chars_per_token
-                if token_estimate > self.config.max_tokens:
-                    violations.append(
-                        SizeViolation(
-                            violation_type=SizeViolationType.TOKENS_EXCEEDED,
-                            limit=self.config.max_tokens,
-                            actual=token_estimate,
-                        )
-                    )
-        except (TypeError, ValueError):
-            pass
+        if isinstance(result, LazyContent):
+            self._check_size(result.raw_size, len(result.raw), violations)
+            if not self._may_exceed_structure(result):
+                return violations
+            result = result.value
+        else:
+            # Check byte size
+            try:
+                serialized = json.dumps(result, default=str)
+                self._check_size(len(serialized.encode("utf-8")), len(serialized), violations)
+            except (TypeError, ValueError):
+                pass
 
         # Check array lengths and depth
         array_violation = self._check_array_length(result, "")
@@ -178,6 +173,44 @@ class OutputSizeGuard(BaseGuard):
 
         return violations
 
+    def _check_size(self, byte_size: int, char_count: int, violations: list[SizeViolation]) -> None:
+        """Check byte size and token estimate of the serialized output."""
+        if byte_size > self.config.max_bytes:
+            violations.append(
+                SizeViolation(
+                    violation_type=SizeViolationType.BYTES_EXCEEDED,
+                    limit=self.config.max_bytes,
+                    actual=byte_size,
+                )
+            )
+
+        # Check token estimate
+        if self.config.max_tokens is not None:
+            token_estimate = char_count // self.config.chars_per_token
+            if token_estimate > self.config.max_tokens:
+                violations.append(
+                    SizeViolation(
+                        violation_type=SizeViolationType.TOKENS_EXCEEDED,
+                        limit=self.config.max_tokens,
+                        actual=token_estimate,
+                    )
+                )
+
+    def _may_exceed_structure(self, content: LazyContent) -> bool:
+        """
+        Whether raw JSON text could break the array-length or depth limits.
+
+        An array longer than the limit needs at least that many commas, and
+        nesting deeper than the limit needs more opening brackets than the
+        limit. Counting them is much cheaper than decoding.
+        """
+        raw = content.raw
+        if isinstance(raw, str):
+            commas, brackets = raw.count(","), raw.count("[") + raw.count("{")
+        else:
+            commas, brackets = raw.count(b","), raw.count(b"[") + raw.count(b"{")
+        return commas >= self.config.max_array_length or brackets > self.config.max_depth
+
     def _check_array_length(
         self,
         value: Any,
@@ -22,6 +22,8 @@ from chuk_tool_processor.mcp.middleware import (
     # Status models
     CircuitBreakerStatus,
     CircuitBreakerToolState,
+    ConcurrencyDefaults,
+    ConcurrencySettings,
     MiddlewareConfig,
     # Enums
     MiddlewareLayer,
@@ -40,22 +42,38 @@ from chuk_tool_processor.mcp.middleware import (
     # Result model
     ToolExecutionResult,
 )
-from chuk_tool_processor.mcp.models import MCPConfig, MCPServerConfig, MCPTransport
+from chuk_tool_processor.mcp.models import MCPCacheSettings, MCPConfig, MCPServerConfig, MCPTransport
 from chuk_tool_processor.mcp.register_mcp_tools import register_mcp_tools
 from chuk_tool_processor.mcp.setup_mcp_http_streamable import setup_mcp_http_streamable
 from chuk_tool_processor.mcp.setup_mcp_sse import setup_mcp_sse
 from chuk_tool_processor.mcp.setup_mcp_stdio import setup_mcp_stdio
 from chuk_tool_processor.mcp.stream_manager import StreamManager
-from chuk_tool_processor.mcp.transport import HTTPStreamableTransport, MCPBaseTransport, SSETransport, StdioTransport
+from chuk_tool_processor.mcp.tool_snapshot import ToolSetDiff, ToolSnapshot, ToolSnapshotStore
+from chuk_tool_processor.mcp.transport import (
+    BatchConfig,
+    HTTPPoolConfig,
+    HTTPStreamableTransport,
+    MCPBaseTransport,
+    SSETransport,
+    StdioPoolTransport,
+    StdioTransport,
+    SupervisorConfig,
+)
 
 __all__ = [
     # Transports
     "MCPBaseTransport",
     "StdioTransport",
+    "StdioPoolTransport",
     "SSETransport",
     "HTTPStreamableTransport",
+    "HTTPPoolConfig",
     # StreamManager
     "StreamManager",
+    # Tool-schema snapshots
+    "ToolSnapshotStore",
+    "ToolSnapshot",
+    "ToolSetDiff",
     # Middleware - Enums
     "MiddlewareLayer",
     "RetryableError",
@@ -64,10 +82,12 @@ __all__ = [
     "RetryDefaults",
     "CircuitBreakerDefaults",
     "RateLimitingDefaults",
+    "ConcurrencyDefaults",
     # Middleware - Configuration
     "RetrySettings",
     "CircuitBreakerSettings",
     "RateLimitSettings",
+    "ConcurrencySettings",
     "MiddlewareConfig",
     # Middleware - Status
     "RetryStatus",
@@ -83,8 +103,11 @@ __all__ = [
     # Tools and models
     "MCPTool",
     "MCPConfig",
+    "MCPCacheSettings",
     "MCPServerConfig",
     "MCPTransport",
+    "SupervisorConfig",
+    "BatchConfig",
     # Setup helpers
     "register_mcp_tools",
     "setup_mcp_stdio",
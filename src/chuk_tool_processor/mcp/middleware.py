@@ -6,10 +6,12 @@ Async-native, Pydantic-based middleware configuration for:
 - Retry with exponential backoff
 - Circuit breaker pattern
 - Rate limiting
+- Per-server in-flight limits
 """
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any
@@ -105,6 +107,12 @@ class RateLimitingDefaults:
     PERIOD: float = 60.0
 
 
+class ConcurrencyDefaults:
+    """Default values for transport concurrency configuration."""
+
+    MAX_IN_FLIGHT_PER_SERVER: int | None = None
+
+
 # ============================================================================
 # Pydantic Configuration Models
 # ============================================================================
@@ -147,6 +155,18 @@ class RateLimitSettings(BaseModel):
     model_config = {"frozen": True}
 
 
+class ConcurrencySettings(BaseModel):
+    """Transport concurrency settings."""
+
+    max_in_flight_per_server: int | None = Field(
+        default=ConcurrencyDefaults.MAX_IN_FLIGHT_PER_SERVER,
+        ge=1,
+        description="Maximum concurrent calls per MCP server (None = unlimited)",
+    )
+
+    model_config = {"frozen": True}
+
+
 class MiddlewareConfig(BaseModel):
     """Complete middleware configuration.
 
@@ -160,6 +180,7 @@ class MiddlewareConfig(BaseModel):
     retry: RetrySettings = Field(default_factory=RetrySettings)
     circuit_breaker: CircuitBreakerSettings = Field(default_factory=CircuitBreakerSettings)
     rate_limiting: RateLimitSettings = Field(default_factory=RateLimitSettings)
+    concurrency: ConcurrencySettings = Field(default_factory=ConcurrencySettings)
 
     model_config = {"frozen": True}
 
@@ -242,12 +263,30 @@ class StreamManagerExecutor:
 
     Converts StreamManager's call_tool(tool_name, arguments) interface
     to the execute(list[ToolCall]) -> list[ToolResult] interface.
+
+    Calls in a batch are dispatched concurrently. Each call's server is
+    resolved once, and at most ``max_in_flight_per_server`` calls run against
+    any one server at a time, across all batches sharing this executor.
     """
 
-    __slots__ = ("_stream_manager",)
+    __slots__ = ("_stream_manager", "_max_in_flight_per_server", "_server_semaphores")
 
-    def __init__(self, stream_manager: StreamManager) -> None:
+    def __init__(self, stream_manager: StreamManager, max_in_flight_per_server: int | None = None) -> None:
+        if max_in_flight_per_server is not None and max_in_flight_per_server < 1:
+            raise ValueError("max_in_flight_per_server must be at least 1")
         self._stream_manager = stream_manager
+        self._max_in_flight_per_server = max_in_flight_per_server
+        self._server_semaphores: dict[str | None, asyncio.Semaphore] = {}
+
+    def _semaphore_for(self, server_name: str | None) -> asyncio.Semaphore | None:
+        """Get the in-flight limiter for a server, if limits are configured."""
+        if self._max_in_flight_per_server is None:
+            return None
+        semaphore = self._server_semaphores.get(server_name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_in_flight_per_server)
+            self._server_semaphores[server_name] = semaphore
+        return semaphore
 
     async def execute(
         self,
@@ -257,59 +296,79 @@ class StreamManagerExecutor:
         use_cache: bool = True,  # noqa: ARG002
     ) -> list[ToolResult]:
         """Execute tool calls via StreamManager."""
-        results: list[ToolResult] = []
-
-        for call in calls:
-            start_time = datetime.now(UTC)
-            tool_name = call.tool
-            arguments = call.arguments or {}
+        if not calls:
+            return []
+        if len(calls) == 1:
+            call = calls[0]
+            return [await self._execute_one(call, self._stream_manager.get_server_for_tool(call.tool), timeout)]
+
+        # Resolve each call's server once; calls to the same server share its in-flight limit
+        tasks = [
+            asyncio.create_task(self._execute_one(call, self._stream_manager.get_server_for_tool(call.tool), timeout))
+            for call in calls
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _execute_one(self, call: ToolCall, server_name: str | None, timeout: float | None) -> ToolResult:
+        """Execute a single call, holding the server's in-flight slot if limited."""
+        semaphore = self._semaphore_for(server_name)
+        if semaphore is None:
+            return await self._call(call, server_name, timeout)
+        async with semaphore:
+            return await self._call(call, server_name, timeout)
+
+    async def _call(self, call: ToolCall, server_name: str | None, timeout: float | None) -> ToolResult:
+        """Call the transport and convert the raw response into a ToolResult."""
+        start_time = datetime.now(UTC)
+        tool_name = call.tool
+        arguments = call.arguments or {}
 
-            try:
-                raw_result = await self._stream_manager._direct_call_tool(
-                    tool_name=tool_name,
-                    arguments=arguments,
-                    timeout=timeout,
-                )
+        try:
+            raw_result = await self._stream_manager._direct_call_tool(
+                tool_name=tool_name,
+                arguments=arguments,
+                server_name=server_name,
+                timeout=timeout,
+            )
 
-                end_time = datetime.now(UTC)
-
-                if isinstance(raw_result, dict) and raw_result.get("isError"):
-                    result = ToolResult(
-                        tool=tool_name,
-                        result=None,
-                        error=raw_result.get("error", "Unknown error"),
-                        start_time=start_time,
-                        end_time=end_time,
-                        machine="stream_manager",
-                        pid=0,
-                    )
-                else:
-                    result = ToolResult(
-                        tool=tool_name,
-                        result=raw_result,
-                        error=None,
-                        start_time=start_time,
-                        end_time=end_time,
-                        machine="stream_manager",
-                        pid=0,
-                    )
-                results.append(result)
-
-            except Exception as e:
-                end_time = datetime.now(UTC)
-                results.append(
-                    ToolResult(
-                        tool=tool_name,
-                        result=None,
-                        error=str(e),
-                        start_time=start_time,
-                        end_time=end_time,
-                        machine="stream_manager",
-                        pid=0,
-                    )
+            end_time = datetime.now(UTC)
+
+            if isinstance(raw_result, dict) and raw_result.get("isError"):
+                return ToolResult(
+                    tool=tool_name,
+                    result=None,
+                    error=raw_result.get("error", "Unknown error"),
+                    start_time=start_time,
+                    end_time=end_time,
+                    machine="stream_manager",
+                    pid=0,
                 )
+            return ToolResult(
+                tool=tool_name,
+                result=raw_result,
+                error=None,
+                start_time=start_time,
+                end_time=end_time,
+                machine="stream_manager",
+                pid=0,
+            )
 
-        return results
+        except Exception as e:
+            end_time = datetime.now(UTC)
+            return ToolResult(
+                tool=tool_name,
+                result=None,
+                error=str(e),
+                start_time=start_time,
+                end_time=end_time,
+                machine="stream_manager",
+                pid=0,
+            )
 
 
 # ============================================================================
@@ -333,7 +392,10 @@ class MiddlewareStack:
         config: MiddlewareConfig | None = None,
     ) -> None:
         self._config = config or MiddlewareConfig()
-        self._base_executor = StreamManagerExecutor(stream_manager)
+        self._base_executor = StreamManagerExecutor(
+            stream_manager,
+            max_in_flight_per_server=self._config.concurrency.max_in_flight_per_server,
+        )
         self._executor: Any = None
         self._circuit_breaker_executor: CircuitBreakerExecutor | None = None
         self._build_stack()
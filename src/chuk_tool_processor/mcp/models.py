@@ -11,6 +11,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field, model_validator
 
+from chuk_tool_processor.mcp.transport.models import BatchConfig, HTTPPoolConfig, SupervisorConfig
+
 
 class MCPTransport(StrEnum):
     """Supported MCP transport types."""
@@ -21,6 +23,50 @@ class MCPTransport(StrEnum):
     HTTP_STREAMABLE = "http_streamable"
 
 
+class MCPCacheSettings(BaseModel):
+    """
+    Which MCP tools get their results cached, driven by tool annotations.
+
+    MCP servers describe tool behaviour with ``annotations``: a tool with
+    ``readOnlyHint: true`` has no side effects, so repeating a call with the
+    same arguments may be answered from the processor's result cache without
+    touching the server. Tools that declare ``idempotentHint: false`` are
+    never cached unless listed in ``always_cache``.
+
+    Example:
+        >>> MCPCacheSettings(ttl=60, never_cache=["get_time"], tool_ttls={"search": 600})
+    """
+
+    enabled: bool = Field(default=True, description="Derive cacheability from tool annotations")
+    ttl: int | None = Field(
+        default=None, ge=1, description="TTL in seconds for cached tools (None = processor default)"
+    )
+    cache_idempotent: bool = Field(
+        default=False, description="Also cache tools that are idempotent but not declared read-only"
+    )
+    tool_ttls: dict[str, int] = Field(default_factory=dict, description="Per-tool TTL overrides in seconds")
+    always_cache: list[str] = Field(default_factory=list, description="Tools cached regardless of annotations")
+    never_cache: list[str] = Field(default_factory=list, description="Tools never cached")
+
+    def is_cacheable(self, tool_name: str, annotations: dict[str, Any] | None) -> bool:
+        """Decide whether results of ``tool_name`` may be served from cache."""
+        if not self.enabled or tool_name in self.never_cache:
+            return False
+        if tool_name in self.always_cache:
+            return True
+
+        annotations = annotations or {}
+        if annotations.get("idempotentHint") is False:
+            return False
+        if annotations.get("readOnlyHint") is True:
+            return True
+        return self.cache_idempotent and annotations.get("idempotentHint") is True
+
+    def ttl_for(self, tool_name: str) -> int | None:
+        """TTL for ``tool_name``; ``None`` means the processor's default TTL."""
+        return self.tool_ttls.get(tool_name, self.ttl)
+
+
 class MCPServerConfig(BaseModel):
     """Unified configuration for MCP servers (all transport types)."""
 
@@ -31,6 +77,7 @@ class MCPServerConfig(BaseModel):
     command: str | None = Field(default=None, description="Command to execute (stdio only)")
     args: list[str] = Field(default_factory=list, description="Command arguments (stdio only)")
     env: dict[str, str] | None = Field(default=None, description="Environment variables (stdio only)")
+    replicas: int = Field(default=1, ge=1, description="Identical processes behind this server (stdio only)")
 
     # SSE/HTTP fields
     url: str | None = Field(default=None, description="Server URL (sse/http)")
@@ -39,6 +86,22 @@ class MCPServerConfig(BaseModel):
     sse_read_timeout: float = Field(default=300.0, description="SSE read timeout in seconds (sse only)")
     api_key: str | None = Field(default=None, description="API key extracted from Authorization header")
     session_id: str | None = Field(default=None, description="Session ID for HTTP transport")
+    http_pool: HTTPPoolConfig | None = Field(
+        default=None, description="Shared connection-pool settings for this origin (sse/http)"
+    )
+    supervisor: SupervisorConfig | None = Field(
+        default=None, description="Background pings and reconnects instead of recovering inside calls"
+    )
+    batching: BatchConfig | None = Field(
+        default=None,
+        description="JSON-RPC batch arrays for concurrent requests, when the server supports them (sse only)",
+    )
+    lazy_content: bool = Field(
+        default=False, description="Return text results undecoded as LazyContent until first structured access"
+    )
+    cache: MCPCacheSettings | None = Field(
+        default=None, description="Result-caching overrides for this server's tools (None = MCPConfig.tool_cache)"
+    )
 
     @model_validator(mode="after")
     def validate_transport_fields(self) -> MCPServerConfig:
@@ -67,6 +130,12 @@ class MCPServerConfig(BaseModel):
             }
             if self.env:
                 result["env"] = self.env
+            if self.replicas > 1:
+                result["replicas"] = self.replicas
+            if self.supervisor is not None:
+                result["supervisor"] = self.supervisor
+            if self.lazy_content:
+                result["lazy_content"] = True
             return result
         else:
             # SSE/HTTP
@@ -78,10 +147,18 @@ class MCPServerConfig(BaseModel):
             }
             if self.transport == MCPTransport.SSE:
                 result["sse_read_timeout"] = self.sse_read_timeout
+                if self.batching is not None:
+                    result["batching"] = self.batching
             if self.api_key:
                 result["api_key"] = self.api_key
             if self.session_id:
                 result["session_id"] = self.session_id
+            if self.http_pool is not None:
+                result["http_pool"] = self.http_pool
+            if self.supervisor is not None:
+                result["supervisor"] = self.supervisor
+            if self.lazy_content:
+                result["lazy_content"] = True
             return result
 
 
@@ -133,6 +210,9 @@ class MCPConfig(BaseModel):
     # Caching
     enable_caching: bool = Field(default=True, description="Enable result caching")
     cache_ttl: int = Field(default=300, description="Cache time-to-live in seconds")
+    tool_cache: MCPCacheSettings = Field(
+        default_factory=MCPCacheSettings, description="Which MCP tools are cached, based on their annotations"
+    )
 
     # Rate limiting
     enable_rate_limiting: bool = Field(default=False, description="Enable rate limiting")
@@ -145,8 +225,13 @@ class MCPConfig(BaseModel):
     enable_retries: bool = Field(default=True, description="Enable automatic retries on failure")
     max_retries: int = Field(default=3, description="Maximum number of retry attempts")
 
+    # Tool-schema snapshots
+    snapshot_dir: str | None = Field(
+        default=None, description="Directory for persistent tool-schema snapshots (warm start); None disables"
+    )
+
     # Legacy config file support
     config_file: str | None = Field(default=None, description="Optional config file path (for backward compatibility)")
 
 
-__all__ = ["MCPServerConfig", "MCPTransport", "MCPConfig"]
+__all__ = ["MCPCacheSettings", "MCPServerConfig", "MCPTransport", "MCPConfig"]
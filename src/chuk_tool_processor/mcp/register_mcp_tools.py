@@ -12,7 +12,9 @@ from typing import Any
 
 from chuk_tool_processor.logging import get_logger
 from chuk_tool_processor.mcp.mcp_tool import MCPTool, RecoveryConfig
+from chuk_tool_processor.mcp.models import MCPCacheSettings
 from chuk_tool_processor.mcp.stream_manager import StreamManager
+from chuk_tool_processor.mcp.tool_snapshot import ToolSetDiff
 from chuk_tool_processor.registry.metadata import MCPToolFactoryParams
 from chuk_tool_processor.registry.provider import ToolRegistryProvider
 
@@ -32,6 +34,9 @@ async def register_mcp_tools(
     defer_all_except: list[str] | None = None,
     defer_only: list[str] | None = None,
     search_keywords_fn: Any = None,
+    # Result caching driven by tool annotations
+    cache_settings: MCPCacheSettings | None = None,
+    server_cache_settings: dict[str, MCPCacheSettings] | None = None,
 ) -> list[str]:
     """
     Pull the remote tool catalogue and create local MCPTool wrappers.
@@ -56,6 +61,11 @@ async def register_mcp_tools(
         List of tool names to defer. Only used if defer_loading=False.
     search_keywords_fn
         Optional function(tool_name, tool_def) -> list[str] to generate search keywords
+    cache_settings
+        Which tools are marked cacheable based on their ``readOnlyHint`` /
+        ``idempotentHint`` annotations. Defaults to :class:`MCPCacheSettings`.
+    server_cache_settings
+        Per-server overrides of ``cache_settings``, keyed by server name
 
     Returns
     -------
@@ -69,97 +79,165 @@ async def register_mcp_tools(
     if hasattr(registry, "set_stream_manager"):
         registry.set_stream_manager(namespace, stream_manager)
 
+    cache_settings = cache_settings or MCPCacheSettings()
+    server_cache_settings = server_cache_settings or {}
+
+    async def register_one(tool_def: dict[str, Any]) -> str | None:
+        server = stream_manager.get_server_for_tool(tool_def.get("name", "")) if server_cache_settings else None
+        return await _register_tool(
+            registry,
+            stream_manager,
+            tool_def,
+            namespace=namespace,
+            default_timeout=default_timeout,
+            enable_resilience=enable_resilience,
+            recovery_config=recovery_config,
+            defer_loading=defer_loading,
+            defer_all_except=defer_all_except,
+            defer_only=defer_only,
+            search_keywords_fn=search_keywords_fn,
+            cache_settings=server_cache_settings.get(server or "", cache_settings),
+        )
+
+    # When a server's tool list changes (snapshot refresh, reconnect), only
+    # the added and changed tools are re-registered. Subscribe before reading
+    # the catalogue so a refresh that lands mid-registration is not missed.
+    # Registering the same namespace again replaces the earlier listener.
+    if hasattr(stream_manager, "add_tool_change_listener"):
+
+        async def on_tools_changed(diff: ToolSetDiff) -> None:
+            wanted = set(diff.added) | set(diff.changed)
+            for tool_def in stream_manager.get_tools_for_server(diff.server):
+                if tool_def.get("name") in wanted:
+                    await register_one(tool_def)
+            if diff.removed:
+                logger.debug(
+                    "MCP tools removed from server '%s' stay registered but will fail to route: %s",
+                    diff.server,
+                    diff.removed,
+                )
+
+        stream_manager.add_tool_change_listener(on_tools_changed, key=f"register_mcp_tools:{namespace}")
+
     # Get the remote tool catalogue
     mcp_tools: list[dict[str, Any]] = stream_manager.get_all_tools()
 
     for tool_def in mcp_tools:
-        tool_name = tool_def.get("name")
-        if not tool_name:
-            logger.warning("Remote tool definition without a 'name' field - skipped")
-            continue
-
-        description = tool_def.get("description") or f"MCP tool • {tool_name}"
-
-        # Determine if this tool should be deferred
-        should_defer = False
-        if defer_loading:
-            # Defer all except those in the exception list
-            should_defer = tool_name not in (defer_all_except or [])
-        elif defer_only:
-            # Only defer those in the defer list
-            should_defer = tool_name in defer_only
-
-        # Generate search keywords for deferred tools
-        search_keywords = []
-        if should_defer and search_keywords_fn:
-            search_keywords = search_keywords_fn(tool_name, tool_def)
-        elif should_defer:
-            # Default: use tool name and description words
-            search_keywords = [tool_name.lower()]
-            if description:
-                # Extract words from description
-                words = description.lower().split()
-                search_keywords.extend([w for w in words if len(w) > 3])
-
-        meta: dict[str, Any] = {
-            "description": description,
-            "is_async": True,
-            "tags": {"mcp", "remote"},
-            "argument_schema": tool_def.get("inputSchema", {}),
-            "defer_loading": should_defer,
-        }
-
-        # Add search keywords for deferred tools
-        if should_defer and search_keywords:
-            meta["search_keywords"] = search_keywords[:10]  # Limit to 10
-
-        # Add icon if present (MCP spec 2025-11-25)
-        if "icon" in tool_def:
-            meta["icon"] = tool_def["icon"]
-
-        # For deferred tools, store factory params as Pydantic model
-        if should_defer:
-            meta["mcp_factory_params"] = MCPToolFactoryParams(
-                tool_name=tool_name,
-                default_timeout=default_timeout,
-                enable_resilience=enable_resilience,
-                recovery_config=recovery_config,
-                namespace=namespace,
-            )
-
-        try:
-            # Create MCPTool wrapper with optional resilience configuration
-            wrapper = MCPTool(
-                tool_name=tool_name,
-                stream_manager=stream_manager,
-                default_timeout=default_timeout,
-                enable_resilience=enable_resilience,
-                recovery_config=recovery_config,
-            )
-
-            await registry.register_tool(
-                wrapper,
-                name=tool_name,
-                namespace=namespace,
-                metadata=meta,
-            )
-
-            registered.append(tool_name)
-            defer_status = " (deferred)" if should_defer else ""
-            logger.debug(
-                "MCP tool '%s' registered as '%s:%s'%s",
-                tool_name,
-                namespace,
-                tool_name,
-                defer_status,
-            )
-        except Exception as exc:
-            logger.error("Failed to register MCP tool '%s': %s", tool_name, exc)
+        name = await register_one(tool_def)
+        if name:
+            registered.append(name)
 
     logger.debug("MCP registration complete - %d tool(s) available", len(registered))
     return registered
 
 
+async def _register_tool(
+    registry: Any,
+    stream_manager: StreamManager,
+    tool_def: dict[str, Any],
+    *,
+    namespace: str,
+    default_timeout: float,
+    enable_resilience: bool,
+    recovery_config: RecoveryConfig | None,
+    defer_loading: bool,
+    defer_all_except: list[str] | None,
+    defer_only: list[str] | None,
+    search_keywords_fn: Any,
+    cache_settings: MCPCacheSettings,
+) -> str | None:
+    """Create and register the MCPTool wrapper for one remote tool; return its name on success."""
+    tool_name = tool_def.get("name")
+    if not tool_name:
+        logger.warning("Remote tool definition without a 'name' field - skipped")
+        return None
+
+    description = tool_def.get("description") or f"MCP tool • {tool_name}"
+
+    # Determine if this tool should be deferred
+    should_defer = False
+    if defer_loading:
+        # Defer all except those in the exception list
+        should_defer = tool_name not in (defer_all_except or [])
+    elif defer_only:
+        # Only defer those in the defer list
+        should_defer = tool_name in defer_only
+
+    # Generate search keywords for deferred tools
+    search_keywords = []
+    if should_defer and search_keywords_fn:
+        search_keywords = search_keywords_fn(tool_name, tool_def)
+    elif should_defer:
+        # Default: use tool name and description words
+        search_keywords = [tool_name.lower()]
+        if description:
+            # Extract words from description
+            words = description.lower().split()
+            search_keywords.extend([w for w in words if len(w) > 3])
+
+    meta: dict[str, Any] = {
+        "description": description,
+        "is_async": True,
+        "tags": {"mcp", "remote"},
+        "argument_schema": tool_def.get("inputSchema", {}),
+        "defer_loading": should_defer,
+    }
+
+    # Read-only tools are served from the processor's result cache, so a
+    # repeated call never reaches the transport
+    if cache_settings.is_cacheable(tool_name, tool_def.get("annotations")):
+        meta["cacheable"] = True
+        meta["cache_ttl"] = cache_settings.ttl_for(tool_name)
+
+    # Add search keywords for deferred tools
+    if should_defer and search_keywords:
+        meta["search_keywords"] = search_keywords[:10]  # Limit to 10
+
+    # Add icon if present (MCP spec 2025-11-25)
+    if "icon" in tool_def:
+        meta["icon"] = tool_def["icon"]
+
+    # For deferred tools, store factory params as Pydantic model
+    if should_defer:
+        meta["mcp_factory_params"] = MCPToolFactoryParams(
+            tool_name=tool_name,
+            default_timeout=default_timeout,
+            enable_resilience=enable_resilience,
+            recovery_config=recovery_config,
+            namespace=namespace,
+        )
+
+    try:
+        # Create MCPTool wrapper with optional resilience configuration
+        wrapper = MCPTool(
+            tool_name=tool_name,
+            stream_manager=stream_manager,
+            default_timeout=default_timeout,
+            enable_resilience=enable_resilience,
+            recovery_config=recovery_config,
+        )
+
+        await registry.register_tool(
+            wrapper,
+            name=tool_name,
+            namespace=namespace,
+            metadata=meta,
+        )
+    except Exception as exc:
+        logger.error("Failed to register MCP tool '%s': %s", tool_name, exc)
+        return None
+
+    defer_status = " (deferred)" if should_defer else ""
+    logger.debug(
+        "MCP tool '%s' registered as '%s:%s'%s",
+        tool_name,
+        namespace,
+        tool_name,
+        defer_status,
+    )
+    return tool_name
+
+
 async def update_mcp_tools_stream_manager(
     namespace: str,
     new_stream_manager: StreamManager | None,
@@ -17,10 +17,16 @@ It:
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from chuk_tool_processor.core.processor import ToolProcessor
 from chuk_tool_processor.logging import get_logger
 from chuk_tool_processor.mcp.register_mcp_tools import register_mcp_tools
 from chuk_tool_processor.mcp.stream_manager import StreamManager
+from chuk_tool_processor.mcp.tool_snapshot import ToolSnapshotStore
+
+if TYPE_CHECKING:
+    from chuk_tool_processor.mcp.models import MCPCacheSettings, MCPServerConfig
 
 logger = get_logger("chuk_tool_processor.mcp.setup_http_streamable")
 
@@ -30,7 +36,7 @@ logger = get_logger("chuk_tool_processor.mcp.setup_http_streamable")
 # --------------------------------------------------------------------------- #
 async def setup_mcp_http_streamable(
     *,
-    servers: list[dict[str, str]],
+    servers: list[dict[str, Any]] | list[MCPServerConfig],
     server_names: dict[int, str] | None = None,
     connection_timeout: float = 30.0,
     default_timeout: float = 30.0,
@@ -45,6 +51,8 @@ async def setup_mcp_http_streamable(
     max_retries: int = 2,  # Retry non-OAuth errors (OAuth handled at transport level)
     namespace: str = "http",
     oauth_refresh_callback: any | None = None,  # NEW: OAuth token refresh callback
+    snapshot_dir: str | None = None,
+    tool_cache: MCPCacheSettings | None = None,
 ) -> tuple[ToolProcessor, StreamManager]:
     """
     Initialize HTTP Streamable transport MCP + a :class:`ToolProcessor`.
@@ -71,6 +79,10 @@ async def setup_mcp_http_streamable(
         max_retries: Maximum retry attempts
         namespace: Namespace for registered tools
         oauth_refresh_callback: Optional async callback to refresh OAuth tokens (NEW)
+        snapshot_dir: Optional directory for tool-schema snapshots (warm start)
+        tool_cache: Which tools are cached based on their MCP annotations
+            (None = MCPCacheSettings defaults). MCPServerConfig entries can
+            override it per server with their ``cache`` field.
 
     Returns:
         Tuple of (ToolProcessor, StreamManager)
@@ -88,18 +100,31 @@ async def setup_mcp_http_streamable(
         ...     namespace="mytools"
         ... )
     """
+    from chuk_tool_processor.mcp.models import MCPServerConfig as MCPServerConfigModel
+
+    server_dicts = [s.to_dict() if isinstance(s, MCPServerConfigModel) else s for s in servers]
+    server_cache_settings = {
+        s.name: s.cache for s in servers if isinstance(s, MCPServerConfigModel) and s.cache is not None
+    }
+
     # 1️⃣  create & connect the stream-manager with HTTP Streamable transport
     stream_manager = await StreamManager.create_with_http_streamable(
-        servers=servers,
+        servers=server_dicts,
         server_names=server_names,
         connection_timeout=connection_timeout,
         default_timeout=default_timeout,
         initialization_timeout=initialization_timeout,
         oauth_refresh_callback=oauth_refresh_callback,  # NEW: Pass OAuth callback
+        snapshot_store=ToolSnapshotStore(snapshot_dir) if snapshot_dir else None,
     )
 
     # 2️⃣  pull the remote tool list and register each one locally
-    registered = await register_mcp_tools(stream_manager, namespace=namespace)
+    registered = await register_mcp_tools(
+        stream_manager,
+        namespace=namespace,
+        cache_settings=tool_cache,
+        server_cache_settings=server_cache_settings or None,
+    )
 
     # 3️⃣  build a processor instance configured to your taste
     # IMPORTANT: Retries are enabled but OAuth errors are excluded
@@ -19,9 +19,10 @@ from chuk_tool_processor.core.processor import ToolProcessor
 from chuk_tool_processor.logging import get_logger
 from chuk_tool_processor.mcp.register_mcp_tools import register_mcp_tools
 from chuk_tool_processor.mcp.stream_manager import StreamManager
+from chuk_tool_processor.mcp.tool_snapshot import ToolSnapshotStore
 
 if TYPE_CHECKING:
-    from chuk_tool_processor.mcp.models import MCPConfig, MCPServerConfig
+    from chuk_tool_processor.mcp.models import MCPCacheSettings, MCPConfig, MCPServerConfig
 
 logger = get_logger("chuk_tool_processor.mcp.setup_stdio")
 
@@ -49,6 +50,8 @@ async def setup_mcp_stdio(  # noqa: C901 - long but just a config facade
     enable_retries: bool = True,
     max_retries: int = 3,
     namespace: str = "mcp",
+    snapshot_dir: str | None = None,
+    tool_cache: MCPCacheSettings | None = None,
 ) -> tuple[ToolProcessor, StreamManager]:
     """
     Initialise stdio-transport MCP + a :class:`ToolProcessor`.
@@ -74,6 +77,8 @@ async def setup_mcp_stdio(  # noqa: C901 - long but just a config facade
         enable_retries: Enable retries
         max_retries: Maximum retry attempts
         namespace: Tool namespace
+        snapshot_dir: Optional directory for tool-schema snapshots (warm start)
+        tool_cache: Which tools are cached based on their MCP annotations
 
     Returns:
         Tuple of (ToolProcessor, StreamManager)
@@ -141,6 +146,8 @@ async def setup_mcp_stdio(  # noqa: C901 - long but just a config facade
         enable_retries = config.enable_retries
         max_retries = config.max_retries
         namespace = config.namespace
+        snapshot_dir = config.snapshot_dir
+        tool_cache = config.tool_cache
 
     # Ensure servers is provided
     if servers is None:
@@ -159,6 +166,7 @@ async def setup_mcp_stdio(  # noqa: C901 - long but just a config facade
             transport_type="stdio",
             default_timeout=default_timeout,
             initialization_timeout=initialization_timeout,
+            snapshot_store=ToolSnapshotStore(snapshot_dir) if snapshot_dir else None,
         )
     else:
         # NEW DX: servers are config dicts or Pydantic models
@@ -174,10 +182,19 @@ async def setup_mcp_stdio(  # noqa: C901 - long but just a config facade
             server_names=server_names,
             default_timeout=default_timeout,
             initialization_timeout=initialization_timeout,
+            snapshot_store=ToolSnapshotStore(snapshot_dir) if snapshot_dir else None,
         )
 
     # 2️⃣  pull the remote tool list and register each one locally
-    registered = await register_mcp_tools(stream_manager, namespace=namespace)
+    server_cache_settings = {
+        s.name: s.cache for s in servers if isinstance(s, MCPServerConfigModel) and s.cache is not None
+    }
+    registered = await register_mcp_tools(
+        stream_manager,
+        namespace=namespace,
+        cache_settings=tool_cache,
+        server_cache_settings=server_cache_settings or None,
+    )
 
     # 3️⃣  build a processor instance configured to your taste
     processor = ToolProcessor(
@@ -12,7 +12,10 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import inspect
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 # --------------------------------------------------------------------------- #
@@ -22,20 +25,48 @@ from chuk_mcp.config import load_config  # type: ignore[import-untyped]
 
 from chuk_tool_processor.logging import get_logger
 from chuk_tool_processor.mcp.models import MCPTransport
+from chuk_tool_processor.mcp.tool_snapshot import ToolSetDiff, ToolSnapshot, ToolSnapshotStore
 from chuk_tool_processor.mcp.transport import (
     HTTPStreamableTransport,
     MCPBaseTransport,
     SSETransport,
+    StdioPoolTransport,
     StdioTransport,
     TimeoutConfig,
 )
-from chuk_tool_processor.mcp.transport.models import MCPToolDefinition, ServerInfo
+from chuk_tool_processor.mcp.transport.models import (
+    BatchConfig,
+    HTTPPoolConfig,
+    MCPToolDefinition,
+    ServerInfo,
+    SupervisorConfig,
+)
 
 if TYPE_CHECKING:
     from chuk_tool_processor.mcp.middleware import MiddlewareConfig, MiddlewareStack
 
 logger = get_logger("chuk_tool_processor.mcp.stream_manager")
 
+# Default number of servers connected at once during initialization
+DEFAULT_INIT_CONCURRENCY = 8
+
+
+@dataclass
+class _ServerConnection:
+    """Outcome of connecting to one server during initialization."""
+
+    idx: int
+    name: str
+    transport: MCPBaseTransport
+    tools: list[MCPToolDefinition] | None = None
+    status: str = "Down"
+    snapshot: ToolSnapshot | None = None
+    from_snapshot: bool = False
+
+
+# Called with the diff whenever a server's live tool list differs from what was served
+ToolChangeListener = Callable[[ToolSetDiff], Awaitable[None] | None]
+
 
 class StreamManager:
     """
@@ -68,16 +99,28 @@ class StreamManager:
         self,
         timeout_config: TimeoutConfig | None = None,
         middleware_config: MiddlewareConfig | None = None,
+        snapshot_store: ToolSnapshotStore | None = None,
     ) -> None:
         self.transports: dict[str, MCPBaseTransport] = {}
         self.server_info: list[ServerInfo] = []
         self.tool_to_server_map: dict[str, str] = {}
         self.server_names: dict[int, str] = {}
         self.all_tools: list[MCPToolDefinition] = []
+        # server name -> (transport, whether its call_tool accepts ``timeout``)
+        self._call_capabilities: dict[str, tuple[MCPBaseTransport, bool]] = {}
         self._lock = asyncio.Lock()
         self._closed = False  # Track if we've been closed
         self.timeout_config = timeout_config or TimeoutConfig()
 
+        # Tool snapshots: warm start from disk, refresh in the background, diff on change
+        self._snapshot_store = snapshot_store
+        self._snapshot_keys: dict[str, str] = {}  # server name -> config hash
+        self._snapshots: dict[str, ToolSnapshot] = {}  # server name -> tools currently served
+        self._server_tools: dict[str, list[MCPToolDefinition]] = {}
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
+        self._tool_listeners: list[ToolChangeListener] = []
+        self._keyed_tool_listeners: dict[str, ToolChangeListener] = {}
+
         # Middleware support
         self._middleware_config = middleware_config
         self._middleware_stack: MiddlewareStack | None = None
@@ -94,9 +137,11 @@ class StreamManager:
         transport_type: str = "stdio",
         default_timeout: float = 30.0,
         initialization_timeout: float = 60.0,  # NEW: Timeout for entire initialization
+        max_concurrency: int = DEFAULT_INIT_CONCURRENCY,
+        snapshot_store: ToolSnapshotStore | None = None,
     ) -> StreamManager:
         """Create StreamManager with timeout protection."""
-        inst = cls()
+        inst = cls(snapshot_store=snapshot_store)
         await inst.initialize(
             config_file,
             servers,
@@ -104,6 +149,7 @@ class StreamManager:
             transport_type,
             default_timeout=default_timeout,
             initialization_timeout=initialization_timeout,
+            max_concurrency=max_concurrency,
         )
         return inst
 
@@ -116,9 +162,11 @@ class StreamManager:
         default_timeout: float = 30.0,
         initialization_timeout: float = 60.0,  # NEW
         oauth_refresh_callback: any | None = None,  # NEW: OAuth token refresh callback
+        max_concurrency: int = DEFAULT_INIT_CONCURRENCY,
+        snapshot_store: ToolSnapshotStore | None = None,
     ) -> StreamManager:
         """Create StreamManager with SSE transport and timeout protection."""
-        inst = cls()
+        inst = cls(snapshot_store=snapshot_store)
         await inst.initialize_with_sse(
             servers,
             server_names,
@@ -126,6 +174,7 @@ class StreamManager:
             default_timeout=default_timeout,
             initialization_timeout=initialization_timeout,
             oauth_refresh_callback=oauth_refresh_callback,  # NEW: Pass OAuth callback
+            max_concurrency=max_concurrency,
         )
         return inst
 
@@ -136,14 +185,17 @@ class StreamManager:
         server_names: dict[int, str] | None = None,
         default_timeout: float = 30.0,
         initialization_timeout: float = 60.0,
+        max_concurrency: int = DEFAULT_INIT_CONCURRENCY,
+        snapshot_store: ToolSnapshotStore | None = None,
     ) -> StreamManager:
         """Create StreamManager with STDIO transport and timeout protection (no config file needed)."""
-        inst = cls()
+        inst = cls(snapshot_store=snapshot_store)
         await inst.initialize_with_stdio(
             servers,
             server_names,
             default_timeout=default_timeout,
             initialization_timeout=initialization_timeout,
+            max_concurrency=max_concurrency,
         )
         return inst
 
@@ -156,9 +208,11 @@ class StreamManager:
         default_timeout: float = 30.0,
         initialization_timeout: float = 60.0,  # NEW
         oauth_refresh_callback: any | None = None,  # NEW: OAuth token refresh callback
+        max_concurrency: int = DEFAULT_INIT_CONCURRENCY,
+        snapshot_store: ToolSnapshotStore | None = None,
     ) -> StreamManager:
         """Create StreamManager with HTTP Streamable transport and timeout protection."""
-        inst = cls()
+        inst = cls(snapshot_store=snapshot_store)
         await inst.initialize_with_http_streamable(
             servers,
             server_names,
@@ -166,6 +220,7 @@ class StreamManager:
             default_timeout=default_timeout,
             initialization_timeout=initialization_timeout,
             oauth_refresh_callback=oauth_refresh_callback,  # NEW: Pass OAuth callback
+            max_concurrency=max_concurrency,
         )
         return inst
 
@@ -216,8 +271,15 @@ class StreamManager:
         transport_type: str = "stdio",
         default_timeout: float = 30.0,
         initialization_timeout: float = 60.0,
+        max_concurrency: int = DEFAULT_INIT_CONCURRENCY,
     ) -> None:
-        """Initialize with graceful headers handling for all transport types."""
+        """
+        Initialize with graceful headers handling for all transport types.
+
+        Servers are connected concurrently, at most ``max_concurrency`` at a time.
+        Each server gets its own ``initialization_timeout``, so one slow or hung
+        server does not delay the others.
+        """
         if self._closed:
             raise RuntimeError("Cannot initialize a closed StreamManager")
 
@@ -228,123 +290,99 @@ class StreamManager:
             logger.error("Unsupported transport type: %s", transport_type)
             return
 
-        async with self._lock:
-            self.server_names = server_names or {}
+        async def build(server_name: str) -> MCPBaseTransport | None:
+            if transport_enum == MCPTransport.STDIO:
+                params, server_timeout = await load_config(config_file, server_name)
+                # Use per-server timeout if specified, otherwise use global default
+                effective_timeout = server_timeout if server_timeout is not None else default_timeout
+                logger.debug(
+                    f"Server '{server_name}' using timeout: {effective_timeout}s (per-server: {server_timeout}, default: {default_timeout})"
+                )
+                # Use initialization_timeout for connection_timeout since subprocess
+                # launch can take time (e.g., uvx downloading packages)
+                transport: MCPBaseTransport = StdioTransport(
+                    params, connection_timeout=initialization_timeout, default_timeout=effective_timeout
+                )
+            elif transport_enum == MCPTransport.SSE:
+                logger.debug("Using SSE transport in initialize() - consider using initialize_with_sse() instead")
+                params, server_timeout = await load_config(config_file, server_name)
+                # Use per-server timeout if specified, otherwise use global default
+                effective_timeout = server_timeout if server_timeout is not None else default_timeout
+
+                if isinstance(params, dict) and "url" in params:
+                    sse_url = params["url"]
+                    api_key = params.get("api_key")
+                    headers = params.get("headers", {})
+                else:
+                    sse_url = "http://localhost:8000"
+                    api_key = None
+                    headers = {}
+                    logger.debug("No URL configured for SSE transport, using default: %s", sse_url)
 
-            for idx, server_name in enumerate(servers):
-                try:
-                    if transport_enum == MCPTransport.STDIO:
-                        params, server_timeout = await load_config(config_file, server_name)
-                        # Use per-server timeout if specified, otherwise use global default
-                        effective_timeout = server_timeout if server_timeout is not None else default_timeout
-                        logger.debug(
-                            f"Server '{server_name}' using timeout: {effective_timeout}s (per-server: {server_timeout}, default: {default_timeout})"
-                        )
-                        # Use initialization_timeout for connection_timeout since subprocess
-                        # launch can take time (e.g., uvx downloading packages)
-                        transport: MCPBaseTransport = StdioTransport(
-                            params, connection_timeout=initialization_timeout, default_timeout=effective_timeout
-                        )
-                    elif transport_enum == MCPTransport.SSE:
-                        logger.debug(
-                            "Using SSE transport in initialize() - consider using initialize_with_sse() instead"
-                        )
-                        params, server_timeout = await load_config(config_file, server_name)
-                        # Use per-server timeout if specified, otherwise use global default
-                        effective_timeout = server_timeout if server_timeout is not None else default_timeout
-
-                        if isinstance(params, dict) and "url" in params:
-                            sse_url = params["url"]
-                            api_key = params.get("api_key")
-                            headers = params.get("headers", {})
-                        else:
-                            sse_url = "http://localhost:8000"
-                            api_key = None
-                            headers = {}
-                            logger.debug("No URL configured for SSE transport, using default: %s", sse_url)
-
-                        # Build SSE transport with optional headers
-                        transport_params = {"url": sse_url, "api_key": api_key, "default_timeout": effective_timeout}
-                        if headers:
-                            transport_params["headers"] = headers
-
-                        transport = SSETransport(**transport_params)
-
-                    elif transport_enum in (MCPTransport.HTTP, MCPTransport.HTTP_STREAMABLE):
-                        logger.debug(
-                            "Using HTTP Streamable transport in initialize() - consider using initialize_with_http_streamable() instead"
-                        )
-                        params, server_timeout = await load_config(config_file, server_name)
-                        # Use per-server timeout if specified, otherwise use global default
-                        effective_timeout = server_timeout if server_timeout is not None else default_timeout
-
-                        if isinstance(params, dict) and "url" in params:
-                            http_url = params["url"]
-                            api_key = params.get("api_key")
-                            headers = params.get("headers", {})
-                            session_id = params.get("session_id")
-                        else:
-                            http_url = "http://localhost:8000"
-                            api_key = None
-                            headers = {}
-                            session_id = None
-                            logger.debug("No URL configured for HTTP Streamable transport, using default: %s", http_url)
-
-                        # IMPORTANT: If transport already exists for this server, preserve its session ID
-                        if server_name in self.transports:
-                            existing_transport = self.transports[server_name]
-                            if hasattr(existing_transport, "session_id") and existing_transport.session_id:
-                                session_id = existing_transport.session_id
-                                logger.debug(f"Preserving session ID for {server_name}: {session_id}")
-
-                        # Build HTTP transport (headers not supported yet)
-                        transport_params = {
-                            "url": http_url,
-                            "api_key": api_key,
-                            "default_timeout": effective_timeout,
-                            "session_id": session_id,
-                        }
-                        # Note: headers not added until HTTPStreamableTransport supports them
-                        if headers:
-                            logger.debug("Headers provided but not supported in HTTPStreamableTransport yet")
-
-                        transport = HTTPStreamableTransport(**transport_params)
+                # Build SSE transport with optional headers
+                transport_params = {"url": sse_url, "api_key": api_key, "default_timeout": effective_timeout}
+                if headers:
+                    transport_params["headers"] = headers
 
-                    else:
-                        logger.error("Unsupported transport type: %s", transport_type)
-                        continue
-
-                    # Initialize with timeout protection
-                    try:
-                        if not await asyncio.wait_for(transport.initialize(), timeout=initialization_timeout):
-                            logger.warning("Failed to init %s", server_name)
-                            continue
-                    except TimeoutError:
-                        logger.error("Timeout initialising %s (timeout=%ss)", server_name, initialization_timeout)
-                        continue
-
-                    self.transports[server_name] = transport
-
-                    # Ping and get tools with timeout protection (use longer timeouts for slow servers)
-                    status = (
-                        "Up"
-                        if await asyncio.wait_for(transport.send_ping(), timeout=self.timeout_config.operation)
-                        else "Down"
-                    )
-                    raw_tools = await asyncio.wait_for(transport.get_tools(), timeout=self.timeout_config.operation)
-                    tools = [MCPToolDefinition.model_validate(t) for t in raw_tools]
-
-                    for t in tools:
-                        if t.name:
-                            self.tool_to_server_map[t.name] = server_name
-                    self.all_tools.extend(tools)
-
-                    self.server_info.append(ServerInfo(id=idx, name=server_name, tools=len(tools), status=status))
-                    logger.debug("Initialised %s - %d tool(s)", server_name, len(tools))
-                except TimeoutError:
-                    logger.error("Timeout initialising %s", server_name)
-                except Exception as exc:
-                    logger.error("Error initialising %s: %s", server_name, exc)
+                transport = SSETransport(**transport_params)
+
+            elif transport_enum in (MCPTransport.HTTP, MCPTransport.HTTP_STREAMABLE):
+                logger.debug(
+                    "Using HTTP Streamable transport in initialize() - consider using initialize_with_http_streamable() instead"
+                )
+                params, server_timeout = await load_config(config_file, server_name)
+                # Use per-server timeout if specified, otherwise use global default
+                effective_timeout = server_timeout if server_timeout is not None else default_timeout
+
+                if isinstance(params, dict) and "url" in params:
+                    http_url = params["url"]
+                    api_key = params.get("api_key")
+                    headers = params.get("headers", {})
+                    session_id = params.get("session_id")
+                else:
+                    http_url = "http://localhost:8000"
+                    api_key = None
+                    headers = {}
+                    session_id = None
+                    logger.debug("No URL configured for HTTP Streamable transport, using default: %s", http_url)
+
+                # IMPORTANT: If transport already exists for this server, preserve its session ID
+                if server_name in self.transports:
+                    existing_transport = self.transports[server_name]
+                    if hasattr(existing_transport, "session_id") and existing_transport.session_id:
+                        session_id = existing_transport.session_id
+                        logger.debug(f"Preserving session ID for {server_name}: {session_id}")
+
+                # Build HTTP transport (headers not supported yet)
+                transport_params = {
+                    "url": http_url,
+                    "api_key": api_key,
+                    "default_timeout": effective_timeout,
+                    "session_id": session_id,
+                }
+                # Note: headers not added until HTTPStreamableTransport supports them
+                if headers:
+                    logger.debug("Headers provided but not supported in HTTPStreamableTransport yet")
+
+                transport = HTTPStreamableTransport(**transport_params)
+
+            else:  # pragma: no cover - rejected when converting transport_type above
+                logger.error("Unsupported transport type: %s", transport_type)
+                return None
+
+            return transport
+
+        async with self._lock:
+            self.server_names = server_names or {}
+            for server_name in servers:
+                self._remember_server_config(
+                    server_name, {"config_file": config_file, "server": server_name, "transport": transport_type}
+                )
+            await self._initialize_servers(
+                [(idx, server_name, lambda n=server_name: build(n)) for idx, server_name in enumerate(servers)],
+                initialization_timeout=initialization_timeout,
+                max_concurrency=max_concurrency,
+            )
 
             logger.debug(
                 "StreamManager ready - %d server(s), %d tool(s)",
@@ -360,70 +398,62 @@ class StreamManager:
         default_timeout: float = 30.0,
         initialization_timeout: float = 60.0,
         oauth_refresh_callback: any | None = None,  # NEW: OAuth token refresh callback
+        max_concurrency: int = DEFAULT_INIT_CONCURRENCY,
     ) -> None:
         """Initialize with SSE transport with optional headers support."""
         if self._closed:
             raise RuntimeError("Cannot initialize a closed StreamManager")
 
+        async def build(cfg: dict[str, str]) -> MCPBaseTransport:
+            name = cfg["name"]
+            # Build SSE transport parameters with optional headers
+            transport_params = {
+                "url": cfg["url"],
+                "api_key": cfg.get("api_key"),
+                "connection_timeout": connection_timeout,
+                "default_timeout": default_timeout,
+            }
+
+            # Add headers if provided
+            headers = cfg.get("headers", {})
+            if headers:
+                logger.debug("SSE %s: Using configured headers: %s", name, list(headers.keys()))
+                transport_params["headers"] = headers
+
+            # Add OAuth refresh callback if provided (NEW)
+            if oauth_refresh_callback:
+                transport_params["oauth_refresh_callback"] = oauth_refresh_callback
+                logger.debug("SSE %s: OAuth refresh callback configured", name)
+
+            if cfg.get("http_pool"):
+                transport_params["http_pool"] = HTTPPoolConfig.model_validate(cfg["http_pool"])
+            if cfg.get("supervisor"):
+                transport_params["supervisor"] = SupervisorConfig.model_validate(cfg["supervisor"])
+            if cfg.get("lazy_content"):
+                transport_params["lazy_content"] = True
+            if cfg.get("batching"):
+                transport_params["batching"] = BatchConfig.model_validate(cfg["batching"])
+
+            return SSETransport(**transport_params)
+
         async with self._lock:
             self.server_names = server_names or {}
 
+            jobs: list[tuple[int, str, Callable[[], Awaitable[MCPBaseTransport | None]]]] = []
             for idx, cfg in enumerate(servers):
                 name, url = cfg.get("name"), cfg.get("url")
                 if not (name and url):
                     logger.error("Bad server config: %s", cfg)
                     continue
-                try:
-                    # Build SSE transport parameters with optional headers
-                    transport_params = {
-                        "url": url,
-                        "api_key": cfg.get("api_key"),
-                        "connection_timeout": connection_timeout,
-                        "default_timeout": default_timeout,
-                    }
-
-                    # Add headers if provided
-                    headers = cfg.get("headers", {})
-                    if headers:
-                        logger.debug("SSE %s: Using configured headers: %s", name, list(headers.keys()))
-                        transport_params["headers"] = headers
-
-                    # Add OAuth refresh callback if provided (NEW)
-                    if oauth_refresh_callback:
-                        transport_params["oauth_refresh_callback"] = oauth_refresh_callback
-                        logger.debug("SSE %s: OAuth refresh callback configured", name)
-
-                    transport = SSETransport(**transport_params)
-
-                    try:
-                        if not await asyncio.wait_for(transport.initialize(), timeout=initialization_timeout):
-                            logger.warning("Failed to init SSE %s", name)
-                            continue
-                    except TimeoutError:
-                        logger.error("Timeout initialising SSE %s (timeout=%ss)", name, initialization_timeout)
-                        continue
-
-                    self.transports[name] = transport
-                    # Use longer timeouts for slow servers (ping can take time after initialization)
-                    status = (
-                        "Up"
-                        if await asyncio.wait_for(transport.send_ping(), timeout=self.timeout_config.operation)
-                        else "Down"
-                    )
-                    raw_tools = await asyncio.wait_for(transport.get_tools(), timeout=self.timeout_config.operation)
-                    tools = [MCPToolDefinition.model_validate(t) for t in raw_tools]
-
-                    for t in tools:
-                        if t.name:
-                            self.tool_to_server_map[t.name] = name
-                    self.all_tools.extend(tools)
-
-                    self.server_info.append(ServerInfo(id=idx, name=name, tools=len(tools), status=status))
-                    logger.debug("Initialised SSE %s - %d tool(s)", name, len(tools))
-                except TimeoutError:
-                    logger.error("Timeout initialising SSE %s", name)
-                except Exception as exc:
-                    logger.error("Error initialising SSE %s: %s", name, exc)
+                self._remember_server_config(name, cfg)
+                jobs.append((idx, name, lambda c=cfg: build(c)))
+
+            await self._initialize_servers(
+                jobs,
+                initialization_timeout=initialization_timeout,
+                max_concurrency=max_concurrency,
+                label="SSE",
+            )
 
             logger.debug(
                 "StreamManager ready - %d SSE server(s), %d tool(s)",
@@ -437,69 +467,63 @@ class StreamManager:
         server_names: dict[int, str] | None = None,
         default_timeout: float = 30.0,
         initialization_timeout: float = 60.0,
+        max_concurrency: int = DEFAULT_INIT_CONCURRENCY,
     ) -> None:
         """Initialize with STDIO transport directly from server configs (no config file needed)."""
         if self._closed:
             raise RuntimeError("Cannot initialize a closed StreamManager")
 
+        async def build(cfg: dict[str, Any]) -> MCPBaseTransport:
+            command = cfg["command"]
+            args = cfg.get("args", [])
+            env = cfg.get("env")
+
+            # Build STDIO transport parameters
+            transport_params = {
+                "command": command,
+                "args": args,
+            }
+            if env:
+                transport_params["env"] = env
+
+            logger.debug("STDIO %s: command=%s, args=%s", cfg["name"], command, args)
+
+            # Background supervision and lazy content decoding are opt-in per server
+            options: dict[str, Any] = {
+                "connection_timeout": initialization_timeout,
+                "default_timeout": default_timeout,
+            }
+            if cfg.get("supervisor"):
+                options["supervisor"] = SupervisorConfig.model_validate(cfg["supervisor"])
+            if cfg.get("lazy_content"):
+                options["lazy_content"] = True
+
+            # Several identical processes behind one logical server, each built with the same options
+            replicas = int(cfg.get("replicas") or 1)
+            if replicas > 1:
+                logger.debug("STDIO %s: %d replicas", cfg["name"], replicas)
+                return StdioPoolTransport(transport_params, replicas=replicas, **options)
+
+            return StdioTransport(transport_params, **options)
+
         async with self._lock:
             self.server_names = server_names or {}
 
+            jobs: list[tuple[int, str, Callable[[], Awaitable[MCPBaseTransport | None]]]] = []
             for idx, cfg in enumerate(servers):
                 name = cfg.get("name")
-                command = cfg.get("command")
-                args = cfg.get("args", [])
-                env = cfg.get("env")
-
-                if not (name and command):
+                if not (name and cfg.get("command")):
                     logger.error("Bad STDIO server config (missing name or command): %s", cfg)
                     continue
-
-                try:
-                    # Build STDIO transport parameters
-                    transport_params = {
-                        "command": command,
-                        "args": args,
-                    }
-                    if env:
-                        transport_params["env"] = env
-
-                    logger.debug("STDIO %s: command=%s, args=%s", name, command, args)
-
-                    transport = StdioTransport(
-                        transport_params, connection_timeout=initialization_timeout, default_timeout=default_timeout
-                    )
-
-                    try:
-                        if not await asyncio.wait_for(transport.initialize(), timeout=initialization_timeout):
-                            logger.warning("Failed to init STDIO %s", name)
-                            continue
-                    except TimeoutError:
-                        logger.error("Timeout initialising STDIO %s (timeout=%ss)", name, initialization_timeout)
-                        continue
-
-                    self.transports[name] = transport
-
-                    # Ping and get tools with timeout protection
-                    status = (
-                        "Up"
-                        if await asyncio.wait_for(transport.send_ping(), timeout=self.timeout_config.operation)
-                        else "Down"
-                    )
-                    raw_tools = await asyncio.wait_for(transport.get_tools(), timeout=self.timeout_config.operation)
-                    tools = [MCPToolDefinition.model_validate(t) for t in raw_tools]
-
-                    for t in tools:
-                        if t.name:
-                            self.tool_to_server_map[t.name] = name
-                    self.all_tools.extend(tools)
-
-                    self.server_info.append(ServerInfo(id=idx, name=name, tools=len(tools), status=status))
-                    logger.debug("Initialised STDIO %s - %d tool(s)", name, len(tools))
-                except TimeoutError:
-                    logger.error("Timeout initialising STDIO %s", name)
-                except Exception as exc:
-                    logger.error("Error initialising STDIO %s: %s", name, exc)
+                self._remember_server_config(name, cfg)
+                jobs.append((idx, name, lambda c=cfg: build(c)))
+
+            await self._initialize_servers(
+                jobs,
+                initialization_timeout=initialization_timeout,
+                max_concurrency=max_concurrency,
+                label="STDIO",
+            )
 
             logger.debug(
                 "StreamManager ready - %d STDIO server(s), %d tool(s)",
@@ -515,6 +539,7 @@ class StreamManager:
         default_timeout: float = 30.0,
         initialization_timeout: float = 60.0,
         oauth_refresh_callback: any | None = None,  # NEW: OAuth token refresh callback
+        max_concurrency: int = DEFAULT_INIT_CONCURRENCY,
     ) -> None:
         """Initialize with HTTP Streamable transport with graceful headers handling."""
         if self._closed:
@@ -522,70 +547,55 @@ class StreamManager:
 
         logger.debug(f"initialize_with_http_streamable: initialization_timeout={initialization_timeout}")
 
+        async def build(cfg: dict[str, str]) -> MCPBaseTransport:
+            name = cfg["name"]
+            # Build HTTP Streamable transport parameters
+            transport_params = {
+                "url": cfg["url"],
+                "api_key": cfg.get("api_key"),
+                "connection_timeout": connection_timeout,
+                "default_timeout": default_timeout,
+                "session_id": cfg.get("session_id"),
+            }
+
+            # Handle headers if provided
+            headers = cfg.get("headers", {})
+            if headers:
+                transport_params["headers"] = headers
+                logger.debug("HTTP Streamable %s: Custom headers configured: %s", name, list(headers.keys()))
+
+            # Add OAuth refresh callback if provided (NEW)
+            if oauth_refresh_callback:
+                transport_params["oauth_refresh_callback"] = oauth_refresh_callback
+                logger.debug("HTTP Streamable %s: OAuth refresh callback configured", name)
+
+            if cfg.get("http_pool"):
+                transport_params["http_pool"] = HTTPPoolConfig.model_validate(cfg["http_pool"])
+            if cfg.get("supervisor"):
+                transport_params["supervisor"] = SupervisorConfig.model_validate(cfg["supervisor"])
+            if cfg.get("lazy_content"):
+                transport_params["lazy_content"] = True
+
+            return HTTPStreamableTransport(**transport_params)
+
         async with self._lock:
             self.server_names = server_names or {}
 
+            jobs: list[tuple[int, str, Callable[[], Awaitable[MCPBaseTransport | None]]]] = []
             for idx, cfg in enumerate(servers):
                 name, url = cfg.get("name"), cfg.get("url")
                 if not (name and url):
                     logger.error("Bad server config: %s", cfg)
                     continue
-                try:
-                    # Build HTTP Streamable transport parameters
-                    transport_params = {
-                        "url": url,
-                        "api_key": cfg.get("api_key"),
-                        "connection_timeout": connection_timeout,
-                        "default_timeout": default_timeout,
-                        "session_id": cfg.get("session_id"),
-                    }
-
-                    # Handle headers if provided
-                    headers = cfg.get("headers", {})
-                    if headers:
-                        transport_params["headers"] = headers
-                        logger.debug("HTTP Streamable %s: Custom headers configured: %s", name, list(headers.keys()))
-
-                    # Add OAuth refresh callback if provided (NEW)
-                    if oauth_refresh_callback:
-                        transport_params["oauth_refresh_callback"] = oauth_refresh_callback
-                        logger.debug("HTTP Streamable %s: OAuth refresh callback configured", name)
-
-                    transport = HTTPStreamableTransport(**transport_params)
-
-                    logger.debug(f"Calling transport.initialize() for {name} with timeout={initialization_timeout}s")
-                    try:
-                        if not await asyncio.wait_for(transport.initialize(), timeout=initialization_timeout):
-                            logger.warning("Failed to init HTTP Streamable %s", name)
-                            continue
-                    except TimeoutError:
-                        logger.error(
-                            "Timeout initialising HTTP Streamable %s (timeout=%ss)", name, initialization_timeout
-                        )
-                        continue
-                    logger.debug(f"Successfully initialized {name}")
-
-                    self.transports[name] = transport
-                    # Use longer timeouts for slow servers (ping can take time after initialization)
-                    status = (
-                        "Up"
-                        if await asyncio.wait_for(transport.send_ping(), timeout=self.timeout_config.operation)
-                        else "Down"
-                    )
-                    raw_tools = await asyncio.wait_for(transport.get_tools(), timeout=self.timeout_config.operation)
-                    tools = [MCPToolDefinition.model_validate(t) for t in raw_tools]
-
-                    for t in tools:
-                        if t.name:
-                            self.tool_to_server_map[t.name] = name
-                    self.all_tools.extend(tools)
-
-                    self.server_info.append(ServerInfo(id=idx, name=name, tools=len(tools), status=status))
-                    logger.debug("Initialised HTTP Streamable %s - %d tool(s)", name, len(tools))
-                except TimeoutError:
-                    logger.error("Timeout initialising HTTP Streamable %s", name)
-                except Exception as exc:
-                    logger.error("Error initialising HTTP Streamable %s: %s", name, exc)
+                self._remember_server_config(name, cfg)
+                jobs.append((idx, name, lambda c=cfg: build(c)))
+
+            await self._initialize_servers(
+                jobs,
+                initialization_timeout=initialization_timeout,
+                max_concurrency=max_concurrency,
+                label="HTTP Streamable",
+            )
 
             logger.debug(
                 "StreamManager ready - %d HTTP Streamable server(s), %d tool(s)",
@@ -593,12 +603,254 @@ class StreamManager:
                 len(self.all_tools),
             )
 
+    async def _initialize_servers(
+        self,
+        jobs: list[tuple[int, str, Callable[[], Awaitable[MCPBaseTransport | None]]]],
+        *,
+        initialization_timeout: float,
+        max_concurrency: int = DEFAULT_INIT_CONCURRENCY,
+        label: str = "",
+    ) -> None:
+        """
+        Connect to servers concurrently and merge the results in input order.
+
+        Each job is ``(index, server_name, build)`` where ``build`` creates the
+        transport. At most ``max_concurrency`` servers are connected at once.
+        Results are merged in job order regardless of completion order, so a
+        tool exposed by several servers maps to the last one listed, exactly as
+        with sequential initialization. Must be called with ``_lock`` held.
+        """
+        if not jobs:
+            return
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def bounded(idx: int, name: str, build: Callable[[], Awaitable[MCPBaseTransport | None]]):
+            async with semaphore:
+                return await self._connect_server(idx, name, build, initialization_timeout, label)
+
+        connections = await asyncio.gather(*(bounded(*job) for job in jobs))
+
+        for conn in connections:
+            if conn is None:
+                continue
+            self._register_transport(conn.name, conn.transport)
+            if conn.tools is None:
+                continue
+
+            for t in conn.tools:
+                if t.name:
+                    self.tool_to_server_map[t.name] = conn.name
+            self.all_tools.extend(conn.tools)
+            self._server_tools[conn.name] = conn.tools
+            if conn.snapshot is not None:
+                self._snapshots[conn.name] = conn.snapshot
+
+            self.server_info.append(ServerInfo(id=conn.idx, name=conn.name, tools=len(conn.tools), status=conn.status))
+
+        # Tools served from a snapshot are checked against the live server in the background
+        for conn in connections:
+            if conn is not None and conn.from_snapshot:
+                self._schedule_tool_refresh(conn.name)
+
+    async def _connect_server(
+        self,
+        idx: int,
+        name: str,
+        build: Callable[[], Awaitable[MCPBaseTransport | None]],
+        initialization_timeout: float,
+        label: str = "",
+    ) -> _ServerConnection | None:
+        """
+        Create, initialize, ping and list tools for a single server.
+
+        Returns ``None`` if the transport could not be created or initialized.
+        A transport that initialized but failed to ping or list tools is
+        returned without tools, matching the sequential behaviour.
+        """
+        display = f"{label} {name}" if label else name
+        try:
+            transport = await build()
+            if transport is None:
+                return None
+
+            try:
+                if not await asyncio.wait_for(transport.initialize(), timeout=initialization_timeout):
+                    logger.warning("Failed to init %s", display)
+                    return None
+            except TimeoutError:
+                logger.error("Timeout initialising %s (timeout=%ss)", display, initialization_timeout)
+                return None
+        except Exception as exc:
+            logger.error("Error initialising %s: %s", display, exc)
+            return None
+
+        conn = _ServerConnection(idx=idx, name=name, transport=transport)
+        snapshot = await self._load_snapshot(name)
+        try:
+            # Ping and get tools with timeout protection (use longer timeouts for slow servers)
+            status = (
+                "Up" if await asyncio.wait_for(transport.send_ping(), timeout=self.timeout_config.operation) else "Down"
+            )
+            if snapshot is not None:
+                conn.tools = snapshot.definitions()
+                conn.snapshot = snapshot
+                conn.from_snapshot = True
+            else:
+                raw_tools = await asyncio.wait_for(transport.get_tools(), timeout=self.timeout_config.operation)
+                conn.tools = [MCPToolDefinition.model_validate(t) for t in raw_tools]
+                conn.snapshot = await self._save_snapshot(name, conn.tools)
+            conn.status = status
+            logger.debug(
+                "Initialised %s - %d tool(s)%s",
+                display,
+                len(conn.tools),
+                " from snapshot" if conn.from_snapshot else "",
+            )
+        except TimeoutError:
+            logger.error("Timeout initialising %s", display)
+        except Exception as exc:
+            logger.error("Error initialising %s: %s", display, exc)
+        return conn
+
+    # ------------------------------------------------------------------ #
+    #  tool snapshots                                                    #
+    # ------------------------------------------------------------------ #
+    def _remember_server_config(self, name: str, config: dict[str, Any]) -> None:
+        """Record the config hash that keys ``name``'s snapshot."""
+        self._snapshot_keys[name] = ToolSnapshotStore.key_for(config)
+
+    async def _load_snapshot(self, name: str) -> ToolSnapshot | None:
+        if self._snapshot_store is None or name not in self._snapshot_keys:
+            return None
+        return await self._snapshot_store.load(self._snapshot_keys[name])
+
+    async def _save_snapshot(self, name: str, tools: list[MCPToolDefinition]) -> ToolSnapshot | None:
+        """Write a snapshot of ``tools``; ``None`` (and no hashing) without a store."""
+        if self._snapshot_store is None or name not in self._snapshot_keys:
+            return None
+        snapshot = ToolSnapshot.from_tools(name, self._snapshot_keys[name], tools)
+        await self._snapshot_store.save(snapshot)
+        return snapshot
+
+    def add_tool_change_listener(self, listener: ToolChangeListener, *, key: str | None = None) -> None:
+        """
+        Call ``listener(diff)`` whenever a refresh finds a server's tools changed.
+
+        A ``key`` identifies the listener's owner: adding another listener
+        under the same key replaces the previous one instead of stacking.
+        """
+        if key is not None:
+            previous = self._keyed_tool_listeners.pop(key, None)
+            if previous is not None:
+                self.remove_tool_change_listener(previous)
+            self._keyed_tool_listeners[key] = listener
+        self._tool_listeners.append(listener)
+
+    def remove_tool_change_listener(self, listener: ToolChangeListener) -> None:
+        """Stop notifying ``listener``."""
+        with contextlib.suppress(ValueError):
+            self._tool_listeners.remove(listener)
+        for key, keyed in list(self._keyed_tool_listeners.items()):
+            if keyed is listener:
+                del self._keyed_tool_listeners[key]
+
+    async def refresh_tools(self, server_name: str) -> ToolSetDiff | None:
+        """
+        Re-list a server's tools and apply only what changed.
+
+        Compares per-tool content hashes against the tools currently served.
+        On a change the tool maps are updated, the snapshot is rewritten and
+        listeners receive the diff. Returns ``None`` if the server is unknown
+        or could not be listed.
+        """
+        transport = self.transports.get(server_name)
+        if transport is None or self._closed:
+            return None
+
+        try:
+            raw_tools = await asyncio.wait_for(transport.get_tools(), timeout=self.timeout_config.operation)
+            tools = [MCPToolDefinition.model_validate(t) for t in raw_tools]
+        except Exception as exc:
+            logger.warning("Could not refresh tools for %s: %s", server_name, exc)
+            return None
+
+        key = self._snapshot_keys.get(server_name, "")
+        current = self._snapshots.get(server_name) or ToolSnapshot.from_tools(
+            server_name, key, self._server_tools.get(server_name, [])
+        )
+        fresh = ToolSnapshot.from_tools(server_name, key, tools)
+        diff = current.diff(fresh)
+        if not diff.has_changes:
+            logger.debug("Tools for %s unchanged", server_name)
+            return diff
+
+        async with self._lock:
+            self._apply_server_tools(server_name, tools)
+            self._snapshots[server_name] = fresh
+        if self._snapshot_store is not None and key:
+            await self._snapshot_store.save(fresh)
+        logger.info(
+            "Tools for %s changed: %d added, %d removed, %d changed",
+            server_name,
+            len(diff.added),
+            len(diff.removed),
+            len(diff.changed),
+        )
+
+        for listener in list(self._tool_listeners):
+            try:
+                result = listener(diff)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:
+                logger.error("Tool change listener failed for %s: %s", server_name, exc)
+        return diff
+
+    def _apply_server_tools(self, server_name: str, tools: list[MCPToolDefinition]) -> None:
+        """Replace one server's tools and rebuild the merged maps in server order."""
+        self._server_tools[server_name] = tools
+        self.all_tools = []
+        self.tool_to_server_map = {}
+        for info in self.server_info:
+            for t in self._server_tools.get(info.name, []):
+                if t.name:
+                    self.tool_to_server_map[t.name] = info.name
+                self.all_tools.append(t)
+            if info.name == server_name:
+                info.tools = len(tools)
+
+    def _schedule_tool_refresh(self, server_name: str) -> None:
+        task = asyncio.create_task(self._background_refresh(server_name))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _background_refresh(self, server_name: str) -> None:
+        try:
+            await self.refresh_tools(server_name)
+        except Exception as exc:
+            logger.error("Background tool refresh failed for %s: %s", server_name, exc)
+
+    async def wait_for_tool_refresh(self) -> None:
+        """Wait until background snapshot validation has finished."""
+        while self._refresh_tasks:
+            await asyncio.gather(*list(self._refresh_tasks), return_exceptions=True)
+
+    def _cancel_tool_refreshes(self) -> None:
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        self._refresh_tasks.clear()
+
     # ------------------------------------------------------------------ #
     #  queries                                                           #
     # ------------------------------------------------------------------ #
     def get_all_tools(self) -> list[dict[str, Any]]:
         return [t.model_dump() for t in self.all_tools]
 
+    def get_tools_for_server(self, server_name: str) -> list[dict[str, Any]]:
+        """Tool definitions currently served for one server."""
+        return [t.model_dump() for t in self._server_tools.get(server_name, [])]
+
     def get_server_for_tool(self, tool_name: str) -> str | None:
         return self.tool_to_server_map.get(tool_name)
 
@@ -798,16 +1050,9 @@ class StreamManager:
         if timeout is not None:
             logger.debug("Calling tool '%s' with %ss timeout", tool_name, timeout)
             try:
-                if hasattr(transport, "call_tool"):
-                    import inspect
-
-                    sig = inspect.signature(transport.call_tool)
-                    if "timeout" in sig.parameters:
-                        return await transport.call_tool(tool_name, arguments, timeout=timeout)
-                    else:
-                        return await asyncio.wait_for(transport.call_tool(tool_name, arguments), timeout=timeout)
-                else:
-                    return await asyncio.wait_for(transport.call_tool(tool_name, arguments), timeout=timeout)
+                if self._accepts_timeout(server_name, transport):
+                    return await transport.call_tool(tool_name, arguments, timeout=timeout)
+                return await asyncio.wait_for(transport.call_tool(tool_name, arguments), timeout=timeout)
             except TimeoutError:
                 logger.warning("Tool '%s' timed out after %ss", tool_name, timeout)
                 return {
@@ -817,6 +1062,32 @@ class StreamManager:
         else:
             return await transport.call_tool(tool_name, arguments)
 
+    # ------------------------------------------------------------------ #
+    #  transport capabilities                                            #
+    # ------------------------------------------------------------------ #
+    def _register_transport(self, server_name: str, transport: MCPBaseTransport) -> None:
+        """Register a transport and resolve its call capabilities once."""
+        self.transports[server_name] = transport
+        self._call_capabilities[server_name] = (transport, self._call_accepts_timeout(transport))
+
+    def _accepts_timeout(self, server_name: str, transport: MCPBaseTransport) -> bool:
+        """Whether the transport's call_tool takes a ``timeout`` argument (cached per transport)."""
+        cached = self._call_capabilities.get(server_name)
+        if cached is not None and cached[0] is transport:
+            return cached[1]
+        # Transport was assigned directly rather than registered; resolve and remember it
+        accepts = self._call_accepts_timeout(transport)
+        self._call_capabilities[server_name] = (transport, accepts)
+        return accepts
+
+    @staticmethod
+    def _call_accepts_timeout(transport: MCPBaseTransport) -> bool:
+        """Inspect a transport's call_tool signature for a ``timeout`` parameter."""
+        try:
+            return "timeout" in inspect.signature(transport.call_tool).parameters
+        except (TypeError, ValueError):
+            return False
+
     def enable_middleware(self, config: MiddlewareConfig | None = None) -> None:
         """Enable middleware with the given configuration.
 
@@ -872,6 +1143,8 @@ class StreamManager:
             logger.debug("StreamManager already closed")
             return
 
+        self._cancel_tool_refreshes()
+
         if not self.transports:
             logger.debug("No transports to close")
             self._closed = True
@@ -996,10 +1269,13 @@ class StreamManager:
         """Clean up internal state synchronously."""
         try:
             self.transports.clear()
+            self._call_capabilities.clear()
             self.server_info.clear()
             self.tool_to_server_map.clear()
             self.all_tools.clear()
             self.server_names.clear()
+            self._snapshots.clear()
+            self._server_tools.clear()
         except Exception as e:
             logger.debug("Error during state cleanup: %s", e)
 
@@ -1082,6 +1358,9 @@ class StreamManager:
             success = await transport._attempt_recovery()
             if success:
                 logger.info("Server %s reconnected successfully", server_name)
+                if self._snapshot_store is not None or self._tool_listeners:
+                    # Diff against what we already serve; only changed tools are re-registered
+                    await self.refresh_tools(server_name)
             else:
                 logger.warning("Server %s reconnection failed", server_name)
             return success
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# chuk_tool_processor/mcp/tool_snapshot.py
+"""
+Persistent, content-hashed snapshots of MCP server tool schemas.
+
+Listing and validating hundreds of tool definitions on every start adds
+seconds to cold start. A :class:`ToolSnapshotStore` keeps the last known tool
+list of each server on disk, keyed by a hash of the server's configuration.
+:class:`~chuk_tool_processor.mcp.stream_manager.StreamManager` serves tools
+from the snapshot immediately and checks the live ``tools/list`` in the
+background; each tool carries its own content hash so only tools that
+actually changed are reported (as a :class:`ToolSetDiff`) and re-registered.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field, ValidationError
+
+from chuk_tool_processor.logging import get_logger
+from chuk_tool_processor.mcp.transport.models import MCPToolDefinition
+
+logger = get_logger("chuk_tool_processor.mcp.tool_snapshot")
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def _canonical(obj: Any) -> str:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def content_hash(obj: Any) -> str:
+    """Stable SHA-256 hex digest of a JSON-compatible object."""
+    return hashlib.sha256(_canonical(obj).encode(), usedforsecurity=False).hexdigest()
+
+
+class ToolSetDiff(BaseModel):
+    """Tool names that differ between two versions of a server's tool list."""
+
+    server: str = Field(description="Server the tools belong to")
+    added: list[str] = Field(default_factory=list, description="Tools that are new")
+    removed: list[str] = Field(default_factory=list, description="Tools that disappeared")
+    changed: list[str] = Field(default_factory=list, description="Tools whose definition changed")
+
+    @property
+    def has_changes(self) -> bool:
+        """True if any tool was added, removed or changed."""
+        return bool(self.added or self.removed or self.changed)
+
+
+class ToolSnapshot(BaseModel):
+    """The tool list of one server as last seen, with per-tool content hashes."""
+
+    version: int = Field(default=SNAPSHOT_FORMAT_VERSION, description="Snapshot file format version")
+    server: str = Field(description="Server name")
+    config_key: str = Field(description="Hash of the server configuration the tools came from")
+    digest: str = Field(description="Hash of the whole tool list")
+    tool_digests: dict[str, str] = Field(default_factory=dict, description="Tool name -> definition hash")
+    tools: list[dict[str, Any]] = Field(default_factory=list, description="Validated tool definitions")
+    saved_at: float = Field(default_factory=time.time, description="Unix time the snapshot was written")
+
+    @classmethod
+    def from_tools(cls, server: str, config_key: str, tools: list[MCPToolDefinition]) -> ToolSnapshot:
+        """Build a snapshot from validated tool definitions."""
+        dumped = [t.model_dump() for t in tools]
+        return cls(
+            server=server,
+            config_key=config_key,
+            digest=content_hash(dumped),
+            tool_digests={d["name"]: content_hash(d) for d in dumped},
+            tools=dumped,
+        )
+
+    def definitions(self) -> list[MCPToolDefinition]:
+        """
+        Tool definitions without re-validation.
+
+        The definitions were validated before the snapshot was written, so
+        ``model_construct`` is enough on the warm-start path.
+        """
+        return [MCPToolDefinition.model_construct(**t) for t in self.tools]
+
+    def diff(self, other: ToolSnapshot) -> ToolSetDiff:
+        """What changed going from this snapshot to ``other``."""
+        if self.digest == other.digest:
+            return ToolSetDiff(server=other.server)
+
+        old, new = self.tool_digests, other.tool_digests
+        return ToolSetDiff(
+            server=other.server,
+            added=[name for name in new if name not in old],
+            removed=[name for name in old if name not in new],
+            changed=[name for name, digest in new.items() if name in old and old[name] != digest],
+        )
+
+
+class ToolSnapshotStore:
+    """
+    Directory of tool snapshots, one JSON file per server configuration.
+
+    Files are named after :meth:`key_for` of the server config, so changing a
+    server's command, URL or arguments starts from a fresh snapshot. Writes
+    are atomic (temp file + rename).
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    @staticmethod
+    def key_for(server_config: dict[str, Any]) -> str:
+        """Hash identifying a server configuration."""
+        return content_hash(server_config)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _read(self, key: str) -> ToolSnapshot | None:
+        path = self._path(key)
+        try:
+            data = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+        try:
+            snapshot = ToolSnapshot.model_validate_json(data)
+        except ValidationError as e:
+            logger.warning("Ignoring unreadable tool snapshot %s: %s", path, e)
+            return None
+        if snapshot.version != SNAPSHOT_FORMAT_VERSION or snapshot.config_key != key:
+            return None
+        return snapshot
+
+    def _write(self, snapshot: ToolSnapshot) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".snapshot-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(snapshot.model_dump_json())
+            os.replace(tmp, self._path(snapshot.config_key))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    async def load(self, key: str) -> ToolSnapshot | None:
+        """Load the snapshot for ``key``; ``None`` if missing, stale-format or corrupt."""
+        try:
+            return await asyncio.to_thread(self._read, key)
+        except OSError as e:
+            logger.warning("Could not read tool snapshot %s: %s", key, e)
+            return None
+
+    async def save(self, snapshot: ToolSnapshot) -> None:
+        """Persist ``snapshot``; failures are logged, never raised."""
+        try:
+            await asyncio.to_thread(self._write, snapshot)
+        except OSError as e:
+            logger.warning("Could not write tool snapshot for %s: %s", snapshot.server, e)
+
+    def delete(self, key: str) -> None:
+        """Remove the snapshot for ``key`` if present."""
+        with contextlib.suppress(FileNotFoundError):
+            self._path(key).unlink()
@@ -10,23 +10,37 @@ All transports now follow the same interface and provide consistent behavior:
 """
 
 from .base_transport import MCPBaseTransport
+from .http_pool import HTTPClientPool, get_http_client_pool
 from .http_streamable_transport import HTTPStreamableTransport
 from .models import (
+    BatchConfig,
     HeadersConfig,
+    HTTPPoolConfig,
     ServerInfo,
+    SupervisorConfig,
     TimeoutConfig,
     TransportMetrics,
 )
 from .sse_transport import SSETransport
+from .stdio_pool_transport import StdioPoolTransport
 from .stdio_transport import StdioTransport
+from .supervisor import TransportState, TransportSupervisor
 
 __all__ = [
     "MCPBaseTransport",
     "StdioTransport",
+    "StdioPoolTransport",
     "SSETransport",
     "HTTPStreamableTransport",
     "TimeoutConfig",
     "TransportMetrics",
     "ServerInfo",
     "HeadersConfig",
+    "HTTPPoolConfig",
+    "HTTPClientPool",
+    "get_http_client_pool",
+    "SupervisorConfig",
+    "BatchConfig",
+    "TransportState",
+    "TransportSupervisor",
 ]
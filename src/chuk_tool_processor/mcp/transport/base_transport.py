@@ -8,6 +8,11 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Any
 
+from chuk_tool_processor.models.lazy_content import LazyContent
+
+from .models import SupervisorConfig
+from .supervisor import TransportSupervisor
+
 
 class MCPBaseTransport(ABC):
     """
@@ -17,6 +22,12 @@ class MCPBaseTransport(ABC):
     for consistency across stdio, SSE, and HTTP streamable transports.
     """
 
+    # Set by transports constructed with a SupervisorConfig
+    _supervisor: TransportSupervisor | None = None
+
+    # Return text content as LazyContent instead of decoding it eagerly
+    lazy_content: bool = False
+
     # ------------------------------------------------------------------ #
     #  Core connection lifecycle                                         #
     # ------------------------------------------------------------------ #
@@ -153,6 +164,44 @@ class MCPBaseTransport(ABC):
         except Exception:
             return False
 
+    # ------------------------------------------------------------------ #
+    #  Background supervision                                            #
+    # ------------------------------------------------------------------ #
+    @property
+    def supervisor(self) -> TransportSupervisor | None:
+        """The background supervisor, if this transport is supervised and initialized."""
+        return self._supervisor
+
+    def _start_supervisor(self, config: SupervisorConfig | None) -> None:
+        """Start background supervision after a successful initialize (no-op if running)."""
+        if config is None or self._supervisor is not None:
+            return
+        self._supervisor = TransportSupervisor(self, config)
+        self._supervisor.start()
+
+    async def _stop_supervisor(self) -> None:
+        supervisor, self._supervisor = self._supervisor, None
+        if supervisor is not None:
+            await supervisor.stop()
+
+    async def _supervised_ready(self) -> bool:
+        """
+        Call-path gate for supervised transports.
+
+        Hands an unhealthy connection to the supervisor instead of recovering
+        inline, then waits (bounded) for it to become ready again.
+        """
+        supervisor = self._supervisor
+        if supervisor is None:
+            return True
+        if not self.is_connected():
+            supervisor.mark_degraded()
+        return await supervisor.wait_ready()
+
+    def _unavailable_result(self) -> dict[str, Any]:
+        state = self._supervisor.state if self._supervisor is not None else "closed"
+        return {"isError": True, "error": f"Connection {state}; reconnecting in background"}
+
     # ------------------------------------------------------------------ #
     #  Backward compatibility and utility methods                       #
     # ------------------------------------------------------------------ #
@@ -270,6 +319,8 @@ class MCPBaseTransport(ABC):
             if isinstance(content_item, dict):
                 if content_item.get("type") == "text":
                     text_content = content_item.get("text", "")
+                    if self.lazy_content:
+                        return LazyContent(text_content)
                     # Try to parse JSON, fall back to plain text
                     try:
                         import json
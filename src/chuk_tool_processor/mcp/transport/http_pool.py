@@ -0,0 +1,156 @@
+# chuk_tool_processor/mcp/transport/http_pool.py
+"""
+Process-wide registry of pooled ``httpx.AsyncClient`` instances.
+
+Every remote transport used to open its own client (and therefore its own
+connection pool), and HTTP health probes opened a fresh client per probe,
+paying a TCP/TLS handshake each time. The registry hands out one shared
+client per ``(event loop, origin, HTTPPoolConfig)`` so transports that talk
+to the same host reuse keep-alive connections and, when enabled, multiplex
+requests over HTTP/2.
+
+Clients are reference counted: :meth:`HTTPClientPool.acquire` takes a
+reference and :meth:`HTTPClientPool.release` drops it, closing the client
+when the last holder lets go. Timeouts and credentials are passed per
+request, so holders with different timeouts or API keys can still share a
+client. Pooled clients never store cookies: a session cookie set in reply to
+one holder's credentials would otherwise be sent with every other holder's
+requests to the same origin.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any
+
+import httpx
+
+from .models import HTTPPoolConfig
+
+logger = logging.getLogger(__name__)
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_PoolKey = tuple[asyncio.AbstractEventLoop, str, HTTPPoolConfig]
+
+
+@dataclass
+class _PooledClient:
+    client: httpx.AsyncClient
+    refs: int = 0
+
+
+def _no_cookie_jar() -> CookieJar:
+    """A cookie jar whose policy accepts no domain, so nothing is stored or sent."""
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=()))
+
+
+def origin_of(url: str) -> str:
+    """Return ``scheme://host[:port]`` for ``url``."""
+    parsed = httpx.URL(url)
+    port = f":{parsed.port}" if parsed.port is not None else ""
+    return f"{parsed.scheme}://{parsed.host}{port}"
+
+
+class HTTPClientPool:
+    """Reference-counted shared HTTP clients keyed by origin and pool settings."""
+
+    def __init__(self) -> None:
+        self._clients: dict[_PoolKey, _PooledClient] = {}
+        self._keys: dict[int, _PoolKey] = {}
+        self._warned_http2 = False
+
+    def _build_client(self, config: HTTPPoolConfig) -> httpx.AsyncClient:
+        http2 = config.http2
+        if http2 and not _HTTP2_AVAILABLE:
+            if not self._warned_http2:
+                logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+                self._warned_http2 = True
+            http2 = False
+
+        return httpx.AsyncClient(
+            cookies=_no_cookie_jar(),
+            follow_redirects=True,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+        )
+
+    def _prune_closed_loops(self) -> None:
+        """Forget clients whose event loop has gone away (their sockets died with it)."""
+        stale = [key for key in self._clients if key[0].is_closed()]
+        for key in stale:
+            entry = self._clients.pop(key)
+            self._keys.pop(id(entry.client), None)
+
+    def acquire(self, url: str, config: HTTPPoolConfig | None = None) -> httpx.AsyncClient:
+        """
+        Take a reference to the shared client for ``url``'s origin.
+
+        Must be called from a running event loop; pair every call with
+        :meth:`release`.
+        """
+        config = config or HTTPPoolConfig()
+        self._prune_closed_loops()
+
+        key: _PoolKey = (asyncio.get_running_loop(), origin_of(url), config)
+        entry = self._clients.get(key)
+        if entry is None or entry.client.is_closed:
+            entry = _PooledClient(self._build_client(config))
+            self._clients[key] = entry
+            self._keys[id(entry.client)] = key
+            logger.debug("Created pooled HTTP client for %s", key[1])
+        entry.refs += 1
+        return entry.client
+
+    async def release(self, client: httpx.AsyncClient) -> None:
+        """Drop a reference taken by :meth:`acquire`; close the client on the last one."""
+        key = self._keys.get(id(client))
+        entry = self._clients.get(key) if key is not None else None
+        if entry is None or entry.client is not client:
+            return
+
+        entry.refs -= 1
+        if entry.refs > 0:
+            return
+
+        del self._clients[key]
+        del self._keys[id(client)]
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug("Error closing pooled HTTP client for %s: %s", key[1], e)
+
+    async def close_all(self) -> None:
+        """Close every client regardless of outstanding references."""
+        entries = list(self._clients.values())
+        self._clients.clear()
+        self._keys.clear()
+        for entry in entries:
+            try:
+                await entry.client.aclose()
+            except Exception as e:
+                logger.debug("Error closing pooled HTTP client: %s", e)
+
+    def get_stats(self) -> list[dict[str, Any]]:
+        """One entry per live client: origin, references and pool settings."""
+        self._prune_closed_loops()
+        return [
+            {"origin": origin, "refs": entry.refs, "http2": config.http2, "max_connections": config.max_connections}
+            for (_loop, origin, config), entry in self._clients.items()
+        ]
+
+
+_pool = HTTPClientPool()
+
+
+def get_http_client_pool() -> HTTPClientPool:
+    """Return the process-wide HTTP client pool."""
+    return _pool
@@ -24,7 +24,8 @@ from chuk_mcp.transports.http.transport import (
 )
 
 from .base_transport import MCPBaseTransport
-from .models import TimeoutConfig, TransportMetrics
+from .http_pool import get_http_client_pool
+from .models import HTTPPoolConfig, SupervisorConfig, TimeoutConfig, TransportMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,9 @@ class HTTPStreamableTransport(MCPBaseTransport):
         enable_metrics: bool = True,
         oauth_refresh_callback: Any | None = None,
         timeout_config: TimeoutConfig | None = None,
+        http_pool: HTTPPoolConfig | None = None,
+        supervisor: SupervisorConfig | None = None,
+        lazy_content: bool = False,
     ):
         """
         Initialize HTTP Streamable transport with enhanced configuration.
@@ -62,6 +66,9 @@ class HTTPStreamableTransport(MCPBaseTransport):
             enable_metrics: Whether to track performance metrics
             oauth_refresh_callback: Optional async callback to refresh OAuth tokens
             timeout_config: Optional timeout configuration model with connect/operation/quick/shutdown
+            http_pool: Optional pool settings for the shared client used by health probes
+            supervisor: Optional background supervision (pings and reconnects off the call path)
+            lazy_content: Return text results as LazyContent, decoded on first structured access
         """
         # Ensure URL points to the /mcp endpoint
         if not url.endswith("/mcp"):
@@ -74,6 +81,9 @@ class HTTPStreamableTransport(MCPBaseTransport):
         self.session_id = session_id
         self.enable_metrics = enable_metrics
         self.oauth_refresh_callback = oauth_refresh_callback
+        self.http_pool = http_pool or HTTPPoolConfig()
+        self._supervisor_config = supervisor
+        self.lazy_content = lazy_content
 
         # Use timeout config or create from individual parameters
         if timeout_config is None:
@@ -96,6 +106,8 @@ class HTTPStreamableTransport(MCPBaseTransport):
         self._read_stream = None
         self._write_stream = None
         self._initialized = False
+        # Pooled client for health probes, held until cleanup so probes reuse keep-alive connections
+        self._health_client = None
 
         # Health monitoring (NEW - like SSE)
         self._last_successful_ping = None
@@ -123,14 +135,16 @@ class HTTPStreamableTransport(MCPBaseTransport):
     async def _test_connection_health(self) -> bool:
         """Test basic HTTP connectivity (like SSE's connectivity test)."""
         try:
-            import httpx
-
-            async with httpx.AsyncClient(timeout=self.timeout_config.quick) as client:
-                # Test basic connectivity to base URL
-                base_url = self.url.replace("/mcp", "")
-                response = await client.get(f"{base_url}/health", headers=self._get_headers())
-                logger.debug("Health check response: %s", response.status_code)
-                return response.status_code < 500  # Accept any non-server-error
+            if self._health_client is None:
+                self._health_client = get_http_client_pool().acquire(self.url, self.http_pool)
+
+            # Test basic connectivity to base URL
+            base_url = self.url.replace("/mcp", "")
+            response = await self._health_client.get(
+                f"{base_url}/health", headers=self._get_headers(), timeout=self.timeout_config.quick
+            )
+            logger.debug("Health check response: %s", response.status_code)
+            return response.status_code < 500  # Accept any non-server-error
         except Exception as e:
             logger.debug("Connection health test failed: %s", e)
             return True  # Don't fail on health check errors
@@ -229,6 +243,7 @@ class HTTPStreamableTransport(MCPBaseTransport):
                     total_init_time,
                     ping_time,
                 )
+                self._start_supervisor(self._supervisor_config)
                 return True
             else:
                 logger.debug("HTTP connection established but ping failed")
@@ -237,6 +252,7 @@ class HTTPStreamableTransport(MCPBaseTransport):
                 self._consecutive_failures = 1  # Mark one failure
                 if self.enable_metrics and self._metrics:
                     self._metrics.initialization_time = time.time() - start_time
+                self._start_supervisor(self._supervisor_config)
                 return True
 
         except TimeoutError:
@@ -271,6 +287,7 @@ class HTTPStreamableTransport(MCPBaseTransport):
 
     async def close(self) -> None:
         """Close with enhanced cleanup and metrics reporting."""
+        await self._stop_supervisor()
         if not self._initialized:
             return
 
@@ -305,6 +322,9 @@ class HTTPStreamableTransport(MCPBaseTransport):
         self._read_stream = None
         self._write_stream = None
         self._initialized = False
+        if self._health_client is not None:
+            client, self._health_client = self._health_client, None
+            await get_http_client_pool().release(client)
         # NOTE: We do NOT reset self.session_id here - it should persist across reconnections
 
     async def send_ping(self) -> bool:
@@ -413,6 +433,9 @@ class HTTPStreamableTransport(MCPBaseTransport):
         self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
     ) -> dict[str, Any]:
         """Enhanced tool calling with recovery and health monitoring."""
+        # Supervised: recovery runs in the background, the call only checks state
+        if self._supervisor is not None and not await self._supervised_ready():
+            return self._unavailable_result()
         if not self._initialized:
             return {"isError": True, "error": "Transport not initialized"}
 
@@ -425,8 +448,8 @@ class HTTPStreamableTransport(MCPBaseTransport):
         try:
             logger.debug("Calling tool '%s' with timeout %ss", tool_name, tool_timeout)
 
-            # Enhanced connection check with recovery attempt
-            if not self.is_connected():
+            # Enhanced connection check with recovery attempt (unsupervised only)
+            if self._supervisor is None and not self.is_connected():
                 logger.warning("Connection unhealthy, attempting recovery...")
                 if not await self._attempt_recovery():
                     if self.enable_metrics:
@@ -632,6 +655,8 @@ class HTTPStreamableTransport(MCPBaseTransport):
                 "max_consecutive_failures": self._max_consecutive_failures,
             }
         )
+        if self._supervisor is not None:
+            metrics["supervisor"] = self._supervisor.get_stats()
         return metrics
 
     def set_session_id(self, session_id: str | None) -> None:
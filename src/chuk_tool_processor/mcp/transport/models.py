@@ -41,6 +41,68 @@ class TimeoutConfig(BaseModel):
     shutdown: float = Field(default=2.0, description="Timeout for shutdown and cleanup operations")
 
 
+class HTTPPoolConfig(BaseModel):
+    """
+    Connection-pool settings for the shared HTTP clients used by remote transports.
+
+    Transports with the same origin and the same pool settings share one
+    ``httpx.AsyncClient`` (see :mod:`.http_pool`), so keep-alive connections and
+    TLS sessions are reused across transports and health probes.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_connections: int = Field(default=100, ge=1, description="Maximum concurrent connections per origin")
+    max_keepalive_connections: int = Field(default=20, ge=0, description="Idle connections kept open per origin")
+    keepalive_expiry: float = Field(default=30.0, gt=0, description="Seconds an idle connection is kept open")
+    http2: bool = Field(
+        default=False,
+        description="Multiplex requests over HTTP/2 (requires the 'h2' package; falls back to HTTP/1.1 without it)",
+    )
+
+
+class BatchConfig(BaseModel):
+    """
+    JSON-RPC batching for transports that POST each request (SSE).
+
+    Requests issued within ``window_ms`` of each other are sent as one JSON-RPC
+    batch array instead of one POST each. Every request still waits on its
+    own response with its own timeout.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    window_ms: float = Field(default=2.0, ge=0, description="How long to collect requests before sending a batch")
+    max_batch_size: int = Field(default=32, ge=1, description="Send immediately once this many requests are queued")
+    require_server_support: bool = Field(
+        default=True,
+        description=(
+            "Only batch if the server negotiates MCP 2025-03-26 (the revision with JSON-RPC batching) "
+            "or advertises capabilities.experimental.batching"
+        ),
+    )
+
+
+class SupervisorConfig(BaseModel):
+    """
+    Settings for the background supervisor that keeps a transport connected.
+
+    With a supervisor, pings and reconnects run in a background task instead
+    of inside ``call_tool``; calls only check the published state and either
+    wait up to ``park_timeout`` for a reconnect or fail fast.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    ping_interval: float = Field(default=30.0, gt=0, description="Seconds between keep-alive pings while ready")
+    initial_backoff: float = Field(default=0.5, gt=0, description="First delay between failed reconnect attempts")
+    max_backoff: float = Field(default=30.0, gt=0, description="Upper bound for the reconnect backoff")
+    backoff_multiplier: float = Field(default=2.0, ge=1.0, description="Backoff growth per failed reconnect")
+    park_timeout: float = Field(
+        default=10.0, ge=0, description="Seconds a call waits for a reconnect before failing (0 = fail fast)"
+    )
+
+
 class TransportMetrics(BaseModel):
     """Performance and connection metrics for transports."""
 
@@ -58,6 +120,8 @@ class TransportMetrics(BaseModel):
     connection_errors: int = Field(default=0, description="Number of connection errors")
     recovery_attempts: int = Field(default=0, description="Number of recovery attempts")
     session_discoveries: int = Field(default=0, description="Number of session discoveries (SSE)")
+    batches_sent: int = Field(default=0, description="Number of JSON-RPC batch arrays sent")
+    batched_requests: int = Field(default=0, description="Number of requests sent inside batches")
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary format."""
@@ -0,0 +1,85 @@
+# chuk_tool_processor/mcp/transport/sse_parser.py
+"""
+Incremental Server-Sent Events parser working on raw byte chunks.
+
+The SSE transport used to read ``aiter_lines()``, which decodes every chunk
+to text, splits it into ``str`` lines and only then looks at the fields.
+For large streamed tool results that means the payload is decoded, copied
+line by line and re-encoded before JSON parsing. :class:`SSEParser` keeps
+the stream as bytes: chunks are appended to one buffer, scanned for line
+ends from where the previous scan stopped, and ``data:`` fields of an event
+are accumulated until the blank line that dispatches it. The dispatched
+:class:`SSEEvent` carries its data as ``bytes``, ready for ``orjson.loads``.
+
+Follows the WHATWG event-stream format: ``\\n`` and ``\\r\\n`` line ends,
+``:`` comments, one optional space after the colon, multiple ``data:``
+lines joined with ``\\n``, and events without data are not dispatched. An
+event that is not terminated by a blank line when the stream ends is
+dropped.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+__all__ = ["SSEEvent", "SSEParser"]
+
+
+@dataclass(slots=True)
+class SSEEvent:
+    """One dispatched event."""
+
+    event: str
+    data: bytes
+    id: str | None = None
+
+
+class SSEParser:
+    """Feed byte chunks in, get complete :class:`SSEEvent` objects out."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._scan_from = 0
+        self._data: list[bytes] = []
+        self._event = ""
+        self.last_event_id: str | None = None
+
+    def feed(self, chunk: bytes) -> list[SSEEvent]:
+        """Consume ``chunk`` and return the events it completed (often none)."""
+        buffer = self._buffer
+        buffer += chunk
+        events: list[SSEEvent] = []
+        start = 0
+        with memoryview(buffer) as view:
+            while (end := buffer.find(b"\n", self._scan_from)) != -1:
+                line_end = end - 1 if end > start and buffer[end - 1] == 0x0D else end
+                # One copy from the buffer straight into an immutable line
+                self._line(view[start:line_end].tobytes(), events)
+                start = self._scan_from = end + 1
+        if start:
+            del buffer[:start]
+        # Only bytes appended after this point can contain the next line end
+        self._scan_from = len(buffer)
+        return events
+
+    def _line(self, line: bytes, events: list[SSEEvent]) -> None:
+        if not line:
+            if self._data:
+                data = self._data[0] if len(self._data) == 1 else b"\n".join(self._data)
+                events.append(SSEEvent(self._event or "message", data, self.last_event_id))
+                self._data = []
+            self._event = ""
+            return
+        if line[0] == 0x3A:  # ":" comment / keep-alive
+            return
+
+        name, colon, value = line.partition(b":")
+        if colon and value[:1] == b" ":
+            value = value[1:]
+        if name == b"data":
+            self._data.append(value)
+        elif name == b"event":
+            self._event = value.decode("utf-8", "replace")
+        elif name == b"id" and b"\x00" not in value:
+            self.last_event_id = value.decode("utf-8", "replace")
+        # "retry" and unknown fields are ignored
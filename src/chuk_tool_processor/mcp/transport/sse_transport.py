@@ -10,7 +10,6 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import logging
 import time
 import uuid
@@ -18,8 +17,12 @@ from typing import Any
 
 import httpx
 
+from chuk_tool_processor.utils import fast_json as json
+
 from .base_transport import MCPBaseTransport
-from .models import TimeoutConfig, TransportMetrics
+from .http_pool import get_http_client_pool
+from .models import BatchConfig, HTTPPoolConfig, SupervisorConfig, TimeoutConfig, TransportMetrics
+from .sse_parser import SSEEvent, SSEParser
 
 logger = logging.getLogger(__name__)
 
@@ -41,15 +44,29 @@ class SSETransport(MCPBaseTransport):
         enable_metrics: bool = True,
         oauth_refresh_callback: Any | None = None,
         timeout_config: TimeoutConfig | None = None,
+        http_pool: HTTPPoolConfig | None = None,
+        supervisor: SupervisorConfig | None = None,
+        batching: BatchConfig | None = None,
+        lazy_content: bool = False,
     ):
         """
         Initialize SSE transport.
+
+        ``http_pool`` configures the shared client used for message POSTs;
+        transports with the same origin and pool settings share connections.
+        ``supervisor`` moves pings and reconnects into a background task.
+        ``batching`` coalesces concurrent requests into JSON-RPC batch arrays.
+        ``lazy_content`` returns text results as LazyContent, decoded on first use.
         """
         self.url = url.rstrip("/")
         self.api_key = api_key
         self.configured_headers = headers or {}
         self.enable_metrics = enable_metrics
         self.oauth_refresh_callback = oauth_refresh_callback
+        self.http_pool = http_pool or HTTPPoolConfig()
+        self._supervisor_config = supervisor
+        self.batching = batching
+        self.lazy_content = lazy_content
 
         # Use timeout config or create from individual parameters
         if timeout_config is None:
@@ -67,9 +84,18 @@ class SSETransport(MCPBaseTransport):
         self.pending_requests: dict[str, asyncio.Future] = {}
         self._initialized = False
 
-        # HTTP clients
+        # JSON-RPC batching: requests queued during the window, the timer that
+        # flushes them, and in-flight batch POSTs
+        self._batch_active = False
+        self._batch_queue: list[dict[str, Any]] = []
+        self._batch_timer: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+
+        # HTTP clients: a dedicated one for the long-lived SSE stream and a
+        # pooled one, shared per origin, for message POSTs
         self.stream_client = None
         self.send_client = None
+        self._send_client_pooled = False
 
         # SSE stream management
         self.sse_task = None
@@ -133,17 +159,15 @@ class SSETransport(MCPBaseTransport):
                 logger.error("Gateway connectivity test failed")
                 return False
 
-            # Create HTTP clients
+            # Create HTTP clients. The stream client only ever holds the one
+            # SSE GET; all message POSTs go through the shared per-origin pool.
             self.stream_client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.connection_timeout),
                 follow_redirects=True,
-                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
-            )
-            self.send_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.default_timeout),
-                follow_redirects=True,
-                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
             )
+            self.send_client = get_http_client_pool().acquire(self.url, self.http_pool)
+            self._send_client_pooled = True
 
             # Connect to SSE stream
             sse_url = self._construct_sse_url(self.url)
@@ -193,7 +217,8 @@ class SSETransport(MCPBaseTransport):
                 init_response = await self._send_request(
                     "initialize",
                     {
-                        "protocolVersion": "2024-11-05",
+                        # 2025-03-26 is the MCP revision that allows JSON-RPC batches
+                        "protocolVersion": "2025-03-26" if self.batching else "2024-11-05",
                         "capabilities": {},
                         "clientInfo": {"name": "chuk-tool-processor", "version": "1.0.0"},
                     },
@@ -208,6 +233,10 @@ class SSETransport(MCPBaseTransport):
                 # Send initialized notification
                 await self._send_notification("notifications/initialized")
 
+                self._batch_active = self._server_supports_batching(init_response.get("result") or {})
+                if self.batching and not self._batch_active:
+                    logger.debug("Server does not support JSON-RPC batches; sending requests individually")
+
                 # FIXED: Set health tracking state
                 self._initialized = True
                 self._initialization_time = time.time()
@@ -219,6 +248,7 @@ class SSETransport(MCPBaseTransport):
                     self._metrics.initialization_time = init_time
 
                 logger.debug("SSE transport initialized successfully in %.3fs", time.time() - start_time)
+                self._start_supervisor(self._supervisor_config)
                 return True
 
             except Exception as e:
@@ -236,92 +266,10 @@ class SSETransport(MCPBaseTransport):
         try:
             logger.debug("Starting SSE stream processing...")
 
-            current_event = None
-
-            async for line in self.sse_response.aiter_lines():
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Handle event type declarations
-                if line.startswith("event:"):
-                    current_event = line.split(":", 1)[1].strip()
-                    logger.debug("SSE event type: %s", current_event)
-                    continue
-
-                # Handle session endpoint discovery
-                if not self.message_url and line.startswith("data:"):
-                    data_part = line.split(":", 1)[1].strip()
-
-                    # NEW FORMAT: event: endpoint + data: https://...
-                    if current_event == "endpoint" and data_part.startswith("http"):
-                        self.message_url = data_part
-
-                        # Extract session ID from URL if present
-                        if "session_id=" in data_part:
-                            self.session_id = data_part.split("session_id=")[1].split("&")[0]
-                        elif "sessionId=" in data_part:
-                            self.session_id = data_part.split("sessionId=")[1].split("&")[0]
-                        else:
-                            self.session_id = str(uuid.uuid4())
-
-                        logger.debug("Session endpoint discovered via event format: %s", self.message_url)
-                        continue
-
-                    # RELATIVE PATH FORMAT: event: endpoint + data: /sse/message?sessionId=...
-                    elif current_event == "endpoint" and data_part.startswith("/"):
-                        endpoint_path = data_part
-                        self.message_url = f"{self.url}{endpoint_path}"
-
-                        # Extract session ID if present
-                        if "session_id=" in endpoint_path:
-                            self.session_id = endpoint_path.split("session_id=")[1].split("&")[0]
-                        elif "sessionId=" in endpoint_path:
-                            self.session_id = endpoint_path.split("sessionId=")[1].split("&")[0]
-                        else:
-                            self.session_id = str(uuid.uuid4())
-
-                        logger.debug("Session endpoint discovered via relative path: %s", self.message_url)
-                        continue
-
-                    # OLD FORMAT: data: /messages/... (backwards compatibility)
-                    elif "/messages/" in data_part:
-                        endpoint_path = data_part
-                        self.message_url = f"{self.url}{endpoint_path}"
-
-                        # Extract session ID if present
-                        if "session_id=" in endpoint_path:
-                            self.session_id = endpoint_path.split("session_id=")[1].split("&")[0]
-                        else:
-                            self.session_id = str(uuid.uuid4())
-
-                        logger.debug("Session endpoint discovered via old format: %s", self.message_url)
-                        continue
-
-                # Handle JSON-RPC responses
-                if line.startswith("data:"):
-                    data_part = line.split(":", 1)[1].strip()
-
-                    # Skip keepalive pings and empty data
-                    if not data_part or data_part.startswith("ping") or data_part in ("{}", "[]"):
-                        continue
-
-                    try:
-                        response_data = json.loads(data_part)
-
-                        # Handle JSON-RPC responses with request IDs
-                        if "jsonrpc" in response_data and "id" in response_data:
-                            request_id = str(response_data["id"])
-
-                            # Resolve pending request if found
-                            if request_id in self.pending_requests:
-                                future = self.pending_requests.pop(request_id)
-                                if not future.done():
-                                    future.set_result(response_data)
-                                    logger.debug("Resolved request ID: %s", request_id)
-
-                    except json.JSONDecodeError as e:
-                        logger.debug("Non-JSON data in SSE stream (ignoring): %s", e)
+            parser = SSEParser()
+            async for chunk in self.sse_response.aiter_bytes():
+                for event in parser.feed(chunk):
+                    self._handle_sse_event(event)
 
         except Exception as e:
             if self.enable_metrics and self._metrics:
@@ -330,6 +278,130 @@ class SSETransport(MCPBaseTransport):
             # FIXED: Don't increment consecutive failures for stream processing errors
             # These are often temporary and don't indicate connection health
 
+    def _handle_sse_event(self, event: SSEEvent) -> None:
+        """Route one SSE event: session discovery until connected, then JSON-RPC responses."""
+        data = event.data
+
+        # Handle session endpoint discovery
+        if not self.message_url and self._discover_endpoint(event.event, data.decode("utf-8", "replace").strip()):
+            return
+
+        # Skip keepalive pings and empty data
+        if not data or data.startswith(b"ping") or data in (b"{}", b"[]"):
+            return
+
+        # Payload bytes go straight to the JSON decoder (orjson when installed)
+        try:
+            self._resolve_responses(json.loads(data))
+        except ValueError as e:
+            logger.debug("Non-JSON data in SSE stream (ignoring): %s", e)
+
+    def _discover_endpoint(self, event: str, data_part: str) -> bool:
+        """Set ``message_url`` and ``session_id`` from an endpoint event; return whether it was one."""
+        # NEW FORMAT: event: endpoint + data: https://...
+        if event == "endpoint" and data_part.startswith("http"):
+            self.message_url = data_part
+            logger.debug("Session endpoint discovered via event format: %s", self.message_url)
+
+        # RELATIVE PATH FORMAT: event: endpoint + data: /sse/message?sessionId=...
+        elif event == "endpoint" and data_part.startswith("/"):
+            self.message_url = f"{self.url}{data_part}"
+            logger.debug("Session endpoint discovered via relative path: %s", self.message_url)
+
+        # OLD FORMAT: data: /messages/... (backwards compatibility)
+        elif "/messages/" in data_part:
+            self.message_url = f"{self.url}{data_part}"
+            logger.debug("Session endpoint discovered via old format: %s", self.message_url)
+
+        else:
+            return False
+
+        # Extract session ID from URL if present
+        if "session_id=" in data_part:
+            self.session_id = data_part.split("session_id=")[1].split("&")[0]
+        elif "sessionId=" in data_part:
+            self.session_id = data_part.split("sessionId=")[1].split("&")[0]
+        else:
+            self.session_id = str(uuid.uuid4())
+        return True
+
+    def _resolve_responses(self, data: Any) -> None:
+        """Resolve pending requests from a JSON-RPC response or batch response array."""
+        for response_data in data if isinstance(data, list) else [data]:
+            # Handle JSON-RPC responses with request IDs
+            if not isinstance(response_data, dict) or "jsonrpc" not in response_data or "id" not in response_data:
+                continue
+            request_id = str(response_data["id"])
+
+            # Resolve pending request if found
+            future = self.pending_requests.pop(request_id, None)
+            if future is not None and not future.done():
+                future.set_result(response_data)
+                logger.debug("Resolved request ID: %s", request_id)
+
+    # ------------------------------------------------------------------ #
+    #  JSON-RPC batching                                                 #
+    # ------------------------------------------------------------------ #
+    def _server_supports_batching(self, init_result: dict[str, Any]) -> bool:
+        """Decide from the initialize result whether requests may be batched."""
+        if self.batching is None:
+            return False
+        if not self.batching.require_server_support:
+            return True
+        experimental = (init_result.get("capabilities") or {}).get("experimental") or {}
+        return init_result.get("protocolVersion") == "2025-03-26" or bool(experimental.get("batching"))
+
+    def _enqueue_batched(self, message: dict[str, Any]) -> None:
+        """Queue a request for the next batch; flush on size or when the window closes."""
+        config = self.batching or BatchConfig()
+        self._batch_queue.append(message)
+        if len(self._batch_queue) >= config.max_batch_size:
+            self._flush_batch()
+        elif self._batch_timer is None:
+            loop = asyncio.get_running_loop()
+            self._batch_timer = loop.call_later(config.window_ms / 1000.0, self._flush_batch)
+
+    def _flush_batch(self) -> None:
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        queued, self._batch_queue = self._batch_queue, []
+
+        # Requests that already timed out while queued are not sent
+        messages = [m for m in queued if (f := self.pending_requests.get(m["id"])) is not None and not f.done()]
+        if not messages:
+            return
+        task = asyncio.create_task(self._post_batch(messages))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _post_batch(self, messages: list[dict[str, Any]]) -> None:
+        """POST queued requests as one batch; responses arrive like any other."""
+        body: Any = messages if len(messages) > 1 else messages[0]
+        if len(messages) > 1 and self.enable_metrics and self._metrics:
+            self._metrics.batches_sent += 1
+            self._metrics.batched_requests += len(messages)
+
+        error: Exception
+        try:
+            headers = {"Content-Type": "application/json", **self._get_headers()}
+            response = await self.send_client.post(
+                self.message_url, headers=headers, json=body, timeout=self.default_timeout
+            )
+            if response.status_code == 202:
+                return
+            if response.status_code == 200:
+                self._resolve_responses(response.json())
+                return
+            error = RuntimeError(f"HTTP request failed with status: {response.status_code}")
+        except Exception as e:
+            error = e
+
+        for message in messages:
+            future = self.pending_requests.pop(message["id"], None)
+            if future is not None and not future.done():
+                future.set_exception(error)
+
     async def _send_request(
         self, method: str, params: dict[str, Any] = None, timeout: float | None = None
     ) -> dict[str, Any]:
@@ -345,10 +417,22 @@ class SSETransport(MCPBaseTransport):
         self.pending_requests[request_id] = future
 
         try:
+            if self._batch_active:
+                # Sent with other requests from the same window; the per-call
+                # timeout covers the window, the POST and the response
+                self._enqueue_batched(message)
+                result = await asyncio.wait_for(future, timeout=timeout or self.default_timeout)
+                if method.startswith("tools/"):
+                    self._consecutive_failures = 0
+                    self._last_successful_ping = time.time()
+                return result
+
             # Send HTTP POST request
             headers = {"Content-Type": "application/json", **self._get_headers()}
 
-            response = await self.send_client.post(self.message_url, headers=headers, json=message)
+            response = await self.send_client.post(
+                self.message_url, headers=headers, json=message, timeout=self.default_timeout
+            )
 
             if response.status_code == 202:
                 # Async response - wait for result via SSE
@@ -396,7 +480,9 @@ class SSETransport(MCPBaseTransport):
 
         headers = {"Content-Type": "application/json", **self._get_headers()}
 
-        response = await self.send_client.post(self.message_url, headers=headers, json=message)
+        response = await self.send_client.post(
+            self.message_url, headers=headers, json=message, timeout=self.default_timeout
+        )
 
         if response.status_code not in (200, 202):
             logger.warning("Notification failed with status: %s", response.status_code)
@@ -507,6 +593,9 @@ class SSETransport(MCPBaseTransport):
         self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
     ) -> dict[str, Any]:
         """Execute a tool with the given arguments."""
+        # Supervised: recovery runs in the background, the call only checks state
+        if self._supervisor is not None and not await self._supervised_ready():
+            return self._unavailable_result()
         if not self._initialized:
             return {"isError": True, "error": "Transport not initialized"}
 
@@ -514,8 +603,8 @@ class SSETransport(MCPBaseTransport):
         if self.enable_metrics and self._metrics:
             self._metrics.total_calls += 1
 
-        # Check connection health before executing
-        if not self.is_connected():
+        # Check connection health before executing (unsupervised only)
+        if self._supervisor is None and not self.is_connected():
             logger.debug("SSE connection unhealthy, attempting recovery...")
             if not await self._attempt_recovery():
                 if self.enable_metrics:
@@ -679,6 +768,7 @@ class SSETransport(MCPBaseTransport):
 
     async def close(self) -> None:
         """Close the transport and clean up resources."""
+        await self._stop_supervisor()
         if not self._initialized:
             return
 
@@ -701,6 +791,17 @@ class SSETransport(MCPBaseTransport):
             with contextlib.suppress(asyncio.CancelledError):
                 await self.sse_task
 
+        # Drop queued batches
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        self._batch_queue.clear()
+        self._batch_active = False
+        for task in list(self._batch_tasks):
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
         # Close SSE stream context
         if self.sse_stream_context:
             try:
@@ -713,7 +814,10 @@ class SSETransport(MCPBaseTransport):
             await self.stream_client.aclose()
 
         if self.send_client:
-            await self.send_client.aclose()
+            if self._send_client_pooled:
+                await get_http_client_pool().release(self.send_client)
+            else:
+                await self.send_client.aclose()
 
         # Cancel any pending requests
         for _request_id, future in self.pending_requests.items():
@@ -730,6 +834,7 @@ class SSETransport(MCPBaseTransport):
         self.sse_stream_context = None
         self.stream_client = None
         self.send_client = None
+        self._send_client_pooled = False
         # FIXED: Reset health tracking
         self._consecutive_failures = 0
         self._last_successful_ping = None
@@ -769,6 +874,8 @@ class SSETransport(MCPBaseTransport):
                 else False,
             }
         )
+        if self._supervisor is not None:
+            metrics["supervisor"] = self._supervisor.get_stats()
         return metrics
 
     def reset_metrics(self) -> None:
@@ -0,0 +1,400 @@
+# chuk_tool_processor/mcp/transport/stdio_pool_transport.py
+"""
+Replicated STDIO transport: N identical server processes behind one logical server.
+
+A single :class:`StdioTransport` serialises every call on one stdin/stdout
+pipe, so a CPU-bound MCP server is limited to one core. The pool launches
+``replicas`` copies of the same command and sends each call to the healthy
+replica with the fewest outstanding requests. A replica that crashes is
+replaced in the background while the others keep serving. Tool definitions
+are identical across replicas, so ``get_tools()`` is fetched once and shared.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from .base_transport import MCPBaseTransport
+from .models import SupervisorConfig
+from .stdio_transport import StdioTransport
+
+logger = logging.getLogger(__name__)
+
+# Metrics summed across replicas in get_metrics()
+_SUMMED_METRICS = (
+    "total_calls",
+    "successful_calls",
+    "failed_calls",
+    "total_time",
+    "process_restarts",
+    "pipe_errors",
+    "process_crashes",
+    "recovery_attempts",
+    "memory_usage_mb",
+    "cpu_percent",
+)
+
+
+class StdioPoolTransport(MCPBaseTransport):
+    """
+    Pool of identical STDIO server processes exposed as one transport.
+
+    Dispatch is least-outstanding-requests: each call goes to the connected
+    replica with the fewest in-flight calls, ties broken round-robin so idle
+    replicas share the load evenly.
+    """
+
+    def __init__(
+        self,
+        server_params,
+        replicas: int = 2,
+        connection_timeout: float = 30.0,
+        default_timeout: float = 30.0,
+        enable_metrics: bool = True,
+        process_monitor: bool = True,
+        replace_delay: float = 1.0,
+        max_replace_delay: float = 30.0,
+        transport_factory: Callable[[], MCPBaseTransport] | None = None,
+        lazy_content: bool = False,
+        supervisor: SupervisorConfig | None = None,
+    ):
+        """
+        Initialize the replica pool.
+
+        Args:
+            server_params: Server parameters (dict or StdioParameters object)
+            replicas: Number of identical processes to run
+            connection_timeout: Timeout for starting each replica
+            default_timeout: Default timeout for operations
+            enable_metrics: Whether to track performance metrics
+            process_monitor: Whether to monitor subprocess health
+            replace_delay: Initial delay before replacing a crashed replica
+            max_replace_delay: Upper bound for the replacement backoff
+            transport_factory: Optional factory for replica transports (defaults to StdioTransport)
+            lazy_content: Return text results as LazyContent, decoded on first structured access
+            supervisor: Optional background supervision, applied to every replica
+        """
+        if replicas < 1:
+            raise ValueError("replicas must be at least 1")
+
+        self.server_params = server_params
+        self.replicas = replicas
+        self.connection_timeout = connection_timeout
+        self.default_timeout = default_timeout
+        self.enable_metrics = enable_metrics
+        self.process_monitor = process_monitor
+        self.replace_delay = replace_delay
+        self.max_replace_delay = max_replace_delay
+        self.lazy_content = lazy_content
+        self._supervisor_config = supervisor
+        self._transport_factory = transport_factory or self._default_factory
+
+        self._replicas: list[MCPBaseTransport | None] = [None] * replicas
+        self._outstanding: list[int] = [0] * replicas
+        self._replacements: dict[int, asyncio.Task[None]] = {}
+        self._next = 0
+        self._tools: list[dict[str, Any]] | None = None
+        self._tools_lock = asyncio.Lock()
+        self._initialized = False
+        self._closed = False
+        self._replaced_count = 0
+
+    def _default_factory(self) -> MCPBaseTransport:
+        return StdioTransport(
+            self.server_params,
+            connection_timeout=self.connection_timeout,
+            default_timeout=self.default_timeout,
+            enable_metrics=self.enable_metrics,
+            process_monitor=self.process_monitor,
+            lazy_content=self.lazy_content,
+            supervisor=self._supervisor_config,
+        )
+
+    # ------------------------------------------------------------------ #
+    #  Lifecycle                                                         #
+    # ------------------------------------------------------------------ #
+    async def initialize(self) -> bool:
+        """Start all replicas concurrently; succeed if at least one is ready."""
+        if self._initialized:
+            return True
+        self._closed = False
+
+        async def start(index: int) -> bool:
+            transport = self._transport_factory()
+            try:
+                ok = await transport.initialize()
+            except Exception as e:
+                logger.error("STDIO replica %d failed to start: %s", index, e)
+                ok = False
+            if ok:
+                self._replicas[index] = transport
+            else:
+                await self._discard(transport)
+            return ok
+
+        started = await asyncio.gather(*(start(i) for i in range(self.replicas)))
+        if not any(started):
+            logger.warning("STDIO pool initialization failed: no replica started")
+            return False
+
+        self._initialized = True
+        for index, ok in enumerate(started):
+            if not ok:
+                self._schedule_replacement(index)
+
+        logger.debug("STDIO pool ready - %d/%d replica(s)", sum(started), self.replicas)
+        return True
+
+    async def close(self) -> None:
+        """Stop replacement tasks and close every replica."""
+        self._closed = True
+        self._initialized = False
+
+        tasks = list(self._replacements.values())
+        self._replacements.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
+        replicas = [r for r in self._replicas if r is not None]
+        self._replicas = [None] * self.replicas
+        self._outstanding = [0] * self.replicas
+        results = await asyncio.gather(*(r.close() for r in replicas), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug("Error closing STDIO replica: %s", result)
+
+    async def _attempt_recovery(self) -> bool:
+        """Replace every disconnected replica now."""
+        for index, replica in enumerate(self._replicas):
+            if replica is None or not replica.is_connected():
+                self._schedule_replacement(index, delay=0.0)
+        tasks = list(self._replacements.values())
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return self.is_connected()
+
+    # ------------------------------------------------------------------ #
+    #  Replica management                                                #
+    # ------------------------------------------------------------------ #
+    def _pick(self) -> int | None:
+        """
+        Index of the connected replica with the fewest outstanding calls.
+
+        Empty or disconnected slots are skipped and scheduled for replacement,
+        so a replica that dies while idle is restarted on the next call.
+        """
+        best: int | None = None
+        count = self.replicas
+        for offset in range(count):
+            index = (self._next + offset) % count
+            replica = self._replicas[index]
+            if replica is None or not replica.is_connected():
+                if self._initialized:
+                    self._schedule_replacement(index)
+                continue
+            if best is None or self._outstanding[index] < self._outstanding[best]:
+                best = index
+        if best is not None:
+            self._next = (best + 1) % count
+        return best
+
+    def _check_replica(self, index: int, replica: MCPBaseTransport) -> None:
+        """Schedule a replacement if a replica has stopped being usable."""
+        if self._replicas[index] is replica and not replica.is_connected():
+            logger.warning("STDIO replica %d disconnected, replacing in background", index)
+            self._schedule_replacement(index)
+
+    def _schedule_replacement(self, index: int, delay: float | None = None) -> None:
+        """Start a background task that replaces replica ``index``."""
+        if self._closed or index in self._replacements:
+            return
+        task = asyncio.create_task(self._replace(index, self.replace_delay if delay is None else delay))
+        self._replacements[index] = task
+        task.add_done_callback(lambda _t, i=index: self._replacements.pop(i, None))
+
+    async def _replace(self, index: int, delay: float) -> None:
+        """Close a dead replica and start a new one, backing off on failure."""
+        old = self._replicas[index]
+        self._replicas[index] = None
+        self._outstanding[index] = 0
+        if old is not None:
+            with contextlib.suppress(Exception):
+                await old.close()
+
+        while not self._closed:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            transport = self._transport_factory()
+            try:
+                ok = await transport.initialize()
+            except Exception as e:
+                logger.debug("STDIO replica %d restart failed: %s", index, e)
+                ok = False
+            if ok:
+                if self._closed:
+                    await transport.close()
+                    return
+                self._replicas[index] = transport
+                self._replaced_count += 1
+                logger.debug("STDIO replica %d replaced", index)
+                return
+            await self._discard(transport)
+            delay = min(max(delay * 2, self.replace_delay), self.max_replace_delay)
+
+    @staticmethod
+    async def _discard(transport: MCPBaseTransport) -> None:
+        """Close a replica that failed to start so its process does not linger."""
+        try:
+            await transport.close()
+        except Exception as e:
+            logger.debug("Error closing failed STDIO replica: %s", e)
+
+    async def _dispatch(self, operation: Callable[[MCPBaseTransport], Any]) -> tuple[bool, Any]:
+        """Run ``operation`` on the least-loaded replica; (False, None) if none is available."""
+        index = self._pick()
+        if index is None:
+            return False, None
+        replica = self._replicas[index]
+        assert replica is not None
+        self._outstanding[index] += 1
+        try:
+            return True, await operation(replica)
+        finally:
+            if self._replicas[index] is replica:
+                self._outstanding[index] -= 1
+            self._check_replica(index, replica)
+
+    # ------------------------------------------------------------------ #
+    #  Health                                                            #
+    # ------------------------------------------------------------------ #
+    async def send_ping(self) -> bool:
+        """Ping every replica; the pool is up if any replica answers."""
+        if not self._initialized:
+            return False
+        live = [(i, r) for i, r in enumerate(self._replicas) if r is not None]
+        if not live:
+            return False
+        results = await asyncio.gather(*(r.send_ping() for _, r in live), return_exceptions=True)
+        for (index, replica), ok in zip(live, results, strict=True):
+            if ok is not True:
+                self._check_replica(index, replica)
+        return any(ok is True for ok in results)
+
+    def is_connected(self) -> bool:
+        """Connected while at least one replica is connected."""
+        if not self._initialized:
+            return False
+        return any(r is not None and r.is_connected() for r in self._replicas)
+
+    # ------------------------------------------------------------------ #
+    #  MCP operations                                                    #
+    # ------------------------------------------------------------------ #
+    async def get_tools(self) -> list[dict[str, Any]]:
+        """Tool definitions, fetched from one replica and shared by all."""
+        if not self._initialized:
+            logger.debug("Cannot get tools: transport not initialized")
+            return []
+        if self._tools is not None:
+            return self._tools
+        async with self._tools_lock:
+            if self._tools is None:
+                _, tools = await self._dispatch(lambda r: r.get_tools())
+                if tools:
+                    self._tools = tools
+                return tools or []
+            return self._tools
+
+    async def call_tool(
+        self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
+    ) -> dict[str, Any]:
+        """Call a tool on the least-loaded replica."""
+        if not self._initialized:
+            return {"isError": True, "error": "Transport not initialized"}
+        dispatched, result = await self._dispatch(lambda r: r.call_tool(tool_name, arguments, timeout=timeout))
+        if not dispatched:
+            return {"isError": True, "error": "No healthy STDIO replica available"}
+        return result
+
+    async def list_resources(self) -> dict[str, Any]:
+        """List resources from any replica."""
+        if not self._initialized:
+            return {}
+        _, result = await self._dispatch(lambda r: r.list_resources())
+        return result or {}
+
+    async def list_prompts(self) -> dict[str, Any]:
+        """List prompts from any replica."""
+        if not self._initialized:
+            return {}
+        _, result = await self._dispatch(lambda r: r.list_prompts())
+        return result or {}
+
+    async def read_resource(self, uri: str) -> dict[str, Any]:
+        """Read a resource from any replica."""
+        if not self._initialized:
+            return {}
+        _, result = await self._dispatch(lambda r: r.read_resource(uri))
+        return result or {}
+
+    async def get_prompt(self, name: str, arguments: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Get a prompt from any replica."""
+        if not self._initialized:
+            return {}
+        _, result = await self._dispatch(lambda r: r.get_prompt(name, arguments))  # type: ignore[attr-defined]
+        return result or {}
+
+    # ------------------------------------------------------------------ #
+    #  Metrics                                                           #
+    # ------------------------------------------------------------------ #
+    def get_metrics(self) -> dict[str, Any]:
+        """Metrics summed across replicas, plus pool state."""
+        per_replica = [r.get_metrics() if r is not None else None for r in self._replicas]
+        metrics: dict[str, Any] = dict.fromkeys(_SUMMED_METRICS, 0)
+        for replica_metrics in per_replica:
+            if replica_metrics is None:
+                continue
+            for key in _SUMMED_METRICS:
+                metrics[key] += replica_metrics.get(key) or 0
+        metrics["avg_response_time"] = metrics["total_time"] / metrics["total_calls"] if metrics["total_calls"] else 0.0
+        metrics.update(
+            {
+                "is_connected": self.is_connected(),
+                "replicas": self.replicas,
+                "healthy_replicas": sum(1 for r in self._replicas if r is not None and r.is_connected()),
+                "replicas_replaced": self._replaced_count,
+                "outstanding": list(self._outstanding),
+            }
+        )
+        return metrics
+
+    def reset_metrics(self) -> None:
+        """Reset metrics on every replica."""
+        for replica in self._replicas:
+            if replica is not None:
+                replica.reset_metrics()
+
+    def get_streams(self) -> list[tuple]:
+        """Streams of every live replica."""
+        streams: list[tuple] = []
+        for replica in self._replicas:
+            if replica is not None:
+                streams.extend(replica.get_streams())
+        return streams
+
+    async def __aenter__(self):
+        """Context manager entry."""
+        success = await self.initialize()
+        if not success:
+            raise RuntimeError("Failed to initialize StdioPoolTransport")
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager cleanup."""
+        await self.close()
@@ -22,7 +22,10 @@ from chuk_mcp.protocol.messages import (  # type: ignore[import-untyped]
 from chuk_mcp.transports.stdio import stdio_client  # type: ignore[import-untyped]
 from chuk_mcp.transports.stdio.parameters import StdioParameters  # type: ignore[import-untyped]
 
+from chuk_tool_processor.models.lazy_content import LazyContent
+
 from .base_transport import MCPBaseTransport
+from .models import SupervisorConfig
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +45,8 @@ class StdioTransport(MCPBaseTransport):
         default_timeout: float = 30.0,
         enable_metrics: bool = True,
         process_monitor: bool = True,
+        supervisor: SupervisorConfig | None = None,
+        lazy_content: bool = False,
     ):  # NEW
         """
         Initialize STDIO transport with enhanced configuration.
@@ -52,6 +57,8 @@ class StdioTransport(MCPBaseTransport):
             default_timeout: Default timeout for operations
             enable_metrics: Whether to track performance metrics
             process_monitor: Whether to monitor subprocess health (NEW)
+            supervisor: Optional background supervision (pings and reconnects off the call path)
+            lazy_content: Return text results as LazyContent, decoded on first structured access
         """
         # Convert dict to StdioParameters if needed
         if isinstance(server_params, dict):
@@ -82,6 +89,8 @@ class StdioTransport(MCPBaseTransport):
         self.default_timeout = default_timeout
         self.enable_metrics = enable_metrics
         self.process_monitor = process_monitor  # NEW
+        self._supervisor_config = supervisor
+        self.lazy_content = lazy_content
 
         # Connection state
         self._context = None
@@ -219,6 +228,7 @@ class StdioTransport(MCPBaseTransport):
                         time.monotonic() - start_time,
                         ping_time,
                     )
+                    self._start_supervisor(self._supervisor_config)
                     return True
                 else:
                     logger.debug("STDIO connection established but ping failed")
@@ -227,6 +237,7 @@ class StdioTransport(MCPBaseTransport):
                     self._consecutive_failures = 1
                     if self.enable_metrics:
                         self._metrics["initialization_time"] = time.monotonic() - start_time
+                    self._start_supervisor(self._supervisor_config)
                     return True
             else:
                 logger.warning("STDIO initialization failed")
@@ -269,6 +280,7 @@ class StdioTransport(MCPBaseTransport):
 
     async def close(self) -> None:
         """Enhanced close with process monitoring and metrics."""
+        await self._stop_supervisor()
         if not self._initialized:
             return
 
@@ -453,6 +465,9 @@ class StdioTransport(MCPBaseTransport):
         self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
     ) -> dict[str, Any]:
         """Enhanced tool calling with recovery and process monitoring."""
+        # Supervised: recovery runs in the background, the call only checks state
+        if self._supervisor is not None and not await self._supervised_ready():
+            return self._unavailable_result()
         if not self._initialized:
             return {"isError": True, "error": "Transport not initialized"}
 
@@ -465,8 +480,8 @@ class StdioTransport(MCPBaseTransport):
         try:
             logger.debug("Calling tool '%s' with timeout %ss", tool_name, tool_timeout)
 
-            # Enhanced connection check with recovery attempt
-            if not self.is_connected():
+            # Enhanced connection check with recovery attempt (unsupervised only)
+            if self._supervisor is None and not self.is_connected():
                 logger.debug("Connection unhealthy, attempting recovery...")
                 if not await self._attempt_recovery():
                     if self.enable_metrics:
@@ -575,6 +590,8 @@ class StdioTransport(MCPBaseTransport):
             item = content_list[0]
             if isinstance(item, dict) and item.get("type") == "text":
                 text = item.get("text", "")
+                if self.lazy_content:
+                    return LazyContent(text)
 
                 # STDIO-specific: preserve string format for numeric values
                 try:
@@ -682,6 +699,8 @@ class StdioTransport(MCPBaseTransport):
                 "process_uptime": (time.monotonic() - self._process_start_time) if self._process_start_time else 0,
             }
         )
+        if self._supervisor is not None:
+            metrics["supervisor"] = self._supervisor.get_stats()
         return metrics
 
     def reset_metrics(self) -> None:
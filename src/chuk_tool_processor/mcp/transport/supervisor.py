@@ -0,0 +1,184 @@
+# chuk_tool_processor/mcp/transport/supervisor.py
+"""
+Background connection supervision for MCP transports.
+
+Without a supervisor, transports check their health inside ``call_tool`` and
+run ``_attempt_recovery()`` inline, so the first call after a blip pays the
+whole reconnect and concurrent callers queue up behind it. A
+:class:`TransportSupervisor` moves that work into one background task per
+transport: it pings on an interval (keep-alive), reconnects with exponential
+backoff when the transport stops being connected, and publishes a
+:class:`TransportState`. The call path only reads that state - an O(1)
+check while ready - and otherwise waits up to ``park_timeout`` for the
+reconnect to finish or fails fast.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from .models import SupervisorConfig
+
+if TYPE_CHECKING:
+    from .base_transport import MCPBaseTransport
+
+logger = logging.getLogger(__name__)
+
+
+class TransportState(StrEnum):
+    """Connection state published by a :class:`TransportSupervisor`."""
+
+    READY = "ready"
+    DEGRADED = "degraded"
+    RECONNECTING = "reconnecting"
+    CLOSED = "closed"
+
+
+class TransportSupervisor:
+    """Keeps one transport connected from a background task."""
+
+    def __init__(self, transport: MCPBaseTransport, config: SupervisorConfig | None = None) -> None:
+        self.transport = transport
+        self.config = config or SupervisorConfig()
+        self._state = TransportState.READY
+        self._ready = asyncio.Event()
+        self._ready.set()
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self.stats: dict[str, int] = {
+            "pings": 0,
+            "ping_failures": 0,
+            "reconnects": 0,
+            "reconnect_failures": 0,
+            "parked_calls": 0,
+            "failed_fast": 0,
+        }
+
+    # ------------------------------------------------------------------ #
+    #  State                                                             #
+    # ------------------------------------------------------------------ #
+    @property
+    def state(self) -> TransportState:
+        """Current published state."""
+        return self._state
+
+    @property
+    def is_ready(self) -> bool:
+        """True while the transport is connected and calls may proceed."""
+        return self._state is TransportState.READY
+
+    def _set_state(self, state: TransportState) -> None:
+        if state is self._state:
+            return
+        logger.debug("%s: %s -> %s", self.transport.__class__.__name__, self._state, state)
+        self._state = state
+        # Parked callers are released on READY (proceed) and CLOSED (fail)
+        if state in (TransportState.READY, TransportState.CLOSED):
+            self._ready.set()
+        else:
+            self._ready.clear()
+
+    def mark_degraded(self) -> None:
+        """Report from the call path that the transport stopped working; reconnect now."""
+        if self._state is TransportState.READY:
+            self._set_state(TransportState.DEGRADED)
+            self._wake.set()
+
+    async def wait_ready(self) -> bool:
+        """
+        Return whether a call may proceed.
+
+        Returns immediately while ready. Otherwise parks the caller until the
+        background reconnect completes or ``park_timeout`` elapses.
+        """
+        if self._state is TransportState.READY:
+            return True
+        if self._state is TransportState.CLOSED or self.config.park_timeout <= 0:
+            self.stats["failed_fast"] += 1
+            return False
+
+        self.stats["parked_calls"] += 1
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=self.config.park_timeout)
+        except TimeoutError:
+            return False
+        return self._state is TransportState.READY
+
+    def get_stats(self) -> dict[str, Any]:
+        """State plus ping and reconnect counters."""
+        return {"state": self._state.value, **self.stats}
+
+    # ------------------------------------------------------------------ #
+    #  Lifecycle                                                         #
+    # ------------------------------------------------------------------ #
+    def start(self) -> None:
+        """Start the background task (idempotent); needs a running event loop."""
+        if self._task is not None and not self._task.done():
+            return
+        self._set_state(TransportState.READY if self.transport.is_connected() else TransportState.DEGRADED)
+        self._task = asyncio.create_task(self._run(), name=f"{self.transport.__class__.__name__}-supervisor")
+
+    async def stop(self) -> None:
+        """Stop supervising and release parked callers."""
+        self._set_state(TransportState.CLOSED)
+        task, self._task = self._task, None
+        if task is None or task is asyncio.current_task():
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await task
+
+    async def _sleep(self, delay: float) -> None:
+        """Sleep for ``delay`` or until :meth:`mark_degraded` wakes us."""
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wake.wait(), timeout=delay)
+        self._wake.clear()
+
+    async def _ping(self) -> bool:
+        self.stats["pings"] += 1
+        try:
+            ok = bool(await self.transport.send_ping())
+        except Exception as e:
+            logger.debug("Supervisor ping raised: %s", e)
+            ok = False
+        if not ok:
+            self.stats["ping_failures"] += 1
+        return ok
+
+    async def _reconnect(self) -> bool:
+        self._set_state(TransportState.RECONNECTING)
+        self.stats["reconnects"] += 1
+        try:
+            ok = bool(await self.transport._attempt_recovery())
+        except Exception as e:
+            logger.warning("Background reconnect raised: %s", e)
+            ok = False
+        if ok:
+            self._set_state(TransportState.READY)
+        else:
+            self.stats["reconnect_failures"] += 1
+            self._set_state(TransportState.DEGRADED)
+        return ok
+
+    async def _run(self) -> None:
+        backoff = self.config.initial_backoff
+        while self._state is not TransportState.CLOSED:
+            if self._state is TransportState.READY:
+                await self._sleep(self.config.ping_interval)
+                if self._state is not TransportState.READY:
+                    continue
+                # A single failed ping is tolerated; the transport's own
+                # failure threshold decides when it stops being connected
+                if not await self._ping() and not self.transport.is_connected():
+                    self._set_state(TransportState.DEGRADED)
+                continue
+
+            if await self._reconnect():
+                backoff = self.config.initial_backoff
+                continue
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * self.config.backoff_multiplier, self.config.max_backoff)
@@ -20,6 +20,7 @@ from chuk_tool_processor.models.execution_trace import (
     ReplayResult,
     TraceBuilder,
 )
+from chuk_tool_processor.models.lazy_content import LazyContent
 from chuk_tool_processor.models.sandbox_policy import (
     CapabilityGrant,
     FilesystemPolicy,
@@ -86,6 +87,7 @@ __all__ = [
     "StreamingTool",
     "ToolCall",
     "ToolResult",
+    "LazyContent",
     "ToolSpec",
     "ToolCapability",
     "tool_spec",
@@ -0,0 +1,124 @@
+# chuk_tool_processor/models/lazy_content.py
+"""
+Tool output kept as raw text until something needs its structure.
+
+MCP tools return their result as a text content item that usually holds
+JSON. Transports decode it so callers get dicts and lists, but callers that
+hand the result straight back to the model then encode it again. With
+``lazy_content`` enabled, a transport returns :class:`LazyContent` instead:
+the raw text (or bytes) is kept, ``str()`` returns it unchanged, and the
+JSON is decoded only on first structured access (``value``, indexing,
+iteration, ``len``, comparison) and then cached.
+
+Size checks can use :attr:`LazyContent.raw_size` without decoding.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+from chuk_tool_processor.utils import fast_json as json
+
+__all__ = ["LazyContent", "unwrap_lazy"]
+
+_UNSET: Any = object()
+
+
+class LazyContent:
+    """Raw tool output that decodes as JSON (or stays text) on first structured access."""
+
+    __slots__ = ("_raw", "_value")
+
+    def __init__(self, raw: str | bytes) -> None:
+        self._raw = raw
+        self._value = _UNSET
+
+    # ------------------------------------------------------------------ #
+    #  Raw access (never decodes)                                        #
+    # ------------------------------------------------------------------ #
+    @property
+    def raw(self) -> str | bytes:
+        """The content exactly as received."""
+        return self._raw
+
+    @property
+    def text(self) -> str:
+        """The content as text, for forwarding verbatim."""
+        raw = self._raw
+        return raw if isinstance(raw, str) else raw.decode("utf-8", "replace")
+
+    @property
+    def raw_size(self) -> int:
+        """Size of the content in UTF-8 bytes."""
+        raw = self._raw
+        if isinstance(raw, bytes) or raw.isascii():
+            return len(raw)
+        return len(raw.encode("utf-8"))
+
+    @property
+    def is_decoded(self) -> bool:
+        """True once the structured value has been produced."""
+        return self._value is not _UNSET
+
+    # ------------------------------------------------------------------ #
+    #  Structured access (decodes once)                                  #
+    # ------------------------------------------------------------------ #
+    @property
+    def value(self) -> Any:
+        """The decoded JSON value, or the text if it is not JSON."""
+        if self._value is _UNSET:
+            try:
+                self._value = json.loads(self._raw)
+            except ValueError:
+                self._value = self.text
+        return self._value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = self.value
+        return value.get(key, default) if isinstance(value, dict) else default
+
+    def keys(self) -> Any:
+        return self.value.keys()
+
+    def values(self) -> Any:
+        return self.value.values()
+
+    def items(self) -> Any:
+        return self.value.items()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.value[key]
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.value)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyContent):
+            return self._raw == other._raw or self.value == other.value
+        return bool(self.value == other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        text = self.text
+        preview = f"{text[:60]}..." if len(text) > 60 else text
+        state = "decoded" if self.is_decoded else "raw"
+        return f"LazyContent({preview!r}, {self.raw_size} bytes, {state})"
+
+
+def unwrap_lazy(value: Any) -> Any:
+    """Return the decoded value of :class:`LazyContent`; any other value unchanged."""
+    return value.value if isinstance(value, LazyContent) else value
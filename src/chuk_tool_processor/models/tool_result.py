@@ -11,7 +11,10 @@ import uuid
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, model_validator
+
+from chuk_tool_processor.models.lazy_content import LazyContent, unwrap_lazy
+from chuk_tool_processor.utils import fast_json
 
 if TYPE_CHECKING:
     from chuk_tool_processor.core.exceptions import ErrorCategory, ErrorCode, ErrorInfo
@@ -110,6 +113,29 @@ class ToolResult(BaseModel):
 
         return self
 
+    @field_serializer("result")
+    def _serialize_result(self, value: Any) -> Any:
+        """Dump lazily decoded MCP content as its decoded value."""
+        return unwrap_lazy(value)
+
+    @property
+    def result_text(self) -> str | None:
+        """
+        The result as text to hand back to a model.
+
+        Lazy MCP content is returned as received, without decoding and
+        re-encoding it. Strings are returned as is and other values are
+        JSON-encoded. None if there is no result.
+        """
+        value = self.result
+        if value is None:
+            return None
+        if isinstance(value, LazyContent):
+            return value.text
+        if isinstance(value, str):
+            return value
+        return fast_json.dumps(value, default=str)
+
     @property
     def is_success(self) -> bool:
         """Check if the execution was successful (no error)."""
@@ -176,7 +202,7 @@ class ToolResult(BaseModel):
             "id": self.id,
             "call_id": self.call_id,
             "tool": self.tool,
-            "result": self.result,
+            "result": unwrap_lazy(self.result),
             "error": self.error,
             "success": self.is_success,
             "duration": self.duration,
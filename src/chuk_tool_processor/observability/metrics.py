@@ -31,6 +31,8 @@ class PrometheusMetrics:
     - tool_cache_operations_total: Counter of cache operations
     - tool_circuit_breaker_state: Gauge of circuit breaker state
     - tool_retry_attempts_total: Counter of retry attempts
+    - tool_concurrency_limit: Gauge of the adaptive concurrency limit
+    - tool_concurrency_queue_depth: Gauge of calls waiting for a concurrency slot
     """
 
     def __init__(self) -> None:
@@ -88,6 +90,25 @@ class PrometheusMetrics:
                 ["tool", "allowed"],
             )
 
+            # Adaptive concurrency metrics
+            self.tool_concurrency_limit: Gauge = Gauge(
+                "tool_concurrency_limit",
+                "Current adaptive concurrency limit",
+                ["tool"],
+            )
+
+            self.tool_concurrency_in_flight: Gauge = Gauge(
+                "tool_concurrency_in_flight",
+                "Tool calls currently holding a concurrency slot",
+                ["tool"],
+            )
+
+            self.tool_concurrency_queue_depth: Gauge = Gauge(
+                "tool_concurrency_queue_depth",
+                "Tool calls waiting for a concurrency slot",
+                ["tool"],
+            )
+
             logger.info("Prometheus metrics initialized")
 
         except ImportError as e:
@@ -220,6 +241,29 @@ class PrometheusMetrics:
 
         self.tool_rate_limit_checks_total.labels(tool=tool, allowed=str(allowed)).inc()
 
+    def record_concurrency_limit(
+        self,
+        tool: str,
+        limit: int,
+        in_flight: int,
+        queue_depth: int,
+    ) -> None:
+        """
+        Record adaptive concurrency limiter state.
+
+        Args:
+            tool: Tool name
+            limit: Current in-flight limit
+            in_flight: Calls currently executing
+            queue_depth: Calls waiting for a slot
+        """
+        if not self._initialized:
+            return
+
+        self.tool_concurrency_limit.labels(tool=tool).set(limit)
+        self.tool_concurrency_in_flight.labels(tool=tool).set(in_flight)
+        self.tool_concurrency_queue_depth.labels(tool=tool).set(queue_depth)
+
 
 def init_metrics() -> PrometheusMetrics:
     """
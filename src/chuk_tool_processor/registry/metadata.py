@@ -72,6 +72,8 @@ class ToolMetadata(BaseModel):
         concurrency_limit: Optional maximum concurrent executions.
         timeout: Optional default timeout in seconds.
         rate_limit: Optional rate limiting configuration.
+        cacheable: Whether results may be served from the result cache.
+        cache_ttl: Optional cache TTL in seconds for this tool.
     """
 
     name: str = Field(..., description="Tool name")
@@ -94,6 +96,8 @@ class ToolMetadata(BaseModel):
     concurrency_limit: int | None = Field(None, description="Maximum concurrent executions (None = unlimited)")
     timeout: float | None = Field(None, description="Default timeout in seconds (None = no timeout)")
     rate_limit: dict[str, Any] | None = Field(None, description="Rate limiting configuration")
+    cacheable: bool = Field(False, description="Whether successful results may be served from the result cache")
+    cache_ttl: int | None = Field(None, description="Cache TTL in seconds (None = executor default)")
 
     # Additional fields for async-native architecture
     supports_streaming: bool = Field(False, description="Whether the tool supports streaming responses")
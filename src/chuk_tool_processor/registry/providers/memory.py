@@ -41,6 +41,8 @@ class InMemoryToolRegistry(ToolRegistryInterface):
         self._loaded_deferred_tools: set[str] = set()  # Set of "namespace.name"
         # Store stream_manager references for MCP tools by namespace
         self._stream_managers: dict[str, Any] = {}  # {namespace: StreamManager}
+        # Bumped on every change to the registered or active tools
+        self._generation = 0
         # Lock for thread safety
         self._lock = asyncio.Lock()
 
@@ -112,6 +114,16 @@ class InMemoryToolRegistry(ToolRegistryInterface):
                 # Eager loading (default behavior)
                 self._tools[namespace][key] = tool
                 self._metadata[namespace][key] = tool_metadata
+            self._generation += 1
+
+    async def get_generation(self) -> int:
+        """
+        Counter that changes whenever a tool is registered or a deferred tool is loaded.
+
+        Lets callers cache data derived from the registry (such as exported
+        schemas) until the registry changes.
+        """
+        return self._generation
 
     # ------------------------------------------------------------------ #
     # retrieval
@@ -354,6 +366,7 @@ class InMemoryToolRegistry(ToolRegistryInterface):
             self._tools[namespace][name] = tool
             self._metadata[namespace][name] = metadata
             self._loaded_deferred_tools.add(key)
+            self._generation += 1
 
             return tool
 
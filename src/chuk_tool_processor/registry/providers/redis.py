@@ -9,12 +9,19 @@ Note: Tool objects themselves cannot be stored in Redis (they are Python objects
 This provider stores metadata and allows tool loading from import paths.
 For tools that are registered at runtime without import paths, you should
 use a pattern where each process registers the same tools on startup.
+
+Reads are served from a local metadata cache (including TTL-bounded negative
+entries) that is invalidated whenever the shared registry version key
+changes. Listings come from per-namespace index sets instead of ``SCAN``;
+keys written before the index sets existed are indexed by a one-time ``SCAN``
+the first time any process lists tools.
 """
 
 from __future__ import annotations
 
 import asyncio
 import inspect
+import time
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
@@ -34,6 +41,15 @@ class RedisKeyType(StrEnum):
     TOOLS = "tools"
     NAMESPACES = "namespaces"
     DEFERRED = "deferred"
+    TOOL_INDEX = "tool_index"
+    DEFERRED_INDEX = "deferred_index"
+    DEFERRED_NAMESPACES = "deferred_namespaces"
+    VERSION = "version"
+    INDEXED = "indexed"
+
+
+# Keys per MGET when bulk-loading metadata
+_MGET_CHUNK = 500
 
 
 class RedisConfig(BaseModel):
@@ -41,6 +57,11 @@ class RedisConfig(BaseModel):
 
     key_prefix: str = Field(default="chuk", description="Prefix for all Redis keys")
     local_cache_ttl: float = Field(default=60.0, description="TTL in seconds for local tool cache")
+    negative_cache_ttl: float = Field(default=5.0, description="TTL in seconds for cached 'tool not found' results")
+    version_check_interval: float = Field(
+        default=1.0,
+        description="Seconds between registry version checks (0 = check on every read)",
+    )
     redis_url: str = Field(default="redis://localhost:6379/0", description="Redis connection URL")
 
 
@@ -56,6 +77,16 @@ class RedisToolRegistry(ToolRegistryInterface):
     - {prefix}:tools:{namespace}:{name} -> Tool metadata JSON
     - {prefix}:namespaces -> Set of all namespaces
     - {prefix}:deferred:{namespace}:{name} -> Deferred tool metadata JSON
+    - {prefix}:tool_index:{namespace} -> Set of tool names in the namespace
+    - {prefix}:deferred_index:{namespace} -> Set of deferred tool names
+    - {prefix}:deferred_namespaces -> Set of namespaces with deferred tools
+    - {prefix}:version -> Counter bumped on every write
+    - {prefix}:indexed -> Marker set once existing keys have been indexed
+
+    Every process caches metadata and listings locally. The version key is
+    read at most once per ``version_check_interval``; when another process
+    has written since, the local caches are dropped. Misses are cached for
+    ``negative_cache_ttl`` so repeated lookups of unknown tools stay local.
 
     Note: This provider requires the `redis` package with async support:
         pip install redis[hiredis]  # or: uv add redis[hiredis]
@@ -83,6 +114,15 @@ class RedisToolRegistry(ToolRegistryInterface):
         self._stream_managers: dict[str, Any] = {}
         self._lock = asyncio.Lock()
 
+        # Local read-through caches, valid for the registry version they were read at.
+        # (namespace, name) -> (active metadata, deferred metadata, expires_at)
+        self._metadata_cache: dict[tuple[str, str], tuple[ToolMetadata | None, ToolMetadata | None, float]] = {}
+        # (index type, namespace or None) -> (tool infos, expires_at)
+        self._listing_cache: dict[tuple[RedisKeyType, str | None], tuple[list[ToolInfo], float]] = {}
+        self._version: int | None = None
+        self._version_checked_at = float("-inf")
+        self._indexed = False
+
     # ------------------------------------------------------------------ #
     # Key helpers - use enum for key types
     # ------------------------------------------------------------------ #
@@ -105,17 +145,13 @@ class RedisToolRegistry(ToolRegistryInterface):
         """Get Redis key for a deferred tool."""
         return self._build_key(RedisKeyType.DEFERRED, namespace, name)
 
-    def _tools_pattern(self, namespace: str | None = None) -> str:
-        """Get pattern to match all tools in a namespace."""
-        if namespace:
-            return f"{self._config.key_prefix}:{RedisKeyType.TOOLS.value}:{namespace}:*"
-        return f"{self._config.key_prefix}:{RedisKeyType.TOOLS.value}:*"
+    def _index_key(self, index: RedisKeyType, namespace: str) -> str:
+        """Get Redis key for a per-namespace index set."""
+        return self._build_key(index, namespace)
 
-    def _deferred_pattern(self, namespace: str | None = None) -> str:
-        """Get pattern to match all deferred tools in a namespace."""
-        if namespace:
-            return f"{self._config.key_prefix}:{RedisKeyType.DEFERRED.value}:{namespace}:*"
-        return f"{self._config.key_prefix}:{RedisKeyType.DEFERRED.value}:*"
+    def _version_key(self) -> str:
+        """Get Redis key for the registry version counter."""
+        return self._build_key(RedisKeyType.VERSION)
 
     # ------------------------------------------------------------------ #
     # Serialization helpers - use Pydantic native serialization
@@ -131,13 +167,131 @@ class RedisToolRegistry(ToolRegistryInterface):
             data = data.decode()
         return ToolMetadata.model_validate_json(data)
 
-    def _parse_key_parts(self, key: str | bytes) -> tuple[str, str] | None:
-        """Parse namespace and name from a Redis key."""
-        key_str = key.decode() if isinstance(key, bytes) else key
-        parts = key_str.split(":")
-        if len(parts) >= 4:
-            return parts[2], parts[3]
-        return None
+    # ------------------------------------------------------------------ #
+    # Local cache helpers
+    # ------------------------------------------------------------------ #
+
+    def _invalidate_local(self) -> None:
+        """Drop all cached metadata and listings."""
+        self._metadata_cache.clear()
+        self._listing_cache.clear()
+
+    async def _ensure_fresh(self) -> None:
+        """Drop local caches if another process has written since the last check."""
+        now = time.monotonic()
+        if now - self._version_checked_at < self._config.version_check_interval:
+            return
+
+        raw = await self._redis.get(self._version_key())
+        version = int(raw or 0)
+        self._version_checked_at = now
+        if version != self._version:
+            self._invalidate_local()
+            self._version = version
+
+    def _after_write(self, version: int, touched: tuple[str, str]) -> None:
+        """Update local caches after this process bumped the registry version."""
+        if self._version is not None and version == self._version + 1:
+            # Only our own write happened since the last sync
+            self._metadata_cache.pop(touched, None)
+            self._listing_cache.clear()
+        else:
+            self._invalidate_local()
+        self._version = version
+        self._version_checked_at = time.monotonic()
+
+    async def _fetch_metadata(self, pairs: list[tuple[str, str]]) -> None:
+        """Load active and deferred metadata for uncached tools in one round trip."""
+        now = time.monotonic()
+        missing = [pair for pair in pairs if (entry := self._metadata_cache.get(pair)) is None or entry[2] <= now]
+        if not missing:
+            return
+
+        keys: list[str] = []
+        for namespace, name in missing:
+            keys.append(self._tool_key(namespace, name))
+            keys.append(self._deferred_key(namespace, name))
+
+        if len(keys) <= _MGET_CHUNK:
+            values = await self._redis.mget(keys)
+        else:
+            pipe = self._redis.pipeline(transaction=False)
+            for start in range(0, len(keys), _MGET_CHUNK):
+                pipe.mget(keys[start : start + _MGET_CHUNK])
+            values = [value for chunk in await pipe.execute() for value in chunk]
+
+        now = time.monotonic()
+        for i, pair in enumerate(missing):
+            active_bytes, deferred_bytes = values[2 * i], values[2 * i + 1]
+            active = self._deserialize_metadata(active_bytes) if active_bytes else None
+            deferred = self._deserialize_metadata(deferred_bytes) if deferred_bytes else None
+            found = active is not None or deferred is not None
+            ttl = self._config.local_cache_ttl if found else self._config.negative_cache_ttl
+            self._metadata_cache[pair] = (active, deferred, now + ttl)
+
+    async def _lookup(self, name: str, namespace: str) -> tuple[ToolMetadata | None, ToolMetadata | None]:
+        """Return cached (active, deferred) metadata for a tool, reading through to Redis."""
+        await self._ensure_fresh()
+        pair = (namespace, name)
+        await self._fetch_metadata([pair])
+        active, deferred, _ = self._metadata_cache[pair]
+        return active, deferred
+
+    async def _ensure_indexed(self) -> None:
+        """Add keys written before the index sets existed to the index sets, once."""
+        if self._indexed:
+            return
+        marker = self._build_key(RedisKeyType.INDEXED)
+        if not await self._redis.exists(marker):
+            pipe = self._redis.pipeline(transaction=False)
+            for key_type, index, ns_key in (
+                (RedisKeyType.TOOLS, RedisKeyType.TOOL_INDEX, self._namespace_key()),
+                (RedisKeyType.DEFERRED, RedisKeyType.DEFERRED_INDEX, self._build_key(RedisKeyType.DEFERRED_NAMESPACES)),
+            ):
+                base = self._build_key(key_type) + ":"
+                async for key in self._redis.scan_iter(match=f"{base}*"):
+                    namespace, _, name = self._decode(key)[len(base) :].partition(":")
+                    if name:
+                        pipe.sadd(self._index_key(index, namespace), name)
+                        pipe.sadd(ns_key, namespace)
+            pipe.set(marker, "1")
+            await pipe.execute()
+        self._indexed = True
+
+    async def _list_index(self, index: RedisKeyType, namespace: str | None) -> list[ToolInfo]:
+        """List tools from the per-namespace index sets, using the local cache."""
+        await self._ensure_indexed()
+        await self._ensure_fresh()
+        cache_key = (index, namespace)
+        cached = self._listing_cache.get(cache_key)
+        if cached is not None and cached[1] > time.monotonic():
+            return list(cached[0])
+
+        if namespace is not None:
+            namespaces = [namespace]
+        else:
+            ns_key = (
+                self._namespace_key()
+                if index is RedisKeyType.TOOL_INDEX
+                else self._build_key(RedisKeyType.DEFERRED_NAMESPACES)
+            )
+            namespaces = sorted(self._decode(ns) for ns in await self._redis.smembers(ns_key))  # type: ignore[misc]
+
+        result: list[ToolInfo] = []
+        if namespaces:
+            pipe = self._redis.pipeline(transaction=False)
+            for ns in namespaces:
+                pipe.smembers(self._index_key(index, ns))
+            for ns, names in zip(namespaces, await pipe.execute(), strict=True):
+                result.extend(ToolInfo(namespace=ns, name=name) for name in sorted(self._decode(n) for n in names))
+
+        self._listing_cache[cache_key] = (result, time.monotonic() + self._config.local_cache_ttl)
+        return list(result)
+
+    @staticmethod
+    def _decode(value: str | bytes) -> str:
+        """Decode a Redis reply that may be bytes."""
+        return value.decode() if isinstance(value, bytes) else value
 
     # ------------------------------------------------------------------ #
     # Registration
@@ -183,30 +337,42 @@ class RedisToolRegistry(ToolRegistryInterface):
 
             tool_metadata = ToolMetadata(**meta_dict)
 
-            # Check if this is a deferred tool
+            # Write metadata, index entries and the version bump in one round trip
+            pipe = self._redis.pipeline()
             if tool_metadata.defer_loading:
                 # Store metadata in Redis for deferred tools
-                deferred_key = self._deferred_key(namespace, key)
-                await self._redis.set(deferred_key, self._serialize_metadata(tool_metadata))
+                pipe.set(self._deferred_key(namespace, key), self._serialize_metadata(tool_metadata))
+                pipe.sadd(self._index_key(RedisKeyType.DEFERRED_INDEX, namespace), key)
+                pipe.sadd(self._build_key(RedisKeyType.DEFERRED_NAMESPACES), namespace)
 
                 # Store pre-instantiated tool locally if no import_path
                 if tool_metadata.import_path is None and tool_metadata.mcp_factory_params is None:
                     self._deferred_tools.setdefault(namespace, {})[key] = tool
             else:
-                # Eager loading - store metadata in Redis
-                tool_key = self._tool_key(namespace, key)
-                await self._redis.set(tool_key, self._serialize_metadata(tool_metadata))
-
-                # Track namespace
-                await self._redis.sadd(self._namespace_key(), namespace)  # type: ignore[misc]
+                # Eager loading - store metadata in Redis and track namespace
+                pipe.set(self._tool_key(namespace, key), self._serialize_metadata(tool_metadata))
+                pipe.sadd(self._namespace_key(), namespace)
+                pipe.sadd(self._index_key(RedisKeyType.TOOL_INDEX, namespace), key)
 
                 # Cache tool locally
                 self._tools.setdefault(namespace, {})[key] = tool
+            pipe.incr(self._version_key())
+            results = await pipe.execute()
+            self._after_write(int(results[-1]), (namespace, key))
 
     # ------------------------------------------------------------------ #
     # Retrieval
     # ------------------------------------------------------------------ #
 
+    async def get_generation(self) -> int:
+        """
+        The shared registry version, bumped on every write by any process.
+
+        Checked at most once per ``version_check_interval``, like the local caches.
+        """
+        await self._ensure_fresh()
+        return self._version or 0
+
     async def get_tool(self, name: str, namespace: str = "default") -> Any | None:
         """
         Retrieve a tool by name and namespace.
@@ -219,23 +385,19 @@ class RedisToolRegistry(ToolRegistryInterface):
         if tool is not None:
             return tool
 
+        active, deferred = await self._lookup(name, namespace)
+
         # Check if it's a deferred tool
         loaded_key = f"{namespace}.{name}"
-        if loaded_key not in self._loaded_deferred_tools:
-            deferred_key = self._deferred_key(namespace, name)
-            if await self._redis.exists(deferred_key):
-                return await self.load_deferred_tool(name, namespace)
+        if loaded_key not in self._loaded_deferred_tools and deferred is not None:
+            return await self.load_deferred_tool(name, namespace)
 
         # Check if metadata exists in Redis (tool might be registered elsewhere)
-        tool_key = self._tool_key(namespace, name)
-        metadata_bytes = await self._redis.get(tool_key)
-        if metadata_bytes:
-            metadata = self._deserialize_metadata(metadata_bytes)
+        if active is not None and active.import_path:
             # Try to load from import_path
-            if metadata.import_path:
-                tool = await self._import_tool(metadata.import_path)
-                self._tools.setdefault(namespace, {})[name] = tool
-                return tool
+            tool = await self._import_tool(active.import_path)
+            self._tools.setdefault(namespace, {})[name] = tool
+            return tool
 
         return None
 
@@ -257,19 +419,9 @@ class RedisToolRegistry(ToolRegistryInterface):
 
     async def get_metadata(self, name: str, namespace: str = "default") -> ToolMetadata | None:
         """Get metadata for a tool."""
-        # Check active tools
-        tool_key = self._tool_key(namespace, name)
-        metadata_bytes = await self._redis.get(tool_key)
-        if metadata_bytes:
-            return self._deserialize_metadata(metadata_bytes)
-
-        # Check deferred tools
-        deferred_key = self._deferred_key(namespace, name)
-        deferred_bytes = await self._redis.get(deferred_key)
-        if deferred_bytes:
-            return self._deserialize_metadata(deferred_bytes)
-
-        return None
+        # Active tools take precedence over deferred ones
+        active, deferred = await self._lookup(name, namespace)
+        return active if active is not None else deferred
 
     # ------------------------------------------------------------------ #
     # Listing helpers
@@ -277,16 +429,7 @@ class RedisToolRegistry(ToolRegistryInterface):
 
     async def list_tools(self, namespace: str | None = None) -> list[ToolInfo]:
         """Return a list of ToolInfo objects."""
-        result: list[ToolInfo] = []
-        pattern = self._tools_pattern(namespace)
-
-        async for key in self._redis.scan_iter(match=pattern):
-            parsed = self._parse_key_parts(key)
-            if parsed:
-                ns, name = parsed
-                result.append(ToolInfo(namespace=ns, name=name))
-
-        return result
+        return await self._list_index(RedisKeyType.TOOL_INDEX, namespace)
 
     async def list_namespaces(self) -> list[str]:
         """List all namespaces."""
@@ -295,11 +438,14 @@ class RedisToolRegistry(ToolRegistryInterface):
 
     async def list_metadata(self, namespace: str | None = None) -> list[ToolMetadata]:
         """Return all ToolMetadata objects."""
-        result: list[ToolMetadata] = []
         tools = await self.list_tools(namespace)
+        pairs = [(info.namespace, info.name) for info in tools]
+        await self._fetch_metadata(pairs)
 
-        for tool_info in tools:
-            metadata = await self.get_metadata(tool_info.name, tool_info.namespace)
+        result: list[ToolMetadata] = []
+        for pair in pairs:
+            active, deferred, _ = self._metadata_cache[pair]
+            metadata = active if active is not None else deferred
             if metadata:
                 result.append(metadata)
 
@@ -319,25 +465,14 @@ class RedisToolRegistry(ToolRegistryInterface):
         candidates: list[tuple[float, ToolMetadata]] = []
         query_lower = query.lower()
 
-        # Scan all deferred tools
-        pattern = self._deferred_pattern()
-        async for key in self._redis.scan_iter(match=pattern):
-            parsed = self._parse_key_parts(key)
-            if not parsed:
-                continue
-
-            namespace, tool_name = parsed
-
-            # Skip if already loaded
-            loaded_key = f"{namespace}.{tool_name}"
-            if loaded_key in self._loaded_deferred_tools:
-                continue
+        # All not-yet-loaded deferred tools, metadata fetched in one round trip
+        pairs = [(info.namespace, info.name) for info in await self.get_deferred_tools()]
+        await self._fetch_metadata(pairs)
 
-            # Get metadata
-            metadata_bytes = await self._redis.get(key)
-            if not metadata_bytes:
+        for pair in pairs:
+            metadata = self._metadata_cache[pair][1]
+            if metadata is None:
                 continue
-            metadata = self._deserialize_metadata(metadata_bytes)
 
             # Tag filtering
             if tags and not any(tag in metadata.tags for tag in tags):
@@ -399,9 +534,8 @@ class RedisToolRegistry(ToolRegistryInterface):
             return await self.get_tool(name, namespace)
 
         # Get metadata from Redis
-        deferred_key = self._deferred_key(namespace, name)
-        metadata_bytes = await self._redis.get(deferred_key)
-        if not metadata_bytes:
+        _, metadata = await self._lookup(name, namespace)
+        if metadata is None:
             raise ToolNotFoundError(
                 tool_name=name,
                 namespace=namespace,
@@ -409,8 +543,6 @@ class RedisToolRegistry(ToolRegistryInterface):
                 available_namespaces=await self.list_namespaces(),
             )
 
-        metadata = self._deserialize_metadata(metadata_bytes)
-
         async with self._lock:
             # Double-check after acquiring lock
             if loaded_key in self._loaded_deferred_tools:
@@ -427,9 +559,13 @@ class RedisToolRegistry(ToolRegistryInterface):
                 raise ValueError(f"Tool {loaded_key} is deferred but has no import_path or pre-instantiated tool")
 
             # Move from deferred to active
-            tool_key = self._tool_key(namespace, name)
-            await self._redis.set(tool_key, self._serialize_metadata(metadata))
-            await self._redis.sadd(self._namespace_key(), namespace)  # type: ignore[misc]
+            pipe = self._redis.pipeline()
+            pipe.set(self._tool_key(namespace, name), self._serialize_metadata(metadata))
+            pipe.sadd(self._namespace_key(), namespace)
+            pipe.sadd(self._index_key(RedisKeyType.TOOL_INDEX, namespace), name)
+            pipe.incr(self._version_key())
+            results = await pipe.execute()
+            self._after_write(int(results[-1]), (namespace, name))
 
             self._tools.setdefault(namespace, {})[name] = tool
             self._loaded_deferred_tools.add(loaded_key)
@@ -484,18 +620,8 @@ class RedisToolRegistry(ToolRegistryInterface):
 
     async def get_deferred_tools(self, namespace: str | None = None) -> list[ToolInfo]:
         """Get list of deferred tools that haven't been loaded yet."""
-        result: list[ToolInfo] = []
-        pattern = self._deferred_pattern(namespace)
-
-        async for key in self._redis.scan_iter(match=pattern):
-            parsed = self._parse_key_parts(key)
-            if parsed:
-                ns, name = parsed
-                loaded_key = f"{ns}.{name}"
-                if loaded_key not in self._loaded_deferred_tools:
-                    result.append(ToolInfo(namespace=ns, name=name))
-
-        return result
+        deferred = await self._list_index(RedisKeyType.DEFERRED_INDEX, namespace)
+        return [info for info in deferred if f"{info.namespace}.{info.name}" not in self._loaded_deferred_tools]
 
     # ------------------------------------------------------------------ #
     # Cleanup
@@ -504,21 +630,32 @@ class RedisToolRegistry(ToolRegistryInterface):
     async def clear(self) -> None:
         """Clear all tool registrations (useful for testing)."""
         async with self._lock:
-            # Delete all keys with our prefix
+            # Delete all keys with our prefix. The version key survives and is
+            # bumped so other processes drop their caches instead of seeing a
+            # restarted counter that may collide with a version they cached.
+            # The index marker survives too: everything written from now on is indexed.
+            keep = {self._version_key(), self._build_key(RedisKeyType.INDEXED)}
             async for key in self._redis.scan_iter(match=f"{self._config.key_prefix}:*"):
-                await self._redis.delete(key)
+                if self._decode(key) not in keep:
+                    await self._redis.delete(key)
+            version = await self._redis.incr(self._version_key())
 
             # Clear local caches
             self._tools.clear()
             self._deferred_tools.clear()
             self._loaded_deferred_tools.clear()
             self._stream_managers.clear()
+            self._invalidate_local()
+            self._version = int(version)
+            self._version_checked_at = time.monotonic()
 
 
 async def create_redis_registry(
     redis_url: str = "redis://localhost:6379/0",
     key_prefix: str = "chuk",
     local_cache_ttl: float = 60.0,
+    negative_cache_ttl: float = 5.0,
+    version_check_interval: float = 1.0,
 ) -> RedisToolRegistry:
     """
     Factory function to create a Redis registry.
@@ -527,6 +664,8 @@ async def create_redis_registry(
         redis_url: Redis connection URL (default: redis://localhost:6379/0)
         key_prefix: Prefix for all Redis keys (default: "chuk")
         local_cache_ttl: TTL in seconds for local tool cache (default: 60s)
+        negative_cache_ttl: TTL in seconds for cached misses (default: 5s)
+        version_check_interval: Seconds between registry version checks (default: 1s)
 
     Returns:
         Configured RedisToolRegistry instance
@@ -549,6 +688,8 @@ async def create_redis_registry(
         redis_url=redis_url,
         key_prefix=key_prefix,
         local_cache_ttl=local_cache_ttl,
+        negative_cache_ttl=negative_cache_ttl,
+        version_check_interval=version_check_interval,
     )
 
     redis_client = Redis.from_url(redis_url, decode_responses=False)
@@ -2,20 +2,35 @@
 """
 Async helpers that expose all registered tools in various formats and
 translate an OpenAI `function.name` back to the matching tool.
+
+Exported schemas are pre-serialized to JSON bytes once per registry
+generation and target format (see :func:`tool_schemas_json`), so sending the
+full tool list to a model every turn does not rebuild JSON Schemas from the
+Pydantic models each time. Registries without an async ``get_generation()``
+are exported afresh on every call.
 """
 
 from __future__ import annotations
 
 import asyncio
+import inspect
+from dataclasses import dataclass, field
 from typing import Any
 
+from chuk_tool_processor.utils import fast_json as json
+
 # registry
 from .provider import ToolRegistryProvider
 
+# Formats understood by tool_schemas_json() / tool_schema_json()
+EXPORT_FORMATS = ("openai", "anthropic", "mcp")
+
 # --------------------------------------------------------------------------- #
 # internal cache so tool-name lookup is O(1) with async protection
 # --------------------------------------------------------------------------- #
 _OPENAI_NAME_CACHE: dict[str, Any] | None = None
+# Registry and generation the name cache was built for
+_OPENAI_NAME_CACHE_SOURCE: tuple[Any, int | None] | None = None
 _CACHE_LOCK = asyncio.Lock()
 
 
@@ -24,20 +39,25 @@ async def _build_openai_name_cache() -> None:
     Populate the global reverse-lookup table once asynchronously.
 
     This function is thread-safe and will only build the cache once,
-    even with concurrent calls.
+    even with concurrent calls. It is rebuilt when the registry reports a
+    new generation.
     """
-    global _OPENAI_NAME_CACHE
+    global _OPENAI_NAME_CACHE, _OPENAI_NAME_CACHE_SOURCE
 
     # Build the cache with proper locking
     async with _CACHE_LOCK:
+        # Get the registry
+        reg = await ToolRegistryProvider.get_registry()
+        generation = await _registry_generation(reg)
+
         if _OPENAI_NAME_CACHE is not None:
-            return
+            source = _OPENAI_NAME_CACHE_SOURCE
+            if generation is None or (source is not None and source[0] is reg and source[1] == generation):
+                return
 
         # Initialize an empty cache
         _OPENAI_NAME_CACHE = {}
-
-        # Get the registry
-        reg = await ToolRegistryProvider.get_registry()
+        _OPENAI_NAME_CACHE_SOURCE = (reg, generation)
 
         # Get all tools and their names
         tools_list = await reg.list_tools()
@@ -64,9 +84,145 @@ async def _build_openai_name_cache() -> None:
                 pass
 
 
+async def _registry_generation(reg: Any) -> int | None:
+    """The registry's generation, or None if it does not track one."""
+    get_generation = getattr(reg, "get_generation", None)
+    if not inspect.iscoroutinefunction(get_generation):
+        return None
+    generation = await get_generation()
+    return generation if isinstance(generation, int) else None
+
+
+# --------------------------------------------------------------------------- #
+# pre-serialized schema export, valid for one registry generation
+# --------------------------------------------------------------------------- #
+@dataclass
+class _SchemaExport:
+    """Serialized tool specs of one registry at one generation."""
+
+    registry: Any
+    generation: int | None
+    # format -> {(namespace, name): JSON bytes}, in registry order
+    tools: dict[str, dict[tuple[str, str], bytes]] = field(default_factory=dict)
+    # format -> JSON array of all tools
+    payloads: dict[str, bytes] = field(default_factory=dict)
+
+
+_SCHEMA_EXPORT: _SchemaExport | None = None
+_EXPORT_LOCK = asyncio.Lock()
+
+
+def _tool_spec(tool: Any, name: str, fmt: str) -> dict[str, Any] | None:
+    """A tool's spec in ``fmt``, named by its registry key; None if it cannot be exported."""
+    try:
+        own_export = getattr(tool, f"to_{fmt}", None) if fmt != "openai" else None
+        if own_export is not None:
+            spec = own_export()
+            spec["name"] = name
+            return spec
+
+        spec = tool.to_openai()
+        function = spec["function"]
+        # Override the name to ensure round-trip consistency
+        function["name"] = name
+    except (AttributeError, TypeError):
+        # Skip tools that don't support export
+        return None
+
+    if fmt == "openai":
+        return spec
+    parameters = function.get("parameters") or {"type": "object", "properties": {}}
+    schema_key = "input_schema" if fmt == "anthropic" else "inputSchema"
+    return {"name": name, "description": function.get("description", ""), schema_key: parameters}
+
+
+async def _export(fmt: str) -> _SchemaExport:
+    """The schema export holding ``fmt`` for the current registry generation."""
+    global _SCHEMA_EXPORT
+
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+
+    reg = await ToolRegistryProvider.get_registry()
+    generation = await _registry_generation(reg)
+
+    async with _EXPORT_LOCK:
+        export = _SCHEMA_EXPORT
+        if export is None or export.registry is not reg or generation is None or export.generation != generation:
+            export = _SchemaExport(registry=reg, generation=generation)
+            _SCHEMA_EXPORT = export if generation is not None else None
+
+        if fmt not in export.tools:
+            serialized: dict[tuple[str, str], bytes] = {}
+            for tool_info in await reg.list_tools():
+                tool = await reg.get_tool(tool_info.name, tool_info.namespace)
+                if tool is None:
+                    continue
+                spec = _tool_spec(tool, tool_info.name, fmt)
+                if spec is None:
+                    continue
+                try:
+                    serialized[(tool_info.namespace, tool_info.name)] = json.dumps_bytes(spec)
+                except (TypeError, ValueError):
+                    # Skip tools whose spec is not JSON-serializable
+                    continue
+            export.tools[fmt] = serialized
+            export.payloads[fmt] = b"[" + b",".join(serialized.values()) + b"]"
+        return export
+
+
 # --------------------------------------------------------------------------- #
 # public helpers
 # --------------------------------------------------------------------------- #
+async def tool_schemas_json(format: str = "openai") -> bytes:
+    """
+    Return **all** registered tools as one pre-serialized JSON array.
+
+    The bytes can be spliced directly into a request body as the ``tools``
+    parameter. They are built once per registry generation and format; later
+    calls return the same bytes object until a tool is registered or loaded.
+
+    Args:
+        format: ``"openai"``, ``"anthropic"`` or ``"mcp"``
+
+    Returns:
+        UTF-8 JSON array of tool specifications
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    export = await _export(format)
+    return export.payloads[format]
+
+
+async def tool_schema_json(name: str, namespace: str = "default", format: str = "openai") -> bytes | None:
+    """
+    Return one registered tool's pre-serialized spec.
+
+    Args:
+        name: Registry name of the tool
+        namespace: Namespace of the tool
+        format: ``"openai"``, ``"anthropic"`` or ``"mcp"``
+
+    Returns:
+        UTF-8 JSON spec, or None if the tool is not registered or cannot be exported
+    """
+    export = await _export(format)
+    return export.tools[format].get((namespace, name))
+
+
+async def clear_schema_cache() -> None:
+    """
+    Drop the pre-serialized schemas.
+
+    Only needed when a registry without a generation counter is changed, or
+    when tool classes are modified in place.
+    """
+    global _SCHEMA_EXPORT
+    async with _EXPORT_LOCK:
+        _SCHEMA_EXPORT = None
+
+
 async def openai_functions() -> list[dict]:
     """
     Return **all** registered tools in the exact schema the Chat-Completions
@@ -76,31 +232,13 @@ async def openai_functions() -> list[dict]:
     (export → model → parser) stays consistent even when the class name and
     the registered key differ.
 
+    Specs are decoded from the cached payload of :func:`tool_schemas_json`,
+    so callers get fresh dicts they may modify.
+
     Returns:
         List of OpenAI function specifications
     """
-    # Get the registry
-    reg = await ToolRegistryProvider.get_registry()
-    specs: list[dict[str, Any]] = []
-
-    # List all tools
-    tools_list = await reg.list_tools()
-
-    for tool_info in tools_list:
-        # Get each tool
-        tool = await reg.get_tool(tool_info.name, tool_info.namespace)
-        if tool is None:
-            continue
-
-        try:
-            # Get the OpenAI spec
-            spec = tool.to_openai()
-            # Override the name to ensure round-trip consistency
-            spec["function"]["name"] = tool_info.name
-            specs.append(spec)
-        except (AttributeError, TypeError):
-            # Skip tools that don't support OpenAI format
-            pass
+    specs: list[dict[str, Any]] = json.loads(await tool_schemas_json("openai"))
 
     # Ensure the cache is built
     await _build_openai_name_cache()
@@ -139,9 +277,10 @@ async def clear_name_cache() -> None:
 
     This is useful in tests or when the registry changes significantly.
     """
-    global _OPENAI_NAME_CACHE
+    global _OPENAI_NAME_CACHE, _OPENAI_NAME_CACHE_SOURCE
     async with _CACHE_LOCK:
         _OPENAI_NAME_CACHE = None
+        _OPENAI_NAME_CACHE_SOURCE = None
 
 
 async def export_tools_as_openapi(
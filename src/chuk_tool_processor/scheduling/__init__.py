@@ -5,6 +5,9 @@ Scheduling module for tool execution planning.
 This module provides:
 - SchedulerPolicy protocol for pluggable scheduling strategies
 - GreedyDagScheduler for deadline-aware DAG scheduling
+- CriticalPathScheduler for makespan-minimizing (HEFT-style) list scheduling
+- PlanExecutor for running plans without stage barriers
+- LatencyModel for learning est_ms from observed tool latencies
 - Types for tool metadata, constraints, and execution plans
 
 Example:
@@ -24,7 +27,10 @@ Example:
     >>> plan = scheduler.plan(calls, constraints)
 """
 
+from chuk_tool_processor.scheduling.critical_path import CriticalPathScheduler
 from chuk_tool_processor.scheduling.greedy_dag import GreedyDagScheduler
+from chuk_tool_processor.scheduling.latency_model import LatencyModel, QuantileSketch, arg_shape
+from chuk_tool_processor.scheduling.plan_executor import PlanExecutor
 from chuk_tool_processor.scheduling.policy import SchedulerPolicy
 from chuk_tool_processor.scheduling.types import (
     ExecutionPlan,
@@ -45,4 +51,11 @@ __all__ = [
     "SchedulerPolicy",
     # Implementations
     "GreedyDagScheduler",
+    "CriticalPathScheduler",
+    # Execution
+    "PlanExecutor",
+    # Latency estimates
+    "LatencyModel",
+    "QuantileSketch",
+    "arg_shape",
 ]
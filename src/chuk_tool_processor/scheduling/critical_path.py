@@ -0,0 +1,414 @@
+# chuk_tool_processor/scheduling/critical_path.py
+"""
+Critical-path list scheduler (HEFT-style).
+
+GreedyDagScheduler orders ready calls by (priority, est_ms) and packs them
+into stages, without looking at how much work depends on each call, so long
+dependency chains can start late. This scheduler instead:
+
+- Ranks every call by its upward rank: its own est_ms plus the longest
+  est_ms path from it to a sink, i.e. the critical path it starts
+- Places calls in rank order onto pool slots on a simulated timeline, each
+  starting at the later of "all dependencies finished" and "a slot of its
+  pool is free" (pools without a limit have as many slots as needed)
+- Skips low-priority calls whose simulated finish would pass the deadline
+  threshold, or whose cost would exceed the budget, and cascades skips to
+  their dependents
+- Reports the predicted makespan (estimated_total_ms), the critical path and
+  per-pool slot utilization
+
+Stages follow the simulated start times, so running the plan with
+PlanExecutor releases calls in the order the simulation assumed.
+
+It implements the SchedulerPolicy protocol and can be swapped in for
+GreedyDagScheduler to compare plans.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import logging
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+
+from chuk_tool_processor.logging import get_logger
+from chuk_tool_processor.scheduling.latency_model import LatencyModel
+from chuk_tool_processor.scheduling.types import (
+    ExecutionPlan,
+    SchedulingConstraints,
+    SkipReason,
+    ToolCallSpec,
+)
+
+logger = get_logger("chuk_tool_processor.scheduling.critical_path")
+
+
+class CriticalPathScheduler:
+    """
+    Makespan-minimizing list scheduler using upward-rank priorities.
+
+    Example:
+        >>> scheduler = CriticalPathScheduler()
+        >>> calls = [
+        ...     ToolCallSpec(call_id="a", tool_name="fetch", metadata=ToolMetadata(est_ms=100)),
+        ...     ToolCallSpec(call_id="b", tool_name="parse", depends_on=("a",), metadata=ToolMetadata(est_ms=500)),
+        ...     ToolCallSpec(call_id="c", tool_name="ping", metadata=ToolMetadata(est_ms=300)),
+        ... ]
+        >>> plan = scheduler.plan(calls, SchedulingConstraints(pool_limits={"default": 1}))
+        >>> plan.stages  # the 600ms chain a -> b goes first
+        (('a',), ('b',), ('c',))
+        >>> plan.estimated_total_ms
+        900
+    """
+
+    def __init__(
+        self,
+        default_est_ms: int = 1000,
+        skip_threshold_ratio: float = 0.8,
+        latency_model: LatencyModel | None = None,
+        timeout_quantile: float | None = None,
+    ) -> None:
+        """
+        Initialize the critical-path scheduler.
+
+        Args:
+            default_est_ms: Default estimated execution time for calls without est_ms
+            skip_threshold_ratio: Skip low-priority calls whose simulated finish would
+                                  exceed this ratio of the deadline (0.8 = 80%)
+            latency_model: Optional LatencyModel used to fill missing ``est_ms``
+                           (and ``timeout_ms``, see ``timeout_quantile``) from
+                           observed latency before planning
+            timeout_quantile: If set with a latency model, missing ``timeout_ms``
+                              is filled from this quantile (e.g. 0.99)
+        """
+        self.default_est_ms = default_est_ms
+        self.skip_threshold_ratio = skip_threshold_ratio
+        self.latency_model = latency_model
+        self.timeout_quantile = timeout_quantile
+
+    def plan(
+        self,
+        calls: Sequence[ToolCallSpec],
+        constraints: SchedulingConstraints,
+        context: Mapping[str, object] | None = None,  # noqa: ARG002
+    ) -> ExecutionPlan:
+        """
+        Create an execution plan for the given calls.
+
+        Args:
+            calls: Tool calls to schedule
+            constraints: Global constraints (deadline, cost, pool limits)
+            context: Optional request-scoped context (unused)
+
+        Returns:
+            An ExecutionPlan with stages, skips, predicted makespan and utilization
+        """
+        if not calls:
+            return ExecutionPlan()
+
+        if self.latency_model is not None:
+            calls = self.latency_model.annotate(calls, timeout_quantile=self.timeout_quantile)
+
+        call_map = {c.call_id: c for c in calls}
+        est = {cid: call.metadata.est_ms or self.default_est_ms for cid, call in call_map.items()}
+
+        ranks = self._upward_ranks(call_map, est)
+        if ranks is None:
+            logger.warning("Dependency cycle detected, skipping all calls")
+            return ExecutionPlan(skip=tuple(call_map))
+
+        start, skip_ids, skip_reasons = self._simulate(call_map, est, ranks, constraints)
+        finish = {cid: t + est[cid] for cid, t in start.items()}
+        makespan = max(finish.values(), default=0)
+
+        stages = self._build_stages(start, call_map, constraints)
+
+        per_call_timeout_ms: dict[str, int] = {}
+        if constraints.deadline_ms is not None:
+            # Each call may overrun its estimate by the schedule's total slack
+            slack = max(0, constraints.deadline_ms - constraints.now_ms - makespan)
+            for cid in start:
+                timeout_ms = call_map[cid].timeout_ms
+                per_call_timeout_ms[cid] = timeout_ms if timeout_ms is not None else est[cid] + slack
+        elif self.latency_model is not None:
+            # Learned timeouts live on the annotated specs, not the caller's
+            per_call_timeout_ms = {
+                cid: timeout_ms for cid in start if (timeout_ms := call_map[cid].timeout_ms) is not None
+            }
+
+        # Longest est_ms chain among the calls that will actually run
+        scheduled_ranks = self._upward_ranks({cid: call_map[cid] for cid in start}, est) or {}
+        critical_path_ms = max(scheduled_ranks.values(), default=0)
+
+        logger.debug(
+            "Plan created: %d stages, %d scheduled, %d skipped, makespan=%dms, critical_path=%dms",
+            len(stages),
+            len(start),
+            len(skip_ids),
+            makespan,
+            critical_path_ms,
+        )
+
+        return ExecutionPlan(
+            stages=tuple(tuple(stage) for stage in stages),
+            per_call_timeout_ms=per_call_timeout_ms,
+            skip=tuple(skip_ids),
+            skip_reasons=tuple(skip_reasons),
+            critical_path_ms=critical_path_ms if start else None,
+            estimated_total_ms=makespan if start else None,
+            pool_utilization=self._peak_concurrency(start, finish, call_map),
+            slot_utilization=self._slot_utilization(start, est, call_map, constraints, makespan),
+        )
+
+    def _upward_ranks(
+        self,
+        call_map: dict[str, ToolCallSpec],
+        est: dict[str, int],
+    ) -> dict[str, int] | None:
+        """
+        Compute each call's upward rank: est_ms plus the longest path to a sink.
+
+        Walks a topological order (Kahn's algorithm) backwards, so this is O(V + E).
+
+        Returns:
+            Map of call_id -> upward rank in ms, or None if a cycle is detected
+        """
+        in_degree: dict[str, int] = dict.fromkeys(call_map, 0)
+        dependents: dict[str, list[str]] = defaultdict(list)
+        for cid, call in call_map.items():
+            for dep in set(call.depends_on):
+                if dep in call_map:
+                    dependents[dep].append(cid)
+                    in_degree[cid] += 1
+
+        order = [cid for cid, deg in in_degree.items() if deg == 0]
+        for cid in order:  # the list grows while it is walked
+            for dependent in dependents.get(cid, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    order.append(dependent)
+
+        if len(order) != len(call_map):
+            return None
+
+        ranks: dict[str, int] = {}
+        for cid in reversed(order):
+            ranks[cid] = est[cid] + max((ranks[d] for d in dependents.get(cid, ())), default=0)
+        return ranks
+
+    def _simulate(
+        self,
+        call_map: dict[str, ToolCallSpec],
+        est: dict[str, int],
+        ranks: dict[str, int],
+        constraints: SchedulingConstraints,
+    ) -> tuple[dict[str, int], list[str], list[SkipReason]]:
+        """
+        List-schedule calls in upward-rank order onto pool slots.
+
+        Ready calls are taken highest rank first (then priority desc, then input
+        order). Each starts once its dependencies have finished, on the slot of
+        its pool that became free latest before then (best fit, so idle gaps stay
+        small); if every slot is still busy, on the slot that frees up first.
+
+        Returns:
+            (start time in ms per scheduled call, skipped call_ids, skip reasons)
+        """
+        index = {cid: i for i, cid in enumerate(call_map)}
+        waiting: dict[str, int] = {}
+        dependents: dict[str, list[str]] = defaultdict(list)
+        blocked: set[str] = set()
+        for cid, call in call_map.items():
+            deps = set(call.depends_on)
+            if any(dep not in call_map for dep in deps):
+                blocked.add(cid)
+            waiting[cid] = 0
+            for dep in deps:
+                if dep in call_map:
+                    dependents[dep].append(cid)
+                    waiting[cid] += 1
+
+        def key(cid: str) -> tuple[int, int, int, str]:
+            return (-ranks[cid], -call_map[cid].metadata.priority, index[cid], cid)
+
+        ready = [key(cid) for cid, n in waiting.items() if n == 0]
+        heapq.heapify(ready)
+
+        deadline_threshold = None
+        if constraints.deadline_ms is not None:
+            deadline_threshold = int(constraints.deadline_ms * self.skip_threshold_ratio)
+        log_skips = logger.isEnabledFor(logging.DEBUG)
+
+        # pool -> sorted times at which its used slots become free (unused slots are free from 0)
+        slots: dict[str, list[int]] = defaultdict(list)
+        start: dict[str, int] = {}
+        finish: dict[str, int] = {}
+        skip_ids: list[str] = []
+        skipped: set[str] = set()
+        skip_reasons: list[SkipReason] = []
+        cumulative_cost = 0.0
+
+        def skip(cid: str, reason: str, detail: str) -> None:
+            if log_skips:
+                logger.debug("Skipping %s: %s", cid, detail)
+            skipped.add(cid)
+            skip_ids.append(cid)
+            skip_reasons.append(SkipReason(call_id=cid, reason=reason, detail=detail))
+
+        while ready:
+            cid = heapq.heappop(ready)[-1]
+            call = call_map[cid]
+
+            for dependent in dependents.get(cid, ()):
+                waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    heapq.heappush(ready, key(dependent))
+
+            if cid in blocked:
+                # Depends on a call that does not exist; it and its dependents can never run
+                blocked.update(dependents.get(cid, ()))
+                continue
+
+            skipped_deps = [dep for dep in call.depends_on if dep in skipped]
+            if skipped_deps:
+                skip(cid, "dependency_skipped", f"Depends on skipped call(s): {', '.join(skipped_deps)}")
+                continue
+
+            pool = call.metadata.pool
+            limit = constraints.pool_limits.get(pool)
+            capacity = max(1, limit) if limit is not None else None
+            pool_slots = slots[pool]
+            deps_done = max((finish[dep] for dep in call.depends_on if dep in finish), default=0)
+            slot = -1  # index into pool_slots, or -1 for an unused slot / unlimited pool
+            begin = deps_done
+            if capacity is not None:
+                slot = bisect.bisect_right(pool_slots, deps_done) - 1
+                if slot < 0 and len(pool_slots) >= capacity:
+                    slot = 0
+                    begin = pool_slots[0]
+            end = begin + est[cid]
+
+            low_priority = call.metadata.priority <= 0
+            if low_priority and deadline_threshold is not None and constraints.now_ms + end > deadline_threshold:
+                skip(
+                    cid,
+                    "deadline_exceeded",
+                    f"Simulated completion {constraints.now_ms + end}ms > threshold {deadline_threshold}ms",
+                )
+                continue
+
+            cost = call.metadata.cost or 0.0
+            if low_priority and constraints.max_cost is not None and cumulative_cost + cost > constraints.max_cost:
+                skip(
+                    cid,
+                    "cost_exceeded",
+                    f"Cumulative cost {cumulative_cost + cost:.2f} > limit {constraints.max_cost:.2f}",
+                )
+                continue
+
+            if capacity is not None:
+                if slot >= 0:
+                    del pool_slots[slot]
+                bisect.insort(pool_slots, end)
+            start[cid] = begin
+            finish[cid] = end
+            cumulative_cost += cost
+
+        if blocked:
+            logger.warning("Calls with unknown dependencies were not scheduled: %s", sorted(blocked))
+
+        return start, skip_ids, skip_reasons
+
+    def _build_stages(
+        self,
+        start: dict[str, int],
+        call_map: dict[str, ToolCallSpec],
+        constraints: SchedulingConstraints,
+    ) -> list[list[str]]:
+        """
+        Group scheduled calls into stages by simulated start time.
+
+        A new stage begins when the start time changes, when a call depends on
+        a call already in the current stage (zero-length calls), or when the
+        current stage already holds its pool's limit.
+        """
+        stages: list[list[str]] = []
+        stage: list[str] = []
+        members: set[str] = set()
+        pool_counts: dict[str, int] = defaultdict(int)
+        stage_start: int | None = None
+
+        # sorted() is stable: equal start times keep the order calls were placed in
+        for cid in sorted(start, key=start.__getitem__):
+            call = call_map[cid]
+            pool = call.metadata.pool
+            limit = max(1, constraints.pool_limits.get(pool, len(start)))
+            if stage and (
+                start[cid] != stage_start
+                or any(dep in members for dep in call.depends_on)
+                or pool_counts[pool] >= limit
+            ):
+                stages.append(stage)
+                stage, members, pool_counts = [], set(), defaultdict(int)
+            if not stage:
+                stage_start = start[cid]
+            stage.append(cid)
+            members.add(cid)
+            pool_counts[pool] += 1
+
+        if stage:
+            stages.append(stage)
+        return stages
+
+    @staticmethod
+    def _peak_concurrency(
+        start: dict[str, int],
+        finish: dict[str, int],
+        call_map: dict[str, ToolCallSpec],
+    ) -> dict[str, int]:
+        """Per-pool max number of calls running at the same simulated time."""
+        events: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for cid, begin in start.items():
+            pool = call_map[cid].metadata.pool
+            events[pool].append((begin, 1))
+            events[pool].append((finish[cid], -1))
+
+        peak: dict[str, int] = {}
+        for pool, pool_events in events.items():
+            # At equal times, finishes (-1) sort before starts (+1)
+            running = best = 0
+            for _, delta in sorted(pool_events):
+                running += delta
+                best = max(best, running)
+            peak[pool] = best
+        return peak
+
+    @staticmethod
+    def _slot_utilization(
+        start: dict[str, int],
+        est: dict[str, int],
+        call_map: dict[str, ToolCallSpec],
+        constraints: SchedulingConstraints,
+        makespan: int,
+    ) -> dict[str, float]:
+        """
+        Per-pool busy slot time divided by available slot time over the makespan.
+
+        Pools with a limit have that many slots; pools without one are counted
+        with as many slots as they ever use at once.
+        """
+        if makespan <= 0:
+            return {}
+
+        busy: dict[str, int] = defaultdict(int)
+        for cid in start:
+            busy[call_map[cid].metadata.pool] += est[cid]
+
+        peak = CriticalPathScheduler._peak_concurrency(start, {cid: t + est[cid] for cid, t in start.items()}, call_map)
+        utilization: dict[str, float] = {}
+        for pool, busy_ms in busy.items():
+            limit = constraints.pool_limits.get(pool)
+            slot_count = max(1, limit) if limit is not None else max(1, peak[pool])
+            utilization[pool] = round(busy_ms / (slot_count * makespan), 4)
+        return utilization
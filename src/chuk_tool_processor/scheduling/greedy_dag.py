@@ -14,10 +14,13 @@ without requiring a constraint solver.
 
 from __future__ import annotations
 
+import heapq
+import logging
 from collections import defaultdict
 from collections.abc import Mapping, Sequence
 
 from chuk_tool_processor.logging import get_logger
+from chuk_tool_processor.scheduling.latency_model import LatencyModel
 from chuk_tool_processor.scheduling.types import (
     ExecutionPlan,
     SchedulingConstraints,
@@ -54,6 +57,8 @@ class GreedyDagScheduler:
         self,
         default_est_ms: int = 1000,
         skip_threshold_ratio: float = 0.8,
+        latency_model: LatencyModel | None = None,
+        timeout_quantile: float | None = None,
     ) -> None:
         """
         Initialize the greedy DAG scheduler.
@@ -62,9 +67,16 @@ class GreedyDagScheduler:
             default_est_ms: Default estimated execution time for calls without est_ms
             skip_threshold_ratio: Skip calls if their completion would exceed
                                   this ratio of the deadline (0.8 = 80%)
+            latency_model: Optional LatencyModel used to fill missing ``est_ms``
+                           (and ``timeout_ms``, see ``timeout_quantile``) from
+                           observed latency before planning
+            timeout_quantile: If set with a latency model, missing ``timeout_ms``
+                              is filled from this quantile (e.g. 0.99)
         """
         self.default_est_ms = default_est_ms
         self.skip_threshold_ratio = skip_threshold_ratio
+        self.latency_model = latency_model
+        self.timeout_quantile = timeout_quantile
 
     def plan(
         self,
@@ -86,6 +98,9 @@ class GreedyDagScheduler:
         if not calls:
             return ExecutionPlan()
 
+        if self.latency_model is not None:
+            calls = self.latency_model.annotate(calls, timeout_quantile=self.timeout_quantile)
+
         # Build lookup maps
         call_map = {c.call_id: c for c in calls}
         call_ids = set(call_map.keys())
@@ -115,6 +130,14 @@ class GreedyDagScheduler:
         per_call_timeout_ms = {}
         if constraints.deadline_ms is not None:
             per_call_timeout_ms = self._calculate_timeouts(stages, call_map, constraints)
+        elif self.latency_model is not None:
+            # Learned timeouts live on the annotated specs, not the caller's
+            per_call_timeout_ms = {
+                cid: timeout_ms
+                for stage in stages
+                for cid in stage
+                if (timeout_ms := call_map[cid].timeout_ms) is not None
+            }
 
         # Step 5: Calculate explainability metrics
         critical_path_ms, estimated_total_ms = self._calculate_critical_path(stages, call_map)
@@ -138,6 +161,10 @@ class GreedyDagScheduler:
             pool_utilization=pool_utilization,
         )
 
+    def _sort_key(self, call: ToolCallSpec) -> tuple[int, int]:
+        """Ready-queue ordering: priority descending, then est_ms ascending."""
+        return (-call.metadata.priority, call.metadata.est_ms or self.default_est_ms)
+
     def _topological_sort(
         self,
         calls: Sequence[ToolCallSpec],
@@ -146,7 +173,10 @@ class GreedyDagScheduler:
         """
         Perform topological sort on calls based on dependencies.
 
-        Uses Kahn's algorithm for simplicity and cycle detection.
+        Uses Kahn's algorithm with a heap as the ready queue, so the sort is
+        O((V + E) log V). Ready calls are ordered by (priority desc, est_ms asc);
+        ties go to the call that became ready first, with the initially ready
+        calls in input order.
 
         Args:
             calls: All tool calls
@@ -166,30 +196,28 @@ class GreedyDagScheduler:
                     dependents[dep].append(call.call_id)
                     in_degree[call.call_id] += 1
 
-        # Find all calls with no dependencies (in_degree == 0)
-        ready = [cid for cid, deg in in_degree.items() if deg == 0]
-
-        # Sort by (priority desc, est_ms asc) for deterministic ordering
-        def sort_key(cid: str) -> tuple[int, int]:
-            call = call_map[cid]
-            priority = -call.metadata.priority  # Negative for descending
-            est = call.metadata.est_ms or self.default_est_ms
-            return (priority, est)
-
-        ready.sort(key=sort_key)
+        # Heap entries are (priority desc, est_ms asc, arrival); the arrival
+        # counter keeps ties first-in-first-out and makes every key unique
+        ready: list[tuple[int, int, int, str]] = []
+        arrival = 0
+        for cid, deg in in_degree.items():
+            if deg == 0:
+                ready.append((*self._sort_key(call_map[cid]), arrival, cid))
+                arrival += 1
+        heapq.heapify(ready)
 
         result = []
         while ready:
             # Pop highest priority ready call
-            current = ready.pop(0)
+            current = heapq.heappop(ready)[-1]
             result.append(current)
 
             # Update dependents
-            for dep in dependents[current]:
+            for dep in dependents.get(current, ()):
                 in_degree[dep] -= 1
                 if in_degree[dep] == 0:
-                    ready.append(dep)
-                    ready.sort(key=sort_key)
+                    heapq.heappush(ready, (*self._sort_key(call_map[dep]), arrival, dep))
+                    arrival += 1
 
         # Check for cycles
         if len(result) != len(call_map):
@@ -232,15 +260,19 @@ class GreedyDagScheduler:
         if constraints.deadline_ms is not None:
             deadline_threshold = int(constraints.deadline_ms * self.skip_threshold_ratio)
 
+        # Large plans can skip thousands of calls; don't format debug records nobody sees
+        log_skips = logger.isEnabledFor(logging.DEBUG)
+
         for call_id in sorted_ids:
             call = call_map[call_id]
             est_ms = call.metadata.est_ms or self.default_est_ms
             cost = call.metadata.cost or 0.0
 
-            # Check if dependencies are skipped
-            skipped_deps = [dep for dep in call.depends_on if dep in skip_ids]
-            if skipped_deps:
-                logger.debug("Skipping %s because dependency is skipped", call_id)
+            # Check if dependencies are skipped (the detail list is only built for skipped calls)
+            if skip_ids and not skip_ids.isdisjoint(call.depends_on):
+                skipped_deps = [dep for dep in call.depends_on if dep in skip_ids]
+                if log_skips:
+                    logger.debug("Skipping %s because dependency is skipped", call_id)
                 skip_ids.add(call_id)
                 skip_reasons.append(
                     SkipReason(
@@ -257,13 +289,14 @@ class GreedyDagScheduler:
                 and cumulative_time_ms + est_ms > deadline_threshold
                 and call.metadata.priority <= 0
             ):
-                logger.debug(
-                    "Skipping %s: would exceed deadline threshold (%d + %d > %d)",
-                    call_id,
-                    cumulative_time_ms,
-                    est_ms,
-                    deadline_threshold,
-                )
+                if log_skips:
+                    logger.debug(
+                        "Skipping %s: would exceed deadline threshold (%d + %d > %d)",
+                        call_id,
+                        cumulative_time_ms,
+                        est_ms,
+                        deadline_threshold,
+                    )
                 skip_ids.add(call_id)
                 skip_reasons.append(
                     SkipReason(
@@ -280,13 +313,14 @@ class GreedyDagScheduler:
                 and cumulative_cost + cost > constraints.max_cost
                 and call.metadata.priority <= 0
             ):
-                logger.debug(
-                    "Skipping %s: would exceed cost limit (%.2f + %.2f > %.2f)",
-                    call_id,
-                    cumulative_cost,
-                    cost,
-                    constraints.max_cost,
-                )
+                if log_skips:
+                    logger.debug(
+                        "Skipping %s: would exceed cost limit (%.2f + %.2f > %.2f)",
+                        call_id,
+                        cumulative_cost,
+                        cost,
+                        constraints.max_cost,
+                    )
                 skip_ids.add(call_id)
                 skip_reasons.append(
                     SkipReason(
@@ -316,6 +350,12 @@ class GreedyDagScheduler:
         - All dependencies are in earlier stages
         - Pool limits are not exceeded within a stage
 
+        Each stage takes, per pool, the first ``limit`` ready calls in
+        topological order. Readiness is tracked with per-call counts of
+        unfinished dependencies and per-pool heaps of ready calls, so the
+        whole pass is O((V + E) log V) rather than a rescan of every
+        remaining call per stage.
+
         Args:
             scheduled_ids: Topologically sorted call IDs (not skipped)
             call_map: Map of call_id -> ToolCallSpec
@@ -327,42 +367,68 @@ class GreedyDagScheduler:
         if not scheduled_ids:
             return []
 
-        # Track which calls have completed (in earlier stages)
-        completed: set[str] = set()
-        stages: list[list[str]] = []
+        position = {cid: i for i, cid in enumerate(scheduled_ids)}
+        pools = [call_map[cid].metadata.pool for cid in scheduled_ids]
+
+        # Unfinished dependencies per call. Dependencies that are not scheduled
+        # never finish, so calls with such a dependency never become ready.
+        waiting = [0] * len(scheduled_ids)
+        dependents: list[list[int]] = [[] for _ in scheduled_ids]
+        for i, cid in enumerate(scheduled_ids):
+            for dep in set(call_map[cid].depends_on):
+                waiting[i] += 1
+                j = position.get(dep)
+                if j is not None:
+                    dependents[j].append(i)
+
+        # pool -> heap of ready call positions (topological order)
+        ready: dict[str, list[int]] = defaultdict(list)
+        for i in range(len(scheduled_ids)):
+            if waiting[i] == 0:
+                ready[pools[i]].append(i)
+        for heap in ready.values():
+            heapq.heapify(heap)
 
-        remaining = list(scheduled_ids)
+        stages: list[list[str]] = []
+        remaining = len(scheduled_ids)
 
         while remaining:
-            # Find calls that are ready (all deps completed)
-            ready = [cid for cid in remaining if all(dep in completed for dep in call_map[cid].depends_on)]
-
             if not ready:
-                # Should not happen if topological sort is correct
-                logger.error("No ready calls but remaining: %s", remaining)
+                # Only calls with unsatisfiable dependencies are left
+                logger.error(
+                    "No ready calls but remaining: %s",
+                    [cid for i, cid in enumerate(scheduled_ids) if waiting[i] > 0],
+                )
                 break
 
             # Build stage respecting pool limits
-            stage: list[str] = []
-            pool_counts: dict[str, int] = defaultdict(int)
-
-            for call_id in ready:
-                call = call_map[call_id]
-                pool = call.metadata.pool
+            stage: list[int] = []
+            for pool, heap in ready.items():
                 limit = constraints.pool_limits.get(pool, float("inf"))
-
-                if pool_counts[pool] < limit:
-                    stage.append(call_id)
-                    pool_counts[pool] += 1
+                while heap and limit > 0:
+                    stage.append(heapq.heappop(heap))
+                    limit -= 1
 
             if not stage:
                 # Pool limits prevent any progress - add first ready call anyway
                 # to avoid infinite loop
-                stage.append(ready[0])
-
-            stages.append(stage)
-            completed.update(stage)
-            remaining = [cid for cid in remaining if cid not in completed]
+                first = min(ready.values(), key=lambda heap: heap[0])
+                stage.append(heapq.heappop(first))
+            else:
+                stage.sort()
+
+            for pool in [pool for pool, heap in ready.items() if not heap]:
+                del ready[pool]
+
+            # Calls that depend on this stage become ready for the next one
+            for i in stage:
+                for j in dependents[i]:
+                    waiting[j] -= 1
+                    if waiting[j] == 0:
+                        heapq.heappush(ready[pools[j]], j)
+
+            stages.append([scheduled_ids[i] for i in stage])
+            remaining -= len(stage)
 
         return stages
 
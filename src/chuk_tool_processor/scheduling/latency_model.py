@@ -0,0 +1,446 @@
+# chuk_tool_processor/scheduling/latency_model.py
+"""
+Online latency model that learns ``ToolMetadata.est_ms`` from completed calls.
+
+Schedulers, deadline skipping and timeout budgets are only as good as the
+``est_ms`` they are given, which is otherwise hand-entered or falls back to
+``default_est_ms``. A :class:`LatencyModel` learns it from observed tool
+latencies instead:
+
+- Per tool, and optionally per argument shape (argument names, types and
+  order-of-magnitude sizes), so ``search(q="x")`` and a search with a 5k-token
+  prompt are estimated separately once both have been seen often enough
+- An EWMA tracks the typical latency and follows drift quickly
+- A :class:`QuantileSketch` (log-bucketed, relative-error quantiles in
+  constant space) answers tail queries such as p90 or p99 for timeouts
+- ``save()`` / ``load()`` persist the model as JSON across restarts
+
+Feed it with ``ToolProcessor(latency_model=model)`` (or wrap an executor in
+:class:`~chuk_tool_processor.execution.wrappers.latency_tracking.LatencyTrackingExecutor`)
+and pass it to a scheduler (``GreedyDagScheduler(latency_model=model)``) or use
+:meth:`LatencyModel.annotate` to fill ``est_ms`` and ``timeout_ms`` on
+ToolCallSpecs before planning.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import math
+import os
+import tempfile
+import time
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from chuk_tool_processor.logging import get_logger
+from chuk_tool_processor.scheduling.types import ToolCallSpec
+
+logger = get_logger("chuk_tool_processor.scheduling.latency_model")
+
+LATENCY_MODEL_FORMAT_VERSION = 1
+
+# Argument values with a length are bucketed by order of magnitude
+_SIZED_TYPES = (str, bytes, list, tuple, dict, set, frozenset)
+
+
+def arg_shape(args: Mapping[str, Any]) -> str:
+    """
+    Coarse, stable description of a call's arguments.
+
+    Argument names and value types are kept; lengths of strings and
+    collections are reduced to their power-of-two bucket, so calls whose
+    inputs differ only slightly share a shape.
+
+    Example:
+        >>> arg_shape({"query": "weather in Paris", "limit": 5})
+        'limit:int,query:str/5'
+    """
+    parts = []
+    for name in sorted(args):
+        value = args[name]
+        part = f"{name}:{type(value).__name__}"
+        if isinstance(value, _SIZED_TYPES):
+            part += f"/{len(value).bit_length()}"
+        parts.append(part)
+    return ",".join(parts)
+
+
+class QuantileSketch:
+    """
+    Streaming quantile sketch with relative-error guarantees (DDSketch-style).
+
+    Values are counted in logarithmic buckets, so any quantile is returned
+    within ``relative_accuracy`` of the true value while memory stays bounded
+    by ``max_buckets`` regardless of how many values were added. When the
+    bucket limit is reached the lowest buckets are merged, which only affects
+    the accuracy of the smallest quantiles.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of returned quantiles (0-1)
+            max_buckets: Upper bound on the number of buckets kept
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: dict[int, float] = {}
+        self._zero_count = 0.0
+        self._count = 0.0
+
+    @property
+    def count(self) -> float:
+        """Number of values in the sketch (fractional after :meth:`decay`)."""
+        return self._count
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        """Add a non-negative value."""
+        self._count += weight
+        if value <= 0:
+            self._zero_count += weight
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[index] = self._buckets.get(index, 0.0) + weight
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q: float) -> float | None:
+        """Value at quantile ``q`` (0-1), or None if the sketch is empty."""
+        if self._count <= 0:
+            return None
+        rank = min(max(q, 0.0), 1.0) * self._count
+        seen = self._zero_count
+        if seen >= rank and self._zero_count > 0:
+            return 0.0
+        index = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                break
+        return self._value(index)
+
+    def decay(self, factor: float) -> None:
+        """Scale every count by ``factor`` (0-1) so older values weigh less."""
+        self._zero_count *= factor
+        self._buckets = {i: c * factor for i, c in self._buckets.items() if c * factor >= 0.01}
+        self._count = self._zero_count + sum(self._buckets.values())
+
+    def _value(self, index: int) -> float:
+        # Midpoint (in relative terms) of bucket (gamma^(i-1), gamma^i]
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    def _collapse(self) -> None:
+        indices = sorted(self._buckets)
+        excess = len(indices) - self.max_buckets
+        merged = sum(self._buckets.pop(i) for i in indices[:excess])
+        target = indices[excess]
+        self._buckets[target] += merged
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-compatible representation."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_buckets": self.max_buckets,
+            "zero_count": self._zero_count,
+            "count": self._count,
+            "buckets": {str(i): c for i, c in self._buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> QuantileSketch:
+        """Rebuild a sketch from :meth:`to_dict` output."""
+        sketch = cls(float(data["relative_accuracy"]), int(data["max_buckets"]))
+        sketch._zero_count = float(data["zero_count"])
+        sketch._count = float(data["count"])
+        sketch._buckets = {int(i): float(c) for i, c in data["buckets"].items()}
+        return sketch
+
+
+class LatencyStats:
+    """Latency observed for one tool (or one tool and argument shape)."""
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.count = 0
+        self.ewma_ms: float | None = None
+        self.min_ms: float | None = None
+        self.max_ms: float | None = None
+        self.updated_at = 0.0
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def observe(self, duration_ms: float, alpha: float, window: int) -> None:
+        """Add one observation; the sketch is halved whenever it holds ``window`` samples."""
+        self.count += 1
+        self.ewma_ms = duration_ms if self.ewma_ms is None else self.ewma_ms + alpha * (duration_ms - self.ewma_ms)
+        self.min_ms = duration_ms if self.min_ms is None else min(self.min_ms, duration_ms)
+        self.max_ms = duration_ms if self.max_ms is None else max(self.max_ms, duration_ms)
+        self.updated_at = time.time()
+        if self.sketch.count >= window:
+            self.sketch.decay(0.5)
+        self.sketch.add(duration_ms)
+
+    def quantile(self, q: float) -> float | None:
+        """Latency at quantile ``q`` in milliseconds."""
+        return self.sketch.quantile(q)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "ewma_ms": self.ewma_ms,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "updated_at": self.updated_at,
+            "sketch": self.sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> LatencyStats:
+        stats = cls()
+        stats.count = int(data["count"])
+        stats.ewma_ms = data["ewma_ms"]
+        stats.min_ms = data["min_ms"]
+        stats.max_ms = data["max_ms"]
+        stats.updated_at = float(data["updated_at"])
+        stats.sketch = QuantileSketch.from_dict(data["sketch"])
+        return stats
+
+
+class LatencyModel:
+    """
+    Per-tool latency estimates learned online.
+
+    Example:
+        >>> model = LatencyModel.load("latency.json")
+        >>> async with ToolProcessor(latency_model=model) as processor:
+        ...     scheduler = GreedyDagScheduler(latency_model=model, timeout_quantile=0.99)
+        ...     plan = scheduler.plan(calls, constraints)
+        ...     async for result in processor.execute_plan(plan, calls, constraints):
+        ...         ...
+        >>> model.save("latency.json")
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        relative_accuracy: float = 0.01,
+        window: int = 1000,
+        by_arg_shape: bool = False,
+        min_shape_samples: int = 5,
+        max_shapes_per_tool: int = 32,
+    ) -> None:
+        """
+        Initialize an empty model.
+
+        Args:
+            alpha: EWMA weight of each new observation (0-1]
+            relative_accuracy: Relative error of quantile estimates
+            window: Samples after which the quantile sketch halves its counts,
+                    so tail estimates follow changes in the tool's behaviour
+            by_arg_shape: Also learn separate estimates per argument shape
+            min_shape_samples: Observations of a shape needed before its
+                               estimate is used instead of the tool-wide one
+            max_shapes_per_tool: New shapes beyond this many per tool are
+                                 only counted in the tool-wide estimate
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.relative_accuracy = relative_accuracy
+        self.window = window
+        self.by_arg_shape = by_arg_shape
+        self.min_shape_samples = min_shape_samples
+        self.max_shapes_per_tool = max_shapes_per_tool
+        self._tools: dict[str, LatencyStats] = {}
+        self._shapes: dict[str, dict[str, LatencyStats]] = {}
+
+    # ------------------------------------------------------------------ #
+    # Learning                                                           #
+    # ------------------------------------------------------------------ #
+
+    def observe(self, tool: str, duration_ms: float, args: Mapping[str, Any] | None = None) -> None:
+        """Record one completed call of ``tool`` that took ``duration_ms``."""
+        duration_ms = max(0.0, duration_ms)
+        stats = self._tools.get(tool)
+        if stats is None:
+            stats = self._tools[tool] = LatencyStats(self.relative_accuracy)
+        stats.observe(duration_ms, self.alpha, self.window)
+
+        if self.by_arg_shape and args is not None:
+            shapes = self._shapes.setdefault(tool, {})
+            shape = arg_shape(args)
+            shape_stats = shapes.get(shape)
+            if shape_stats is None:
+                if len(shapes) >= self.max_shapes_per_tool:
+                    return
+                shape_stats = shapes[shape] = LatencyStats(self.relative_accuracy)
+            shape_stats.observe(duration_ms, self.alpha, self.window)
+
+    # ------------------------------------------------------------------ #
+    # Queries                                                            #
+    # ------------------------------------------------------------------ #
+
+    def stats(self, tool: str, args: Mapping[str, Any] | None = None) -> LatencyStats | None:
+        """
+        Statistics used to estimate a call of ``tool`` with ``args``.
+
+        The argument-shape statistics are returned when the shape has been
+        seen at least ``min_shape_samples`` times, otherwise the tool-wide
+        statistics; None if the tool has never been observed.
+        """
+        if self.by_arg_shape and args is not None:
+            shape_stats = self._shapes.get(tool, {}).get(arg_shape(args))
+            if shape_stats is not None and shape_stats.count >= self.min_shape_samples:
+                return shape_stats
+        return self._tools.get(tool)
+
+    def estimate_ms(
+        self,
+        tool: str,
+        args: Mapping[str, Any] | None = None,
+        quantile: float | None = None,
+    ) -> int | None:
+        """
+        Estimated latency of a call in whole milliseconds (at least 1).
+
+        Args:
+            tool: Tool name
+            args: Call arguments (used when learning by argument shape)
+            quantile: Latency quantile to return (e.g. 0.9); None for the EWMA
+
+        Returns:
+            The estimate, or None if the tool has never been observed
+        """
+        stats = self.stats(tool, args)
+        if stats is None:
+            return None
+        value = stats.ewma_ms if quantile is None else stats.quantile(quantile)
+        return None if value is None else max(1, math.ceil(value))
+
+    def timeout_ms(
+        self,
+        tool: str,
+        args: Mapping[str, Any] | None = None,
+        quantile: float = 0.99,
+        headroom: float = 1.5,
+    ) -> int | None:
+        """Suggested timeout: the ``quantile`` latency times ``headroom``; None if unobserved."""
+        estimate = self.estimate_ms(tool, args, quantile)
+        return None if estimate is None else math.ceil(estimate * headroom)
+
+    def annotate(
+        self,
+        calls: Sequence[ToolCallSpec],
+        quantile: float | None = None,
+        timeout_quantile: float | None = None,
+        timeout_headroom: float = 1.5,
+        overwrite: bool = False,
+    ) -> list[ToolCallSpec]:
+        """
+        Fill in learned estimates on ToolCallSpecs for scheduling.
+
+        Args:
+            calls: Specs to annotate (not modified)
+            quantile: Quantile used for ``metadata.est_ms``; None for the EWMA
+            timeout_quantile: If set, also fill ``timeout_ms`` from this
+                              quantile times ``timeout_headroom``
+            timeout_headroom: Multiplier applied to the timeout quantile
+            overwrite: Replace values that are already set (by default only
+                       missing ``est_ms`` / ``timeout_ms`` are filled)
+
+        Returns:
+            New specs; calls of tools that were never observed are unchanged
+        """
+        annotated: list[ToolCallSpec] = []
+        for call in calls:
+            updates: dict[str, Any] = {}
+            if overwrite or call.metadata.est_ms is None:
+                est_ms = self.estimate_ms(call.tool_name, call.args, quantile)
+                if est_ms is not None:
+                    updates["metadata"] = call.metadata.model_copy(update={"est_ms": est_ms})
+            if timeout_quantile is not None and (overwrite or call.timeout_ms is None):
+                timeout_ms = self.timeout_ms(call.tool_name, call.args, timeout_quantile, timeout_headroom)
+                if timeout_ms is not None:
+                    updates["timeout_ms"] = timeout_ms
+            annotated.append(call.model_copy(update=updates) if updates else call)
+        return annotated
+
+    def tools(self) -> list[str]:
+        """Names of all observed tools."""
+        return list(self._tools)
+
+    # ------------------------------------------------------------------ #
+    # Persistence                                                        #
+    # ------------------------------------------------------------------ #
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-compatible representation of the configuration and all statistics."""
+        return {
+            "version": LATENCY_MODEL_FORMAT_VERSION,
+            "config": {
+                "alpha": self.alpha,
+                "relative_accuracy": self.relative_accuracy,
+                "window": self.window,
+                "by_arg_shape": self.by_arg_shape,
+                "min_shape_samples": self.min_shape_samples,
+                "max_shapes_per_tool": self.max_shapes_per_tool,
+            },
+            "tools": {tool: stats.to_dict() for tool, stats in self._tools.items()},
+            "shapes": {
+                tool: {shape: stats.to_dict() for shape, stats in shapes.items()}
+                for tool, shapes in self._shapes.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> LatencyModel:
+        """Rebuild a model from :meth:`to_dict` output."""
+        if data.get("version") != LATENCY_MODEL_FORMAT_VERSION:
+            raise ValueError(f"Unsupported latency model version: {data.get('version')}")
+        model = cls(**data["config"])
+        model._tools = {tool: LatencyStats.from_dict(stats) for tool, stats in data["tools"].items()}
+        model._shapes = {
+            tool: {shape: LatencyStats.from_dict(stats) for shape, stats in shapes.items()}
+            for tool, shapes in data["shapes"].items()
+        }
+        return model
+
+    def save(self, path: str | Path) -> None:
+        """Write the model to ``path`` as JSON, atomically (temp file + rename)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".latency-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(self.to_dict(), fh)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str | Path, **kwargs: Any) -> LatencyModel:
+        """
+        Load a model saved with :meth:`save`.
+
+        A missing, unreadable or incompatible file yields a new empty model
+        built with ``kwargs``, so a first start (or a corrupt file) never
+        prevents tools from running. A loaded model keeps the configuration
+        it was saved with.
+        """
+        path = Path(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return cls.from_dict(data)
+        except FileNotFoundError:
+            return cls(**kwargs)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable latency model %s: %s", path, e)
+            return cls(**kwargs)
@@ -0,0 +1,297 @@
+# chuk_tool_processor/scheduling/plan_executor.py
+"""
+Event-driven execution of an ExecutionPlan.
+
+Running a plan stage by stage makes every stage wait for its slowest call,
+even when later calls only depend on fast ones. PlanExecutor uses the plan's
+stages only for ordering and instead:
+
+- Releases each call as soon as all of its own dependencies have succeeded
+- Enforces ``SchedulingConstraints.pool_limits`` with per-pool slots that are
+  handed out in plan order, so a call the scheduler put early (e.g. on the
+  critical path) does not queue behind calls released before it
+- Applies the plan's per-call timeouts, capped by the time left to the deadline
+- Re-checks deadline skips when a call is about to start, using the actual
+  elapsed time rather than the planner's estimate (and a LatencyModel's
+  learned estimate for calls without ``est_ms``)
+- Skips the dependents of calls that fail or are skipped
+
+Results are yielded as calls finish, so callers can consume them while the
+rest of the DAG drains. Every call passed in produces exactly one result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+
+from chuk_tool_processor.core.exceptions import ErrorCategory, ErrorCode, ErrorInfo
+from chuk_tool_processor.logging import get_logger
+from chuk_tool_processor.models.tool_call import ToolCall
+from chuk_tool_processor.models.tool_result import ToolResult
+from chuk_tool_processor.scheduling.latency_model import LatencyModel
+from chuk_tool_processor.scheduling.types import (
+    ExecutionPlan,
+    SchedulingConstraints,
+    ToolCallSpec,
+)
+
+logger = get_logger("chuk_tool_processor.scheduling.plan_executor")
+
+# Executes one call with an optional timeout in seconds
+CallRunner = Callable[[ToolCall, float | None], Awaitable[ToolResult]]
+
+
+class PlanExecutor:
+    """
+    Run an ExecutionPlan without stage barriers.
+
+    Example:
+        >>> async def run_call(call: ToolCall, timeout: float | None) -> ToolResult:
+        ...     return (await executor.execute([call], timeout=timeout))[0]
+        >>>
+        >>> plan = GreedyDagScheduler().plan(calls, constraints)
+        >>> async for result in PlanExecutor(run_call).run(plan, calls, constraints):
+        ...     print(result.call_id, result.is_success)
+    """
+
+    def __init__(self, run_call: CallRunner, latency_model: LatencyModel | None = None) -> None:
+        """
+        Initialize the plan executor.
+
+        Args:
+            run_call: Coroutine function that executes a single ToolCall with
+                      an optional timeout in seconds and returns its result
+            latency_model: Optional source of estimates for calls whose
+                           metadata has no ``est_ms``
+        """
+        self._run_call = run_call
+        self._latency_model = latency_model
+
+    async def run(
+        self,
+        plan: ExecutionPlan,
+        calls: Sequence[ToolCallSpec],
+        constraints: SchedulingConstraints | None = None,
+    ) -> AsyncIterator[ToolResult]:
+        """
+        Execute ``plan`` and yield results as calls finish.
+
+        Calls the plan skips, or leaves out of its stages, are yielded first
+        as skipped results. Each result's ``call_id`` is the spec's call_id.
+
+        Args:
+            plan: Plan produced by a SchedulerPolicy for ``calls``
+            calls: The tool call specs the plan was made for
+            constraints: Constraints the plan was made with (pool limits and
+                         deadline are enforced at run time)
+
+        Yields:
+            One ToolResult per call, in completion order
+        """
+        constraints = constraints or SchedulingConstraints()
+        started = time.monotonic()
+
+        call_map = {c.call_id: c for c in calls}
+        # Stage order decides which of several ready calls is released first
+        order = [cid for stage in plan.stages for cid in stage if cid in call_map]
+        position = {cid: i for i, cid in enumerate(order)}
+        planned_reasons = {r.call_id: r for r in plan.skip_reasons}
+
+        finished: set[str] = set()
+        for cid, spec in call_map.items():
+            if cid not in position:
+                finished.add(cid)
+                reason = planned_reasons.get(cid)
+                if reason is not None:
+                    yield _skipped(spec, reason.reason, f"Skipped by plan: {reason.detail or reason.reason}")
+                elif cid in plan.skip:
+                    yield _skipped(spec, "planned_skip", "Skipped by plan")
+                else:
+                    yield _skipped(spec, "not_scheduled", "Not scheduled: dependencies can never complete")
+
+        # Dependency counts over the calls that will actually run
+        waiting: dict[str, int] = {}
+        dependents: dict[str, list[str]] = {cid: [] for cid in order}
+        blocked: list[tuple[str, str]] = []
+        for cid in order:
+            deps = list(dict.fromkeys(call_map[cid].depends_on))
+            unrunnable = [dep for dep in deps if dep not in position]
+            if unrunnable:
+                blocked.append((cid, unrunnable[0]))
+            waiting[cid] = len(deps) - len(unrunnable)
+            for dep in deps:
+                if dep in position:
+                    dependents[dep].append(cid)
+
+        # A call that depends on something that will not run is skipped, with its dependents
+        for cid, dep in blocked:
+            if cid not in finished:
+                finished.add(cid)
+                yield _skipped(call_map[cid], "dependency_skipped", f"Skipped: dependency '{dep}' will not run")
+                for result in self._cascade(cid, call_map, dependents, finished):
+                    yield result
+
+        pools = {pool: _PoolSlots(limit) for pool, limit in constraints.pool_limits.items()}
+        tasks: dict[asyncio.Task[ToolResult], str] = {}
+
+        def release(cid: str) -> None:
+            spec = call_map[cid]
+            pool = pools.get(spec.metadata.pool)
+            task = asyncio.create_task(
+                self._execute(spec, plan, constraints, started, pool.slot(position[cid]) if pool else nullcontext()),
+                name=f"plan-call-{cid}",
+            )
+            tasks[task] = cid
+
+        for cid in order:
+            if cid not in finished and waiting[cid] == 0:
+                release(cid)
+
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: position[tasks[t]]):
+                    cid = tasks.pop(task)
+                    result = task.result()
+                    finished.add(cid)
+                    yield result
+
+                    if result.is_success:
+                        for dependent in dependents[cid]:
+                            waiting[dependent] -= 1
+                            if waiting[dependent] == 0 and dependent not in finished:
+                                release(dependent)
+                    else:
+                        for skipped in self._cascade(cid, call_map, dependents, finished):
+                            yield skipped
+        finally:
+            # The consumer stopped early (or an error escaped): don't leave calls running
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _cascade(
+        failed_id: str,
+        call_map: dict[str, ToolCallSpec],
+        dependents: dict[str, list[str]],
+        finished: set[str],
+    ) -> list[ToolResult]:
+        """Skip every unfinished transitive dependent of ``failed_id``."""
+        results: list[ToolResult] = []
+        stack = [(failed_id, dep) for dep in reversed(dependents[failed_id])]
+        while stack:
+            parent, cid = stack.pop()
+            if cid in finished:
+                continue
+            finished.add(cid)
+            results.append(
+                _skipped(call_map[cid], "dependency_failed", f"Skipped: dependency '{parent}' did not succeed")
+            )
+            stack.extend((cid, dep) for dep in reversed(dependents[cid]))
+        return results
+
+    async def _execute(
+        self,
+        spec: ToolCallSpec,
+        plan: ExecutionPlan,
+        constraints: SchedulingConstraints,
+        started: float,
+        pool_slot: AbstractAsyncContextManager[object],
+    ) -> ToolResult:
+        """Run one call once it holds a pool slot, re-checking the deadline first."""
+        async with pool_slot:
+            timeout_ms = plan.per_call_timeout_ms.get(spec.call_id, spec.timeout_ms)
+
+            if constraints.deadline_ms is not None:
+                elapsed_ms = constraints.now_ms + int((time.monotonic() - started) * 1000)
+                remaining_ms = constraints.deadline_ms - elapsed_ms
+                if remaining_ms <= 0:
+                    return _skipped(
+                        spec,
+                        "deadline_exceeded",
+                        f"Skipped: deadline of {constraints.deadline_ms}ms passed before the call could start",
+                    )
+                est_ms = spec.metadata.est_ms
+                if est_ms is None and self._latency_model is not None:
+                    est_ms = self._latency_model.estimate_ms(spec.tool_name, spec.args)
+                if spec.metadata.priority <= 0 and est_ms is not None and est_ms > remaining_ms:
+                    return _skipped(
+                        spec,
+                        "deadline_exceeded",
+                        f"Skipped: estimated {est_ms}ms but only {remaining_ms}ms left before the deadline",
+                    )
+                timeout_ms = min(timeout_ms, remaining_ms) if timeout_ms is not None else remaining_ms
+
+            call = ToolCall(id=spec.call_id, tool=spec.tool_name, arguments=dict(spec.args))
+            timeout = timeout_ms / 1000 if timeout_ms is not None else None
+            try:
+                result = await self._run_call(call, timeout)
+            except Exception as exc:
+                logger.debug("Plan call %s raised: %s", spec.call_id, exc)
+                return ToolResult.create_error(spec.tool_name, exc, call_id=spec.call_id)
+
+        if result.call_id != spec.call_id:
+            result = result.model_copy(update={"call_id": spec.call_id})
+        return result
+
+
+class _PoolSlots:
+    """Counting semaphore that grants free slots to the earliest plan position, not the earliest waiter."""
+
+    def __init__(self, limit: int) -> None:
+        # A limit below 1 would deadlock the plan; run such pools one call at a time
+        self._free = max(1, limit)
+        self._waiters: list[tuple[int, asyncio.Future[None]]] = []
+
+    @asynccontextmanager
+    async def slot(self, position: int) -> AsyncIterator[None]:
+        await self._acquire(position)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, position: int) -> None:
+        if self._free and not self._waiters:
+            self._free -= 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (position, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Cancelled after the slot was handed over: pass it on
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._free += 1
+
+
+def _skipped(spec: ToolCallSpec, reason: str, message: str) -> ToolResult:
+    """A non-retryable error result for a call that was not executed."""
+    return ToolResult(
+        tool=spec.tool_name,
+        call_id=spec.call_id,
+        result=None,
+        error=message,
+        error_info=ErrorInfo(
+            code=ErrorCode.TOOL_CANCELLED,
+            category=ErrorCategory.CANCELLED,
+            message=message,
+            retryable=False,
+            details={"call_id": spec.call_id, "skip_reason": reason},
+        ),
+    )
@@ -169,6 +169,8 @@ class ExecutionPlan(BaseModel):
         critical_path_ms: Estimated critical path duration in milliseconds
         estimated_total_ms: Estimated total execution time
         pool_utilization: Per-pool estimated utilization (pool -> concurrent calls)
+        slot_utilization: Per-pool share of slot time kept busy over the predicted
+            makespan (pool -> 0.0-1.0), for schedulers that simulate a timeline
     """
 
     model_config = ConfigDict(frozen=True, extra="forbid")
@@ -208,6 +210,10 @@ class ExecutionPlan(BaseModel):
         default_factory=dict,
         description="Per-pool max concurrent calls in plan",
     )
+    slot_utilization: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-pool fraction of slot time busy over the predicted makespan",
+    )
 
     @property
     def all_scheduled_calls(self) -> set[str]:
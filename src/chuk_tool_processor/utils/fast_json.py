@@ -61,6 +61,29 @@ def dumps(obj: Any, **kwargs: Any) -> str:
         return _stdlib_json.dumps(obj, **kwargs)
 
 
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize obj to compact UTF-8 encoded JSON bytes.
+
+    PERFORMANCE: orjson produces bytes directly, so nothing is decoded only to
+    be encoded again. The stdlib fallback uses the same compact separators and
+    leaves non-ASCII characters unescaped, so both produce the same bytes for
+    plain JSON data.
+
+    Args:
+        obj: Python object to serialize
+
+    Returns:
+        JSON bytes
+    """
+    if HAS_ORJSON:
+        try:
+            return _orjson.dumps(obj)
+        except Exception as e:
+            logger.debug(f"orjson failed, falling back to stdlib json: {e}")
+    return _stdlib_json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
 def loads(s: str | bytes) -> Any:
     """
     Deserialize s (a str, bytes or bytearray containing a JSON document) to a Python object.
@@ -154,4 +177,4 @@ else:
     from json import JSONDecodeError
 
 # Export flag for conditional behavior
-__all__ = ["dumps", "loads", "dump", "load", "HAS_ORJSON", "JSONDecodeError"]
+__all__ = ["dumps", "dumps_bytes", "loads", "dump", "load", "HAS_ORJSON", "JSONDecodeError"]
@@ -12,6 +12,8 @@ import pytest_asyncio
 from chuk_tool_processor.core.processor import ToolProcessor, get_default_processor, process, process_text
 from chuk_tool_processor.models.tool_call import ToolCall
 from chuk_tool_processor.models.tool_result import ToolResult
+from chuk_tool_processor.registry.providers.memory import InMemoryToolRegistry
+from chuk_tool_processor.scheduling import GreedyDagScheduler, SchedulingConstraints, ToolCallSpec
 
 pytestmark = pytest.mark.asyncio
 
@@ -327,6 +329,62 @@ class TestToolProcessor:
         # Should create InProcessStrategy by default
 
 
+class SleepTool:
+    """Sleeps for ``ms`` milliseconds and echoes ``value``."""
+
+    async def execute(self, ms: int = 0, value: str = "") -> str:
+        await asyncio.sleep(ms / 1000)
+        return value
+
+
+class BrokenTool:
+    """Always fails."""
+
+    async def execute(self) -> str:
+        raise ValueError("broken")
+
+
+class TestExecutePlan:
+    """Test cases for ToolProcessor.execute_plan."""
+
+    @pytest_asyncio.fixture
+    async def plan_processor(self):
+        registry = InMemoryToolRegistry()
+        await registry.register_tool(SleepTool, name="sleep")
+        await registry.register_tool(BrokenTool, name="broken")
+        proc = ToolProcessor(registry=registry, enable_caching=False, enable_retries=False)
+        await proc.initialize()
+        return proc
+
+    async def test_streams_results_as_the_dag_drains(self, plan_processor):
+        calls = [
+            ToolCallSpec(call_id="slow", tool_name="sleep", args={"ms": 300, "value": "slow"}),
+            ToolCallSpec(call_id="fast", tool_name="sleep", args={"ms": 10, "value": "fast"}),
+            ToolCallSpec(call_id="after", tool_name="sleep", args={"value": "after"}, depends_on=("fast",)),
+        ]
+        constraints = SchedulingConstraints()
+        plan = GreedyDagScheduler().plan(calls, constraints)
+
+        seen = []
+        async for result in plan_processor.execute_plan(plan, calls, constraints):
+            seen.append((result.call_id, result.result))
+
+        assert seen == [("fast", "fast"), ("after", "after"), ("slow", "slow")]
+
+    async def test_failed_call_skips_dependents(self, plan_processor):
+        calls = [
+            ToolCallSpec(call_id="a", tool_name="broken"),
+            ToolCallSpec(call_id="b", tool_name="sleep", depends_on=("a",)),
+        ]
+        plan = GreedyDagScheduler().plan(calls, SchedulingConstraints())
+
+        results = [r async for r in plan_processor.execute_plan(plan, calls)]
+
+        assert [r.call_id for r in results] == ["a", "b"]
+        assert "broken" in results[0].error
+        assert results[1].error_info.details["skip_reason"] == "dependency_failed"
+
+
 class TestGlobalProcessor:
     """Test global processor functions."""
 
@@ -11,6 +11,7 @@ from chuk_tool_processor.discovery import (
     DynamicToolName,
     SearchResult,
 )
+from chuk_tool_processor.registry.providers.memory import InMemoryToolRegistry
 
 # ============================================================================
 # Test Tool Model
@@ -35,8 +36,8 @@ class MockTool:
 class MockDynamicProvider(BaseDynamicToolProvider[MockTool]):
     """Concrete implementation of BaseDynamicToolProvider for testing."""
 
-    def __init__(self, tools: list[MockTool] | None = None):
-        super().__init__()
+    def __init__(self, tools: list[MockTool] | None = None, registry: Any | None = None):
+        super().__init__(registry=registry)
         self._tools = tools or []
         self._executed_tools: list[tuple[str, dict[str, Any]]] = []
         self._filter_called = False
@@ -633,6 +634,113 @@ class TestBaseDynamicToolProvider:
         results = await provider.search_tools("new")
         assert any(r["name"] == "new_tool" for r in results)
 
+    @pytest.mark.asyncio
+    async def test_search_reindexes_same_size_change(self, provider):
+        """Test that replacing a tool without changing the count is picked up."""
+        await provider.search_tools("add")
+
+        provider._tools[-1] = MockTool(name="send_email", namespace="mail", description="Send an email")
+
+        results = await provider.search_tools("email")
+        assert results[0]["name"] == "send_email"
+
+    @pytest.mark.asyncio
+    async def test_search_skips_tool_fetch_while_generation_unchanged(self, provider):
+        """Test that a reported generation lets searches reuse the index."""
+        fetches = 0
+        generation = 1
+        original_get_all_tools = provider.get_all_tools
+
+        async def counting_get_all_tools():
+            nonlocal fetches
+            fetches += 1
+            return await original_get_all_tools()
+
+        async def get_tools_generation():
+            return generation
+
+        provider.get_all_tools = counting_get_all_tools
+        provider.get_tools_generation = get_tools_generation
+
+        await provider.search_tools("add")
+        await provider.search_tools("mean")
+        assert fetches == 1
+
+        provider._tools.append(MockTool(name="new_tool", namespace="ns", description="New"))
+        generation = 2
+        results = await provider.search_tools("new_tool")
+        assert fetches == 2
+        assert results[0]["name"] == "new_tool"
+
+    @pytest.mark.asyncio
+    async def test_generation_defaults_to_unknown_without_registry(self, provider):
+        """Test that providers without a registry report no generation."""
+        assert await provider.get_tools_generation() is None
+
+    @pytest.mark.asyncio
+    async def test_registry_generation_drives_index_reuse(self, sample_tools):
+        """Test that a registry's get_generation() lets searches skip get_all_tools()."""
+        registry = InMemoryToolRegistry()
+        provider = MockDynamicProvider(list(sample_tools), registry=registry)
+        fetches = 0
+        original_get_all_tools = provider.get_all_tools
+
+        async def counting_get_all_tools():
+            nonlocal fetches
+            fetches += 1
+            return await original_get_all_tools()
+
+        provider.get_all_tools = counting_get_all_tools
+
+        await provider.search_tools("add")
+        await provider.search_tools("mean")
+        assert fetches == 1
+
+        async def new_tool() -> str:
+            return "new"
+
+        await registry.register_tool(new_tool, name="new_tool", namespace="ns")
+        provider._tools.append(MockTool(name="new_tool", namespace="ns", description="New"))
+        results = await provider.search_tools("new_tool")
+        assert fetches == 2
+        assert results[0]["name"] == "new_tool"
+
+    @pytest.mark.asyncio
+    async def test_get_tool_schemas_fetches_tools_once(self, provider):
+        """Test that a batch of schema lookups shares one get_all_tools() call."""
+        fetches = 0
+        original_get_all_tools = provider.get_all_tools
+
+        async def counting_get_all_tools():
+            nonlocal fetches
+            fetches += 1
+            return await original_get_all_tools()
+
+        provider.get_all_tools = counting_get_all_tools
+
+        result = await provider.get_tool_schemas(["add", "normalCdf", "nonexistent", "add"])
+
+        assert fetches == 1
+        assert [s["function"]["name"] for s in result["schemas"]] == ["add", "normal_cdf", "add"]
+        assert result["errors"][0]["tool_name"] == "nonexistent"
+
+    @pytest.mark.asyncio
+    async def test_schema_cache_follows_generation(self, provider):
+        """Test that cached schemas are dropped when the tool-set generation changes."""
+        generation = 1
+
+        async def get_tools_generation():
+            return generation
+
+        provider.get_tools_generation = get_tools_generation
+        await provider.get_tool_schema("add")
+
+        provider._tools = [MockTool(name="add", namespace="math", description="Add two integers")]
+        assert (await provider.get_tool_schema("add"))["function"]["description"] != "Add two integers"
+
+        generation = 2
+        assert (await provider.get_tool_schema("add"))["function"]["description"] == "Add two integers"
+
     @pytest.mark.asyncio
     async def test_get_tool_name_override(self):
         """Test that get_tool_name can be overridden."""
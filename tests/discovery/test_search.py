@@ -8,7 +8,9 @@ import pytest
 
 from chuk_tool_processor.discovery import (
     SessionToolStats,
+    ToolIndex,
     ToolSearchEngine,
+    TrigramIndex,
     compute_domain_penalty,
     detect_query_domain,
     detect_tool_domain,
@@ -22,7 +24,9 @@ from chuk_tool_processor.discovery import (
     score_token_match,
     search_tools,
     tokenize,
+    trigrams,
 )
+from chuk_tool_processor.discovery.search import FIELD_DESC, FIELD_NAME, FIELD_NAMESPACE, FIELD_PARAM
 
 # ============================================================================
 # Test Tool Model (simple dataclass for testing)
@@ -549,6 +553,252 @@ class TestEdgeCases:
         assert isinstance(results, list)
 
 
+# ============================================================================
+# Inverted Index Tests
+# ============================================================================
+
+
+class TestToolIndex:
+    """Tests for the postings-list index behind ToolSearchEngine."""
+
+    @pytest.fixture
+    def tools(self) -> list[MockTool]:
+        return [
+            MockTool(name="read_file", namespace="fs", description="Read a file from disk"),
+            MockTool(name="write_file", namespace="fs", description="Write a file to disk"),
+            MockTool(name="delete_file", namespace="fs", description="Delete a file"),
+            MockTool(
+                name="http_get",
+                namespace="net",
+                description="Fetch a URL",
+                parameters={"type": "object", "properties": {"url": {"type": "string"}}},
+            ),
+        ]
+
+    def test_postings_per_field(self, tools):
+        index = ToolIndex(tools)
+
+        assert index.postings[FIELD_NAME]["file"] == {0: 1, 1: 1, 2: 1}
+        assert index.postings[FIELD_DESC]["disk"] == {0: 1, 1: 1}
+        assert index.postings[FIELD_NAMESPACE]["net"] == {3: 1}
+        assert index.postings[FIELD_PARAM]["url"] == {3: 1}
+        assert index.entries[0].name_tokens == {"read", "file"}
+
+    def test_rare_terms_score_higher(self, tools):
+        index = ToolIndex(tools)
+
+        assert index.idf(1) > index.idf(3)
+        assert index.name_prefix_docs("wri") == {1}
+        assert index.name_prefix_docs("reader", either_direction=True) == {0}
+
+    def test_only_matching_tools_are_scored(self, tools):
+        engine: ToolSearchEngine[MockTool] = ToolSearchEngine()
+        engine.set_tools(tools)
+
+        results = engine.search("write file", use_session_boost=False)
+
+        assert results[0].tool.name == "write_file"
+        assert {r.tool.name for r in results} == {"read_file", "write_file", "delete_file"}
+        assert results[0].match_reasons == ["name:'write'", "name:'file'"]
+
+    def test_stage2_reasons_and_weights(self, tools):
+        engine: ToolSearchEngine[MockTool] = ToolSearchEngine()
+
+        results = engine.search("disk url", tools, use_session_boost=False)
+
+        assert [r.tool.name for r in results] == ["http_get", "read_file", "write_file"]
+        assert results[0].match_reasons == ["desc:'url'", "param:'url'"]
+        assert results[1].match_reasons == ["desc:'disk'"]
+
+    def test_index_reused_for_same_tool_objects(self, tools):
+        engine: ToolSearchEngine[MockTool] = ToolSearchEngine()
+        engine.set_tools(tools)
+
+        assert engine._index_for(list(tools)) is engine._index
+        other = engine._index_for(tools[:2])
+        assert other is not engine._index
+        assert engine._index_for(tools[:2]) is other
+        assert len(other) == 2
+
+
+class TestIncrementalIndex:
+    """Tests for incremental index updates and the generation counter."""
+
+    @pytest.fixture
+    def engine(self) -> ToolSearchEngine[MockTool]:
+        engine: ToolSearchEngine[MockTool] = ToolSearchEngine()
+        engine.set_tools(
+            [
+                MockTool(name="read_file", namespace="fs", description="Read a file"),
+                MockTool(name="get_weather", namespace="web", description="Current weather"),
+            ]
+        )
+        return engine
+
+    def test_add_and_remove_touch_only_their_postings(self, engine):
+        generation = engine.generation
+        tool = MockTool(name="send_email", namespace="mail", description="Send an email")
+
+        engine.add_tools([tool])
+        assert engine.generation == generation + 1
+        assert engine.search("email", use_session_boost=False)[0].tool is tool
+
+        assert engine.remove_tools([tool]) == 1
+        assert "email" not in engine._index.postings[FIELD_DESC]
+        assert "send" not in engine._index.postings[FIELD_NAME]
+        assert len(engine._index) == 2
+        assert engine.remove_tools([tool]) == 0
+        assert engine.generation == generation + 2
+
+    def test_update_tool_replaces_by_namespace_and_name(self, engine):
+        engine.update_tool(MockTool(name="get_weather", namespace="web", description="Seven day forecast"))
+
+        assert len(engine._index) == 2
+        assert "forecast" in engine._index.postings[FIELD_DESC]
+        assert "current" not in engine._index.postings[FIELD_DESC]
+
+    def test_sync_detects_same_size_changes(self, engine):
+        tools = list(engine._tool_cache)
+        assert engine.sync_tools(tools) is False
+
+        swapped = [tools[0], MockTool(name="http_get", namespace="web", description="Fetch a URL")]
+        assert engine.sync_tools(swapped) is True
+        assert {tool.name for tool in engine._tool_cache} == {"read_file", "http_get"}
+
+        equal_copy = [MockTool(**vars(tool)) for tool in swapped]
+        assert engine.sync_tools(equal_copy) is False
+
+    def test_compaction_keeps_results(self, engine):
+        for i in range(200):
+            engine.add_tools([MockTool(name=f"temp_{i}", namespace="tmp")])
+            engine.remove_tools([MockTool(name=f"temp_{i}", namespace="tmp")])
+
+        assert len(engine._index.entries) < 100
+        assert [r.tool.name for r in engine.search("weather", use_session_boost=False)] == ["get_weather"]
+
+
+class TestQueryCache:
+    """Tests for the query-result cache and batched search."""
+
+    @pytest.fixture
+    def tools(self) -> list[MockTool]:
+        return [
+            MockTool(name="read_file", namespace="fs", description="Read a file from disk"),
+            MockTool(name="write_file", namespace="fs", description="Write a file to disk"),
+            MockTool(name="get_weather", namespace="web", description="Current weather for a city"),
+            MockTool(name="calculate_mean", namespace="stats", description="Average of numbers"),
+        ]
+
+    @pytest.fixture
+    def engine(self, tools) -> ToolSearchEngine[MockTool]:
+        engine: ToolSearchEngine[MockTool] = ToolSearchEngine()
+        engine.set_tools(tools)
+        return engine
+
+    def test_repeated_query_hits_cache(self, engine):
+        first = engine.search("read  file ")
+        second = engine.search("read file")
+
+        assert [r.name for r in first] == [r.name for r in second]
+        assert engine.get_query_cache_stats() == {"hits": 1, "misses": 1, "size": 1, "max_size": 256}
+
+    def test_session_boost_applies_to_cached_results(self, engine):
+        assert engine.search("file")[0].name == "read_file"
+
+        engine.record_tool_use("write_file")
+        boosted = engine.search("file")
+
+        assert boosted[0].name == "write_file"
+        assert boosted[0].match_reasons[-1].startswith("session_boost:")
+        assert engine.get_query_cache_stats()["hits"] == 1
+        assert not any(
+            r.startswith("session_boost") for r in engine.search("file", use_session_boost=False)[1].match_reasons
+        )
+
+    def test_returned_results_do_not_alias_cache(self, engine):
+        engine.search("weather")[0].match_reasons.append("mutated")
+
+        assert "mutated" not in engine.search("weather")[0].match_reasons
+
+    def test_generation_change_invalidates(self, engine):
+        engine.search("forecast")
+        engine.add_tools([MockTool(name="get_forecast", namespace="web", description="Weather forecast")])
+
+        assert engine.search("forecast")[0].name == "get_forecast"
+        assert engine.get_query_cache_stats()["hits"] == 0
+
+    def test_lru_eviction_and_disabling(self, tools):
+        engine: ToolSearchEngine[MockTool] = ToolSearchEngine(query_cache_size=2)
+        engine.set_tools(tools)
+        for query in ("read", "write", "read", "weather"):
+            engine.search(query)
+
+        assert [key[0] for key in engine._query_cache] == ["read", "weather"]
+
+        uncached: ToolSearchEngine[MockTool] = ToolSearchEngine(query_cache_size=0)
+        uncached.set_tools(tools)
+        uncached.search("read")
+        assert uncached.get_query_cache_stats()["size"] == 0
+
+    def test_adhoc_tool_lists_are_not_cached(self, engine, tools):
+        engine.search("read", tools[:2])
+
+        assert engine.get_query_cache_stats()["size"] == 0
+
+    def test_search_many_matches_search(self, tools):
+        queries = ["read file", "average", "wether", "", "read file", "disk storage"]
+        batched: ToolSearchEngine[MockTool] = ToolSearchEngine()
+        batched.set_tools(tools)
+        single: ToolSearchEngine[MockTool] = ToolSearchEngine(query_cache_size=0)
+        single.set_tools(tools)
+
+        results = batched.search_many(queries, limit=3)
+
+        assert len(results) == len(queries)
+        for query, batch in zip(queries, results, strict=True):
+            expected = single.search(query, limit=3)
+            assert [(r.name, r.score, r.match_reasons) for r in batch] == [
+                (r.name, r.score, r.match_reasons) for r in expected
+            ]
+        assert batched.get_query_cache_stats()["misses"] == 5
+        assert batched._index._memo is None
+
+    def test_search_many_prewarms_cache(self, engine):
+        engine.search_many(["read", "weather"])
+        engine.search("weather")
+
+        assert engine.get_query_cache_stats()["hits"] == 1
+
+
+class TestTrigramIndex:
+    """Tests for the trigram index behind the fuzzy fallback."""
+
+    def test_trigrams_are_padded(self):
+        assert trigrams("ab") == {"$ab", "ab$"}
+
+    def test_candidates_ranked_by_overlap_and_filtered_by_length(self):
+        index = TrigramIndex(["normal_cdf", "normal_pdf", "mean", "a_very_long_tool_name_indeed"])
+
+        assert index.candidates("normal_cfd", min_ratio=0.5, limit=2) == [0, 1]
+        assert 3 not in index.candidates("normal", min_ratio=0.5, limit=10)
+
+    def test_typo_query_matches_like_full_scan(self):
+        tools = [
+            MockTool(name="delete_invoice", namespace="billing", description="Remove an invoice"),
+            MockTool(name="list_invoices", namespace="billing", description="List invoices"),
+            MockTool(name="get_weather", namespace="web", description="Current weather"),
+        ]
+        engine: ToolSearchEngine[MockTool] = ToolSearchEngine()
+
+        results = engine.search("delte_invioce", tools, use_session_boost=False)
+
+        assert results[0].tool.name == "delete_invoice"
+        assert results[0].match_reasons[0].startswith("fuzzy_name:")
+        name_score = fuzzy_score("delte_invioce", "delete_invoice", threshold=0.5)
+        desc_score = max(fuzzy_score("delte_invioce", w, threshold=0.6) for w in ["remove", "an", "invoice"])
+        assert results[0].score == pytest.approx(10 * name_score + 3 * desc_score)
+
+
 # ============================================================================
 # Session Tracking Tests
 # ============================================================================
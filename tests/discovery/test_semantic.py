@@ -0,0 +1,189 @@
+# tests/discovery/test_semantic.py
+"""Tests for the optional semantic (hashed TF-IDF) search stage."""
+
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from chuk_tool_processor.discovery import (  # noqa: E402
+    SemanticIndex,
+    SemanticSearchConfig,
+    ToolSearchEngine,
+)
+
+
+@dataclass
+class MockTool:
+    name: str
+    namespace: str
+    description: str | None = None
+    parameters: dict[str, Any] | None = None
+
+
+@pytest.fixture
+def tools() -> list[MockTool]:
+    return [
+        MockTool(name="compute_stats", namespace="analytics", description="Compute summary statistics for a dataset"),
+        MockTool(name="send_email", namespace="mail", description="Send an email message to recipients"),
+        MockTool(name="resize_image", namespace="media", description="Resize a picture to a width and height"),
+        MockTool(name="list_invoices", namespace="billing", description="List invoices for a customer account"),
+    ]
+
+
+class TestSemanticIndex:
+    def test_matrix_is_contiguous_and_normalised(self, tools):
+        index: SemanticIndex[MockTool] = SemanticIndex(dimensions=256)
+        index.build(tools)
+
+        assert index.matrix.shape == (4, 256)
+        assert index.matrix.dtype == np.float32
+        assert index.matrix.flags["C_CONTIGUOUS"]
+        assert np.allclose(np.linalg.norm(index.matrix, axis=1), 1.0)
+
+    def test_search_ranks_inflected_paraphrase(self, tools):
+        index: SemanticIndex[MockTool] = SemanticIndex()
+        index.build(tools)
+
+        hits = index.search("summarizing statistical data", k=2)
+
+        assert hits[0][0].name == "compute_stats"
+        assert len(hits) <= 2
+        assert hits == sorted(hits, key=lambda hit: -hit[1])
+
+    def test_rebuild_only_revectorizes_changed_tools(self, tools):
+        index: SemanticIndex[MockTool] = SemanticIndex()
+        index.build(tools)
+        cached = index._features[("mail", "send_email")]
+
+        tools[0] = MockTool(name="compute_stats", namespace="analytics", description="Median and percentiles")
+        index.build(tools)
+
+        assert index._features[("mail", "send_email")][2] is cached[2]
+        assert index.search("percentiles", k=1)[0][0].name == "compute_stats"
+
+    def test_search_many_matches_search(self, tools):
+        index: SemanticIndex[MockTool] = SemanticIndex()
+        index.build(tools)
+        queries = ["summarizing statistical data", "emailing recipients", "zzz"]
+
+        batch = index.search_many(queries, k=3, min_similarity=0.1)
+
+        for query, hits in zip(queries, batch, strict=True):
+            expected = index.search(query, k=3, min_similarity=0.1)
+            assert [tool.name for tool, _ in hits] == [tool.name for tool, _ in expected]
+            assert [sim for _, sim in hits] == pytest.approx([sim for _, sim in expected])
+
+    def test_save_and_memory_map(self, tools, tmp_path):
+        path = tmp_path / "tools.npy"
+        index: SemanticIndex[MockTool] = SemanticIndex()
+        index.build(tools)
+        index.save(path)
+
+        loaded = SemanticIndex.load(path, tools)
+
+        assert isinstance(loaded.matrix, np.memmap)
+        assert np.array_equal(loaded.matrix, index.matrix)
+        assert loaded.search("emailing recipients", k=1)[0][0].name == "send_email"
+
+    @pytest.mark.parametrize("name", ["tools", "tools.index"])
+    def test_save_and_load_without_npy_suffix(self, tools, tmp_path, name):
+        path = tmp_path / name
+        index: SemanticIndex[MockTool] = SemanticIndex()
+        index.build(tools)
+        index.save(path)
+
+        loaded = SemanticIndex.load(path, tools)
+
+        assert loaded is not None
+        assert np.array_equal(loaded.matrix, index.matrix)
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted([f"{name}.npy", f"{name}.json"])
+
+    def test_save_replaces_existing_files(self, tools, tmp_path):
+        path = tmp_path / "tools.npy"
+        index: SemanticIndex[MockTool] = SemanticIndex()
+        index.build(tools[:3])
+        index.save(path)
+        index.build(tools)
+        index.save(path)
+
+        assert SemanticIndex.load(path, tools) is not None
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["tools.json", "tools.npy"]
+
+    def test_load_rejects_stale_file(self, tools, tmp_path):
+        path = tmp_path / "tools.npy"
+        index: SemanticIndex[MockTool] = SemanticIndex()
+        index.build(tools)
+        index.save(path)
+
+        changed = [*tools[:3], MockTool(name="list_invoices", namespace="billing", description="Changed")]
+
+        assert SemanticIndex.load(path, changed) is None
+        assert SemanticIndex.load(path, tools[:3]) is None
+        assert SemanticIndex.load(tmp_path / "missing.npy", tools) is None
+
+
+class TestSemanticSearchEngine:
+    def test_semantic_only_matches_are_added(self, tools):
+        engine: ToolSearchEngine[MockTool] = ToolSearchEngine(semantic=SemanticSearchConfig())
+        engine.set_tools(tools)
+
+        results = engine.search("customers' invoicing", use_session_boost=False)
+
+        assert results[0].tool.name == "list_invoices"
+        assert results[0].match_reasons[0].startswith("semantic:")
+
+    def test_lexical_scores_are_blended(self, tools):
+        lexical: ToolSearchEngine[MockTool] = ToolSearchEngine()
+        lexical.set_tools(tools)
+        blended: ToolSearchEngine[MockTool] = ToolSearchEngine(semantic=SemanticSearchConfig(weight=0.5))
+        blended.set_tools(tools)
+
+        before = lexical.search("emailing recipients", use_session_boost=False)[0]
+        after = blended.search("emailing recipients", use_session_boost=False)[0]
+
+        assert after.tool.name == before.tool.name == "send_email"
+        sim = float(after.match_reasons[-1].split(":")[1])
+        assert after.score == pytest.approx(0.5 * before.score + 0.5 * sim * before.score, rel=1e-2)
+
+    def test_follows_incremental_updates(self, tools):
+        engine: ToolSearchEngine[MockTool] = ToolSearchEngine(semantic=SemanticSearchConfig())
+        engine.set_tools(tools)
+        engine.search("pictures", use_session_boost=False)
+
+        engine.add_tools(
+            [MockTool(name="translate_text", namespace="nlp", description="Translate text between languages")]
+        )
+
+        assert engine.search("translating language", use_session_boost=False)[0].tool.name == "translate_text"
+
+    def test_search_many_shares_one_matrix_product(self, tools):
+        engine: ToolSearchEngine[MockTool] = ToolSearchEngine(semantic=SemanticSearchConfig())
+        engine.set_tools(tools)
+        reference: ToolSearchEngine[MockTool] = ToolSearchEngine(semantic=SemanticSearchConfig(), query_cache_size=0)
+        reference.set_tools(tools)
+        queries = ["customers' invoicing", "summarizing statistical data"]
+
+        batch = engine.search_many(queries, use_session_boost=False)
+
+        for query, results in zip(queries, batch, strict=True):
+            expected = reference.search(query, use_session_boost=False)
+            assert [r.name for r in results] == [r.name for r in expected]
+            assert [r.score for r in results] == pytest.approx([r.score for r in expected])
+
+    def test_persists_to_index_path(self, tools, tmp_path):
+        path = tmp_path / "semantic.npy"
+        config = SemanticSearchConfig(index_path=path)
+        engine: ToolSearchEngine[MockTool] = ToolSearchEngine(semantic=config)
+        engine.set_tools(tools)
+        engine.search("summarizing statistical data")
+        assert path.exists()
+
+        restarted: ToolSearchEngine[MockTool] = ToolSearchEngine(semantic=config)
+        restarted.set_tools(tools)
+        results = restarted.search("summarizing statistical data", use_session_boost=False)
+
+        assert isinstance(restarted._semantic.matrix, np.memmap)
+        assert results[0].tool.name == "compute_stats"
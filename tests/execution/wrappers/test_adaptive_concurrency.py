@@ -0,0 +1,360 @@
+# tests/execution/wrappers/test_adaptive_concurrency.py
+"""
+Tests for the adaptive concurrency limiting wrapper.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pydantic import ValidationError
+
+from chuk_tool_processor.core.processor import ToolProcessor
+from chuk_tool_processor.execution.wrappers import adaptive_concurrency as ac_module
+from chuk_tool_processor.execution.wrappers.adaptive_concurrency import (
+    AdaptiveConcurrencyConfig,
+    AdaptiveConcurrencyExecutor,
+    AdaptiveLimiter,
+    ConcurrencyLimitAlgorithm,
+)
+from chuk_tool_processor.models.tool_call import ToolCall
+from chuk_tool_processor.models.tool_result import ToolResult
+
+
+# --------------------------------------------------------------------------- #
+# Helpers
+# --------------------------------------------------------------------------- #
+class GatedExecutor:
+    """Holds every call until released and tracks peak concurrency."""
+
+    def __init__(self, error_tools: set[str] | None = None):
+        self.gate = asyncio.Event()
+        self.active = 0
+        self.peak = 0
+        self.error_tools = error_tools or set()
+
+    async def execute(self, calls, timeout=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await self.gate.wait()
+        finally:
+            self.active -= 1
+        call = calls[0]
+        if call.tool in self.error_tools:
+            return [ToolResult(tool=call.tool, error="boom")]
+        return [ToolResult(tool=call.tool, result=call.arguments.get("i"))]
+
+
+class RaisingExecutor:
+    """Raises for every call."""
+
+    async def execute(self, calls, timeout=None):
+        raise RuntimeError("executor exploded")
+
+
+# --------------------------------------------------------------------------- #
+# Config
+# --------------------------------------------------------------------------- #
+def test_config_defaults():
+    config = AdaptiveConcurrencyConfig()
+    assert config.algorithm == ConcurrencyLimitAlgorithm.AIMD
+    assert config.min_limit <= config.initial_limit <= config.max_limit
+
+
+def test_config_rejects_inverted_bounds():
+    with pytest.raises(ValidationError):
+        AdaptiveConcurrencyConfig(initial_limit=50, max_limit=10)
+
+
+# --------------------------------------------------------------------------- #
+# Limiter
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_limiter_queues_fifo_beyond_limit():
+    limiter = AdaptiveLimiter("t", AdaptiveConcurrencyConfig(initial_limit=1))
+    order: list[int] = []
+
+    await limiter.acquire()
+
+    async def waiter(i: int):
+        await limiter.acquire()
+        order.append(i)
+
+    tasks = [asyncio.create_task(waiter(i)) for i in range(3)]
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 3
+    assert limiter.in_flight == 1
+
+    for _ in range(3):
+        limiter.release(None)
+        await asyncio.sleep(0)
+
+    await asyncio.gather(*tasks)
+    assert order == [0, 1, 2]
+    assert limiter.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_cancelled_waiter_does_not_leak_slot():
+    limiter = AdaptiveLimiter("t", AdaptiveConcurrencyConfig(initial_limit=1))
+    await limiter.acquire()
+
+    task = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter.queue_depth == 0
+    limiter.release(None)
+    assert limiter.in_flight == 0
+    await limiter.acquire()
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_granted_then_cancelled_hands_slot_on():
+    limiter = AdaptiveLimiter("t", AdaptiveConcurrencyConfig(initial_limit=1))
+    await limiter.acquire()
+
+    first = asyncio.create_task(limiter.acquire())
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    # Grant the slot to ``first`` and cancel it before it resumes
+    limiter.release(None)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    await asyncio.wait_for(second, timeout=1.0)
+    assert limiter.in_flight == 1
+
+
+def test_aimd_increases_under_load_and_backs_off_on_error():
+    config = AdaptiveConcurrencyConfig(initial_limit=4, backoff_ratio=0.5)
+    limiter = AdaptiveLimiter("t", config)
+
+    limiter._in_flight = 4
+    limiter.release(0.01)
+    assert limiter.limit == 5
+
+    limiter._in_flight = 4
+    limiter.release(0.01, dropped=True)
+    assert limiter.limit == 2
+    assert limiter.get_stats().drops == 1
+
+
+def test_aimd_does_not_grow_when_app_limited():
+    limiter = AdaptiveLimiter("t", AdaptiveConcurrencyConfig(initial_limit=10))
+    limiter._in_flight = 1
+    limiter.release(0.01)
+    assert limiter.limit == 10
+
+
+def test_aimd_latency_threshold_counts_as_drop():
+    config = AdaptiveConcurrencyConfig(initial_limit=10, latency_threshold=0.5, backoff_ratio=0.5)
+    limiter = AdaptiveLimiter("t", config)
+    limiter._in_flight = 10
+    limiter.release(1.0)
+    assert limiter.limit == 5
+
+
+def test_limit_clamped_to_bounds():
+    config = AdaptiveConcurrencyConfig(initial_limit=2, min_limit=2, max_limit=3, backoff_ratio=0.1)
+    limiter = AdaptiveLimiter("t", config)
+
+    limiter._in_flight = 2
+    limiter.release(0.01, dropped=True)
+    assert limiter.limit == 2
+
+    for _ in range(5):
+        limiter._in_flight = 3
+        limiter.release(0.01)
+    assert limiter.limit == 3
+
+
+def test_gradient_shrinks_when_latency_rises():
+    config = AdaptiveConcurrencyConfig(
+        algorithm=ConcurrencyLimitAlgorithm.GRADIENT,
+        initial_limit=50,
+        smoothing=1.0,
+    )
+    limiter = AdaptiveLimiter("t", config)
+
+    for _ in range(20):
+        limiter._in_flight = limiter.limit
+        limiter.release(0.01)
+    baseline = limiter.limit
+
+    for _ in range(5):
+        limiter._in_flight = limiter.limit
+        limiter.release(0.2)
+
+    assert limiter.limit < baseline
+    assert limiter.get_stats().long_latency is not None
+
+
+def test_gradient_backs_off_on_error_and_ignores_light_load():
+    config = AdaptiveConcurrencyConfig(
+        algorithm=ConcurrencyLimitAlgorithm.GRADIENT,
+        initial_limit=20,
+        backoff_ratio=0.5,
+    )
+    limiter = AdaptiveLimiter("t", config)
+
+    limiter._in_flight = 1
+    limiter.release(0.01)
+    assert limiter.limit == 20
+
+    limiter._in_flight = 20
+    limiter.release(0.01, dropped=True)
+    assert limiter.limit == 10
+
+
+# --------------------------------------------------------------------------- #
+# Executor
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_executor_empty_calls():
+    executor = AdaptiveConcurrencyExecutor(GatedExecutor())
+    assert await executor.execute([]) == []
+
+
+@pytest.mark.asyncio
+async def test_executor_bounds_concurrency_and_preserves_order():
+    inner = GatedExecutor()
+    executor = AdaptiveConcurrencyExecutor(inner, default_config=AdaptiveConcurrencyConfig(initial_limit=2))
+    calls = [ToolCall(tool="slow", arguments={"i": i}) for i in range(6)]
+
+    task = asyncio.create_task(executor.execute(calls))
+    await asyncio.sleep(0.01)
+
+    stats = executor.get_limiter_stats()["slow"]
+    assert stats.in_flight == 2
+    assert stats.queue_depth == 4
+
+    inner.gate.set()
+    results = await task
+
+    assert [r.result for r in results] == list(range(6))
+    assert inner.peak == 2
+    assert executor.get_limiter_stats()["slow"].in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_queue_wait_is_bounded_by_timeout():
+    inner = GatedExecutor()
+    executor = AdaptiveConcurrencyExecutor(inner, default_config=AdaptiveConcurrencyConfig(initial_limit=1))
+
+    running = asyncio.create_task(executor.execute([ToolCall(tool="slow")]))
+    await asyncio.sleep(0)
+    call = ToolCall(tool="slow")
+
+    [result] = await executor.execute([call], timeout=0.05)
+
+    assert result.error is not None
+    assert "Timeout" in result.error
+    assert result.call_id == call.id
+    assert result.machine == "adaptive_concurrency"
+    stats = executor.get_limiter_stats()["slow"]
+    assert stats.queue_depth == 0
+    assert stats.in_flight == 1
+
+    inner.gate.set()
+    await running
+    assert executor.get_limiter_stats()["slow"].in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_uses_per_tool_configs():
+    inner = GatedExecutor()
+    executor = AdaptiveConcurrencyExecutor(
+        inner,
+        default_config=AdaptiveConcurrencyConfig(initial_limit=5),
+        tool_configs={"narrow": AdaptiveConcurrencyConfig(initial_limit=1, max_limit=1)},
+    )
+    inner.gate.set()
+    await executor.execute([ToolCall(tool="narrow"), ToolCall(tool="wide")])
+
+    stats = executor.get_limiter_stats()
+    assert stats["narrow"].limit == 1
+    assert stats["wide"].limit == 5
+
+
+@pytest.mark.asyncio
+async def test_executor_error_results_shrink_limit():
+    inner = GatedExecutor(error_tools={"flaky"})
+    inner.gate.set()
+    config = AdaptiveConcurrencyConfig(initial_limit=8, backoff_ratio=0.5)
+    executor = AdaptiveConcurrencyExecutor(inner, default_config=config)
+
+    results = await executor.execute([ToolCall(tool="flaky")])
+
+    assert results[0].error == "boom"
+    assert executor.get_limiter_stats()["flaky"].limit == 4
+
+
+@pytest.mark.asyncio
+async def test_executor_converts_exceptions_to_error_results():
+    executor = AdaptiveConcurrencyExecutor(RaisingExecutor())
+    call = ToolCall(tool="bad")
+
+    results = await executor.execute([call])
+
+    assert "executor exploded" in results[0].error
+    assert results[0].call_id == call.id
+    assert results[0].machine == "adaptive_concurrency"
+    assert executor.get_limiter_stats()["bad"].drops == 1
+
+
+@pytest.mark.asyncio
+async def test_executor_forwards_use_cache_when_supported():
+    inner = Mock()
+    inner.use_cache = True
+    inner.execute = AsyncMock(return_value=[ToolResult(tool="t", result=1)])
+    executor = AdaptiveConcurrencyExecutor(inner)
+
+    await executor.execute([ToolCall(tool="t")], timeout=3.0, use_cache=False)
+
+    inner.execute.assert_awaited_once()
+    assert inner.execute.await_args.kwargs == {"timeout": 3.0, "use_cache": False}
+
+
+@pytest.mark.asyncio
+async def test_executor_records_metrics(monkeypatch):
+    metrics = Mock()
+    monkeypatch.setattr(ac_module, "get_metrics", lambda: metrics)
+    inner = GatedExecutor()
+    inner.gate.set()
+    executor = AdaptiveConcurrencyExecutor(inner)
+
+    await executor.execute([ToolCall(tool="t")])
+
+    assert metrics.record_concurrency_limit.call_count == 2
+    last = metrics.record_concurrency_limit.call_args
+    assert last.args == ("t",)
+    assert last.kwargs["in_flight"] == 0
+    assert last.kwargs["queue_depth"] == 0
+
+
+# --------------------------------------------------------------------------- #
+# Processor integration
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_processor_wraps_strategy_with_adaptive_limiter():
+    registry = AsyncMock()
+    config = AdaptiveConcurrencyConfig(initial_limit=3)
+    processor = ToolProcessor(
+        registry=registry,
+        enable_caching=False,
+        enable_retries=False,
+        enable_adaptive_concurrency=True,
+        adaptive_concurrency_config=config,
+    )
+    await processor.initialize()
+
+    assert isinstance(processor.executor, AdaptiveConcurrencyExecutor)
+    assert processor.executor.executor is processor.strategy
+    assert processor.executor.default_config is config
@@ -19,6 +19,7 @@ from chuk_tool_processor.execution.wrappers.caching import (
 )
 from chuk_tool_processor.models.tool_call import ToolCall
 from chuk_tool_processor.models.tool_result import ToolResult
+from chuk_tool_processor.registry.providers.memory import InMemoryToolRegistry
 
 
 # --------------------------------------------------------------------------- #
@@ -421,3 +422,40 @@ async def test_cacheable_decorator():
 
     # Verify it works
     assert is_tool_cacheable("TestTool") is True
+
+
+# --------------------------------------------------------------------------- #
+# Registry-driven cache policy
+# --------------------------------------------------------------------------- #
+class CountingRegistry(InMemoryToolRegistry):
+    """Counts metadata lookups."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+
+    async def get_metadata(self, name, namespace="default"):
+        self.lookups += 1
+        return await super().get_metadata(name, namespace)
+
+
+@pytest.mark.asyncio
+async def test_registry_cache_policy_is_memoized_per_generation():
+    registry = CountingRegistry()
+    await registry.register_tool(object, name="lookup", metadata={"cacheable": True, "cache_ttl": 30})
+    await registry.register_tool(object, name="send")
+    executor = CachingToolExecutor(DummyExecutor(), InMemoryCache(), registry=registry)
+
+    for i in range(3):
+        await executor.execute([ToolCall(tool="lookup", arguments={"i": i}), ToolCall(tool="send")])
+    lookups = registry.lookups
+
+    assert await executor._cache_policy(ToolCall(tool="lookup")) == (True, 30)
+    assert registry.lookups == lookups == 2
+
+    # A registry write invalidates the memoized decisions
+    await registry.register_tool(object, name="send", metadata={"cacheable": True})
+    await executor.execute([ToolCall(tool="send")])
+
+    assert registry.lookups == lookups + 1
+    assert await executor._cache_policy(ToolCall(tool="send")) == (True, None)
@@ -0,0 +1,121 @@
+# tests/execution/wrappers/test_latency_tracking.py
+"""
+Tests for the latency tracking wrapper.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from chuk_tool_processor.core.processor import ToolProcessor
+from chuk_tool_processor.execution.wrappers.adaptive_concurrency import AdaptiveConcurrencyExecutor
+from chuk_tool_processor.execution.wrappers.latency_tracking import LatencyTrackingExecutor
+from chuk_tool_processor.models.tool_call import ToolCall
+from chuk_tool_processor.models.tool_result import ToolResult
+from chuk_tool_processor.scheduling import LatencyModel
+
+
+# --------------------------------------------------------------------------- #
+# Helpers
+# --------------------------------------------------------------------------- #
+class TimedExecutor:
+    """Returns results whose duration is ``arguments["ms"]``, in reverse order."""
+
+    async def execute(self, calls, timeout=None):
+        start = datetime.now(UTC)
+        results = []
+        for call in calls:
+            end = start + timedelta(milliseconds=call.arguments.get("ms", 0))
+            results.append(
+                ToolResult(
+                    tool=call.tool,
+                    call_id=call.id,
+                    result=None if call.arguments.get("error") else "ok",
+                    error=call.arguments.get("error"),
+                    cached=call.arguments.get("cached", False),
+                    start_time=start,
+                    end_time=end,
+                )
+            )
+        return list(reversed(results))
+
+
+# --------------------------------------------------------------------------- #
+# Executor
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_executor_empty_calls():
+    executor = LatencyTrackingExecutor(TimedExecutor(), LatencyModel())
+    assert await executor.execute([]) == []
+
+
+@pytest.mark.asyncio
+async def test_executor_records_successful_calls_by_call_id():
+    model = LatencyModel(by_arg_shape=True, min_shape_samples=1)
+    executor = LatencyTrackingExecutor(TimedExecutor(), model)
+    calls = [ToolCall(tool="fast", arguments={"ms": 20}), ToolCall(tool="slow", arguments={"ms": 300})]
+
+    results = await executor.execute(calls)
+
+    assert [r.tool for r in results] == ["slow", "fast"]
+    assert model.estimate_ms("fast") == 20
+    assert model.estimate_ms("slow", {"ms": 1}) == 300
+
+
+@pytest.mark.asyncio
+async def test_executor_skips_cached_and_failed_results():
+    model = LatencyModel()
+    executor = LatencyTrackingExecutor(TimedExecutor(), model)
+    calls = [
+        ToolCall(tool="cached", arguments={"ms": 1, "cached": True}),
+        ToolCall(tool="broken", arguments={"ms": 5, "error": "boom"}),
+    ]
+
+    await executor.execute(calls)
+
+    assert model.tools() == []
+
+
+@pytest.mark.asyncio
+async def test_executor_records_timeouts_as_lower_bound():
+    model = LatencyModel()
+    executor = LatencyTrackingExecutor(TimedExecutor(), model)
+
+    await executor.execute([ToolCall(tool="hung", arguments={"ms": 500, "error": "Timeout after 0.5s"})], timeout=0.5)
+
+    assert model.estimate_ms("hung") == 500
+
+
+@pytest.mark.asyncio
+async def test_executor_forwards_use_cache_when_supported():
+    inner = Mock()
+    inner.use_cache = True
+    inner.execute = AsyncMock(return_value=[])
+    executor = LatencyTrackingExecutor(inner, LatencyModel())
+
+    await executor.execute([ToolCall(tool="t")], timeout=3.0, use_cache=False)
+
+    assert inner.execute.await_args.kwargs == {"timeout": 3.0, "use_cache": False}
+
+
+# --------------------------------------------------------------------------- #
+# Processor integration
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_processor_tracks_latency_innermost():
+    model = LatencyModel()
+    processor = ToolProcessor(
+        registry=AsyncMock(),
+        enable_caching=False,
+        enable_retries=False,
+        enable_adaptive_concurrency=True,
+        latency_model=model,
+    )
+    await processor.initialize()
+
+    assert isinstance(processor.executor, AdaptiveConcurrencyExecutor)
+    tracker = processor.executor.executor
+    assert isinstance(tracker, LatencyTrackingExecutor)
+    assert tracker.executor is processor.strategy
+    assert tracker.model is model
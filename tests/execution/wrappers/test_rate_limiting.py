@@ -195,6 +195,131 @@ async def test_both_global_and_tool_rate_limits(monkeypatch):
     assert slept == [10.0]  # Global limit is enforced first and is longer
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("burst", [None, 1])
+@pytest.mark.parametrize("limit, period", [(2, 10.0), (5, 1.0), (100, 60.0)])
+async def test_limit_never_exceeded_per_period(monkeypatch, limit, period, burst):
+    """Test no window of length ``period`` admits more than ``limit`` calls."""
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    async def fake_sleep(dur):
+        now[0] += dur
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    limiter = RateLimiter(
+        global_limit=limit,
+        global_period=period,
+        tool_limits={"t": (limit, period)},
+        global_burst=burst,
+        tool_bursts={"t": burst} if burst is not None else None,
+    )
+    admitted: list[float] = []
+    for _ in range(3 * limit):
+        await limiter.wait("t")
+        admitted.append(now[0])
+        now[0] += period / (7 * limit)  # callers arrive faster than the limit allows
+
+    for i, start in enumerate(admitted):
+        in_window = [t for t in admitted[i:] if t < start + period - 1e-9]
+        assert len(in_window) <= limit
+
+
+@pytest.mark.asyncio
+async def test_global_burst_configuration(monkeypatch):
+    """Test that burst controls how many requests pass back-to-back."""
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    slept: list[float] = []
+
+    async def fake_sleep(dur):
+        slept.append(dur)
+        now[0] += dur
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    limiter = RateLimiter(global_limit=10, global_period=10, global_burst=1)
+
+    await limiter.wait("t")
+    await limiter.wait("t")
+    await limiter.wait("t")
+    assert slept == [1.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_tool_burst_configuration(monkeypatch):
+    """Test per-tool burst overrides."""
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    slept: list[float] = []
+
+    async def fake_sleep(dur):
+        slept.append(dur)
+        now[0] += dur
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    limiter = RateLimiter(tool_limits={"tool1": (2, 10)}, tool_bursts={"tool1": 3})
+
+    for _ in range(4):
+        await limiter.wait("tool1")
+    assert slept == [5.0]
+
+
+@pytest.mark.asyncio
+async def test_waiters_admitted_fifo_at_their_own_slot(monkeypatch):
+    """Blocked callers are scheduled in arrival order, one interval apart."""
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    requested: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def recording_sleep(dur):
+        requested.append(dur)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", recording_sleep)
+
+    limiter = RateLimiter(global_limit=1, global_period=2)
+    await asyncio.gather(*(limiter.wait("t") for _ in range(4)))
+
+    # Each waiter sleeps exactly once, until its own reserved slot
+    assert requested == [2.0, 4.0, 6.0]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_returns_its_slot(monkeypatch):
+    """A cancelled last-in-line waiter does not consume capacity."""
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    limiter = RateLimiter(global_limit=1, global_period=60)
+    await limiter.wait("t")
+
+    task = asyncio.create_task(limiter.wait("t"))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # After one interval the next caller passes without waiting
+    now[0] = 60.0
+    global_limited, _ = await limiter.check_limits("t")
+    assert global_limited is False
+
+
+def test_invalid_limits_rejected():
+    """Zero limits or bursts are configuration errors."""
+    with pytest.raises(ValueError):
+        RateLimiter(global_limit=0)
+    with pytest.raises(ValueError):
+        RateLimiter(global_limit=5, global_burst=0)
+
+
 @pytest.mark.asyncio
 async def test_check_limits_method():
     """Test the non-blocking check_limits method."""
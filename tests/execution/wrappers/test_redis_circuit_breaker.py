@@ -1039,7 +1039,7 @@ async def test_can_execute_returns_true_when_closed():
     from unittest.mock import AsyncMock, MagicMock
 
     mock_redis = MagicMock()
-    mock_redis.eval = AsyncMock(return_value=1)
+    mock_redis.evalsha = AsyncMock(return_value=1)
 
     breaker = RedisCircuitBreaker(
         mock_redis,
@@ -1057,7 +1057,7 @@ async def test_can_execute_returns_false_when_open():
     from unittest.mock import AsyncMock, MagicMock
 
     mock_redis = MagicMock()
-    mock_redis.eval = AsyncMock(return_value=0)
+    mock_redis.evalsha = AsyncMock(return_value=0)
 
     breaker = RedisCircuitBreaker(
         mock_redis,
@@ -1075,7 +1075,7 @@ async def test_record_success_transitions_to_closed():
     from unittest.mock import AsyncMock, MagicMock
 
     mock_redis = MagicMock()
-    mock_redis.eval = AsyncMock(return_value=b"closed")
+    mock_redis.evalsha = AsyncMock(return_value=b"closed")
 
     breaker = RedisCircuitBreaker(
         mock_redis,
@@ -1084,7 +1084,7 @@ async def test_record_success_transitions_to_closed():
 
     # Should trigger the log path for transitioning to closed
     await breaker.record_success("test_tool")
-    mock_redis.eval.assert_called_once()
+    mock_redis.evalsha.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -1093,7 +1093,7 @@ async def test_record_success_stays_half_open():
     from unittest.mock import AsyncMock, MagicMock
 
     mock_redis = MagicMock()
-    mock_redis.eval = AsyncMock(return_value=b"half_open")
+    mock_redis.evalsha = AsyncMock(return_value=b"half_open")
 
     breaker = RedisCircuitBreaker(
         mock_redis,
@@ -1101,7 +1101,7 @@ async def test_record_success_stays_half_open():
     )
 
     await breaker.record_success("test_tool")
-    mock_redis.eval.assert_called_once()
+    mock_redis.evalsha.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -1110,7 +1110,7 @@ async def test_record_failure_transitions_to_open():
     from unittest.mock import AsyncMock, MagicMock
 
     mock_redis = MagicMock()
-    mock_redis.eval = AsyncMock(return_value=b"open")
+    mock_redis.evalsha = AsyncMock(return_value=b"open")
 
     breaker = RedisCircuitBreaker(
         mock_redis,
@@ -1119,7 +1119,7 @@ async def test_record_failure_transitions_to_open():
 
     # Should trigger the log path for transitioning to open
     await breaker.record_failure("test_tool")
-    mock_redis.eval.assert_called_once()
+    mock_redis.evalsha.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -1128,7 +1128,7 @@ async def test_record_failure_stays_closed():
     from unittest.mock import AsyncMock, MagicMock
 
     mock_redis = MagicMock()
-    mock_redis.eval = AsyncMock(return_value=b"closed")
+    mock_redis.evalsha = AsyncMock(return_value=b"closed")
 
     breaker = RedisCircuitBreaker(
         mock_redis,
@@ -1136,7 +1136,7 @@ async def test_record_failure_stays_closed():
     )
 
     await breaker.record_failure("test_tool")
-    mock_redis.eval.assert_called_once()
+    mock_redis.evalsha.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -1689,3 +1689,221 @@ async def test_executor_reset_circuit_mocked():
     await executor.reset_circuit("test_tool")
 
     mock_breaker.reset.assert_called_once_with("test_tool")
+
+
+# --------------------------------------------------------------------------- #
+# Local state mirror, pub/sub fan-out and batched successes
+# --------------------------------------------------------------------------- #
+def _local_breaker(redis, **kwargs):
+    """Create a locally cached breaker with a low failure threshold."""
+    return RedisCircuitBreaker(
+        redis,
+        default_config=RedisCircuitBreakerConfig(failure_threshold=2, reset_timeout=60.0),
+        local_cache=True,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_cache_skips_redis_for_closed_circuit(fake_redis):
+    """Test closed circuits are answered from the local mirror."""
+    from unittest.mock import patch
+
+    breaker = _local_breaker(fake_redis, local_state_ttl=30.0)
+
+    assert await breaker.can_execute("tool") is True
+    with patch.object(fake_redis, "evalsha", wraps=fake_redis.evalsha) as spy:
+        for _ in range(10):
+            assert await breaker.can_execute("tool") is True
+    assert spy.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_local_cache_entry_expires(fake_redis):
+    """Test a mirrored CLOSED state is re-checked after the TTL."""
+    from unittest.mock import patch
+
+    breaker = _local_breaker(fake_redis, local_state_ttl=0.01)
+
+    await breaker.can_execute("tool")
+    await asyncio.sleep(0.02)
+    with patch.object(fake_redis, "evalsha", wraps=fake_redis.evalsha) as spy:
+        await breaker.can_execute("tool")
+    assert spy.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_local_cache_opening_locally_takes_effect_immediately(fake_redis):
+    """Test a circuit opened by this process is not served from the mirror."""
+    breaker = _local_breaker(fake_redis, local_state_ttl=30.0)
+
+    assert await breaker.can_execute("tool") is True
+    await breaker.record_failure("tool")
+    await breaker.record_failure("tool")
+
+    assert await breaker.can_execute("tool") is False
+
+
+@pytest.mark.asyncio
+async def test_pubsub_fans_out_open_to_other_processes(fake_redis):
+    """Test another process's mirror drops a circuit opened elsewhere."""
+    local = _local_breaker(fake_redis, local_state_ttl=30.0)
+    remote = _local_breaker(fake_redis, local_state_ttl=30.0)
+    await local.start_listener()
+    try:
+        assert await local.can_execute("tool") is True
+
+        await remote.record_failure("tool")
+        await remote.record_failure("tool")
+
+        for _ in range(50):
+            if not local._is_cached_closed("tool"):
+                break
+            await asyncio.sleep(0.01)
+
+        assert await local.can_execute("tool") is False
+    finally:
+        await local.close()
+
+
+@pytest.mark.asyncio
+async def test_start_listener_is_idempotent(fake_redis):
+    """Test starting the listener twice keeps a single task."""
+    breaker = _local_breaker(fake_redis)
+    await breaker.start_listener()
+    task = breaker._listener_task
+    await breaker.start_listener()
+    assert breaker._listener_task is task
+    await breaker.close()
+    assert task.done()
+
+
+@pytest.mark.asyncio
+async def test_closed_successes_are_batched(fake_redis):
+    """Test CLOSED-state successes are coalesced into one background flush."""
+    from unittest.mock import patch
+
+    breaker = _local_breaker(fake_redis, local_state_ttl=30.0, success_flush_interval=0.01)
+    await breaker.can_execute("a")
+    await breaker.can_execute("b")
+
+    with patch.object(fake_redis, "evalsha", wraps=fake_redis.evalsha) as spy:
+        for _ in range(5):
+            await breaker.record_success("a")
+            await breaker.record_success("b")
+        assert spy.call_count == 0
+        assert breaker._pending_successes == {"a", "b"}
+
+    await asyncio.sleep(0.05)
+    assert breaker._pending_successes == set()
+
+
+@pytest.mark.asyncio
+async def test_pending_success_lands_before_failure(fake_redis):
+    """Test a batched success is written before a later failure is counted."""
+    breaker = _local_breaker(fake_redis, local_state_ttl=30.0, success_flush_interval=60.0)
+    await breaker.can_execute("tool")
+
+    await breaker.record_failure("tool")
+    await breaker.record_success("tool")  # batched; resets the window when written
+    await breaker.record_failure("tool")
+
+    state = await breaker.get_state("tool")
+    assert state["state"] == "closed"
+    assert state["failure_count"] == 1
+    await breaker.close()
+
+
+@pytest.mark.asyncio
+async def test_half_open_success_is_recorded_immediately(fake_redis):
+    """Test successes outside CLOSED bypass batching."""
+    breaker = RedisCircuitBreaker(
+        fake_redis,
+        default_config=RedisCircuitBreakerConfig(failure_threshold=1, success_threshold=1, reset_timeout=0.01),
+        local_cache=True,
+    )
+    await breaker.record_failure("tool")
+    await asyncio.sleep(0.02)
+    assert await breaker.can_execute("tool") is True  # OPEN -> HALF_OPEN
+
+    await breaker.record_success("tool")
+
+    assert breaker._pending_successes == set()
+    assert (await breaker.get_state("tool"))["state"] == "closed"
+    assert breaker._is_cached_closed("tool")
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_successes(fake_redis):
+    """Test close() writes out pending successes."""
+    breaker = _local_breaker(fake_redis, local_state_ttl=30.0, success_flush_interval=60.0)
+    await breaker.can_execute("tool")
+    await breaker.record_failure("tool")
+    await breaker.record_success("tool")
+
+    await breaker.close()
+
+    assert breaker._pending_successes == set()
+    assert (await breaker.get_state("tool"))["failure_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_with_local_cache_skips_can_execute_round_trip(fake_redis):
+    """Test the executor pays no Redis cost on the way in for closed circuits."""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    breaker = _local_breaker(fake_redis, local_state_ttl=30.0, success_flush_interval=60.0)
+    inner = MagicMock()
+    inner.execute = AsyncMock(return_value=[ToolResult(tool="tool", result="ok")])
+    executor = RedisCircuitBreakerExecutor(inner, breaker)
+
+    await executor.execute([ToolCall(tool="tool", arguments={})])
+    with patch.object(fake_redis, "evalsha", wraps=fake_redis.evalsha) as spy:
+        for _ in range(5):
+            await executor.execute([ToolCall(tool="tool", arguments={})])
+    assert spy.call_count == 0
+    await breaker.close()
+
+
+@pytest.mark.asyncio
+async def test_scripts_reload_after_script_flush(fake_redis):
+    """Test EVALSHA calls, including the batched flush, recover from NOSCRIPT."""
+    breaker = _local_breaker(fake_redis, local_state_ttl=30.0, success_flush_interval=60.0)
+    assert await breaker.can_execute("tool") is True
+    await breaker.record_failure("tool")
+    await breaker.record_success("tool")
+
+    await fake_redis.script_flush()
+    await breaker.flush()
+    assert (await breaker.get_state("tool"))["failure_count"] == 0
+
+    await fake_redis.script_flush()
+    await breaker.record_failure("tool")
+    await breaker.record_failure("tool")
+    assert (await breaker.get_state("tool"))["state"] == "open"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["close", "aclose"])
+async def test_executor_close_flushes_successes_and_stops_listener(fake_redis, method):
+    """Test closing the executor writes batched successes and cancels the listener."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    breaker = _local_breaker(fake_redis, local_state_ttl=30.0, success_flush_interval=60.0)
+    await breaker.start_listener()
+    listener = breaker._listener_task
+    inner = MagicMock()
+    inner.execute = AsyncMock(return_value=[ToolResult(tool="tool", result="ok")])
+    executor = RedisCircuitBreakerExecutor(inner, breaker)
+
+    await executor.execute([ToolCall(tool="tool", arguments={})])
+    await breaker.record_failure("tool")
+    await executor.execute([ToolCall(tool="tool", arguments={})])
+    assert breaker._pending_successes == {"tool"}
+
+    await getattr(executor, method)()
+
+    assert breaker._pending_successes == set()
+    assert (await breaker.get_state("tool"))["failure_count"] == 0
+    assert listener.done()
+    assert breaker._listener_task is None
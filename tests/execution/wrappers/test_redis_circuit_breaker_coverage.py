@@ -31,7 +31,8 @@ from chuk_tool_processor.models.tool_result import ToolResult
 def _make_mock_redis() -> MagicMock:
     """Create a mock Redis client with all needed async methods."""
     r = MagicMock()
-    r.eval = AsyncMock(return_value=1)
+    r.evalsha = AsyncMock(return_value=1)
+    r.script_load = AsyncMock()
     r.hgetall = AsyncMock(return_value={})
     r.delete = AsyncMock()
     return r
@@ -111,7 +112,7 @@ class TestCanExecute:
     @pytest.mark.asyncio
     async def test_returns_true_when_allowed(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=1)
+        r.evalsha = AsyncMock(return_value=1)
         cb = RedisCircuitBreaker(r)
         result = await cb.can_execute("tool")
         assert result is True
@@ -119,7 +120,7 @@ class TestCanExecute:
     @pytest.mark.asyncio
     async def test_returns_false_when_blocked(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=0)
+        r.evalsha = AsyncMock(return_value=0)
         cb = RedisCircuitBreaker(r)
         result = await cb.can_execute("tool")
         assert result is False
@@ -127,13 +128,13 @@ class TestCanExecute:
     @pytest.mark.asyncio
     async def test_passes_config_values_to_lua(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=1)
+        r.evalsha = AsyncMock(return_value=1)
         cfg = RedisCircuitBreakerConfig(reset_timeout=30.0, half_open_max_calls=3)
         cb = RedisCircuitBreaker(r, default_config=cfg, key_prefix="cb")
         await cb.can_execute("mytool")
 
-        call_args = r.eval.call_args[0]
-        # Lua script is first arg
+        call_args = r.evalsha.call_args[0]
+        # Script SHA is first arg
         assert isinstance(call_args[0], str)
         # key count
         assert call_args[1] == 1
@@ -147,11 +148,11 @@ class TestCanExecute:
     @pytest.mark.asyncio
     async def test_uses_tool_specific_config(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=1)
+        r.evalsha = AsyncMock(return_value=1)
         special = RedisCircuitBreakerConfig(reset_timeout=99.0, half_open_max_calls=7)
         cb = RedisCircuitBreaker(r, tool_configs={"special": special})
         await cb.can_execute("special")
-        call_args = r.eval.call_args[0]
+        call_args = r.evalsha.call_args[0]
         assert call_args[4] == "99.0"
         assert call_args[5] == "7"
 
@@ -163,27 +164,27 @@ class TestRecordSuccess:
     @pytest.mark.asyncio
     async def test_transitions_to_closed(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=b"closed")
+        r.evalsha = AsyncMock(return_value=b"closed")
         cb = RedisCircuitBreaker(r)
         await cb.record_success("tool")
-        r.eval.assert_awaited_once()
+        r.evalsha.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_stays_half_open(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=b"half_open")
+        r.evalsha = AsyncMock(return_value=b"half_open")
         cb = RedisCircuitBreaker(r)
         await cb.record_success("tool")
-        r.eval.assert_awaited_once()
+        r.evalsha.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_passes_correct_keys_and_args(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=b"closed")
+        r.evalsha = AsyncMock(return_value=b"closed")
         cfg = RedisCircuitBreakerConfig(success_threshold=3)
         cb = RedisCircuitBreaker(r, default_config=cfg, key_prefix="cb")
         await cb.record_success("api")
-        call_args = r.eval.call_args[0]
+        call_args = r.evalsha.call_args[0]
         # 2 keys
         assert call_args[1] == 2
         assert call_args[2] == "cb:api:state"
@@ -194,7 +195,7 @@ class TestRecordSuccess:
     async def test_non_closed_result_no_log(self):
         """When result is not b'closed', the info log should not fire."""
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=b"half_open")
+        r.evalsha = AsyncMock(return_value=b"half_open")
         cb = RedisCircuitBreaker(r)
         # Should not raise
         await cb.record_success("tool")
@@ -207,27 +208,27 @@ class TestRecordFailure:
     @pytest.mark.asyncio
     async def test_transitions_to_open(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=b"open")
+        r.evalsha = AsyncMock(return_value=b"open")
         cb = RedisCircuitBreaker(r)
         await cb.record_failure("tool")
-        r.eval.assert_awaited_once()
+        r.evalsha.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_stays_closed(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=b"closed")
+        r.evalsha = AsyncMock(return_value=b"closed")
         cb = RedisCircuitBreaker(r)
         await cb.record_failure("tool")
-        r.eval.assert_awaited_once()
+        r.evalsha.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_passes_correct_keys_and_args(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=b"closed")
+        r.evalsha = AsyncMock(return_value=b"closed")
         cfg = RedisCircuitBreakerConfig(failure_window=90.0, failure_threshold=7)
         cb = RedisCircuitBreaker(r, default_config=cfg, key_prefix="cb")
         await cb.record_failure("api")
-        call_args = r.eval.call_args[0]
+        call_args = r.evalsha.call_args[0]
         assert call_args[1] == 2  # 2 keys
         assert call_args[2] == "cb:api:state"
         assert call_args[3] == "cb:api:failures"
@@ -239,7 +240,7 @@ class TestRecordFailure:
     @pytest.mark.asyncio
     async def test_non_open_result_no_warning_log(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=b"closed")
+        r.evalsha = AsyncMock(return_value=b"closed")
         cb = RedisCircuitBreaker(r)
         await cb.record_failure("tool")
         # No exception expected
@@ -447,6 +448,119 @@ class TestResetAll:
         assert count == 0
 
 
+# ---------------------------------------------------------------------------
+# Local mirror / batching
+# ---------------------------------------------------------------------------
+class TestLocalCache:
+    def test_disabled_by_default(self):
+        cb = RedisCircuitBreaker(_make_mock_redis())
+        assert cb.local_cache is False
+        cb._mirror("tool", "closed")
+        assert cb._closed_at == {}
+
+    @pytest.mark.asyncio
+    async def test_can_execute_caches_only_closed(self):
+        r = _make_mock_redis()
+        r.evalsha = AsyncMock(side_effect=[1, 2])
+        cb = RedisCircuitBreaker(r, local_cache=True, local_state_ttl=30.0)
+
+        assert await cb.can_execute("tool") is True  # HALF_OPEN allow
+        assert not cb._is_cached_closed("tool")
+        assert await cb.can_execute("tool") is True  # CLOSED
+        assert cb._is_cached_closed("tool")
+        assert await cb.can_execute("tool") is True
+        assert r.evalsha.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_script_args_include_channel_and_tool(self):
+        r = _make_mock_redis()
+        cb = RedisCircuitBreaker(r, key_prefix="cb")
+        await cb.can_execute("tool")
+        assert r.evalsha.call_args[0][-2:] == ("cb:events", "tool")
+
+    def test_apply_event(self):
+        cb = RedisCircuitBreaker(_make_mock_redis(), local_cache=True, local_state_ttl=30.0)
+        cb._apply_event(b"ns:tool:closed")
+        assert cb._is_cached_closed("ns:tool")
+        cb._apply_event("ns:tool:open")
+        assert not cb._is_cached_closed("ns:tool")
+        cb._apply_event(b"garbage")
+        assert cb._closed_at == {}
+
+    @pytest.mark.asyncio
+    async def test_listener_failure_clears_mirror(self):
+        cb = RedisCircuitBreaker(_make_mock_redis(), local_cache=True, local_state_ttl=30.0)
+        cb._mirror("tool", "closed")
+
+        async def broken_listen():
+            raise ConnectionError("gone")
+            yield  # noqa
+
+        pubsub = MagicMock()
+        pubsub.listen = broken_listen
+        pubsub.unsubscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+
+        await cb._listen(pubsub)
+
+        assert cb._closed_at == {}
+        pubsub.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_flush_pipelines_pending_successes(self):
+        r = _make_mock_redis()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[b"closed", b"closed"])
+        r.pipeline = MagicMock(return_value=pipe)
+        cb = RedisCircuitBreaker(r, local_cache=True)
+        cb._pending_successes = {"a", "b"}
+
+        await cb.flush()
+
+        r.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.evalsha.call_count == 2
+        r.evalsha.assert_not_called()
+        assert cb._pending_successes == set()
+
+    @pytest.mark.asyncio
+    async def test_flush_noop_when_empty(self):
+        r = _make_mock_redis()
+        cb = RedisCircuitBreaker(r, local_cache=True)
+        await cb.flush()
+        r.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_background_flush_logs_errors(self):
+        r = _make_mock_redis()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=ConnectionError("down"))
+        r.pipeline = MagicMock(return_value=pipe)
+        cb = RedisCircuitBreaker(r, local_cache=True, success_flush_interval=0.0)
+        cb._pending_successes = {"a"}
+
+        await cb._flush_later()  # must not raise
+
+    @pytest.mark.asyncio
+    async def test_reset_drops_pending_success(self):
+        r = _make_mock_redis()
+        cb = RedisCircuitBreaker(r, local_cache=True)
+        cb._pending_successes = {"tool"}
+        await cb.reset("tool")
+        assert cb._pending_successes == set()
+
+    @pytest.mark.asyncio
+    async def test_factory_starts_listener_when_local_cache(self):
+        mock_redis = _make_mock_redis()
+        with (
+            patch("redis.asyncio.Redis") as mock_redis_cls,
+            patch.object(RedisCircuitBreaker, "start_listener", new_callable=AsyncMock) as start,
+        ):
+            mock_redis_cls.from_url.return_value = mock_redis
+            cb = await create_redis_circuit_breaker(local_cache=True)
+        assert cb.local_cache is True
+        start.assert_awaited_once()
+
+
 # ---------------------------------------------------------------------------
 # RedisCircuitBreakerExecutor
 # ---------------------------------------------------------------------------
@@ -783,7 +897,7 @@ class TestStateTransitions:
     async def test_closed_to_open_via_failures(self):
         r = _make_mock_redis()
         # record_failure returns "closed" twice, then "open"
-        r.eval = AsyncMock(side_effect=[b"closed", b"closed", b"open"])
+        r.evalsha = AsyncMock(side_effect=[b"closed", b"closed", b"open"])
         cb = RedisCircuitBreaker(
             r,
             default_config=RedisCircuitBreakerConfig(failure_threshold=3),
@@ -791,14 +905,14 @@ class TestStateTransitions:
         await cb.record_failure("tool")
         await cb.record_failure("tool")
         await cb.record_failure("tool")
-        assert r.eval.call_count == 3
+        assert r.evalsha.call_count == 3
 
     @pytest.mark.asyncio
     async def test_half_open_success_to_closed(self):
         r = _make_mock_redis()
         # can_execute returns 1 (allowed in half_open)
         # record_success returns b"closed"
-        r.eval = AsyncMock(side_effect=[1, b"closed"])
+        r.evalsha = AsyncMock(side_effect=[1, b"closed"])
         cb = RedisCircuitBreaker(r)
         can = await cb.can_execute("tool")
         assert can is True
@@ -807,10 +921,10 @@ class TestStateTransitions:
     @pytest.mark.asyncio
     async def test_half_open_failure_reopens(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(side_effect=[1, b"open"])
+        r.evalsha = AsyncMock(side_effect=[1, b"open"])
         cb = RedisCircuitBreaker(r)
         can = await cb.can_execute("tool")
         assert can is True
         await cb.record_failure("tool")
-        # last eval returned b"open"
-        assert r.eval.call_count == 2
+        # last evalsha returned b"open"
+        assert r.evalsha.call_count == 2
@@ -348,8 +348,8 @@ async def test_redis_rate_limiter_generate_request_id(fake_redis):
 
 
 @pytest.mark.asyncio
-async def test_redis_rate_limiter_acquire_slot_success(fake_redis):
-    """Test _acquire_slot returns None on success."""
+async def test_redis_rate_limiter_try_acquire_success(fake_redis):
+    """Test _try_acquire grants a slot with no wait."""
     limiter = RedisRateLimiter(
         fake_redis,
         global_limit=10,
@@ -357,13 +357,13 @@ async def test_redis_rate_limiter_acquire_slot_success(fake_redis):
     )
 
     # Should acquire successfully
-    result = await limiter._acquire_slot(limiter._global_key(), 10, 60.0)
-    assert result is None  # Success
+    result = await limiter._try_acquire(limiter._scopes("tool"), 1)
+    assert result == (1, 0.0)
 
 
 @pytest.mark.asyncio
-async def test_redis_rate_limiter_acquire_slot_limited(fake_redis):
-    """Test _acquire_slot returns wait time when limited."""
+async def test_redis_rate_limiter_try_acquire_limited(fake_redis):
+    """Test _try_acquire returns wait time when limited."""
     limiter = RedisRateLimiter(
         fake_redis,
         global_limit=1,
@@ -371,13 +371,13 @@ async def test_redis_rate_limiter_acquire_slot_limited(fake_redis):
     )
 
     # First should succeed
-    result1 = await limiter._acquire_slot(limiter._global_key(), 1, 60.0)
-    assert result1 is None
+    granted1, _ = await limiter._try_acquire(limiter._scopes("tool"), 1)
+    assert granted1 == 1
 
-    # Second should be limited
-    result2 = await limiter._acquire_slot(limiter._global_key(), 1, 60.0)
-    assert result2 is not None
-    assert result2 > 0  # Should be wait time
+    # Second should be limited with a fractional wait close to the period
+    granted2, wait = await limiter._try_acquire(limiter._scopes("tool"), 1)
+    assert granted2 == 0
+    assert 59.0 < wait <= 60.0
 
 
 @pytest.mark.asyncio
@@ -562,27 +562,46 @@ async def test_redis_rate_limiter_check_limits_both_limited(fake_redis):
 # Additional tests for better coverage
 # --------------------------------------------------------------------------- #
 @pytest.mark.asyncio
-async def test_redis_rate_limiter_acquire_slot_returns_wait_time(fake_redis):
-    """Test _acquire_slot returns wait time when at limit."""
+async def test_redis_rate_limiter_combined_acquire_is_all_or_nothing(fake_redis):
+    """Test a blocked tool limit does not consume a global slot."""
     limiter = RedisRateLimiter(
         fake_redis,
-        global_limit=1,
+        global_limit=10,
         global_period=60.0,
+        tool_limits={"limited": (1, 60.0)},
     )
 
-    # Acquire first slot
-    result1 = await limiter._acquire_slot(limiter._global_key(), 1, 60.0)
-    assert result1 is None  # Success
+    await limiter.wait("limited")
+    granted, wait = await limiter._try_acquire(limiter._scopes("limited"), 1)
+    assert granted == 0
+    assert wait > 0
 
-    # Second attempt should return wait time
-    result2 = await limiter._acquire_slot(limiter._global_key(), 1, 60.0)
-    assert result2 is not None
-    assert result2 > 0  # Positive wait time
+    usage = await limiter.get_usage("limited")
+    assert usage["global"]["used"] == 1
+    assert usage["limited"]["used"] == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_rate_limiter_grants_partial_block(fake_redis):
+    """Test requesting several slots grants what the tightest scope allows."""
+    limiter = RedisRateLimiter(
+        fake_redis,
+        global_limit=10,
+        global_period=60.0,
+        tool_limits={"limited": (3, 60.0)},
+    )
+
+    granted, _ = await limiter._try_acquire(limiter._scopes("limited"), 5)
+    assert granted == 3
+
+    usage = await limiter.get_usage("limited")
+    assert usage["global"]["used"] == 3
+    assert usage["limited"]["used"] == 3
 
 
 @pytest.mark.asyncio
-async def test_redis_rate_limiter_acquire_global_loops(fake_redis):
-    """Test _acquire_global loops until slot available."""
+async def test_redis_rate_limiter_global_wait_loops(fake_redis):
+    """Test wait loops until a global slot is available."""
     limiter = RedisRateLimiter(
         fake_redis,
         global_limit=1,
@@ -604,8 +623,8 @@ async def test_redis_rate_limiter_acquire_global_loops(fake_redis):
 
 
 @pytest.mark.asyncio
-async def test_redis_rate_limiter_acquire_tool_loops(fake_redis):
-    """Test _acquire_tool loops until slot available."""
+async def test_redis_rate_limiter_tool_wait_loops(fake_redis):
+    """Test wait loops until a tool slot is available."""
     limiter = RedisRateLimiter(
         fake_redis,
         global_limit=None,  # No global limit
@@ -818,13 +837,29 @@ async def test_redis_rate_limiter_get_usage_cleans_expired(fake_redis):
 # --------------------------------------------------------------------------- #
 # Mocked tests for better coverage of internal code paths
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
-async def test_acquire_slot_returns_none_on_success():
-    """Test _acquire_slot returns None when slot is acquired."""
+def _mock_redis(counts=None, acquire=None):
+    """Build a MagicMock Redis client with evalsha and a pipeline."""
     from unittest.mock import AsyncMock, MagicMock
 
     mock_redis = MagicMock()
-    mock_redis.eval = AsyncMock(return_value=-1)
+    if acquire is None:
+        mock_redis.evalsha = AsyncMock(return_value=[1, b"0"])
+    else:
+        mock_redis.evalsha = AsyncMock(side_effect=acquire)
+    mock_redis.script_load = AsyncMock()
+    mock_redis.delete = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=counts or [])
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+    return mock_redis
+
+
+@pytest.mark.asyncio
+async def test_try_acquire_calls_script_by_sha():
+    """Test _try_acquire invokes the cached script with EVALSHA."""
+    from chuk_tool_processor.execution.wrappers.redis_rate_limiting import _ACQUIRE_SHA
+
+    mock_redis = _mock_redis()
 
     limiter = RedisRateLimiter(
         mock_redis,
@@ -832,17 +867,21 @@ async def test_acquire_slot_returns_none_on_success():
         global_period=60.0,
     )
 
-    result = await limiter._acquire_slot("test_key", 10, 60.0)
-    assert result is None
+    result = await limiter._try_acquire(limiter._scopes("tool"), 1)
+    assert result == (1, 0.0)
 
+    args = mock_redis.evalsha.call_args.args
+    assert args[0] == _ACQUIRE_SHA
+    assert args[1] == 1
+    assert args[2] == "ratelimit:global"
+    mock_redis.eval.assert_not_called()
+    mock_redis.script_load.assert_not_called()
 
-@pytest.mark.asyncio
-async def test_acquire_slot_returns_wait_time_when_limited():
-    """Test _acquire_slot returns wait time when at limit."""
-    from unittest.mock import AsyncMock, MagicMock
 
-    mock_redis = MagicMock()
-    mock_redis.eval = AsyncMock(return_value=30.5)  # Wait time
+@pytest.mark.asyncio
+async def test_try_acquire_returns_wait_time_when_limited():
+    """Test _try_acquire parses the fractional wait time."""
+    mock_redis = _mock_redis(acquire=[[0, b"30.5"]])
 
     limiter = RedisRateLimiter(
         mock_redis,
@@ -850,17 +889,15 @@ async def test_acquire_slot_returns_wait_time_when_limited():
         global_period=60.0,
     )
 
-    result = await limiter._acquire_slot("test_key", 10, 60.0)
-    assert result == 30.5
-    assert isinstance(result, float)
+    granted, wait = await limiter._try_acquire(limiter._scopes("tool"), 1)
+    assert granted == 0
+    assert wait == 30.5
 
 
 @pytest.mark.asyncio
-async def test_acquire_global_returns_immediately_when_no_limit():
-    """Test _acquire_global returns immediately when no global limit."""
-    from unittest.mock import MagicMock
-
-    mock_redis = MagicMock()
+async def test_wait_returns_immediately_when_no_limit():
+    """Test wait returns immediately when no limits are configured."""
+    mock_redis = _mock_redis()
 
     limiter = RedisRateLimiter(
         mock_redis,
@@ -868,18 +905,17 @@ async def test_acquire_global_returns_immediately_when_no_limit():
     )
 
     # Should return immediately without calling Redis
-    await limiter._acquire_global()
-    mock_redis.eval.assert_not_called()
+    await limiter.wait("tool")
+    mock_redis.evalsha.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_acquire_global_loops_until_slot_available():
-    """Test _acquire_global loops until slot is available."""
-    from unittest.mock import AsyncMock, MagicMock, patch
+async def test_wait_loops_until_slot_available():
+    """Test wait sleeps for the returned wait time and retries."""
+    from unittest.mock import AsyncMock, patch
 
-    mock_redis = MagicMock()
     # First call returns wait time, second returns success
-    mock_redis.eval = AsyncMock(side_effect=[0.01, -1])
+    mock_redis = _mock_redis(acquire=[[0, b"0.25"], [1, b"0"]])
 
     limiter = RedisRateLimiter(
         mock_redis,
@@ -888,19 +924,18 @@ async def test_acquire_global_loops_until_slot_available():
     )
 
     # Patch _async_sleep to avoid actual sleeping
-    with patch.object(limiter, "_async_sleep", new_callable=AsyncMock):
-        await limiter._acquire_global()
+    with patch.object(limiter, "_async_sleep", new_callable=AsyncMock) as mock_sleep:
+        await limiter.wait("tool")
 
-    # Should have been called twice
-    assert mock_redis.eval.call_count == 2
+    # Should have been called twice, sleeping exactly the reported wait
+    assert mock_redis.evalsha.call_count == 2
+    mock_sleep.assert_called_once_with(0.25)
 
 
 @pytest.mark.asyncio
-async def test_acquire_tool_returns_immediately_when_no_limit():
-    """Test _acquire_tool returns immediately when tool has no limit."""
-    from unittest.mock import MagicMock
-
-    mock_redis = MagicMock()
+async def test_wait_unlimited_tool_skips_redis():
+    """Test wait skips Redis when the tool has no limit."""
+    mock_redis = _mock_redis()
 
     limiter = RedisRateLimiter(
         mock_redis,
@@ -909,18 +944,18 @@ async def test_acquire_tool_returns_immediately_when_no_limit():
     )
 
     # Should return immediately without calling Redis
-    await limiter._acquire_tool("unknown_tool")
-    mock_redis.eval.assert_not_called()
+    await limiter.wait("unknown_tool")
+    mock_redis.evalsha.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_acquire_tool_loops_until_slot_available():
-    """Test _acquire_tool loops until slot is available."""
-    from unittest.mock import AsyncMock, MagicMock, patch
+async def test_evalsha_loads_script_on_noscript():
+    """Test the script is loaded once when Redis reports NOSCRIPT."""
+    from redis.exceptions import NoScriptError
 
-    mock_redis = MagicMock()
-    # First call returns wait time, second returns success
-    mock_redis.eval = AsyncMock(side_effect=[0.01, -1])
+    from chuk_tool_processor.execution.wrappers.redis_rate_limiting import _ACQUIRE_SCRIPT
+
+    mock_redis = _mock_redis(acquire=[NoScriptError("NOSCRIPT No matching script"), [1, b"0"]])
 
     limiter = RedisRateLimiter(
         mock_redis,
@@ -928,22 +963,28 @@ async def test_acquire_tool_loops_until_slot_available():
         tool_limits={"limited_tool": (10, 60.0)},
     )
 
-    # Patch _async_sleep to avoid actual sleeping
-    with patch.object(limiter, "_async_sleep", new_callable=AsyncMock):
-        await limiter._acquire_tool("limited_tool")
+    await limiter.wait("limited_tool")
+
+    mock_redis.script_load.assert_awaited_once_with(_ACQUIRE_SCRIPT)
+    assert mock_redis.evalsha.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_evalsha_propagates_other_errors():
+    """Test non-NOSCRIPT errors are not swallowed."""
+    mock_redis = _mock_redis(acquire=[RuntimeError("connection lost")])
+
+    limiter = RedisRateLimiter(mock_redis, global_limit=10)
 
-    # Should have been called twice
-    assert mock_redis.eval.call_count == 2
+    with pytest.raises(RuntimeError, match="connection lost"):
+        await limiter.wait("tool")
+    mock_redis.script_load.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_check_limits_global_limited():
     """Test check_limits when global limit is reached."""
-    from unittest.mock import AsyncMock, MagicMock
-
-    mock_redis = MagicMock()
-    mock_redis.zremrangebyscore = AsyncMock()
-    mock_redis.zcard = AsyncMock(return_value=100)  # At limit
+    mock_redis = _mock_redis(counts=[100])  # At limit
 
     limiter = RedisRateLimiter(
         mock_redis,
@@ -960,11 +1001,7 @@ async def test_check_limits_global_limited():
 @pytest.mark.asyncio
 async def test_check_limits_tool_limited():
     """Test check_limits when tool limit is reached."""
-    from unittest.mock import AsyncMock, MagicMock
-
-    mock_redis = MagicMock()
-    mock_redis.zremrangebyscore = AsyncMock()
-    mock_redis.zcard = AsyncMock(return_value=10)  # At limit
+    mock_redis = _mock_redis(counts=[10])  # At limit
 
     limiter = RedisRateLimiter(
         mock_redis,
@@ -980,12 +1017,8 @@ async def test_check_limits_tool_limited():
 
 @pytest.mark.asyncio
 async def test_check_limits_both_limited():
-    """Test check_limits when both limits are reached."""
-    from unittest.mock import AsyncMock, MagicMock
-
-    mock_redis = MagicMock()
-    mock_redis.zremrangebyscore = AsyncMock()
-    mock_redis.zcard = AsyncMock(return_value=100)  # At limit
+    """Test check_limits when both limits are reached in one pipeline."""
+    mock_redis = _mock_redis(counts=[100, 100])  # At limit
 
     limiter = RedisRateLimiter(
         mock_redis,
@@ -998,16 +1031,16 @@ async def test_check_limits_both_limited():
 
     assert global_limited is True
     assert tool_limited is True
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    pipe = mock_redis.pipeline.return_value
+    assert pipe.zcount.call_count == 2
+    pipe.execute.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_get_usage_with_global_limit():
     """Test get_usage returns global usage info."""
-    from unittest.mock import AsyncMock, MagicMock
-
-    mock_redis = MagicMock()
-    mock_redis.zremrangebyscore = AsyncMock()
-    mock_redis.zcard = AsyncMock(return_value=50)
+    mock_redis = _mock_redis(counts=[50])
 
     limiter = RedisRateLimiter(
         mock_redis,
@@ -1026,11 +1059,7 @@ async def test_get_usage_with_global_limit():
 @pytest.mark.asyncio
 async def test_get_usage_with_tool_limit():
     """Test get_usage returns tool usage info."""
-    from unittest.mock import AsyncMock, MagicMock
-
-    mock_redis = MagicMock()
-    mock_redis.zremrangebyscore = AsyncMock()
-    mock_redis.zcard = AsyncMock(return_value=5)
+    mock_redis = _mock_redis(counts=[5])
 
     limiter = RedisRateLimiter(
         mock_redis,
@@ -1049,11 +1078,7 @@ async def test_get_usage_with_tool_limit():
 @pytest.mark.asyncio
 async def test_get_usage_remaining_never_negative():
     """Test get_usage returns 0 for remaining when over limit."""
-    from unittest.mock import AsyncMock, MagicMock
-
-    mock_redis = MagicMock()
-    mock_redis.zremrangebyscore = AsyncMock()
-    mock_redis.zcard = AsyncMock(return_value=150)  # Over limit
+    mock_redis = _mock_redis(counts=[150])  # Over limit
 
     limiter = RedisRateLimiter(
         mock_redis,
@@ -1135,12 +1160,9 @@ async def test_reset_unknown_tool_no_error():
 
 
 @pytest.mark.asyncio
-async def test_wait_calls_acquire_global_and_tool():
-    """Test wait calls both _acquire_global and _acquire_tool."""
-    from unittest.mock import AsyncMock, MagicMock, patch
-
-    mock_redis = MagicMock()
-    mock_redis.eval = AsyncMock(return_value=-1)
+async def test_wait_acquires_global_and_tool_in_one_call():
+    """Test wait takes global and tool slots in a single script call."""
+    mock_redis = _mock_redis()
 
     limiter = RedisRateLimiter(
         mock_redis,
@@ -1149,14 +1171,12 @@ async def test_wait_calls_acquire_global_and_tool():
         tool_limits={"my_tool": (10, 60.0)},
     )
 
-    with (
-        patch.object(limiter, "_acquire_global", new_callable=AsyncMock) as mock_global,
-        patch.object(limiter, "_acquire_tool", new_callable=AsyncMock) as mock_tool,
-    ):
-        await limiter.wait("my_tool")
+    await limiter.wait("my_tool")
 
-    mock_global.assert_called_once()
-    mock_tool.assert_called_once_with("my_tool")
+    mock_redis.evalsha.assert_awaited_once()
+    args = mock_redis.evalsha.call_args.args
+    assert args[1] == 2
+    assert args[2:4] == ("ratelimit:global", "ratelimit:tool:my_tool")
 
 
 @pytest.mark.asyncio
@@ -1172,3 +1192,122 @@ async def test_async_sleep_actually_sleeps():
         await limiter._async_sleep(0.5)
 
     mock_sleep.assert_called_once_with(0.5)
+
+
+# --------------------------------------------------------------------------- #
+# Lease mode
+# --------------------------------------------------------------------------- #
+def test_lease_settings_validated(fake_redis):
+    """Test invalid lease settings are rejected."""
+    with pytest.raises(ValueError, match="lease_size"):
+        RedisRateLimiter(fake_redis, global_limit=10, lease_size=0)
+    with pytest.raises(ValueError, match="lease_ttl"):
+        RedisRateLimiter(fake_redis, global_limit=10, lease_ttl=0)
+
+
+@pytest.mark.asyncio
+async def test_lease_spends_tokens_locally(fake_redis):
+    """Test a lease serves several calls from one Redis round trip."""
+    from unittest.mock import patch
+
+    limiter = RedisRateLimiter(fake_redis, global_limit=100, global_period=60.0, lease_size=4, lease_ttl=30.0)
+
+    with patch.object(limiter, "_try_acquire", wraps=limiter._try_acquire) as spy:
+        for _ in range(5):
+            await limiter.wait("tool")
+
+    # 4 calls from the first lease, the 5th refills
+    assert spy.call_count == 2
+    usage = await limiter.get_usage()
+    assert usage["global"]["used"] == 8
+
+
+@pytest.mark.asyncio
+async def test_lease_refill_is_single_flight(fake_redis):
+    """Test concurrent callers share one refill."""
+    from unittest.mock import patch
+
+    limiter = RedisRateLimiter(fake_redis, global_limit=100, global_period=60.0, lease_size=8, lease_ttl=30.0)
+
+    with patch.object(limiter, "_try_acquire", wraps=limiter._try_acquire) as spy:
+        await asyncio.gather(*(limiter.wait("tool") for _ in range(8)))
+
+    assert spy.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_lease_is_per_limited_tool(fake_redis):
+    """Test tools with their own limit lease separately from global-only tools."""
+    limiter = RedisRateLimiter(
+        fake_redis,
+        global_limit=100,
+        global_period=60.0,
+        tool_limits={"limited": (10, 60.0)},
+        lease_size=3,
+        lease_ttl=30.0,
+    )
+
+    await limiter.wait("limited")
+    await limiter.wait("a")
+    await limiter.wait("b")  # shares the global-only lease with "a"
+
+    usage = await limiter.get_usage("limited")
+    assert usage["limited"]["used"] == 3
+    assert usage["global"]["used"] == 6
+
+
+@pytest.mark.asyncio
+async def test_lease_never_exceeds_limit(fake_redis):
+    """Test a lease is capped by remaining capacity."""
+    limiter = RedisRateLimiter(fake_redis, global_limit=2, global_period=60.0, lease_size=5)
+
+    await limiter.wait("tool")
+    await limiter.wait("tool")
+
+    assert limiter._leases[None][0] == 0
+    global_limited, _ = await limiter.check_limits("tool")
+    assert global_limited is True
+
+
+@pytest.mark.asyncio
+async def test_lease_expires(fake_redis):
+    """Test unspent tokens are dropped once the lease TTL passes."""
+    limiter = RedisRateLimiter(fake_redis, global_limit=100, global_period=60.0, lease_size=10, lease_ttl=0.05)
+
+    await limiter.wait("tool")
+    await asyncio.sleep(0.06)
+    await limiter.wait("tool")
+
+    usage = await limiter.get_usage()
+    assert usage["global"]["used"] == 20
+
+
+@pytest.mark.asyncio
+async def test_lease_ttl_capped_by_period(fake_redis):
+    """Test a lease never outlives the shortest window it was drawn from."""
+    import time
+
+    limiter = RedisRateLimiter(fake_redis, global_limit=100, global_period=0.5, lease_size=4, lease_ttl=30.0)
+
+    await limiter.wait("tool")
+    assert limiter._leases[None][1] - time.monotonic() <= 0.5
+
+
+@pytest.mark.asyncio
+async def test_reset_drops_leases(fake_redis):
+    """Test reset clears unspent local leases."""
+    limiter = RedisRateLimiter(
+        fake_redis,
+        global_limit=100,
+        tool_limits={"limited": (10, 60.0)},
+        lease_size=4,
+    )
+
+    await limiter.wait("limited")
+    await limiter.wait("other")
+    await limiter.reset("limited")
+    assert "limited" not in limiter._leases
+    assert None in limiter._leases
+
+    await limiter.reset()
+    assert limiter._leases == {}
@@ -14,6 +14,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from chuk_tool_processor.execution.wrappers.redis_rate_limiting import (
+    _ACQUIRE_SCRIPT,
+    _ACQUIRE_SHA,
     RedisRateLimiter,
     create_redis_rate_limiter,
 )
@@ -22,13 +24,24 @@ from chuk_tool_processor.execution.wrappers.redis_rate_limiting import (
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-def _make_mock_redis() -> MagicMock:
-    """Create a mock Redis client with all needed async methods."""
+def _make_mock_redis(count: int = 0) -> MagicMock:
+    """Create a mock Redis client; every pipelined ZCOUNT reports ``count``."""
     r = MagicMock()
-    r.eval = AsyncMock(return_value=-1)
-    r.zremrangebyscore = AsyncMock()
-    r.zcard = AsyncMock(return_value=0)
+    r.evalsha = AsyncMock(return_value=[1, b"0"])
+    r.script_load = AsyncMock()
     r.delete = AsyncMock()
+
+    queued: list[int] = []
+
+    async def execute() -> list[int]:
+        results = list(queued)
+        queued.clear()
+        return results
+
+    pipe = MagicMock()
+    pipe.zcount = MagicMock(side_effect=lambda *_args: queued.append(count))
+    pipe.execute = AsyncMock(side_effect=execute)
+    r.pipeline = MagicMock(return_value=pipe)
     return r
 
 
@@ -92,120 +105,108 @@ class TestKeyHelpers:
 
 
 # ---------------------------------------------------------------------------
-# _acquire_slot
+# _try_acquire / _evalsha
 # ---------------------------------------------------------------------------
-class TestAcquireSlot:
+class TestTryAcquire:
     @pytest.mark.asyncio
-    async def test_returns_none_on_success(self):
+    async def test_returns_granted_on_success(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=-1)
         limiter = RedisRateLimiter(r, global_limit=10)
-        result = await limiter._acquire_slot("key", 10, 60.0)
-        assert result is None
+        result = await limiter._try_acquire(limiter._scopes("t"), 1)
+        assert result == (1, 0.0)
 
     @pytest.mark.asyncio
     async def test_returns_float_wait_time_when_limited(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=42.5)
+        r.evalsha = AsyncMock(return_value=[0, b"42.5"])
         limiter = RedisRateLimiter(r, global_limit=10)
-        result = await limiter._acquire_slot("key", 10, 60.0)
-        assert result == 42.5
-        assert isinstance(result, float)
+        granted, wait = await limiter._try_acquire(limiter._scopes("t"), 1)
+        assert granted == 0
+        assert wait == 42.5
+        assert isinstance(wait, float)
 
     @pytest.mark.asyncio
-    async def test_returns_zero_wait_time(self):
+    async def test_passes_correct_args_to_evalsha(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=0)
+        limiter = RedisRateLimiter(
+            r,
+            global_limit=10,
+            global_period=60.0,
+            tool_limits={"t": (5, 30.0)},
+            key_prefix="pfx",
+        )
+        await limiter._try_acquire(limiter._scopes("t"), 3)
+
+        args = r.evalsha.call_args.args
+        # SHA, number of keys, then both keys
+        assert args[0] == _ACQUIRE_SHA
+        assert args[1] == 2
+        assert args[2:4] == ("pfx:global", "pfx:tool:t")
+        # now, request_id, requested, then (limit, period) per key
+        assert args[6] == "3"
+        assert args[7:] == ("10", "60.0", "5", "30.0")
+
+    @pytest.mark.asyncio
+    async def test_loads_script_on_noscript_error(self):
+        r = _make_mock_redis()
+        r.evalsha = AsyncMock(side_effect=[Exception("NOSCRIPT No matching script"), [1, b"0"]])
         limiter = RedisRateLimiter(r, global_limit=10)
-        result = await limiter._acquire_slot("key", 10, 60.0)
-        assert result == 0.0
+        result = await limiter._try_acquire(limiter._scopes("t"), 1)
+        assert result == (1, 0.0)
+        r.script_load.assert_awaited_once_with(_ACQUIRE_SCRIPT)
+        assert r.evalsha.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_passes_correct_args_to_eval(self):
+    async def test_other_errors_propagate(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=-1)
-        limiter = RedisRateLimiter(r, global_limit=10, key_prefix="pfx")
-        await limiter._acquire_slot("pfx:global", 10, 60.0)
+        r.evalsha = AsyncMock(side_effect=ConnectionError("down"))
+        limiter = RedisRateLimiter(r, global_limit=10)
+        with pytest.raises(ConnectionError):
+            await limiter._try_acquire(limiter._scopes("t"), 1)
+        r.script_load.assert_not_called()
 
-        call_args = r.eval.call_args
-        # First positional arg is the Lua script (string)
-        assert isinstance(call_args[0][0], str)
-        # Second arg is number of keys (1)
-        assert call_args[0][1] == 1
-        # Third arg is the key
-        assert call_args[0][2] == "pfx:global"
+    def test_script_sha_matches_body(self):
+        import hashlib
+
+        assert hashlib.sha1(_ACQUIRE_SCRIPT.encode()).hexdigest() == _ACQUIRE_SHA
 
 
 # ---------------------------------------------------------------------------
-# _acquire_global
+# _acquire
 # ---------------------------------------------------------------------------
-class TestAcquireGlobal:
-    @pytest.mark.asyncio
-    async def test_returns_immediately_when_no_limit(self):
-        r = _make_mock_redis()
-        limiter = RedisRateLimiter(r, global_limit=None)
-        await limiter._acquire_global()
-        r.eval.assert_not_called()
-
+class TestAcquire:
     @pytest.mark.asyncio
     async def test_acquires_on_first_try(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=-1)
-        limiter = RedisRateLimiter(r, global_limit=10, global_period=60.0)
-        await limiter._acquire_global()
-        assert r.eval.call_count == 1
+        limiter = RedisRateLimiter(r, global_limit=10)
+        assert await limiter._acquire(limiter._scopes("t")) == 1
+        assert r.evalsha.call_count == 1
 
     @pytest.mark.asyncio
     async def test_loops_until_slot_available(self):
         r = _make_mock_redis()
-        # First call: wait 0.01s, second call: success
-        r.eval = AsyncMock(side_effect=[0.01, -1])
-        limiter = RedisRateLimiter(r, global_limit=10, global_period=60.0)
+        r.evalsha = AsyncMock(side_effect=[[0, b"0.05"], [1, b"0"]])
+        limiter = RedisRateLimiter(r, global_limit=10)
         with patch.object(limiter, "_async_sleep", new_callable=AsyncMock) as mock_sleep:
-            await limiter._acquire_global()
-        assert r.eval.call_count == 2
-        mock_sleep.assert_called_once()
-        # sleep called with max(0.01, 0.01)
-        assert mock_sleep.call_args[0][0] >= 0.01
+            await limiter._acquire(limiter._scopes("t"))
+        assert r.evalsha.call_count == 2
+        mock_sleep.assert_awaited_once_with(0.05)
 
     @pytest.mark.asyncio
     async def test_loops_multiple_times(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(side_effect=[0.02, 0.03, -1])
-        limiter = RedisRateLimiter(r, global_limit=1, global_period=60.0)
+        r.evalsha = AsyncMock(side_effect=[[0, b"0.02"], [0, b"0.03"], [1, b"0"]])
+        limiter = RedisRateLimiter(r, global_limit=10)
         with patch.object(limiter, "_async_sleep", new_callable=AsyncMock):
-            await limiter._acquire_global()
-        assert r.eval.call_count == 3
-
-
-# ---------------------------------------------------------------------------
-# _acquire_tool
-# ---------------------------------------------------------------------------
-class TestAcquireTool:
-    @pytest.mark.asyncio
-    async def test_returns_immediately_when_tool_not_in_limits(self):
-        r = _make_mock_redis()
-        limiter = RedisRateLimiter(r, tool_limits={})
-        await limiter._acquire_tool("unknown")
-        r.eval.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_acquires_on_first_try(self):
-        r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=-1)
-        limiter = RedisRateLimiter(r, tool_limits={"api": (5, 30.0)})
-        await limiter._acquire_tool("api")
-        assert r.eval.call_count == 1
+            await limiter._acquire(limiter._scopes("t"))
+        assert r.evalsha.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_loops_until_slot_available(self):
+    async def test_returns_partial_grant(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(side_effect=[0.05, -1])
-        limiter = RedisRateLimiter(r, tool_limits={"api": (1, 60.0)})
-        with patch.object(limiter, "_async_sleep", new_callable=AsyncMock) as mock_sleep:
-            await limiter._acquire_tool("api")
-        assert r.eval.call_count == 2
-        mock_sleep.assert_called_once()
+        r.evalsha = AsyncMock(return_value=[3, b"0"])
+        limiter = RedisRateLimiter(r, global_limit=10)
+        assert await limiter._acquire(limiter._scopes("t"), 8) == 3
 
 
 # ---------------------------------------------------------------------------
@@ -213,36 +214,53 @@ class TestAcquireTool:
 # ---------------------------------------------------------------------------
 class TestWait:
     @pytest.mark.asyncio
-    async def test_calls_both_acquire_methods(self):
+    async def test_global_and_tool_in_one_round_trip(self):
         r = _make_mock_redis()
         limiter = RedisRateLimiter(
             r,
             global_limit=100,
             tool_limits={"tool_a": (10, 60.0)},
         )
-        with (
-            patch.object(limiter, "_acquire_global", new_callable=AsyncMock) as mg,
-            patch.object(limiter, "_acquire_tool", new_callable=AsyncMock) as mt,
-        ):
-            await limiter.wait("tool_a")
-        mg.assert_awaited_once()
-        mt.assert_awaited_once_with("tool_a")
+        await limiter.wait("tool_a")
+        r.evalsha.assert_awaited_once()
+        assert r.evalsha.call_args.args[1] == 2
 
     @pytest.mark.asyncio
     async def test_no_global_limit_still_checks_tool(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=-1)
         limiter = RedisRateLimiter(r, global_limit=None, tool_limits={"x": (2, 10.0)})
         await limiter.wait("x")
-        # eval called once for tool acquire
-        assert r.eval.call_count == 1
+        # one key: the tool
+        assert r.evalsha.call_count == 1
+        assert r.evalsha.call_args.args[1:3] == (1, "ratelimit:tool:x")
 
     @pytest.mark.asyncio
     async def test_no_limits_at_all(self):
         r = _make_mock_redis()
         limiter = RedisRateLimiter(r, global_limit=None, tool_limits={})
         await limiter.wait("anything")
-        r.eval.assert_not_called()
+        r.evalsha.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lease_mode_spends_locally(self):
+        r = _make_mock_redis()
+        r.evalsha = AsyncMock(return_value=[4, b"0"])
+        limiter = RedisRateLimiter(r, global_limit=100, lease_size=4)
+        for _ in range(4):
+            await limiter.wait("t")
+        assert r.evalsha.call_count == 1
+        # Requested a block of lease_size slots
+        assert r.evalsha.call_args.args[5] == "4"
+
+    @pytest.mark.asyncio
+    async def test_lease_mode_partial_grant(self):
+        r = _make_mock_redis()
+        r.evalsha = AsyncMock(side_effect=[[2, b"0"], [4, b"0"]])
+        limiter = RedisRateLimiter(r, global_limit=100, lease_size=4)
+        for _ in range(3):
+            await limiter.wait("t")
+        assert r.evalsha.call_count == 2
+        assert limiter._leases[None][0] == 3
 
 
 # ---------------------------------------------------------------------------
@@ -271,8 +289,7 @@ class TestCheckLimits:
 
     @pytest.mark.asyncio
     async def test_global_not_limited(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=5)
+        r = _make_mock_redis(count=5)
         limiter = RedisRateLimiter(r, global_limit=100)
         gl, tl = await limiter.check_limits("tool")
         assert gl is False
@@ -280,8 +297,7 @@ class TestCheckLimits:
 
     @pytest.mark.asyncio
     async def test_global_limited(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=100)
+        r = _make_mock_redis(count=100)
         limiter = RedisRateLimiter(r, global_limit=100)
         gl, tl = await limiter.check_limits("tool")
         assert gl is True
@@ -289,8 +305,7 @@ class TestCheckLimits:
 
     @pytest.mark.asyncio
     async def test_tool_limited(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=10)
+        r = _make_mock_redis(count=10)
         limiter = RedisRateLimiter(r, global_limit=None, tool_limits={"api": (10, 60.0)})
         gl, tl = await limiter.check_limits("api")
         assert gl is False
@@ -298,8 +313,7 @@ class TestCheckLimits:
 
     @pytest.mark.asyncio
     async def test_tool_not_limited_when_below_threshold(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=3)
+        r = _make_mock_redis(count=3)
         limiter = RedisRateLimiter(r, global_limit=None, tool_limits={"api": (10, 60.0)})
         gl, tl = await limiter.check_limits("api")
         assert gl is False
@@ -307,8 +321,7 @@ class TestCheckLimits:
 
     @pytest.mark.asyncio
     async def test_both_limited(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=50)
+        r = _make_mock_redis(count=50)
         limiter = RedisRateLimiter(
             r,
             global_limit=50,
@@ -319,9 +332,8 @@ class TestCheckLimits:
         assert tl is True
 
     @pytest.mark.asyncio
-    async def test_calls_zremrangebyscore_for_cleanup(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=0)
+    async def test_single_pipelined_round_trip(self):
+        r = _make_mock_redis(count=0)
         limiter = RedisRateLimiter(
             r,
             global_limit=10,
@@ -329,18 +341,27 @@ class TestCheckLimits:
             tool_limits={"api": (5, 30.0)},
         )
         await limiter.check_limits("api")
-        # Called once for global, once for tool
-        assert r.zremrangebyscore.call_count == 2
+        r.pipeline.assert_called_once_with(transaction=False)
+        pipe = r.pipeline.return_value
+        # One ZCOUNT for global, one for tool, one execute
+        assert pipe.zcount.call_count == 2
+        pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_tool_not_in_limits_skips_tool_check(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=0)
+        r = _make_mock_redis(count=0)
         limiter = RedisRateLimiter(r, global_limit=10, tool_limits={"other": (5, 30.0)})
         gl, tl = await limiter.check_limits("unknown_tool")
         assert tl is False
-        # zremrangebyscore called only once (for global)
-        assert r.zremrangebyscore.call_count == 1
+        # zcount queued only once (for global)
+        assert r.pipeline.return_value.zcount.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_no_limits_skips_redis(self):
+        r = _make_mock_redis()
+        limiter = RedisRateLimiter(r, global_limit=None)
+        assert await limiter.check_limits("tool") == (False, False)
+        r.pipeline.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -356,8 +377,7 @@ class TestGetUsage:
 
     @pytest.mark.asyncio
     async def test_global_usage_info(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=30)
+        r = _make_mock_redis(count=30)
         limiter = RedisRateLimiter(r, global_limit=100, global_period=60.0)
         usage = await limiter.get_usage()
         assert usage["global"]["used"] == 30
@@ -367,16 +387,14 @@ class TestGetUsage:
 
     @pytest.mark.asyncio
     async def test_global_remaining_never_negative(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=200)
+        r = _make_mock_redis(count=200)
         limiter = RedisRateLimiter(r, global_limit=100)
         usage = await limiter.get_usage()
         assert usage["global"]["remaining"] == 0
 
     @pytest.mark.asyncio
     async def test_tool_usage_info(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=3)
+        r = _make_mock_redis(count=3)
         limiter = RedisRateLimiter(
             r,
             global_limit=None,
@@ -391,16 +409,14 @@ class TestGetUsage:
 
     @pytest.mark.asyncio
     async def test_tool_remaining_never_negative(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=50)
+        r = _make_mock_redis(count=50)
         limiter = RedisRateLimiter(r, global_limit=None, tool_limits={"x": (10, 60.0)})
         usage = await limiter.get_usage("x")
         assert usage["x"]["remaining"] == 0
 
     @pytest.mark.asyncio
     async def test_tool_not_in_limits_excluded(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=0)
+        r = _make_mock_redis(count=0)
         limiter = RedisRateLimiter(r, global_limit=10, tool_limits={"known": (5, 60.0)})
         usage = await limiter.get_usage("unknown")
         assert "unknown" not in usage
@@ -408,8 +424,7 @@ class TestGetUsage:
 
     @pytest.mark.asyncio
     async def test_no_tool_argument(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=5)
+        r = _make_mock_redis(count=5)
         limiter = RedisRateLimiter(
             r,
             global_limit=100,
@@ -422,8 +437,7 @@ class TestGetUsage:
 
     @pytest.mark.asyncio
     async def test_both_global_and_tool(self):
-        r = _make_mock_redis()
-        r.zcard = AsyncMock(return_value=7)
+        r = _make_mock_redis(count=7)
         limiter = RedisRateLimiter(
             r,
             global_limit=100,
@@ -559,51 +573,46 @@ class TestCreateRedisRateLimiter:
 # Edge cases / integration-level
 # ---------------------------------------------------------------------------
 class TestEdgeCases:
-    @pytest.mark.asyncio
-    async def test_sliding_window_acquire_returns_negative_one_as_success(self):
-        """Lua script returns -1 for success, verify we treat it correctly."""
-        r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=-1)
-        limiter = RedisRateLimiter(r, global_limit=10)
-        result = await limiter._acquire_slot("k", 10, 60.0)
-        assert result is None
-
     @pytest.mark.asyncio
     async def test_concurrent_wait_calls(self):
         """Multiple concurrent waits should all complete."""
         r = _make_mock_redis()
-        r.eval = AsyncMock(return_value=-1)
         limiter = RedisRateLimiter(r, global_limit=100, tool_limits={"t": (50, 60.0)})
         tasks = [limiter.wait("t") for _ in range(10)]
         await asyncio.gather(*tasks)
-        # 10 waits: each calls _acquire_global and _acquire_tool => 20 eval calls
-        assert r.eval.call_count == 20
+        # 10 waits: each takes global and tool slots in one call
+        assert r.evalsha.call_count == 10
 
     @pytest.mark.asyncio
     async def test_wait_global_blocked_then_succeeds(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(side_effect=[0.001, -1])
+        r.evalsha = AsyncMock(side_effect=[[0, b"0.001"], [1, b"0"]])
         limiter = RedisRateLimiter(r, global_limit=1, global_period=60.0)
         with patch.object(limiter, "_async_sleep", new_callable=AsyncMock):
-            await limiter._acquire_global()
-        assert r.eval.call_count == 2
+            await limiter.wait("t")
+        assert r.evalsha.call_count == 2
 
     @pytest.mark.asyncio
     async def test_wait_tool_blocked_then_succeeds(self):
         r = _make_mock_redis()
-        r.eval = AsyncMock(side_effect=[0.001, -1])
+        r.evalsha = AsyncMock(side_effect=[[0, b"0.001"], [1, b"0"]])
         limiter = RedisRateLimiter(r, tool_limits={"t": (1, 60.0)})
         with patch.object(limiter, "_async_sleep", new_callable=AsyncMock):
-            await limiter._acquire_tool("t")
-        assert r.eval.call_count == 2
+            await limiter.wait("t")
+        assert r.evalsha.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_sleep_uses_max_of_001_and_wait_time(self):
-        """When wait_time < 0.01, we should sleep for 0.01."""
+    async def test_sleep_has_small_floor(self):
+        """A zero wait from Redis still yields for a millisecond before retrying."""
         r = _make_mock_redis()
-        r.eval = AsyncMock(side_effect=[0.001, -1])  # very small wait
+        r.evalsha = AsyncMock(side_effect=[[0, b"0"], [1, b"0"]])
         limiter = RedisRateLimiter(r, global_limit=1)
         with patch.object(limiter, "_async_sleep", new_callable=AsyncMock) as mock_sleep:
-            await limiter._acquire_global()
-        # max(0.01, 0.001) == 0.01
-        mock_sleep.assert_awaited_once_with(0.01)
+            await limiter.wait("t")
+        mock_sleep.assert_awaited_once_with(0.001)
+
+    def test_invalid_lease_settings(self):
+        with pytest.raises(ValueError):
+            RedisRateLimiter(_make_mock_redis(), lease_size=0)
+        with pytest.raises(ValueError):
+            RedisRateLimiter(_make_mock_redis(), lease_ttl=-1.0)
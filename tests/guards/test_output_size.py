@@ -1,6 +1,8 @@
 # tests/guards/test_output_size.py
 """Tests for OutputSizeGuard."""
 
+import json
+
 import pytest
 
 from chuk_tool_processor.guards.base import GuardVerdict
@@ -10,6 +12,7 @@ from chuk_tool_processor.guards.output_size import (
     SizeViolationType,
     TruncationMode,
 )
+from chuk_tool_processor.models.lazy_content import LazyContent
 
 
 class TestOutputSizeGuard:
@@ -113,3 +116,43 @@ class TestTruncation:
         guard = OutputSizeGuard(config=OutputSizeConfig(max_bytes=50, truncation_mode=TruncationMode.TRUNCATE))
         result = guard.check_output("tool", {}, {"data": "x" * 20000})
         assert result.verdict == GuardVerdict.REPAIR
+
+
+class TestLazyContent:
+    """Size checks on undecoded MCP content."""
+
+    def test_bytes_checked_on_raw_length_without_decoding(self):
+        guard = OutputSizeGuard(config=OutputSizeConfig(max_bytes=100))
+        content = LazyContent('"' + "x" * 200 + '"')
+
+        result = guard.check_output("tool", {}, content)
+
+        assert result.verdict == GuardVerdict.BLOCK
+        assert "202 > 100" in result.reason
+        assert not content.is_decoded
+
+    def test_small_content_allowed_without_decoding(self):
+        guard = OutputSizeGuard(config=OutputSizeConfig(max_bytes=1000, max_array_length=10))
+        content = LazyContent('{"items": [1, 2, 3]}')
+
+        assert guard.check_output("tool", {}, content).allowed
+        assert not content.is_decoded
+
+    def test_structure_checked_when_text_could_exceed_limits(self):
+        guard = OutputSizeGuard(config=OutputSizeConfig(max_array_length=5))
+        content = LazyContent(b"[" + b",".join(b"1" for _ in range(20)) + b"]")
+
+        result = guard.check_output("tool", {}, content)
+
+        assert result.verdict == GuardVerdict.BLOCK
+        assert "array_length_exceeded" in result.reason
+        assert content.is_decoded
+
+    def test_truncation_reports_raw_size(self):
+        guard = OutputSizeGuard(config=OutputSizeConfig(max_array_length=3, truncation_mode=TruncationMode.TRUNCATE))
+        raw = '{"items": [1, 2, 3, 4, 5]}'
+
+        result = guard.check_output("tool", {}, LazyContent(raw))
+
+        assert result.verdict == GuardVerdict.REPAIR
+        assert json.loads(result.fallback_response)["original_size"] == len(raw)
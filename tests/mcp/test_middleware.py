@@ -10,6 +10,7 @@ Tests cover:
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -19,6 +20,7 @@ from chuk_tool_processor.mcp.middleware import (
     CircuitBreakerSettings,
     CircuitBreakerStatus,
     CircuitBreakerToolState,
+    ConcurrencySettings,
     MiddlewareConfig,
     MiddlewareLayer,
     MiddlewareStack,
@@ -397,10 +399,69 @@ class TestStreamManagerExecutor:
         mock_stream_manager._direct_call_tool.assert_called_with(
             tool_name="test_tool",
             arguments={},
+            server_name=mock_stream_manager.get_server_for_tool.return_value,
             timeout=None,
         )
         assert len(results) == 1
 
+    @pytest.mark.asyncio
+    async def test_execute_dispatches_batch_concurrently(self, mock_stream_manager):
+        """Calls to different servers overlap instead of running back to back."""
+        mock_stream_manager.get_server_for_tool.side_effect = lambda tool: f"server_{tool}"
+        active = 0
+        peak = 0
+
+        async def call(tool_name, arguments, server_name, timeout):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"server": server_name}
+
+        mock_stream_manager._direct_call_tool.side_effect = call
+        executor = StreamManagerExecutor(mock_stream_manager)
+        calls = [ToolCall(tool=f"t{i}", arguments={}) for i in range(4)]
+
+        results = await executor.execute(calls)
+
+        assert peak == 4
+        assert [r.result for r in results] == [{"server": f"server_t{i}"} for i in range(4)]
+
+    @pytest.mark.asyncio
+    async def test_execute_applies_per_server_in_flight_limit(self, mock_stream_manager):
+        """Each server gets its own in-flight limit."""
+        mock_stream_manager.get_server_for_tool.side_effect = lambda tool: tool.split(".")[0]
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def call(tool_name, arguments, server_name, timeout):
+            active[server_name] = active.get(server_name, 0) + 1
+            peak[server_name] = max(peak.get(server_name, 0), active[server_name])
+            await asyncio.sleep(0.01)
+            active[server_name] -= 1
+            return {"ok": tool_name}
+
+        mock_stream_manager._direct_call_tool.side_effect = call
+        executor = StreamManagerExecutor(mock_stream_manager, max_in_flight_per_server=2)
+        calls = [ToolCall(tool=f"{server}.t{i}", arguments={}) for server in ("a", "b") for i in range(5)]
+
+        results = await executor.execute(calls)
+
+        assert peak == {"a": 2, "b": 2}
+        assert [r.result["ok"] for r in results] == [c.tool for c in calls]
+
+    def test_invalid_in_flight_limit(self, mock_stream_manager):
+        """In-flight limit must be positive."""
+        with pytest.raises(ValueError):
+            StreamManagerExecutor(mock_stream_manager, max_in_flight_per_server=0)
+
+    def test_stack_passes_concurrency_settings(self, mock_stream_manager):
+        """MiddlewareStack configures its base executor from ConcurrencySettings."""
+        config = MiddlewareConfig(concurrency=ConcurrencySettings(max_in_flight_per_server=3))
+        stack = MiddlewareStack(mock_stream_manager, config)
+        assert stack._base_executor._max_in_flight_per_server == 3
+
 
 class TestMiddlewareStack:
     """Tests for MiddlewareStack."""
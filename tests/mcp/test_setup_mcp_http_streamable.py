@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from chuk_tool_processor.core.processor import ToolProcessor
+from chuk_tool_processor.mcp.models import MCPCacheSettings, MCPServerConfig, MCPTransport
 from chuk_tool_processor.mcp.setup_mcp_http_streamable import setup_mcp_http_streamable
 from chuk_tool_processor.mcp.stream_manager import StreamManager
 
@@ -86,10 +87,13 @@ class TestSetupMCPHTTPStreamable:
                 default_timeout=45.0,
                 initialization_timeout=60.0,
                 oauth_refresh_callback=None,
+                snapshot_store=None,
             )
 
             # Verify register_mcp_tools was called with correct namespace
-            mock_register.assert_called_once_with(stream_manager, namespace="custom_ns")
+            mock_register.assert_called_once_with(
+                stream_manager, namespace="custom_ns", cache_settings=None, server_cache_settings=None
+            )
 
             # Verify ToolProcessor was created with correct options
             # Note: retry_config is now also passed (None when enable_retries=False)
@@ -256,3 +260,30 @@ class TestSetupMCPHTTPStreamable:
             processor, stream_manager = result
             assert processor == mock_processor
             assert stream_manager == mock_stream_manager
+
+    @pytest.mark.asyncio
+    async def test_setup_passes_cache_settings(self):
+        """tool_cache and per-server MCPServerConfig.cache reach register_mcp_tools."""
+        tool_cache = MCPCacheSettings(enabled=False)
+        server_cache = MCPCacheSettings(never_cache=["now"])
+        servers = [
+            MCPServerConfig(name="api", transport=MCPTransport.HTTP, url="http://test.com", cache=server_cache),
+            {"name": "plain", "url": "http://plain.com"},
+        ]
+
+        with (
+            patch(
+                "chuk_tool_processor.mcp.setup_mcp_http_streamable.StreamManager.create_with_http_streamable",
+                AsyncMock(),
+            ) as mock_create,
+            patch(
+                "chuk_tool_processor.mcp.setup_mcp_http_streamable.register_mcp_tools",
+                AsyncMock(return_value=[]),
+            ) as mock_register,
+            patch("chuk_tool_processor.mcp.setup_mcp_http_streamable.ToolProcessor"),
+        ):
+            await setup_mcp_http_streamable(servers=servers, tool_cache=tool_cache)
+
+        assert mock_create.call_args.kwargs["servers"] == [servers[0].to_dict(), servers[1]]
+        assert mock_register.call_args.kwargs["cache_settings"] is tool_cache
+        assert mock_register.call_args.kwargs["server_cache_settings"] == {"api": server_cache}
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from chuk_tool_processor.core.processor import ToolProcessor
+from chuk_tool_processor.mcp.models import MCPCacheSettings, MCPServerConfig, MCPTransport
 from chuk_tool_processor.mcp.setup_mcp_sse import setup_mcp_sse
 from chuk_tool_processor.mcp.stream_manager import StreamManager
 
@@ -58,3 +59,24 @@ class TestSetupMCPSSE:
 
             # Verify ToolProcessor was created with correct options
             mock_processor_class.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_setup_passes_cache_settings(self):
+        """tool_cache and per-server MCPServerConfig.cache reach register_mcp_tools."""
+        tool_cache = MCPCacheSettings(enabled=False)
+        server_cache = MCPCacheSettings(ttl=30)
+        servers = [
+            MCPServerConfig(name="weather", transport=MCPTransport.SSE, url="http://test.com", cache=server_cache),
+            MCPServerConfig(name="geo", transport=MCPTransport.SSE, url="http://geo.com"),
+        ]
+
+        with (
+            patch("chuk_tool_processor.mcp.setup_mcp_sse.StreamManager.create_with_sse", AsyncMock()) as mock_create,
+            patch("chuk_tool_processor.mcp.setup_mcp_sse.register_mcp_tools", AsyncMock(return_value=[])) as mock_reg,
+            patch("chuk_tool_processor.mcp.setup_mcp_sse.ToolProcessor"),
+        ):
+            await setup_mcp_sse(servers=servers, tool_cache=tool_cache)
+
+        assert mock_create.call_args.kwargs["servers"] == [s.to_dict() for s in servers]
+        assert mock_reg.call_args.kwargs["cache_settings"] is tool_cache
+        assert mock_reg.call_args.kwargs["server_cache_settings"] == {"weather": server_cache}
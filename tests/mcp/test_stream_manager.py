@@ -1076,6 +1076,48 @@ class TestStreamManager:
         assert result["result"] == "success"
         assert result["timeout"] == 15.0
 
+    @pytest.mark.asyncio
+    async def test_call_capabilities_resolved_once(self, stream_manager):
+        """The call_tool signature is inspected at registration, not per call."""
+        mock_transport = AsyncMock(spec=MCPBaseTransport)
+
+        async def call_with_timeout(tool_name, args, timeout=None):
+            return {"timeout": timeout}
+
+        mock_transport.call_tool = call_with_timeout
+        stream_manager._register_transport("test_server", mock_transport)
+        stream_manager.tool_to_server_map["test_tool"] = "test_server"
+
+        with patch("chuk_tool_processor.mcp.stream_manager.inspect.signature") as mock_signature:
+            for _ in range(3):
+                result = await stream_manager.call_tool("test_tool", {}, timeout=5.0)
+
+        mock_signature.assert_not_called()
+        assert result == {"timeout": 5.0}
+
+    @pytest.mark.asyncio
+    async def test_call_capabilities_follow_replaced_transport(self, stream_manager):
+        """Replacing a transport re-resolves its capabilities."""
+        first = AsyncMock(spec=MCPBaseTransport)
+
+        async def with_timeout(tool_name, args, timeout=None):
+            return {"timeout": timeout}
+
+        first.call_tool = with_timeout
+        stream_manager._register_transport("test_server", first)
+        stream_manager.tool_to_server_map["test_tool"] = "test_server"
+
+        second = AsyncMock(spec=MCPBaseTransport)
+
+        async def without_timeout(tool_name, args):
+            return {"timeout": "n/a"}
+
+        second.call_tool = without_timeout
+        stream_manager.transports["test_server"] = second
+
+        result = await stream_manager.call_tool("test_tool", {}, timeout=5.0)
+        assert result == {"timeout": "n/a"}
+
     # ------------------------------------------------------------------ #
     # Close method tests                                                 #
     # ------------------------------------------------------------------ #
@@ -1338,3 +1380,126 @@ class TestStreamManager:
 
             # Should not add any transports
             assert len(stream_manager.transports) == 0
+
+
+class TestConcurrentInitialization:
+    """Tests for concurrent multi-server initialization."""
+
+    @staticmethod
+    def _transport(tools: list[str], init_delay: float = 0.0, gate: asyncio.Event | None = None, tracker=None):
+        transport = AsyncMock(spec=MCPBaseTransport)
+
+        async def initialize():
+            if tracker is not None:
+                tracker["active"] += 1
+                tracker["peak"] = max(tracker["peak"], tracker["active"])
+            try:
+                if gate is not None:
+                    await gate.wait()
+                await asyncio.sleep(init_delay)
+            finally:
+                if tracker is not None:
+                    tracker["active"] -= 1
+            return True
+
+        transport.initialize = initialize
+        transport.send_ping = AsyncMock(return_value=True)
+        transport.get_tools = AsyncMock(return_value=[{"name": t, "description": t} for t in tools])
+        return transport
+
+    @pytest.mark.asyncio
+    async def test_servers_initialize_concurrently(self):
+        """Total start-up time is bounded by the slowest server, not the sum."""
+        sm = StreamManager()
+        transports = {f"s{i}": self._transport([f"tool{i}"], init_delay=0.2) for i in range(5)}
+
+        with patch(
+            "chuk_tool_processor.mcp.stream_manager.StdioTransport",
+            side_effect=lambda params, **_: transports[params["command"]],
+        ):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await sm.initialize_with_stdio([{"name": n, "command": n} for n in transports])
+            elapsed = loop.time() - start
+
+        assert elapsed < 0.6
+        assert sorted(sm.transports) == sorted(transports)
+        assert len(sm.all_tools) == 5
+
+    @pytest.mark.asyncio
+    async def test_hung_server_does_not_block_others(self):
+        """A server that never finishes initializing only costs its own timeout."""
+        sm = StreamManager()
+        hung = self._transport(["never"], gate=asyncio.Event())
+        fast = self._transport(["quick"])
+
+        with patch(
+            "chuk_tool_processor.mcp.stream_manager.StdioTransport",
+            side_effect=lambda params, **_: hung if params["command"] == "hung" else fast,
+        ):
+            await sm.initialize_with_stdio(
+                [{"name": "hung", "command": "hung"}, {"name": "fast", "command": "fast"}],
+                initialization_timeout=0.1,
+            )
+
+        assert list(sm.transports) == ["fast"]
+        assert sm.tool_to_server_map == {"quick": "fast"}
+        assert [(info.id, info.name) for info in sm.server_info] == [(1, "fast")]
+
+    @pytest.mark.asyncio
+    async def test_merge_is_deterministic(self):
+        """Results merge in config order regardless of completion order."""
+        sm = StreamManager()
+        # "first" finishes last; "second" also exposes "shared" and must not win
+        transports = {
+            "first": self._transport(["a", "shared"], init_delay=0.05),
+            "second": self._transport(["b", "shared"]),
+            "third": self._transport(["c", "shared"], init_delay=0.02),
+        }
+
+        with patch(
+            "chuk_tool_processor.mcp.stream_manager.StdioTransport",
+            side_effect=lambda params, **_: transports[params["command"]],
+        ):
+            await sm.initialize_with_stdio([{"name": n, "command": n} for n in transports])
+
+        assert list(sm.transports) == ["first", "second", "third"]
+        assert [info.name for info in sm.server_info] == ["first", "second", "third"]
+        assert [t.name for t in sm.all_tools] == ["a", "shared", "b", "shared", "c", "shared"]
+        assert sm.tool_to_server_map["shared"] == "third"
+
+    @pytest.mark.asyncio
+    async def test_fan_out_is_bounded(self):
+        """No more than max_concurrency servers connect at once."""
+        sm = StreamManager()
+        tracker = {"active": 0, "peak": 0}
+        transports = {f"s{i}": self._transport([f"t{i}"], init_delay=0.02, tracker=tracker) for i in range(6)}
+
+        with patch(
+            "chuk_tool_processor.mcp.stream_manager.HTTPStreamableTransport",
+            side_effect=lambda **kw: transports[kw["url"]],
+        ):
+            await sm.initialize_with_http_streamable(
+                [{"name": n, "url": n} for n in transports],
+                max_concurrency=2,
+            )
+
+        assert tracker["peak"] == 2
+        assert len(sm.transports) == 6
+
+    @pytest.mark.asyncio
+    async def test_build_failure_is_isolated(self):
+        """A transport that fails to construct does not affect other servers."""
+        sm = StreamManager()
+        good = self._transport(["ok"])
+
+        def factory(**kw):
+            if kw["url"] == "bad":
+                raise RuntimeError("cannot build")
+            return good
+
+        with patch("chuk_tool_processor.mcp.stream_manager.SSETransport", side_effect=factory):
+            await sm.initialize_with_sse([{"name": "bad", "url": "bad"}, {"name": "good", "url": "good"}])
+
+        assert list(sm.transports) == ["good"]
+        assert sm.tool_to_server_map == {"ok": "good"}
@@ -0,0 +1,139 @@
+# tests/mcp/test_tool_caching.py
+"""
+Tests for annotation-driven result caching of MCP tools.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+
+from chuk_tool_processor.core.processor import ToolProcessor
+from chuk_tool_processor.mcp import MCPCacheSettings
+from chuk_tool_processor.mcp.mcp_tool import RecoveryConfig
+from chuk_tool_processor.mcp.register_mcp_tools import register_mcp_tools
+from chuk_tool_processor.mcp.stream_manager import StreamManager
+from chuk_tool_processor.models.tool_call import ToolCall
+from chuk_tool_processor.registry.provider import ToolRegistryProvider
+from chuk_tool_processor.registry.providers.memory import InMemoryToolRegistry
+
+TOOLS = [
+    {"name": "lookup", "annotations": {"readOnlyHint": True}},
+    {"name": "put", "annotations": {"idempotentHint": True}},
+    {"name": "send", "annotations": {"readOnlyHint": True, "idempotentHint": False}},
+    {"name": "plain"},
+]
+
+
+def _stream_manager(tools: list[dict] | None = None, servers: dict[str, str] | None = None) -> Mock:
+    sm = Mock(spec=StreamManager)
+    sm.get_all_tools = Mock(return_value=tools if tools is not None else TOOLS)
+    sm.get_server_for_tool = Mock(side_effect=lambda name: (servers or {}).get(name))
+    sm.get_server_info = Mock(return_value=[{"name": "srv"}])
+    sm.transports = {"srv": Mock()}
+    sm.call_tool = AsyncMock(side_effect=lambda **kw: {"isError": False, "content": kw["arguments"]})
+    return sm
+
+
+@pytest_asyncio.fixture
+async def registry():
+    reg = InMemoryToolRegistry()
+    await ToolRegistryProvider.set_registry(reg)
+    yield reg
+    await ToolRegistryProvider.set_registry(None)
+
+
+# --------------------------------------------------------------------------- #
+# Policy
+# --------------------------------------------------------------------------- #
+@pytest.mark.parametrize(
+    ("annotations", "settings", "expected"),
+    [
+        ({"readOnlyHint": True}, MCPCacheSettings(), True),
+        ({"readOnlyHint": True, "idempotentHint": False}, MCPCacheSettings(), False),
+        ({"idempotentHint": True}, MCPCacheSettings(), False),
+        ({"idempotentHint": True}, MCPCacheSettings(cache_idempotent=True), True),
+        (None, MCPCacheSettings(), False),
+        ({"readOnlyHint": True}, MCPCacheSettings(enabled=False), False),
+        ({"readOnlyHint": True}, MCPCacheSettings(never_cache=["t"]), False),
+        ({"idempotentHint": False}, MCPCacheSettings(always_cache=["t"]), True),
+    ],
+)
+def test_cache_policy(annotations, settings, expected):
+    assert settings.is_cacheable("t", annotations) is expected
+
+
+def test_ttl_overrides():
+    settings = MCPCacheSettings(ttl=60, tool_ttls={"search": 600})
+    assert settings.ttl_for("search") == 600
+    assert settings.ttl_for("other") == 60
+
+
+# --------------------------------------------------------------------------- #
+# Registration
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_registration_marks_read_only_tools(registry):
+    await register_mcp_tools(_stream_manager(), namespace="mcp", cache_settings=MCPCacheSettings(ttl=42))
+
+    cacheable = {m.name: m.cache_ttl for m in await registry.list_metadata("mcp") if m.cacheable}
+    assert cacheable == {"lookup": 42}
+
+
+@pytest.mark.asyncio
+async def test_per_server_overrides(registry):
+    sm = _stream_manager(servers={"lookup": "fresh", "put": "kv"})
+    await register_mcp_tools(
+        sm,
+        namespace="mcp",
+        server_cache_settings={"fresh": MCPCacheSettings(enabled=False), "kv": MCPCacheSettings(cache_idempotent=True)},
+    )
+
+    cacheable = sorted(m.name for m in await registry.list_metadata("mcp") if m.cacheable)
+    assert cacheable == ["put"]
+
+
+# --------------------------------------------------------------------------- #
+# Execution
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_cache_hit_skips_transport(registry):
+    sm = _stream_manager()
+    await register_mcp_tools(sm, namespace="mcp")
+    processor = ToolProcessor(enable_caching=True, cache_ttl=60)
+
+    first = await processor.execute([ToolCall(tool="lookup", arguments={"q": "x"})])
+    sm.call_tool.reset_mock()
+    sm.get_server_info.reset_mock()
+    second = await processor.execute([ToolCall(tool="lookup", arguments={"q": "x"})])
+
+    assert first[0].result == second[0].result == {"q": "x"}
+    assert second[0].cached is True
+    sm.call_tool.assert_not_awaited()
+    sm.get_server_info.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_tools_bypass_cache(registry):
+    sm = _stream_manager()
+    await register_mcp_tools(sm, namespace="mcp")
+    processor = ToolProcessor(enable_caching=True, cache_ttl=60)
+
+    for _ in range(2):
+        results = await processor.execute([ToolCall(tool="send", arguments={"to": "a"})])
+        assert results[0].cached is False
+    assert sm.call_tool.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unavailable_results_are_not_cached(registry):
+    sm = _stream_manager()
+    sm.call_tool = AsyncMock(return_value={"isError": True, "error": "boom"})
+    await register_mcp_tools(sm, namespace="mcp", recovery_config=RecoveryConfig(max_retries=0))
+    processor = ToolProcessor(enable_caching=True, cache_ttl=60)
+
+    for _ in range(2):
+        results = await processor.execute([ToolCall(tool="lookup", arguments={"q": "x"})])
+        assert results[0].result["available"] is False
+        assert results[0].cached is False
+    assert sm.call_tool.await_count == 2
@@ -0,0 +1,235 @@
+# tests/mcp/test_tool_snapshot.py
+"""
+Tests for persistent tool-schema snapshots and snapshot-driven warm start.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from chuk_tool_processor.mcp.register_mcp_tools import register_mcp_tools
+from chuk_tool_processor.mcp.stream_manager import StreamManager
+from chuk_tool_processor.mcp.tool_snapshot import ToolSetDiff, ToolSnapshot, ToolSnapshotStore
+from chuk_tool_processor.mcp.transport import MCPBaseTransport
+from chuk_tool_processor.mcp.transport.models import MCPToolDefinition
+from chuk_tool_processor.registry.provider import ToolRegistryProvider
+from chuk_tool_processor.registry.providers.memory import InMemoryToolRegistry
+
+
+def _defs(*names: str, desc: str = "v1") -> list[MCPToolDefinition]:
+    return [MCPToolDefinition(name=n, description=f"{n} {desc}") for n in names]
+
+
+def _transport(tools: list[dict]) -> AsyncMock:
+    transport = AsyncMock(spec=MCPBaseTransport)
+    transport.initialize = AsyncMock(return_value=True)
+    transport.send_ping = AsyncMock(return_value=True)
+    transport.get_tools = AsyncMock(return_value=tools)
+    transport._attempt_recovery = AsyncMock(return_value=True)
+    return transport
+
+
+async def _start(store: ToolSnapshotStore, transport: AsyncMock, cfg: dict | None = None) -> StreamManager:
+    sm = StreamManager(snapshot_store=store)
+    with patch("chuk_tool_processor.mcp.stream_manager.StdioTransport", return_value=transport):
+        await sm.initialize_with_stdio([cfg or {"name": "srv", "command": "srv"}])
+    return sm
+
+
+# --------------------------------------------------------------------------- #
+# Snapshot and store
+# --------------------------------------------------------------------------- #
+def test_diff_reports_only_changed_tools():
+    old = ToolSnapshot.from_tools("srv", "k", _defs("a", "b", "c"))
+    new = ToolSnapshot.from_tools("srv", "k", _defs("a", "c", "d"))
+    new_b = ToolSnapshot.from_tools("srv", "k", [*_defs("a", "b"), *_defs("c", desc="v2")])
+
+    diff = old.diff(new)
+    assert (diff.added, diff.removed, diff.changed) == (["d"], ["b"], [])
+    assert old.diff(new_b).changed == ["c"]
+    assert not old.diff(ToolSnapshot.from_tools("srv", "k", _defs("a", "b", "c"))).has_changes
+
+
+def test_key_depends_on_config_content_not_order():
+    assert ToolSnapshotStore.key_for({"a": 1, "b": [1, 2]}) == ToolSnapshotStore.key_for({"b": [1, 2], "a": 1})
+    assert ToolSnapshotStore.key_for({"a": 1}) != ToolSnapshotStore.key_for({"a": 2})
+
+
+@pytest.mark.asyncio
+async def test_store_round_trip(tmp_path):
+    store = ToolSnapshotStore(tmp_path / "snapshots")
+    snapshot = ToolSnapshot.from_tools("srv", "abc", _defs("a", "b"))
+
+    assert await store.load("abc") is None
+    await store.save(snapshot)
+    loaded = await store.load("abc")
+
+    assert loaded is not None
+    assert loaded.digest == snapshot.digest
+    assert [t.name for t in loaded.definitions()] == ["a", "b"]
+    assert list((tmp_path / "snapshots").glob("*.tmp")) == []
+
+    store.delete("abc")
+    assert await store.load("abc") is None
+
+
+@pytest.mark.asyncio
+async def test_store_ignores_corrupt_and_mismatched_files(tmp_path):
+    store = ToolSnapshotStore(tmp_path)
+    (tmp_path / "bad.json").write_text("{not json")
+    assert await store.load("bad") is None
+
+    await store.save(ToolSnapshot.from_tools("srv", "abc", _defs("a")))
+    (tmp_path / "abc.json").rename(tmp_path / "other.json")
+    assert await store.load("other") is None
+
+
+# --------------------------------------------------------------------------- #
+# StreamManager warm start
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_cold_start_writes_snapshot(tmp_path):
+    store = ToolSnapshotStore(tmp_path)
+    transport = _transport([{"name": "a"}, {"name": "b"}])
+
+    sm = await _start(store, transport)
+
+    assert [t["name"] for t in sm.get_all_tools()] == ["a", "b"]
+    key = ToolSnapshotStore.key_for({"name": "srv", "command": "srv"})
+    snapshot = await store.load(key)
+    assert snapshot is not None and sorted(snapshot.tool_digests) == ["a", "b"]
+    await sm.close()
+
+
+@pytest.mark.asyncio
+async def test_warm_start_serves_snapshot_before_live_listing(tmp_path):
+    store = ToolSnapshotStore(tmp_path)
+    cold = await _start(store, _transport([{"name": "a"}, {"name": "b"}]))
+    await cold.close()
+
+    gate = asyncio.Event()
+    live = _transport([{"name": "a"}, {"name": "b"}])
+
+    async def slow_get_tools():
+        await gate.wait()
+        return [{"name": "a"}, {"name": "b"}]
+
+    live.get_tools = AsyncMock(side_effect=slow_get_tools)
+    sm = await _start(store, live)
+
+    # Tools are available although tools/list has not answered yet
+    assert [t["name"] for t in sm.get_all_tools()] == ["a", "b"]
+    assert sm.get_server_for_tool("a") == "srv"
+
+    gate.set()
+    await sm.wait_for_tool_refresh()
+    live.get_tools.assert_awaited_once()
+    await sm.close()
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_applies_and_reports_diff(tmp_path):
+    store = ToolSnapshotStore(tmp_path)
+    cold = await _start(store, _transport([{"name": "a"}, {"name": "b", "description": "old"}]))
+    await cold.close()
+
+    diffs: list[ToolSetDiff] = []
+    live = _transport([{"name": "b", "description": "new"}, {"name": "c"}])
+    sm = StreamManager(snapshot_store=store)
+    sm.add_tool_change_listener(diffs.append)
+    with patch("chuk_tool_processor.mcp.stream_manager.StdioTransport", return_value=live):
+        await sm.initialize_with_stdio([{"name": "srv", "command": "srv"}])
+    await sm.wait_for_tool_refresh()
+
+    assert [(d.added, d.removed, d.changed) for d in diffs] == [(["c"], ["a"], ["b"])]
+    assert [t["name"] for t in sm.get_all_tools()] == ["b", "c"]
+    assert sm.get_server_for_tool("a") is None
+    assert sm.get_server_info()[0]["tools"] == 2
+
+    # The snapshot on disk now matches the live server
+    key = ToolSnapshotStore.key_for({"name": "srv", "command": "srv"})
+    assert sorted((await store.load(key)).tool_digests) == ["b", "c"]
+    await sm.close()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_refresh_does_not_notify(tmp_path):
+    store = ToolSnapshotStore(tmp_path)
+    await (await _start(store, _transport([{"name": "a"}]))).close()
+
+    listener = AsyncMock()
+    sm = StreamManager(snapshot_store=store)
+    sm.add_tool_change_listener(listener)
+    with patch("chuk_tool_processor.mcp.stream_manager.StdioTransport", return_value=_transport([{"name": "a"}])):
+        await sm.initialize_with_stdio([{"name": "srv", "command": "srv"}])
+    await sm.wait_for_tool_refresh()
+
+    listener.assert_not_called()
+    await sm.close()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_diffs_tools(tmp_path):
+    transport = _transport([{"name": "a"}])
+    sm = await _start(ToolSnapshotStore(tmp_path), transport)
+    transport.get_tools.return_value = [{"name": "a"}, {"name": "z"}]
+
+    assert await sm.reconnect("srv") is True
+
+    assert sm.get_server_for_tool("z") == "srv"
+    await sm.close()
+
+
+@pytest.mark.asyncio
+async def test_register_mcp_tools_reregisters_only_changed(tmp_path):
+    store = ToolSnapshotStore(tmp_path)
+    await (await _start(store, _transport([{"name": "keep"}, {"name": "edit", "description": "old"}]))).close()
+
+    registry = InMemoryToolRegistry()
+    await ToolRegistryProvider.set_registry(registry)
+    sm = await _start(store, _transport([{"name": "keep"}, {"name": "edit", "description": "new"}]))
+    registered = await register_mcp_tools(sm, namespace="snap")
+    assert sorted(registered) == ["edit", "keep"]
+
+    with patch.object(registry, "register_tool", wraps=registry.register_tool) as spy:
+        await sm.wait_for_tool_refresh()
+
+    assert [c.kwargs["name"] for c in spy.call_args_list] == ["edit"]
+    metadata = await registry.get_metadata("edit", "snap")
+    assert metadata.description == "new"
+    await sm.close()
+    await ToolRegistryProvider.set_registry(None)
+
+
+@pytest.mark.asyncio
+async def test_register_mcp_tools_twice_refreshes_once(tmp_path):
+    registry = InMemoryToolRegistry()
+    await ToolRegistryProvider.set_registry(registry)
+    transport = _transport([{"name": "a"}])
+    sm = await _start(ToolSnapshotStore(tmp_path), transport)
+    await register_mcp_tools(sm, namespace="twice")
+    await register_mcp_tools(sm, namespace="twice")
+    transport.get_tools.return_value = [{"name": "a"}, {"name": "b"}]
+
+    with patch.object(registry, "register_tool", wraps=registry.register_tool) as spy:
+        await sm.refresh_tools("srv")
+
+    assert [c.kwargs["name"] for c in spy.call_args_list] == ["b"]
+    await sm.close()
+    await ToolRegistryProvider.set_registry(None)
+
+
+@pytest.mark.asyncio
+async def test_keyed_listener_replaces_previous():
+    sm = StreamManager()
+    first, second, other = AsyncMock(), AsyncMock(), AsyncMock()
+    sm.add_tool_change_listener(first, key="owner")
+    sm.add_tool_change_listener(other)
+    sm.add_tool_change_listener(second, key="owner")
+
+    assert sm._tool_listeners == [other, second]
+
+    sm.remove_tool_change_listener(second)
+    assert sm._tool_listeners == [other]
+    assert sm._keyed_tool_listeners == {}
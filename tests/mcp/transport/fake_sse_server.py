@@ -0,0 +1,175 @@
+# tests/mcp/transport/fake_sse_server.py
+"""
+In-process fake MCP server speaking the SSE transport over real sockets.
+
+Standard library only, so tests and benchmarks can exercise SSETransport
+end to end without FastAPI/uvicorn. It implements just enough of HTTP/1.1
+and MCP: ``GET /sse`` announces the message endpoint and then streams
+responses, ``POST /messages`` accepts single JSON-RPC messages or batch
+arrays and answers ``202``. Tools: ``echo`` (returns its arguments; an
+optional ``delay`` argument sleeps first) and ``fail`` (returns an error).
+
+Counters in :attr:`FakeSSEServer.stats` let tests check how many POSTs and
+batches the client actually sent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import uuid
+from typing import Any
+
+TOOLS = [
+    {"name": "echo", "description": "Echo the arguments", "inputSchema": {"type": "object"}},
+    {"name": "fail", "description": "Always fails", "inputSchema": {"type": "object"}},
+]
+
+
+class FakeSSEServer:
+    """Minimal MCP-over-SSE server bound to 127.0.0.1 on a free port."""
+
+    def __init__(self, *, protocol_version: str = "2024-11-05", response_delay: float = 0.0) -> None:
+        self.protocol_version = protocol_version
+        self.response_delay = response_delay
+        self.stats = {"posts": 0, "batches": 0, "messages": 0, "max_batch": 0}
+        self._sessions: dict[str, asyncio.Queue[Any]] = {}
+        self._server: asyncio.Server | None = None
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._writers: set[asyncio.StreamWriter] = set()
+        self.port = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    async def __aenter__(self) -> FakeSSEServer:
+        self._server = await asyncio.start_server(self._handle_connection, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        for queue in self._sessions.values():
+            queue.put_nowait(None)
+        if self._server is not None:
+            self._server.close()
+        # Closing the sockets ends the connection handlers; only reply tasks
+        # still sleeping are cancelled
+        for writer in list(self._writers):
+            writer.close()
+        for task in list(self._tasks):
+            if task.get_coro().__name__ == "_respond":
+                task.cancel()
+        for task in list(self._tasks):
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
+    # ------------------------------------------------------------------ #
+    #  HTTP                                                              #
+    # ------------------------------------------------------------------ #
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._tasks.add(task)
+        self._writers.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                method, target, _ = request_line.decode().split(" ", 2)
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+
+                path, _, query = target.partition("?")
+                if method == "GET" and path == "/sse":
+                    await self._stream(writer)
+                    return
+                if method == "POST" and path == "/messages":
+                    session = dict(p.split("=", 1) for p in query.split("&") if "=" in p).get("session_id", "")
+                    status = self._accept(session, json.loads(body))
+                    writer.write(f"HTTP/1.1 {status}\r\nContent-Length: 0\r\n\r\n".encode())
+                else:
+                    writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            return
+        finally:
+            if task is not None:
+                self._tasks.discard(task)
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _stream(self, writer: asyncio.StreamWriter) -> None:
+        session = uuid.uuid4().hex
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._sessions[session] = queue
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n\r\n")
+        writer.write(f"event: endpoint\ndata: /messages?session_id={session}\n\n".encode())
+        await writer.drain()
+        try:
+            while (payload := await queue.get()) is not None:
+                writer.write(f"event: message\ndata: {json.dumps(payload)}\n\n".encode())
+                await writer.drain()
+        finally:
+            self._sessions.pop(session, None)
+
+    # ------------------------------------------------------------------ #
+    #  MCP                                                               #
+    # ------------------------------------------------------------------ #
+    def _accept(self, session: str, payload: Any) -> str:
+        queue = self._sessions.get(session)
+        if queue is None:
+            return "404 Not Found"
+
+        self.stats["posts"] += 1
+        messages = payload if isinstance(payload, list) else [payload]
+        if isinstance(payload, list):
+            self.stats["batches"] += 1
+            self.stats["max_batch"] = max(self.stats["max_batch"], len(payload))
+        self.stats["messages"] += len(messages)
+
+        task = asyncio.create_task(self._respond(queue, messages, batch=isinstance(payload, list)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return "202 Accepted"
+
+    async def _respond(self, queue: asyncio.Queue[Any], messages: list[dict[str, Any]], *, batch: bool) -> None:
+        if self.response_delay:
+            await asyncio.sleep(self.response_delay)
+        replies = [r for r in await asyncio.gather(*(self._handle(m) for m in messages)) if r is not None]
+        if not replies:
+            return
+        if batch:
+            queue.put_nowait(replies)
+        else:
+            for reply in replies:
+                queue.put_nowait(reply)
+
+    async def _handle(self, message: dict[str, Any]) -> dict[str, Any] | None:
+        if "id" not in message:
+            return None  # notification
+        method, params = message.get("method"), message.get("params") or {}
+
+        if method == "initialize":
+            result: dict[str, Any] = {
+                "protocolVersion": self.protocol_version,
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "fake-sse", "version": "1.0"},
+            }
+        elif method == "tools/list":
+            result = {"tools": TOOLS}
+        elif method == "tools/call" and params.get("name") == "echo":
+            arguments = params.get("arguments") or {}
+            if arguments.get("delay"):
+                await asyncio.sleep(arguments["delay"])
+            result = {"content": [{"type": "text", "text": json.dumps(arguments)}]}
+        elif method == "tools/call":
+            result = {"content": [{"type": "text", "text": "failed"}], "isError": True}
+        else:
+            return {"jsonrpc": "2.0", "id": message["id"], "error": {"code": -32601, "message": "not found"}}
+        return {"jsonrpc": "2.0", "id": message["id"], "result": result}
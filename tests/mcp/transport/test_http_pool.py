@@ -0,0 +1,203 @@
+# tests/mcp/transport/test_http_pool.py
+"""
+Tests for the shared per-origin HTTP client pool.
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from chuk_tool_processor.mcp.transport import HTTPPoolConfig, SSETransport
+from chuk_tool_processor.mcp.transport import http_pool as http_pool_module
+from chuk_tool_processor.mcp.transport.http_pool import HTTPClientPool, origin_of
+from chuk_tool_processor.mcp.transport.http_streamable_transport import HTTPStreamableTransport
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+class MockTransportPool(HTTPClientPool):
+    """Pool whose clients answer locally instead of opening sockets."""
+
+    def __init__(self):
+        super().__init__()
+        self.built: list[httpx.AsyncClient] = []
+
+    def _build_client(self, config):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        self.built.append(client)
+        return client
+
+
+def test_origin_of():
+    assert origin_of("https://api.example.com/mcp/sse") == "https://api.example.com"
+    assert origin_of("http://localhost:8080/mcp") == "http://localhost:8080"
+
+
+def test_pool_config_is_hashable_and_validated():
+    assert hash(HTTPPoolConfig()) == hash(HTTPPoolConfig())
+    with pytest.raises(ValueError):
+        HTTPPoolConfig(max_connections=0)
+
+
+@pytest.mark.asyncio
+async def test_same_origin_shares_one_client():
+    pool = MockTransportPool()
+    a = pool.acquire("https://example.com/a")
+    b = pool.acquire("https://example.com/b/sse")
+    c = pool.acquire("https://other.example.com/")
+
+    assert a is b
+    assert a is not c
+    assert len(pool.built) == 2
+    assert {s["origin"]: s["refs"] for s in pool.get_stats()} == {
+        "https://example.com": 2,
+        "https://other.example.com": 1,
+    }
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_different_pool_settings_get_separate_clients():
+    pool = MockTransportPool()
+    a = pool.acquire("https://example.com", HTTPPoolConfig(max_connections=10))
+    b = pool.acquire("https://example.com", HTTPPoolConfig(max_connections=200))
+    assert a is not b
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_release_closes_on_last_reference():
+    pool = MockTransportPool()
+    client = pool.acquire("https://example.com")
+    pool.acquire("https://example.com")
+
+    await pool.release(client)
+    assert not client.is_closed
+    await pool.release(client)
+    assert client.is_closed
+    assert pool.get_stats() == []
+
+    # A fresh client is built on the next acquire
+    assert pool.acquire("https://example.com") is not client
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_release_of_unknown_client_is_ignored():
+    pool = MockTransportPool()
+    await pool.release(httpx.AsyncClient())
+
+
+@pytest.mark.asyncio
+async def test_limits_come_from_config():
+    pool = HTTPClientPool()
+    client = pool.acquire("https://example.com", HTTPPoolConfig(max_connections=250, max_keepalive_connections=50))
+    limits = client._transport._pool._max_connections, client._transport._pool._max_keepalive_connections
+    assert limits == (250, 50)
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_http2_falls_back_without_h2(monkeypatch):
+    monkeypatch.setattr(http_pool_module, "_HTTP2_AVAILABLE", False)
+    pool = HTTPClientPool()
+    client = pool.acquire("https://example.com", HTTPPoolConfig(http2=True))
+    assert client._transport._pool._http2 is False
+    assert pool.get_stats()[0]["http2"] is True
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_sse_transports_share_send_client_and_release_it():
+    pool = MockTransportPool()
+    first = SSETransport("https://example.com/a")
+    second = SSETransport("https://example.com/b")
+
+    with patch.object(http_pool_module, "_pool", pool):
+        for transport in (first, second):
+            transport.stream_client = AsyncMock()
+            transport.send_client = pool.acquire(transport.url, transport.http_pool)
+            transport._send_client_pooled = True
+
+        assert first.send_client is second.send_client
+        shared = first.send_client
+
+        await first._cleanup()
+        assert not shared.is_closed
+        await second._cleanup()
+        assert shared.is_closed
+
+
+@pytest.mark.asyncio
+async def test_transports_with_different_api_keys_do_not_share_cookies():
+    seen: list[tuple[str, str | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.headers["Authorization"], request.headers.get("Cookie")))
+        return httpx.Response(200, headers={"Set-Cookie": "session=tenant-a; Path=/"})
+
+    class CookieServerPool(HTTPClientPool):
+        def _build_client(self, config):
+            client = super()._build_client(config)
+            client._transport = httpx.MockTransport(handler)
+            return client
+
+    pool = CookieServerPool()
+    tenant_a = SSETransport("https://example.com/sse", api_key="key-a")
+    tenant_b = SSETransport("https://example.com/sse", api_key="key-b")
+    client_a = pool.acquire(tenant_a.url, tenant_a.http_pool)
+    client_b = pool.acquire(tenant_b.url, tenant_b.http_pool)
+    assert client_a is client_b
+
+    await client_a.post("https://example.com/messages", headers=tenant_a._get_headers())
+    await client_b.post("https://example.com/messages", headers=tenant_b._get_headers())
+    await client_a.post("https://example.com/messages", headers=tenant_a._get_headers())
+
+    assert seen == [("Bearer key-a", None), ("Bearer key-b", None), ("Bearer key-a", None)]
+    assert len(client_a.cookies.jar) == 0
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_http_streamable_health_probes_reuse_pooled_client():
+    pool = MockTransportPool()
+    transport = HTTPStreamableTransport("https://example.com")
+
+    with patch.object(http_pool_module, "_pool", pool):
+        assert await transport._test_connection_health() is True
+        assert await transport._test_connection_health() is True
+        assert len(pool.built) == 1
+
+        client = transport._health_client
+        await transport._cleanup()
+        assert transport._health_client is None
+        assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_http_streamable_health_probe_uses_quick_timeout():
+    client = Mock()
+    client.get = AsyncMock(return_value=Mock(status_code=200))
+    transport = HTTPStreamableTransport("https://example.com")
+    transport._health_client = client
+
+    await transport._test_connection_health()
+
+    assert client.get.await_args.kwargs["timeout"] == transport.timeout_config.quick
+
+
+@pytest.mark.asyncio
+async def test_stream_manager_passes_pool_settings_to_transport():
+    from chuk_tool_processor.mcp.stream_manager import StreamManager
+
+    sm = StreamManager()
+    with patch("chuk_tool_processor.mcp.stream_manager.SSETransport") as mock_sse:
+        mock_sse.return_value.initialize = AsyncMock(return_value=False)
+        await sm.initialize_with_sse(
+            [{"name": "remote", "url": "https://example.com", "http_pool": {"max_connections": 300, "http2": True}}]
+        )
+
+    assert mock_sse.call_args.kwargs["http_pool"] == HTTPPoolConfig(max_connections=300, http2=True)
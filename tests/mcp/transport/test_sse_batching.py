@@ -0,0 +1,117 @@
+# tests/mcp/transport/test_sse_batching.py
+"""
+Tests for request pipelining and JSON-RPC batching over the SSE transport.
+
+These run a real SSETransport against the in-process fake server, so the
+HTTP, SSE parsing and response routing paths are all exercised.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from chuk_tool_processor.mcp.transport import BatchConfig, SSETransport
+
+from .fake_sse_server import FakeSSEServer
+
+
+async def _connect(server: FakeSSEServer, **kwargs) -> SSETransport:
+    transport = SSETransport(server.url, enable_metrics=True, **kwargs)
+    assert await transport.initialize() is True
+    return transport
+
+
+async def _echo_many(transport: SSETransport, n: int) -> list[dict]:
+    return await asyncio.gather(*(transport.call_tool("echo", {"i": i}) for i in range(n)))
+
+
+def _echoed(result: dict) -> dict:
+    content = result["content"]
+    return json.loads(content) if isinstance(content, str) else content
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_batched():
+    async with FakeSSEServer(protocol_version="2025-03-26") as server:
+        transport = await _connect(server, batching=BatchConfig(window_ms=5))
+        posts_before = server.stats["posts"]
+
+        results = await _echo_many(transport, 50)
+
+        assert [_echoed(r)["i"] for r in results] == list(range(50))
+        assert all(r["isError"] is False for r in results)
+        assert server.stats["posts"] - posts_before < 10
+        assert server.stats["batches"] > 0
+        metrics = transport.get_metrics()
+        assert metrics["batches_sent"] == server.stats["batches"]
+        assert metrics["batched_requests"] >= 40
+        await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_caps_each_batch():
+    async with FakeSSEServer(protocol_version="2025-03-26") as server:
+        transport = await _connect(server, batching=BatchConfig(window_ms=50, max_batch_size=8))
+
+        await _echo_many(transport, 20)
+
+        assert server.stats["max_batch"] == 8
+        await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_no_batches_without_server_support():
+    async with FakeSSEServer(protocol_version="2024-11-05") as server:
+        transport = await _connect(server, batching=BatchConfig())
+
+        results = await _echo_many(transport, 10)
+
+        assert all(r["isError"] is False for r in results)
+        assert server.stats["batches"] == 0
+        await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_batching_can_be_forced():
+    async with FakeSSEServer(protocol_version="2024-11-05") as server:
+        transport = await _connect(server, batching=BatchConfig(require_server_support=False))
+
+        await _echo_many(transport, 10)
+
+        assert server.stats["batches"] > 0
+        await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_per_call_timeout_is_respected_inside_a_batch():
+    async with FakeSSEServer(protocol_version="2025-03-26") as server:
+        transport = await _connect(server, batching=BatchConfig(window_ms=5))
+
+        slow, fast = await asyncio.gather(
+            transport.call_tool("echo", {"delay": 1.0}, timeout=0.2),
+            transport.call_tool("echo", {"x": 1}, timeout=5.0),
+        )
+
+        assert slow["isError"] is True
+        assert "timed out" in slow["error"].lower()
+        # The server answers a batch as one array, so the fast call waits for
+        # the slow one but is not failed by the other call's timeout
+        assert _echoed(fast) == {"x": 1}
+        await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_unbatched_requests_are_pipelined():
+    async with FakeSSEServer(response_delay=0.2) as server:
+        transport = await _connect(server)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await _echo_many(transport, 10)
+        elapsed = loop.time() - start
+
+        assert all(r["isError"] is False for r in results)
+        # Ten round trips in flight at once, not one after another
+        assert elapsed < 1.0
+        await transport.close()
@@ -0,0 +1,76 @@
+# tests/mcp/transport/test_sse_parser.py
+"""
+Tests for the incremental byte-level SSE parser.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from chuk_tool_processor.mcp.transport.sse_parser import SSEEvent, SSEParser
+from chuk_tool_processor.mcp.transport.sse_transport import SSETransport
+
+STREAM = (
+    b": keep-alive comment\n"
+    b"event: endpoint\n"
+    b"data: /messages?session_id=abc\n"
+    b"\n"
+    b"id: 7\r\n"
+    b"data: first line\r\n"
+    b"data:second line\r\n"
+    b"\r\n"
+    b"event: ignored\n"
+    b"\n"
+    b"data: {}\n"
+    b"\n"
+)
+EXPECTED = [
+    SSEEvent("endpoint", b"/messages?session_id=abc"),
+    SSEEvent("message", b"first line\nsecond line", "7"),
+    SSEEvent("message", b"{}", "7"),
+]
+
+
+def _parse(chunks: list[bytes]) -> list[SSEEvent]:
+    parser = SSEParser()
+    return [event for chunk in chunks for event in parser.feed(chunk)]
+
+
+def test_parses_fields_comments_and_multiline_data():
+    assert _parse([STREAM]) == EXPECTED
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_result_does_not_depend_on_chunk_boundaries(size):
+    chunks = [STREAM[i : i + size] for i in range(0, len(STREAM), size)]
+    assert _parse(chunks) == EXPECTED
+
+
+def test_unterminated_event_is_held_until_blank_line():
+    parser = SSEParser()
+    assert parser.feed(b"data: partial") == []
+    assert parser.feed(b" payload\n") == []
+    assert parser.feed(b"\n") == [SSEEvent("message", b"partial payload")]
+
+
+@pytest.mark.asyncio
+async def test_transport_resolves_multiline_response_split_across_chunks():
+    transport = SSETransport("http://test.com")
+    transport.message_url = "http://test.com/messages"
+    payload = json.dumps({"jsonrpc": "2.0", "id": "r1", "result": {"text": "x" * 5000}}, indent=2)
+    body = "".join(f"data: {line}\n" for line in payload.splitlines()).encode() + b"\n"
+
+    async def aiter_bytes():
+        for i in range(0, len(body), 1000):
+            yield body[i : i + 1000]
+
+    transport.sse_response = AsyncMock()
+    transport.sse_response.aiter_bytes = aiter_bytes
+    future = asyncio.get_running_loop().create_future()
+    transport.pending_requests["r1"] = future
+
+    await transport._process_sse_stream()
+
+    assert future.result()["result"]["text"] == "x" * 5000
@@ -13,6 +13,16 @@ import pytest
 from chuk_tool_processor.mcp.transport.sse_transport import SSETransport
 
 
+def sse_chunks(lines):
+    """Turn an async generator of SSE lines into ``aiter_bytes`` chunks, one event per data line."""
+
+    async def aiter_bytes():
+        async for line in lines():
+            yield f"{line}\n\n".encode() if line.startswith("data:") else f"{line}\n".encode()
+
+    return aiter_bytes
+
+
 class TestSSETransport:
     """Test SSETransport class with proper mocking and consistent interface."""
 
@@ -45,7 +55,7 @@ class TestSSETransport:
 
         mock_sse_response = AsyncMock()
         mock_sse_response.status_code = 200
-        mock_sse_response.aiter_lines = mock_aiter_lines
+        mock_sse_response.aiter_bytes = sse_chunks(mock_aiter_lines)
 
         # CRITICAL FIX: Create proper async context manager that returns immediately
         class AsyncStreamContext:
@@ -134,7 +144,7 @@ class TestSSETransport:
 
         mock_sse_response = AsyncMock()
         mock_sse_response.status_code = 200
-        mock_sse_response.aiter_lines = mock_aiter_lines
+        mock_sse_response.aiter_bytes = sse_chunks(mock_aiter_lines)
 
         class AsyncStreamContext:
             def __init__(self, response):
@@ -403,7 +413,7 @@ class TestSSETransport:
             yield 'data: {"jsonrpc": "2.0", "id": "req-1", "result": {"test": true}}'
             yield "data: invalid json {"
 
-        mock_response.aiter_lines = mock_lines
+        mock_response.aiter_bytes = sse_chunks(mock_lines)
         transport.sse_response = mock_response
 
         future = asyncio.get_event_loop().create_future()
@@ -663,7 +673,7 @@ class TestSSETransport:
 
         mock_sse_response = AsyncMock()
         mock_sse_response.status_code = 200
-        mock_sse_response.aiter_lines = mock_aiter_lines
+        mock_sse_response.aiter_bytes = sse_chunks(mock_aiter_lines)
 
         class AsyncStreamContext:
             def __init__(self, response):
@@ -704,7 +714,7 @@ class TestSSETransport:
 
         mock_sse_response = AsyncMock()
         mock_sse_response.status_code = 200
-        mock_sse_response.aiter_lines = mock_aiter_lines
+        mock_sse_response.aiter_bytes = sse_chunks(mock_aiter_lines)
 
         class AsyncStreamContext:
             def __init__(self, response):
@@ -1073,7 +1083,7 @@ class TestSSETransport:
             yield "event: endpoint"
             yield "data: http://test.com/sse/message?sessionId=test-456"
 
-        mock_response.aiter_lines = mock_lines
+        mock_response.aiter_bytes = sse_chunks(mock_lines)
         transport.sse_response = mock_response
 
         task = asyncio.create_task(transport._process_sse_stream())
@@ -1094,7 +1104,7 @@ class TestSSETransport:
             yield "event: endpoint"
             yield "data: /sse/message?session_id=test-789"
 
-        mock_response.aiter_lines = mock_lines
+        mock_response.aiter_bytes = sse_chunks(mock_lines)
         transport.sse_response = mock_response
 
         task = asyncio.create_task(transport._process_sse_stream())
@@ -1114,7 +1124,7 @@ class TestSSETransport:
         async def mock_lines():
             yield "data: /messages/somepath"
 
-        mock_response.aiter_lines = mock_lines
+        mock_response.aiter_bytes = sse_chunks(mock_lines)
         transport.sse_response = mock_response
 
         task = asyncio.create_task(transport._process_sse_stream())
@@ -1136,7 +1146,7 @@ class TestSSETransport:
             yield "data: {}"
             yield "data: []"
 
-        mock_response.aiter_lines = mock_lines
+        mock_response.aiter_bytes = sse_chunks(mock_lines)
         transport.sse_response = mock_response
 
         task = asyncio.create_task(transport._process_sse_stream())
@@ -1488,7 +1498,7 @@ class TestSSETransportUncoveredLines:
 
         mock_sse_response = AsyncMock()
         mock_sse_response.status_code = 200
-        mock_sse_response.aiter_lines = mock_aiter_lines
+        mock_sse_response.aiter_bytes = sse_chunks(mock_aiter_lines)
 
         class AsyncStreamContext:
             def __init__(self, response):
@@ -1527,7 +1537,7 @@ class TestSSETransportUncoveredLines:
 
         mock_sse_response = AsyncMock()
         mock_sse_response.status_code = 200
-        mock_sse_response.aiter_lines = mock_aiter_lines
+        mock_sse_response.aiter_bytes = sse_chunks(mock_aiter_lines)
 
         class AsyncStreamContext:
             def __init__(self, response):
@@ -1566,7 +1576,7 @@ class TestSSETransportUncoveredLines:
             yield "   "
             yield "data: /messages/session?session_id=blank-test"
 
-        mock_response.aiter_lines = mock_lines
+        mock_response.aiter_bytes = sse_chunks(mock_lines)
         transport.sse_response = mock_response
 
         task = asyncio.create_task(transport._process_sse_stream())
@@ -1590,7 +1600,7 @@ class TestSSETransportUncoveredLines:
             yield "event: endpoint"
             yield "data: http://server.com/sse/message?sessionId=abc-123&extra=1"
 
-        mock_response.aiter_lines = mock_lines
+        mock_response.aiter_bytes = sse_chunks(mock_lines)
         transport.sse_response = mock_response
 
         task = asyncio.create_task(transport._process_sse_stream())
@@ -1611,7 +1621,7 @@ class TestSSETransportUncoveredLines:
             yield "event: endpoint"
             yield "data: http://server.com/sse/message?other=param"
 
-        mock_response.aiter_lines = mock_lines
+        mock_response.aiter_bytes = sse_chunks(mock_lines)
         transport.sse_response = mock_response
 
         task = asyncio.create_task(transport._process_sse_stream())
@@ -1636,7 +1646,7 @@ class TestSSETransportUncoveredLines:
             yield "event: endpoint"
             yield "data: /sse/message?sessionId=rel-456&extra=1"
 
-        mock_response.aiter_lines = mock_lines
+        mock_response.aiter_bytes = sse_chunks(mock_lines)
         transport.sse_response = mock_response
 
         task = asyncio.create_task(transport._process_sse_stream())
@@ -1657,7 +1667,7 @@ class TestSSETransportUncoveredLines:
             yield "event: endpoint"
             yield "data: /sse/message?other=param"
 
-        mock_response.aiter_lines = mock_lines
+        mock_response.aiter_bytes = sse_chunks(mock_lines)
         transport.sse_response = mock_response
 
         task = asyncio.create_task(transport._process_sse_stream())
@@ -1681,7 +1691,7 @@ class TestSSETransportUncoveredLines:
             raise ConnectionError("SSE stream lost")
             yield  # make it an async generator  # noqa: E501
 
-        mock_response.aiter_lines = mock_lines
+        mock_response.aiter_bytes = sse_chunks(mock_lines)
         transport.sse_response = mock_response
 
         await transport._process_sse_stream()
@@ -1697,7 +1707,7 @@ class TestSSETransportUncoveredLines:
             raise RuntimeError("stream error")
             yield  # noqa: E501
 
-        mock_response.aiter_lines = mock_lines
+        mock_response.aiter_bytes = sse_chunks(mock_lines)
         transport_no_metrics.sse_response = mock_response
 
         # Should not raise even without metrics
@@ -2046,7 +2056,7 @@ class TestSSETransportUncoveredLines:
             yield "event: endpoint"
             yield "data: http://server.com/sse/message?session_id=sid-789&extra=1"
 
-        mock_response.aiter_lines = mock_lines
+        mock_response.aiter_bytes = sse_chunks(mock_lines)
         transport.sse_response = mock_response
 
         task = asyncio.create_task(transport._process_sse_stream())
@@ -0,0 +1,310 @@
+# tests/mcp/transport/test_stdio_pool_transport.py
+"""
+Tests for StdioPoolTransport (replicated STDIO servers).
+"""
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from chuk_tool_processor.mcp.stream_manager import StreamManager
+from chuk_tool_processor.mcp.transport import StdioPoolTransport
+from chuk_tool_processor.mcp.transport.base_transport import MCPBaseTransport
+
+
+class FakeReplica(MCPBaseTransport):
+    """In-memory stand-in for one STDIO server process."""
+
+    instances: list["FakeReplica"] = []
+
+    def __init__(self, start_ok: bool = True, call_delay: float = 0.0):
+        self.start_ok = start_ok
+        self.call_delay = call_delay
+        self.connected = False
+        self.closed = False
+        self.calls = 0
+        self.tools_calls = 0
+        self.gate: asyncio.Event | None = None
+        FakeReplica.instances.append(self)
+
+    async def initialize(self) -> bool:
+        self.connected = self.start_ok
+        return self.start_ok
+
+    async def close(self) -> None:
+        self.closed = True
+        self.connected = False
+
+    async def send_ping(self) -> bool:
+        return self.connected
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def get_tools(self) -> list[dict[str, Any]]:
+        self.tools_calls += 1
+        return [{"name": "echo"}]
+
+    async def call_tool(self, tool_name, arguments, timeout=None) -> dict[str, Any]:
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        await asyncio.sleep(self.call_delay)
+        return {"isError": False, "content": {"replica": FakeReplica.instances.index(self), **arguments}}
+
+    async def list_resources(self) -> dict[str, Any]:
+        return {"resources": []}
+
+    async def list_prompts(self) -> dict[str, Any]:
+        return {"prompts": []}
+
+    def get_metrics(self) -> dict[str, Any]:
+        return {"total_calls": self.calls, "successful_calls": self.calls, "total_time": 0.1 * self.calls}
+
+    def reset_metrics(self) -> None:
+        self.calls = 0
+
+
+@pytest.fixture(autouse=True)
+def _reset_instances():
+    FakeReplica.instances = []
+    yield
+    FakeReplica.instances = []
+
+
+def _pool(replicas: int = 3, factory=None, **kwargs) -> StdioPoolTransport:
+    return StdioPoolTransport(
+        {"command": "echo-server"},
+        replicas=replicas,
+        replace_delay=0.01,
+        transport_factory=factory or FakeReplica,
+        **kwargs,
+    )
+
+
+def test_rejects_zero_replicas():
+    with pytest.raises(ValueError):
+        StdioPoolTransport({"command": "x"}, replicas=0)
+
+
+@pytest.mark.asyncio
+async def test_initialize_starts_all_replicas():
+    pool = _pool(3)
+    assert await pool.initialize() is True
+    assert pool.is_connected()
+    assert pool.get_metrics()["healthy_replicas"] == 3
+    await pool.close()
+    assert all(r.closed for r in FakeReplica.instances)
+    assert not pool.is_connected()
+
+
+@pytest.mark.asyncio
+async def test_initialize_fails_when_no_replica_starts():
+    pool = _pool(2, factory=lambda: FakeReplica(start_ok=False))
+    assert await pool.initialize() is False
+    result = await pool.call_tool("echo", {})
+    assert result["isError"] is True
+
+
+@pytest.mark.asyncio
+async def test_calls_go_to_least_loaded_replica():
+    pool = _pool(3)
+    await pool.initialize()
+    gate = asyncio.Event()
+    for replica in FakeReplica.instances:
+        replica.gate = gate
+
+    tasks = [asyncio.create_task(pool.call_tool("echo", {"i": i})) for i in range(6)]
+    await asyncio.sleep(0)
+    assert pool.get_metrics()["outstanding"] == [2, 2, 2]
+
+    gate.set()
+    results = await asyncio.gather(*tasks)
+    assert sorted(r["content"]["i"] for r in results) == list(range(6))
+    assert pool.get_metrics()["outstanding"] == [0, 0, 0]
+    assert pool.get_metrics()["total_calls"] == 6
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_busy_replica_is_skipped():
+    pool = _pool(2)
+    await pool.initialize()
+    slow, fast = FakeReplica.instances
+    slow.gate = asyncio.Event()
+
+    blocked = asyncio.create_task(pool.call_tool("echo", {}))
+    await asyncio.sleep(0)
+    for _ in range(3):
+        result = await pool.call_tool("echo", {})
+        assert result["content"]["replica"] == 1
+
+    slow.gate.set()
+    await blocked
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_get_tools_is_shared_across_replicas():
+    pool = _pool(3)
+    await pool.initialize()
+    assert await pool.get_tools() == [{"name": "echo"}]
+    assert await pool.get_tools() == [{"name": "echo"}]
+    assert sum(r.tools_calls for r in FakeReplica.instances) == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_crashed_replica_is_replaced_in_background():
+    pool = _pool(2)
+    await pool.initialize()
+    crashed = FakeReplica.instances[0]
+    crashed.connected = False
+
+    # Calls keep flowing to the healthy replica
+    result = await pool.call_tool("echo", {})
+    assert result["content"]["replica"] == 1
+
+    assert await pool.send_ping() is True
+    for _ in range(100):
+        if pool.get_metrics()["healthy_replicas"] == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    metrics = pool.get_metrics()
+    assert metrics["healthy_replicas"] == 2
+    assert metrics["replicas_replaced"] == 1
+    assert crashed.closed
+    assert len(FakeReplica.instances) == 3
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_replica_that_dies_is_replaced_on_next_call():
+    pool = _pool(2)
+    await pool.initialize()
+    idle = FakeReplica.instances[1]
+    idle.connected = False  # process exits while no call is in flight
+
+    result = await pool.call_tool("echo", {})
+    assert result["content"]["replica"] == 0
+
+    for _ in range(100):
+        if pool.get_metrics()["healthy_replicas"] == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    assert pool.get_metrics()["healthy_replicas"] == 2
+    assert idle.closed
+    assert len(FakeReplica.instances) == 3
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_start_is_retried_in_background():
+    attempts = iter([True, False, False, True])
+    pool = _pool(2, factory=lambda: FakeReplica(start_ok=next(attempts)))
+    assert await pool.initialize() is True
+    assert pool.get_metrics()["healthy_replicas"] == 1
+
+    for _ in range(100):
+        if pool.get_metrics()["healthy_replicas"] == 2:
+            break
+        await asyncio.sleep(0.01)
+    assert pool.get_metrics()["healthy_replicas"] == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_replicas_that_fail_to_start_are_closed():
+    attempts = iter([True, False, False, True])
+    pool = _pool(2, factory=lambda: FakeReplica(start_ok=next(attempts)))
+    await pool.initialize()
+
+    for _ in range(100):
+        if pool.get_metrics()["healthy_replicas"] == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    assert [r.closed for r in FakeReplica.instances] == [False, True, True, False]
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_replica_that_raises_on_start_is_closed():
+    class CrashingReplica(FakeReplica):
+        async def initialize(self) -> bool:
+            raise RuntimeError("spawn failed")
+
+    pool = _pool(1, factory=CrashingReplica)
+    assert await pool.initialize() is False
+    assert FakeReplica.instances[0].closed
+
+
+def test_default_factory_applies_timeouts_and_supervisor():
+    from chuk_tool_processor.mcp.transport import StdioTransport
+    from chuk_tool_processor.mcp.transport.models import SupervisorConfig
+
+    supervisor = SupervisorConfig(ping_interval=5.0)
+    pool = StdioPoolTransport(
+        {"command": "echo-server"}, replicas=2, connection_timeout=12.0, default_timeout=7.0, supervisor=supervisor
+    )
+
+    replica = pool._transport_factory()
+    assert isinstance(replica, StdioTransport)
+    assert (replica.connection_timeout, replica.default_timeout) == (12.0, 7.0)
+    assert replica._supervisor_config is supervisor
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_pending_replacements():
+    pool = _pool(2, factory=lambda: FakeReplica(start_ok=len(FakeReplica.instances) == 0))
+    await pool.initialize()
+    assert pool._replacements
+
+    await pool.close()
+    assert not pool._replacements
+
+
+@pytest.mark.asyncio
+async def test_attempt_recovery_replaces_dead_replicas_now():
+    pool = _pool(2)
+    await pool.initialize()
+    for replica in FakeReplica.instances:
+        replica.connected = False
+    assert not pool.is_connected()
+
+    assert await pool._attempt_recovery() is True
+    assert pool.get_metrics()["healthy_replicas"] == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_manager_uses_pool_for_replicas():
+    sm = StreamManager()
+    with patch("chuk_tool_processor.mcp.stream_manager.StdioPoolTransport") as mock_pool:
+        instance = FakeReplica()
+        mock_pool.return_value = instance
+        await sm.initialize_with_stdio([{"name": "echo", "command": "echo-server", "replicas": 4}])
+
+    assert mock_pool.call_args.kwargs["replicas"] == 4
+    assert sm.transports["echo"] is instance
+    assert sm.tool_to_server_map == {"echo": "echo"}
+
+
+@pytest.mark.asyncio
+async def test_stream_manager_passes_server_options_to_pool():
+    sm = StreamManager()
+    with patch("chuk_tool_processor.mcp.stream_manager.StdioPoolTransport") as mock_pool:
+        mock_pool.return_value = FakeReplica()
+        await sm.initialize_with_stdio(
+            [{"name": "echo", "command": "echo-server", "replicas": 2, "supervisor": {"ping_interval": 5.0}}],
+            default_timeout=7.0,
+            initialization_timeout=12.0,
+        )
+
+    kwargs = mock_pool.call_args.kwargs
+    assert kwargs["supervisor"].ping_interval == 5.0
+    assert (kwargs["connection_timeout"], kwargs["default_timeout"]) == (12.0, 7.0)
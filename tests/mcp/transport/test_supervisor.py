@@ -0,0 +1,182 @@
+# tests/mcp/transport/test_supervisor.py
+"""
+Tests for background transport supervision (pings and reconnects off the call path).
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from chuk_tool_processor.mcp.transport import StdioTransport, SupervisorConfig, TransportState
+
+SEND_TOOLS_CALL = "chuk_tool_processor.mcp.transport.stdio_transport.send_tools_call"
+OK_RESPONSE = {"result": {"content": [{"type": "text", "text": "ok"}]}}
+
+
+def _transport(**config) -> StdioTransport:
+    """A supervised StdioTransport that looks connected without a real process."""
+    config.setdefault("ping_interval", 60.0)
+    transport = StdioTransport({"command": "srv"}, process_monitor=False, supervisor=SupervisorConfig(**config))
+    transport._initialized = True
+    transport._streams = (Mock(), Mock())
+    return transport
+
+
+def _recovery(transport: StdioTransport, gate: asyncio.Event | None = None, ok: bool = True) -> AsyncMock:
+    async def recover():
+        if gate is not None:
+            await gate.wait()
+        if ok:
+            transport._initialized = True
+            transport._consecutive_failures = 0
+        return ok
+
+    mock = AsyncMock(side_effect=recover)
+    transport._attempt_recovery = mock
+    return mock
+
+
+@pytest.mark.asyncio
+async def test_ready_calls_skip_recovery():
+    transport = _transport()
+    recovery = _recovery(transport)
+    transport._start_supervisor(transport._supervisor_config)
+
+    with patch(SEND_TOOLS_CALL, AsyncMock(return_value=OK_RESPONSE)):
+        result = await transport.call_tool("echo", {})
+
+    assert result["isError"] is False
+    assert transport.supervisor.state is TransportState.READY
+    recovery.assert_not_awaited()
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_park_behind_one_background_reconnect():
+    transport = _transport(park_timeout=5.0)
+    gate = asyncio.Event()
+    recovery = _recovery(transport, gate)
+    transport._start_supervisor(transport._supervisor_config)
+    transport._consecutive_failures = transport._max_consecutive_failures
+
+    with patch(SEND_TOOLS_CALL, AsyncMock(return_value=OK_RESPONSE)):
+        calls = [asyncio.create_task(transport.call_tool("echo", {"i": i})) for i in range(5)]
+        await asyncio.sleep(0.05)
+        assert not any(c.done() for c in calls)
+        assert transport.supervisor.state is TransportState.RECONNECTING
+
+        gate.set()
+        results = await asyncio.gather(*calls)
+
+    assert all(r["isError"] is False for r in results)
+    recovery.assert_awaited_once()
+    assert transport.supervisor.get_stats()["parked_calls"] == 5
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_without_parking():
+    transport = _transport(park_timeout=0)
+    gate = asyncio.Event()
+    recovery = _recovery(transport, gate)
+    transport._start_supervisor(transport._supervisor_config)
+    transport._initialized = False  # process died
+
+    result = await transport.call_tool("echo", {})
+
+    assert result["isError"] is True
+    assert "reconnecting" in result["error"]
+    await asyncio.sleep(0)
+    recovery.assert_awaited_once()  # reconnect started in the background
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_pings_trigger_reconnect():
+    transport = _transport(ping_interval=0.01)
+    recovered = asyncio.Event()
+
+    async def recover():
+        transport._consecutive_failures = 0
+        recovered.set()
+        return True
+
+    transport._attempt_recovery = AsyncMock(side_effect=recover)
+
+    async def failing_ping():
+        transport._consecutive_failures += 1
+        return False
+
+    transport.send_ping = AsyncMock(side_effect=failing_ping)
+    transport._start_supervisor(transport._supervisor_config)
+
+    await asyncio.wait_for(recovered.wait(), timeout=2.0)
+    stats = transport.supervisor.get_stats()
+    assert stats["ping_failures"] >= transport._max_consecutive_failures
+    assert stats["reconnects"] >= 1
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_backs_off_and_close_releases_parked_callers():
+    transport = _transport(park_timeout=5.0, initial_backoff=0.01, max_backoff=0.02)
+    recovery = _recovery(transport, ok=False)
+    transport._start_supervisor(transport._supervisor_config)
+    supervisor = transport.supervisor
+    transport._initialized = False
+
+    parked = asyncio.create_task(transport.call_tool("echo", {}))
+    await asyncio.sleep(0.1)
+    assert recovery.await_count >= 2
+    assert supervisor.get_stats()["reconnect_failures"] >= 2
+    assert not parked.done()
+
+    await transport.close()
+    result = await asyncio.wait_for(parked, timeout=1.0)
+    assert result["isError"] is True
+    assert supervisor.state is TransportState.CLOSED
+    assert transport.supervisor is None
+
+
+@pytest.mark.asyncio
+async def test_metrics_keep_transport_counters():
+    transport = _transport()
+    transport._start_supervisor(transport._supervisor_config)
+
+    with patch(SEND_TOOLS_CALL, AsyncMock(return_value=OK_RESPONSE)):
+        await transport.call_tool("echo", {})
+
+    metrics = transport.get_metrics()
+    assert metrics["total_calls"] == 1
+    assert metrics["successful_calls"] == 1
+    assert metrics["supervisor"]["state"] == "ready"
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_unsupervised_transport_still_recovers_inline():
+    transport = StdioTransport({"command": "srv"}, process_monitor=False)
+    transport._initialized = True
+    transport._streams = (Mock(), Mock())
+    transport._consecutive_failures = transport._max_consecutive_failures
+    recovery = _recovery(transport)
+
+    with patch(SEND_TOOLS_CALL, AsyncMock(return_value=OK_RESPONSE)):
+        result = await transport.call_tool("echo", {})
+
+    assert result["isError"] is False
+    recovery.assert_awaited_once()
+    assert transport.supervisor is None
+
+
+@pytest.mark.asyncio
+async def test_stream_manager_passes_supervisor_config():
+    from chuk_tool_processor.mcp.stream_manager import StreamManager
+
+    sm = StreamManager()
+    with patch("chuk_tool_processor.mcp.stream_manager.StdioTransport") as mock_stdio:
+        mock_stdio.return_value.initialize = AsyncMock(return_value=False)
+        await sm.initialize_with_stdio([{"name": "srv", "command": "srv", "supervisor": {"ping_interval": 5}}])
+
+    assert mock_stdio.call_args.kwargs["supervisor"] == SupervisorConfig(ping_interval=5)
@@ -0,0 +1,110 @@
+# tests/models/test_lazy_content.py
+"""
+Tests for LazyContent and lazily decoded MCP transport results.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from chuk_tool_processor.mcp.transport import SSETransport, StdioTransport
+from chuk_tool_processor.models import LazyContent, ToolResult
+
+TEXT_RESULT = {"result": {"content": [{"type": "text", "text": '{"rows": [1, 2], "name": "t"}'}]}}
+
+
+# --------------------------------------------------------------------------- #
+# LazyContent
+# --------------------------------------------------------------------------- #
+def test_raw_access_does_not_decode():
+    content = LazyContent('{"a": "é"}')
+
+    assert str(content) == '{"a": "é"}'
+    assert content.raw_size == len('{"a": "é"}'.encode())
+    assert not content.is_decoded
+
+
+def test_structured_access_decodes_once():
+    content = LazyContent(b'{"rows": [1, 2], "name": "t"}')
+
+    assert content["rows"] == [1, 2]
+    assert content.is_decoded
+    assert content.value is content.value
+    assert len(content) == 2
+    assert "name" in content
+    assert content.get("missing", 0) == 0
+    assert dict(content.items()) == {"rows": [1, 2], "name": "t"}
+    assert content == {"rows": [1, 2], "name": "t"}
+
+
+def test_non_json_text_stays_text():
+    content = LazyContent("plain text")
+
+    assert content.value == "plain text"
+    assert content == "plain text"
+
+
+# --------------------------------------------------------------------------- #
+# ToolResult integration
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_tool_result_dumps_decoded_value_and_forwards_raw_text():
+    content = LazyContent('{"x": 1}')
+    result = ToolResult(tool="t", result=content)
+
+    assert result.result_text == '{"x": 1}'
+    assert not content.is_decoded
+
+    assert result.model_dump()["result"] == {"x": 1}
+    assert '"result":{"x":1}' in result.model_dump_json()
+    assert (await result.to_dict())["result"] == {"x": 1}
+
+
+def test_result_text_for_plain_values():
+    assert ToolResult(tool="t", result="hi").result_text == "hi"
+    assert ToolResult(tool="t", result={"a": 1}).result_text == '{"a":1}'
+    assert ToolResult(tool="t").result_text is None
+
+
+# --------------------------------------------------------------------------- #
+# Transports
+# --------------------------------------------------------------------------- #
+def test_transports_decode_eagerly_by_default():
+    assert SSETransport("http://test.com")._normalize_mcp_response(TEXT_RESULT)["content"] == {
+        "rows": [1, 2],
+        "name": "t",
+    }
+
+
+def test_sse_transport_returns_lazy_content():
+    content = SSETransport("http://test.com", lazy_content=True)._normalize_mcp_response(TEXT_RESULT)["content"]
+
+    assert isinstance(content, LazyContent)
+    assert content.raw == '{"rows": [1, 2], "name": "t"}'
+
+
+@pytest.mark.asyncio
+async def test_stdio_transport_returns_lazy_content():
+    transport = StdioTransport({"command": "srv"}, process_monitor=False, lazy_content=True)
+    transport._initialized = True
+    transport._streams = (AsyncMock(), AsyncMock())
+
+    with patch(
+        "chuk_tool_processor.mcp.transport.stdio_transport.send_tools_call", AsyncMock(return_value=TEXT_RESULT)
+    ):
+        result = await transport.call_tool("echo", {})
+
+    assert isinstance(result["content"], LazyContent)
+    assert result["content"]["rows"] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_stream_manager_passes_lazy_content():
+    from chuk_tool_processor.mcp.stream_manager import StreamManager
+
+    sm = StreamManager()
+    with patch("chuk_tool_processor.mcp.stream_manager.StdioTransport") as mock_stdio:
+        mock_stdio.return_value.initialize = AsyncMock(return_value=False)
+        await sm.initialize_with_stdio([{"name": "srv", "command": "srv", "lazy_content": True}])
+
+    assert mock_stdio.call_args.kwargs["lazy_content"] is True
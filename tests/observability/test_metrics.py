@@ -88,6 +88,15 @@ class TestPrometheusMetrics:
 
         metrics.record_rate_limit_check("api_tool", allowed=True)
 
+    def test_record_concurrency_limit(self):
+        """Test recording adaptive concurrency limiter state."""
+        metrics = PrometheusMetrics()
+
+        metrics.record_concurrency_limit("api_tool", limit=12, in_flight=4, queue_depth=2)
+
+        metrics.tool_concurrency_limit.labels.assert_called_with(tool="api_tool")
+        metrics.tool_concurrency_queue_depth.labels.assert_called_with(tool="api_tool")
+
 
 class TestMetricsTimer:
     """Tests for MetricsTimer context manager."""
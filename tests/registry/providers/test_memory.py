@@ -522,3 +522,17 @@ async def test_load_deferred_mcp_tool(registry):
         assert tool is mock_tool_instance
         # Should be marked as loaded
         assert "mcp_defer_ns.DeferredMCP" in registry._loaded_deferred_tools
+
+
+@pytest.mark.asyncio
+async def test_generation_tracks_registrations_and_deferred_loads(registry):
+    """Test that registering a tool or loading a deferred one bumps the generation."""
+    assert await registry.get_generation() == 0
+
+    await registry.register_tool(AsyncTool, name="add")
+    await registry.register_tool(AsyncMulTool, name="mul", metadata={"defer_loading": True})
+    assert await registry.get_generation() == 2
+
+    await registry.get_tool("add")
+    await registry.load_deferred_tool("mul")
+    assert await registry.get_generation() == 3
@@ -51,6 +51,7 @@ class MockRedis:
     def __init__(self):
         self._data: dict[str, bytes] = {}
         self._sets: dict[str, set[bytes]] = {}
+        self.mget_calls = 0
 
     async def get(self, key: str | bytes) -> bytes | None:
         key_str = key.decode() if isinstance(key, bytes) else key
@@ -83,6 +84,18 @@ class MockRedis:
     async def smembers(self, key: str) -> set[bytes]:
         return self._sets.get(key, set())
 
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        self.mget_calls += 1
+        return [self._data.get(k) for k in keys]
+
+    async def incr(self, key: str) -> int:
+        value = int(self._data.get(key, b"0")) + 1
+        self._data[key] = str(value).encode()
+        return value
+
+    def pipeline(self, transaction: bool = True) -> MockPipeline:
+        return MockPipeline(self)
+
     async def scan_iter(self, match: str = "*"):
         """Async generator that yields keys matching the pattern."""
         import fnmatch
@@ -95,6 +108,36 @@ class MockRedis:
                 yield key.encode() if isinstance(key, str) else key
 
 
+class MockPipeline:
+    """Queues commands and runs them against the mock client on execute()."""
+
+    def __init__(self, redis: MockRedis):
+        self._redis = redis
+        self._commands: list[tuple[str, tuple]] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args):
+            self._commands.append((name, args))
+            return self
+
+        return queue
+
+    async def execute(self) -> list:
+        results = [await getattr(self._redis, name)(*args) for name, args in self._commands]
+        self._commands.clear()
+        return results
+
+
+async def _store_deferred(mock_redis: MockRedis, metadata: ToolMetadata, prefix: str = "chuk") -> None:
+    """Write deferred metadata and its index entries the way register_tool does."""
+    from chuk_tool_processor.registry.providers.redis import RedisKeyType
+
+    ns = metadata.namespace
+    await mock_redis.set(f"{prefix}:{RedisKeyType.DEFERRED.value}:{ns}:{metadata.name}", metadata.model_dump_json())
+    await mock_redis.sadd(f"{prefix}:{RedisKeyType.DEFERRED_INDEX.value}:{ns}", metadata.name)
+    await mock_redis.sadd(f"{prefix}:{RedisKeyType.DEFERRED_NAMESPACES.value}", ns)
+
+
 @pytest.fixture
 def mock_redis():
     """Create a mock Redis client."""
@@ -334,8 +377,6 @@ async def test_search_deferred_tools(registry, mock_redis):
     """Test searching deferred tools."""
     # Manually add deferred tool metadata to Redis (bypassing register_tool)
     # This simulates what would be stored when defer_loading=True
-    from chuk_tool_processor.registry.providers.redis import RedisKeyType
-
     metadata1 = ToolMetadata(
         name="data_processor",
         namespace="default",
@@ -343,8 +384,7 @@ async def test_search_deferred_tools(registry, mock_redis):
         description="Processes data efficiently",
         search_keywords=["data", "processing", "etl"],
     )
-    deferred_key1 = f"chuk:{RedisKeyType.DEFERRED.value}:default:data_processor"
-    await mock_redis.set(deferred_key1, metadata1.model_dump_json())
+    await _store_deferred(mock_redis, metadata1)
 
     metadata2 = ToolMetadata(
         name="math_add",
@@ -353,8 +393,7 @@ async def test_search_deferred_tools(registry, mock_redis):
         description="Adds numbers",
         search_keywords=["math", "arithmetic"],
     )
-    deferred_key2 = f"chuk:{RedisKeyType.DEFERRED.value}:default:math_add"
-    await mock_redis.set(deferred_key2, metadata2.model_dump_json())
+    await _store_deferred(mock_redis, metadata2)
 
     # Search for data-related tools
     results = await registry.search_deferred_tools("data")
@@ -365,8 +404,6 @@ async def test_search_deferred_tools(registry, mock_redis):
 @pytest.mark.asyncio
 async def test_search_deferred_tools_with_tags(registry, mock_redis):
     """Test searching deferred tools with tag filter."""
-    from chuk_tool_processor.registry.providers.redis import RedisKeyType
-
     # Manually add deferred tool metadata to Redis
     metadata1 = ToolMetadata(
         name="tagged_tool",
@@ -375,8 +412,7 @@ async def test_search_deferred_tools_with_tags(registry, mock_redis):
         tags={"production", "critical"},
         search_keywords=["important"],
     )
-    deferred_key1 = f"chuk:{RedisKeyType.DEFERRED.value}:default:tagged_tool"
-    await mock_redis.set(deferred_key1, metadata1.model_dump_json())
+    await _store_deferred(mock_redis, metadata1)
 
     metadata2 = ToolMetadata(
         name="untagged_tool",
@@ -384,8 +420,7 @@ async def test_search_deferred_tools_with_tags(registry, mock_redis):
         defer_loading=True,
         search_keywords=["important"],
     )
-    deferred_key2 = f"chuk:{RedisKeyType.DEFERRED.value}:default:untagged_tool"
-    await mock_redis.set(deferred_key2, metadata2.model_dump_json())
+    await _store_deferred(mock_redis, metadata2)
 
     # Search with tag filter
     results = await registry.search_deferred_tools("important", tags=["production"])
@@ -468,6 +503,16 @@ async def test_clear(registry):
     assert tools == []
 
 
+@pytest.mark.asyncio
+async def test_generation_follows_registry_version(registry):
+    """Test that get_generation reports the shared version counter."""
+    before = await registry.get_generation()
+    await registry.register_tool(AsyncTool, name="tool1")
+    await registry.clear()
+
+    assert await registry.get_generation() == before + 2
+
+
 # -----------------------------------------------------------------------------
 # Key Helper Tests
 # -----------------------------------------------------------------------------
@@ -498,32 +543,6 @@ def test_deferred_key(registry):
     assert key == "chuk:deferred:ns:tool"
 
 
-def test_tools_pattern(registry):
-    """Test tools pattern generation."""
-    from chuk_tool_processor.registry.providers.redis import RedisKeyType
-
-    # With namespace
-    pattern = registry._tools_pattern("myns")
-    assert pattern == f"chuk:{RedisKeyType.TOOLS.value}:myns:*"
-
-    # Without namespace
-    pattern = registry._tools_pattern()
-    assert pattern == f"chuk:{RedisKeyType.TOOLS.value}:*"
-
-
-def test_deferred_pattern(registry):
-    """Test deferred pattern generation."""
-    from chuk_tool_processor.registry.providers.redis import RedisKeyType
-
-    # With namespace
-    pattern = registry._deferred_pattern("myns")
-    assert pattern == f"chuk:{RedisKeyType.DEFERRED.value}:myns:*"
-
-    # Without namespace
-    pattern = registry._deferred_pattern()
-    assert pattern == f"chuk:{RedisKeyType.DEFERRED.value}:*"
-
-
 def test_build_key(registry):
     """Test generic key building."""
     from chuk_tool_processor.registry.providers.redis import RedisKeyType
@@ -537,21 +556,6 @@ def test_build_key(registry):
     assert key == "chuk:namespaces"
 
 
-def test_parse_key_parts(registry):
-    """Test key parsing."""
-    # Valid key
-    result = registry._parse_key_parts("chuk:tools:ns:name")
-    assert result == ("ns", "name")
-
-    # Valid bytes key
-    result = registry._parse_key_parts(b"chuk:tools:ns:name")
-    assert result == ("ns", "name")
-
-    # Invalid key (too few parts)
-    result = registry._parse_key_parts("chuk:tools")
-    assert result is None
-
-
 # -----------------------------------------------------------------------------
 # Relevance Score Tests
 # -----------------------------------------------------------------------------
@@ -910,3 +914,192 @@ async def test_deserialize_bytes(registry):
     # Test with bytes
     restored = registry._deserialize_metadata(serialized.encode())
     assert restored.name == "bytestest"
+
+
+# -----------------------------------------------------------------------------
+# Local Cache and Version Tests
+# -----------------------------------------------------------------------------
+def _shared_registry(mock_redis, **config):
+    """Create a registry on a shared mock client, as another process would."""
+    from chuk_tool_processor.registry.providers.redis import RedisConfig, RedisToolRegistry
+
+    return RedisToolRegistry(mock_redis, RedisConfig(**config))
+
+
+def test_redis_config_cache_defaults():
+    """Test RedisConfig negative cache and version check defaults."""
+    from chuk_tool_processor.registry.providers.redis import RedisConfig
+
+    config = RedisConfig()
+    assert config.negative_cache_ttl == 5.0
+    assert config.version_check_interval == 1.0
+
+
+@pytest.mark.asyncio
+async def test_register_writes_index_and_bumps_version(registry, mock_redis):
+    """Test registration maintains index sets and the version counter."""
+    await registry.register_tool(AsyncTool, name="t1", namespace="math")
+    await registry.register_tool(DeferredTool, name="d1", metadata={"defer_loading": True})
+
+    assert mock_redis._sets["chuk:tool_index:math"] == {b"t1"}
+    assert mock_redis._sets["chuk:deferred_index:default"] == {b"d1"}
+    assert mock_redis._sets["chuk:deferred_namespaces"] == {b"default"}
+    assert mock_redis._data["chuk:version"] == b"2"
+
+
+@pytest.mark.asyncio
+async def test_list_tools_does_not_scan(registry, mock_redis):
+    """Test listing reads index sets instead of scanning once the keyspace is indexed."""
+    await registry.register_tool(AsyncTool, name="b", namespace="ns")
+    await registry.register_tool(AnotherTool, name="a", namespace="ns")
+    await registry.list_tools()
+
+    async def no_scan(match="*"):
+        raise AssertionError("list_tools should not SCAN")
+        yield  # pragma: no cover
+
+    mock_redis.scan_iter = no_scan
+    for reader in (registry, _shared_registry(mock_redis)):
+        tools = await reader.list_tools()
+        assert [(t.namespace, t.name) for t in tools] == [("ns", "a"), ("ns", "b")]
+
+
+@pytest.mark.asyncio
+async def test_unindexed_keys_are_backfilled(registry, mock_redis):
+    """Test tools stored without index entries are indexed on first listing."""
+    active = ToolMetadata(name="old", namespace="legacy")
+    deferred = ToolMetadata(name="lazy", namespace="legacy", defer_loading=True)
+    await mock_redis.set("chuk:tools:legacy:old", active.model_dump_json())
+    await mock_redis.set("chuk:deferred:legacy:lazy", deferred.model_dump_json())
+    await mock_redis.sadd("chuk:namespaces", "legacy")
+    await registry.register_tool(AsyncTool, name="new", namespace="legacy")
+
+    assert [t.name for t in await registry.list_tools()] == ["new", "old"]
+    assert [m.name for m in await registry.list_metadata("legacy")] == ["new", "old"]
+    assert [(t.namespace, t.name) for t in await registry.get_deferred_tools()] == [("legacy", "lazy")]
+    assert mock_redis._sets["chuk:deferred_namespaces"] == {b"legacy"}
+    assert "chuk:indexed" in mock_redis._data
+
+
+@pytest.mark.asyncio
+async def test_metadata_reads_are_cached(registry, mock_redis):
+    """Test repeated metadata lookups are served locally."""
+    await registry.register_tool(AsyncTool, name="cached")
+
+    await registry.get_metadata("cached")
+    await registry.get_metadata("cached")
+    assert mock_redis.mget_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_negative_cache(mock_redis):
+    """Test misses are cached and expire after negative_cache_ttl."""
+    registry = _shared_registry(mock_redis, negative_cache_ttl=60.0, version_check_interval=60.0)
+
+    assert await registry.get_tool("missing") is None
+    assert await registry.get_tool("missing") is None
+    assert mock_redis.mget_calls == 1
+
+    registry._metadata_cache[("default", "missing")] = (None, None, 0.0)
+    assert await registry.get_tool("missing") is None
+    assert mock_redis.mget_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_version_change_invalidates_other_process(mock_redis):
+    """Test a write in one process invalidates another process's caches."""
+    writer = _shared_registry(mock_redis)
+    reader = _shared_registry(mock_redis, version_check_interval=0.0)
+
+    assert await reader.get_metadata("late") is None
+    assert await reader.list_tools() == []
+
+    await writer.register_tool(AsyncTool, name="late", metadata={"description": "arrived"})
+
+    metadata = await reader.get_metadata("late")
+    assert metadata is not None
+    assert metadata.description == "arrived"
+    assert [t.name for t in await reader.list_tools()] == ["late"]
+
+
+@pytest.mark.asyncio
+async def test_version_checked_at_most_once_per_interval(mock_redis):
+    """Test stale reads are bounded by version_check_interval."""
+    writer = _shared_registry(mock_redis)
+    reader = _shared_registry(mock_redis, version_check_interval=60.0)
+
+    assert await reader.get_metadata("late") is None
+    await writer.register_tool(AsyncTool, name="late")
+    assert await reader.get_metadata("late") is None
+
+    reader._version_checked_at = float("-inf")
+    assert await reader.get_metadata("late") is not None
+
+
+@pytest.mark.asyncio
+async def test_own_write_keeps_unrelated_cache_entries(registry, mock_redis):
+    """Test a local write only drops the entry it touched."""
+    await registry.register_tool(AsyncTool, name="one")
+    await registry.get_metadata("one")
+    calls = mock_redis.mget_calls
+
+    await registry.register_tool(AnotherTool, name="two")
+    await registry.get_metadata("one")
+    assert mock_redis.mget_calls == calls
+    assert await registry.get_metadata("two") is not None
+
+
+@pytest.mark.asyncio
+async def test_list_metadata_single_round_trip(registry, mock_redis):
+    """Test list_metadata bulk-loads metadata with one MGET."""
+    for i in range(5):
+        await registry.register_tool(AsyncTool, name=f"tool_{i}")
+    registry._invalidate_local()
+    mock_redis.mget_calls = 0
+
+    metadata = await registry.list_metadata()
+    assert len(metadata) == 5
+    assert mock_redis.mget_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_metadata_chunks_large_batches(registry, mock_redis, monkeypatch):
+    """Test large metadata batches are split into pipelined MGETs."""
+    from chuk_tool_processor.registry.providers import redis as redis_module
+
+    monkeypatch.setattr(redis_module, "_MGET_CHUNK", 4)
+    for i in range(5):
+        await registry.register_tool(AsyncTool, name=f"tool_{i}")
+    registry._invalidate_local()
+    mock_redis.mget_calls = 0
+
+    metadata = await registry.list_metadata()
+    assert sorted(m.name for m in metadata) == [f"tool_{i}" for i in range(5)]
+    assert mock_redis.mget_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_clear_bumps_version_for_other_processes(mock_redis):
+    """Test clear() keeps and bumps the version key so peers drop caches."""
+    writer = _shared_registry(mock_redis)
+    reader = _shared_registry(mock_redis, version_check_interval=0.0)
+
+    await writer.register_tool(AsyncTool, name="gone")
+    assert await reader.get_metadata("gone") is not None
+
+    await writer.clear()
+    assert mock_redis._data["chuk:version"] == b"2"
+    assert await reader.get_metadata("gone") is None
+    assert await reader.list_tools() == []
+
+
+@pytest.mark.asyncio
+async def test_load_deferred_updates_index(registry, mock_redis):
+    """Test loading a deferred tool moves it into the active index."""
+    await registry.register_tool(DeferredTool, name="lazy", metadata={"defer_loading": True})
+    assert [t.name for t in await registry.get_deferred_tools()] == ["lazy"]
+
+    await registry.load_deferred_tool("lazy")
+
+    assert [t.name for t in await registry.list_tools()] == ["lazy"]
+    assert await registry.get_deferred_tools() == []
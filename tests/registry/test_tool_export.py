@@ -7,6 +7,7 @@ import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+import pytest_asyncio
 
 from chuk_tool_processor.registry.metadata import ToolInfo
 from chuk_tool_processor.registry.tool_export import (
@@ -408,3 +409,83 @@ class TestExportToolsAsOpenAPI:
             # Should have correct tags
             assert spec["paths"]["/ns1/Tool1"]["post"]["tags"] == ["ns1"]
             assert spec["paths"]["/ns2/Tool2"]["post"]["tags"] == ["ns2"]
+
+
+class TestSchemaExportCache:
+    """Test the pre-serialized, generation-keyed schema export."""
+
+    @pytest_asyncio.fixture
+    async def registry(self):
+        from chuk_tool_processor.registry.providers.memory import InMemoryToolRegistry
+        from chuk_tool_processor.registry.tool_export import clear_schema_cache
+
+        await clear_schema_cache()
+        registry = InMemoryToolRegistry()
+        await registry.register_tool(MockTool, name="alpha")
+        with patch("chuk_tool_processor.registry.tool_export.ToolRegistryProvider") as mock_provider:
+            mock_provider.get_registry = AsyncMock(return_value=registry)
+            yield registry
+        await clear_schema_cache()
+
+    async def test_payload_is_reused_until_generation_changes(self, registry):
+        from chuk_tool_processor.registry.tool_export import tool_schemas_json
+        from chuk_tool_processor.utils import fast_json
+
+        first = await tool_schemas_json()
+        assert await tool_schemas_json() is first
+        assert [spec["function"]["name"] for spec in fast_json.loads(first)] == ["alpha"]
+
+        await registry.register_tool(MockTool, name="beta")
+        second = await tool_schemas_json()
+
+        assert second is not first
+        assert [spec["function"]["name"] for spec in fast_json.loads(second)] == ["alpha", "beta"]
+
+    async def test_formats(self, registry):
+        from chuk_tool_processor.registry.tool_export import tool_schema_json, tool_schemas_json
+        from chuk_tool_processor.utils import fast_json
+
+        anthropic = fast_json.loads(await tool_schemas_json("anthropic"))
+        mcp = fast_json.loads(await tool_schema_json("alpha", format="mcp"))
+
+        assert anthropic == [
+            {"name": "alpha", "description": MockTool.__doc__, "input_schema": {"type": "object", "properties": {}}}
+        ]
+        assert mcp["inputSchema"] == {"type": "object", "properties": {}}
+        assert await tool_schema_json("missing") is None
+        with pytest.raises(ValueError, match="Unknown export format"):
+            await tool_schemas_json("xml")
+
+    async def test_unserializable_spec_skips_only_that_tool(self, registry):
+        from chuk_tool_processor.registry.tool_export import tool_schema_json, tool_schemas_json
+        from chuk_tool_processor.utils import fast_json
+
+        class UnserializableTool(MockTool):
+            @classmethod
+            def to_openai(cls, registry_name: str | None = None) -> dict:
+                spec = super().to_openai(registry_name)
+                spec["function"]["parameters"]["default"] = object()
+                return spec
+
+        await registry.register_tool(UnserializableTool, name="broken")
+
+        payload = fast_json.loads(await tool_schemas_json())
+
+        assert [spec["function"]["name"] for spec in payload] == ["alpha"]
+        assert await tool_schema_json("broken") is None
+
+    async def test_openai_functions_returns_fresh_dicts(self, registry):
+        await clear_name_cache()
+
+        specs = await openai_functions()
+        specs[0]["function"]["name"] = "mutated"
+
+        assert (await openai_functions())[0]["function"]["name"] == "alpha"
+
+    async def test_name_lookup_follows_generation(self, registry):
+        await clear_name_cache()
+        await tool_by_openai_name("alpha")
+
+        await registry.register_tool(MockTool, name="beta")
+
+        assert await tool_by_openai_name("beta") is MockTool
@@ -0,0 +1,168 @@
+"""
+Tests for CriticalPathScheduler.
+
+Tests cover:
+- Upward-rank ordering (long chains start first)
+- Simulated timeline: makespan, critical path, slot utilization
+- Deadline and cost skipping with cascades
+- Stage validity (dependencies and pool limits) on random DAGs
+"""
+
+import random
+
+import pytest
+
+from chuk_tool_processor.scheduling import (
+    CriticalPathScheduler,
+    ExecutionPlan,
+    GreedyDagScheduler,
+    SchedulingConstraints,
+    ToolCallSpec,
+    ToolMetadata,
+)
+
+
+def call(call_id, est_ms, depends_on=(), pool="default", priority=0, **kwargs):
+    return ToolCallSpec(
+        call_id=call_id,
+        tool_name="t",
+        depends_on=tuple(depends_on),
+        metadata=ToolMetadata(pool=pool, est_ms=est_ms, priority=priority, cost=kwargs.pop("cost", None)),
+        **kwargs,
+    )
+
+
+def chain_and_fillers():
+    """A 4 x 100ms chain and four independent 50ms calls."""
+    chain = [call(f"c{i}", 100, depends_on=[f"c{i - 1}"] if i else []) for i in range(4)]
+    fillers = [call(f"f{i}", 50) for i in range(4)]
+    return fillers + chain
+
+
+class TestCriticalPathScheduler:
+    def test_empty_calls(self):
+        plan = CriticalPathScheduler().plan([], SchedulingConstraints())
+
+        assert plan == ExecutionPlan()
+
+    def test_has_plan_method(self):
+        assert callable(CriticalPathScheduler().plan)
+
+    def test_long_chain_starts_first(self):
+        calls = chain_and_fillers()
+        constraints = SchedulingConstraints(pool_limits={"default": 2})
+
+        plan = CriticalPathScheduler().plan(calls, constraints)
+        greedy = GreedyDagScheduler().plan(calls, constraints)
+
+        assert plan.stages[0][0] == "c0"
+        assert plan.estimated_total_ms == 400
+        assert plan.critical_path_ms == 400
+        assert greedy.estimated_total_ms > plan.estimated_total_ms
+
+    def test_slot_utilization(self):
+        calls = chain_and_fillers()
+
+        plan = CriticalPathScheduler().plan(calls, SchedulingConstraints(pool_limits={"default": 2}))
+
+        # 600ms of work on 2 slots over a 400ms makespan
+        assert plan.slot_utilization == {"default": 0.75}
+        assert plan.pool_utilization == {"default": 2}
+
+    def test_unlimited_pool_runs_everything_at_once(self):
+        calls = [call("a", 100), call("b", 400), call("c", 200, depends_on=["a"])]
+
+        plan = CriticalPathScheduler().plan(calls, SchedulingConstraints())
+
+        assert plan.stages == (("b", "a"), ("c",))
+        assert plan.estimated_total_ms == 400
+        assert plan.pool_utilization == {"default": 2}
+
+    def test_pools_are_independent(self):
+        calls = [call("w1", 100, pool="web"), call("w2", 100, pool="web"), call("d", 100, pool="db")]
+
+        plan = CriticalPathScheduler().plan(calls, SchedulingConstraints(pool_limits={"web": 1, "db": 1}))
+
+        assert plan.estimated_total_ms == 200
+        assert plan.slot_utilization == {"web": 1.0, "db": 0.5}
+
+    def test_zero_length_dependency_gets_its_own_stage(self):
+        calls = [call("a", 0), call("b", 0, depends_on=["a"])]
+
+        plan = CriticalPathScheduler(default_est_ms=0).plan(calls, SchedulingConstraints())
+
+        assert plan.stages == (("a",), ("b",))
+
+    def test_deadline_skips_low_priority_with_cascade(self):
+        calls = [
+            call("main", 500, priority=5),
+            call("extra", 400, depends_on=["main"]),
+            call("after_extra", 10, depends_on=["extra"], priority=5),
+        ]
+
+        plan = CriticalPathScheduler().plan(calls, SchedulingConstraints(deadline_ms=1000))
+
+        assert plan.stages == (("main",),)
+        assert plan.skip == ("extra", "after_extra")
+        assert [r.reason for r in plan.skip_reasons] == ["deadline_exceeded", "dependency_skipped"]
+
+    def test_cost_limit(self):
+        calls = [call("a", 10, cost=1.0, priority=1), call("b", 10, cost=1.0), call("c", 10, cost=0.5)]
+
+        plan = CriticalPathScheduler().plan(calls, SchedulingConstraints(max_cost=1.5))
+
+        assert plan.skip == ("b",)
+        assert plan.skip_reasons[0].reason == "cost_exceeded"
+
+    def test_timeouts_include_schedule_slack(self):
+        calls = [call("a", 100), call("b", 200, depends_on=["a"]), call("c", 50, timeout_ms=75)]
+
+        plan = CriticalPathScheduler().plan(calls, SchedulingConstraints(deadline_ms=1000))
+
+        # makespan 300ms leaves 700ms of slack
+        assert plan.per_call_timeout_ms == {"a": 800, "b": 900, "c": 75}
+
+    def test_cycle_skips_everything(self):
+        calls = [call("a", 10, depends_on=["b"]), call("b", 10, depends_on=["a"])]
+
+        plan = CriticalPathScheduler().plan(calls, SchedulingConstraints())
+
+        assert set(plan.skip) == {"a", "b"}
+        assert plan.stages == ()
+
+    def test_unknown_dependency_is_not_scheduled(self):
+        calls = [call("a", 10, depends_on=["missing"]), call("b", 10, depends_on=["a"]), call("c", 10)]
+
+        plan = CriticalPathScheduler().plan(calls, SchedulingConstraints())
+
+        assert plan.stages == (("c",),)
+        assert plan.skip == ()
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_random_plans_are_valid(self, seed):
+        rng = random.Random(seed)
+        calls = [
+            call(
+                f"n{i}",
+                rng.choice([0, 10, 50, 200]),
+                depends_on={f"n{rng.randrange(i)}" for _ in range(rng.randint(0, 3))} if i else (),
+                pool=rng.choice(["a", "b", "default"]),
+                priority=rng.choice([0, 1]),
+            )
+            for i in range(150)
+        ]
+        constraints = SchedulingConstraints(pool_limits={"a": 2, "b": 1}, deadline_ms=rng.choice([None, 3000]))
+        call_map = {c.call_id: c for c in calls}
+
+        plan = CriticalPathScheduler().plan(calls, constraints)
+
+        assert plan.all_scheduled_calls | set(plan.skip) == set(call_map)
+        seen: set[str] = set()
+        for stage in plan.stages:
+            for cid in stage:
+                assert all(dep in seen for dep in call_map[cid].depends_on)
+            for pool, limit in constraints.pool_limits.items():
+                assert sum(call_map[cid].metadata.pool == pool for cid in stage) <= limit
+            seen.update(stage)
+        assert all(0.0 <= u <= 1.0 for u in plan.slot_utilization.values())
+        assert plan.estimated_total_ms is None or plan.estimated_total_ms >= plan.critical_path_ms
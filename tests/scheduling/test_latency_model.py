@@ -0,0 +1,250 @@
+"""
+Tests for LatencyModel and QuantileSketch.
+
+Tests cover:
+- Quantile accuracy, bounded memory and decay of the sketch
+- EWMA estimates per tool and per argument shape
+- Annotating ToolCallSpecs with est_ms and timeout_ms
+- Persistence across restarts
+"""
+
+import json
+import random
+
+import pytest
+
+from chuk_tool_processor.scheduling import (
+    CriticalPathScheduler,
+    GreedyDagScheduler,
+    LatencyModel,
+    QuantileSketch,
+    SchedulingConstraints,
+    ToolCallSpec,
+    ToolMetadata,
+    arg_shape,
+)
+
+
+def spec(call_id, tool, args=None, **kwargs):
+    return ToolCallSpec(call_id=call_id, tool_name=tool, args=args or {}, **kwargs)
+
+
+class TestQuantileSketch:
+    def test_empty(self):
+        assert QuantileSketch().quantile(0.5) is None
+
+    @pytest.mark.parametrize("q", [0.01, 0.25, 0.5, 0.9, 0.99, 1.0])
+    def test_relative_accuracy(self, q):
+        rng = random.Random(q)
+        values = [rng.lognormvariate(4, 1.5) for _ in range(5_000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        exact = sorted(values)[max(0, int(q * len(values)) - 1)]
+
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+    def test_zero_values(self):
+        sketch = QuantileSketch()
+        for value in [0, 0, 0, 10]:
+            sketch.add(value)
+
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(10, rel=0.01)
+
+    def test_bucket_count_is_bounded(self):
+        sketch = QuantileSketch(relative_accuracy=0.01, max_buckets=64)
+        for exponent in range(-20, 60):
+            sketch.add(2.0**exponent)
+
+        assert len(sketch.to_dict()["buckets"]) == 64
+        assert sketch.count == 80
+        assert sketch.quantile(1.0) == pytest.approx(2.0**59, rel=0.01)
+
+    def test_decay_shifts_towards_recent_values(self):
+        sketch = QuantileSketch()
+        for _ in range(100):
+            sketch.add(10)
+        sketch.decay(0.1)
+        for _ in range(100):
+            sketch.add(1000)
+
+        assert sketch.count == pytest.approx(110)
+        assert sketch.quantile(0.5) == pytest.approx(1000, rel=0.01)
+
+    def test_invalid_accuracy(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(relative_accuracy=1.5)
+
+
+class TestArgShape:
+    def test_sizes_are_bucketed(self):
+        assert arg_shape({"q": "abc", "n": 1}) == "n:int,q:str/2"
+        assert arg_shape({"q": "x" * 1000}) == arg_shape({"q": "y" * 600})
+        assert arg_shape({"q": "x" * 1000}) != arg_shape({"q": "y" * 10})
+
+    def test_empty(self):
+        assert arg_shape({}) == ""
+
+
+class TestLatencyModel:
+    def test_unknown_tool(self):
+        model = LatencyModel()
+
+        assert model.estimate_ms("nope") is None
+        assert model.timeout_ms("nope") is None
+        assert model.stats("nope") is None
+
+    def test_ewma(self):
+        model = LatencyModel(alpha=0.5)
+        for duration in [100, 200, 200]:
+            model.observe("search", duration)
+
+        assert model.estimate_ms("search") == 175
+        stats = model.stats("search")
+        assert (stats.count, stats.min_ms, stats.max_ms) == (3, 100, 200)
+
+    def test_estimates_are_at_least_one_ms(self):
+        model = LatencyModel()
+        model.observe("noop", 0.2)
+
+        assert model.estimate_ms("noop") == 1
+
+    def test_quantiles_and_timeouts(self):
+        model = LatencyModel()
+        for duration in range(1, 101):
+            model.observe("db", duration)
+
+        assert model.estimate_ms("db", quantile=0.9) == pytest.approx(90, rel=0.02)
+        assert model.timeout_ms("db", quantile=0.99, headroom=2.0) == pytest.approx(198, rel=0.02)
+
+    def test_arg_shapes_need_enough_samples(self):
+        model = LatencyModel(alpha=1.0, by_arg_shape=True, min_shape_samples=3)
+        small, large = {"prompt": "hi"}, {"prompt": "x" * 5000}
+        for _ in range(3):
+            model.observe("llm", 100, small)
+        model.observe("llm", 4000, large)
+
+        # The large shape has one sample, so the tool-wide estimate is used
+        assert model.estimate_ms("llm", large) == 4000
+        assert model.estimate_ms("llm", small) == 100
+        model.observe("llm", 4000, large)
+        model.observe("llm", 4000, large)
+        model.observe("llm", 100, small)
+        assert model.estimate_ms("llm", large) == 4000
+        assert model.estimate_ms("llm", small) == 100
+
+    def test_shapes_per_tool_are_capped(self):
+        model = LatencyModel(by_arg_shape=True, min_shape_samples=1, max_shapes_per_tool=2)
+        for n in range(4):
+            model.observe("t", 10 * (n + 1), {"items": [0] * (2**n)})
+
+        assert model.stats("t").count == 4
+        assert model.stats("t", {"items": [0] * 8}) is model.stats("t")
+        assert model.estimate_ms("t", {"items": [0]}) == 10
+
+    def test_sketch_follows_recent_latency(self):
+        model = LatencyModel(window=100)
+        for _ in range(1000):
+            model.observe("api", 50)
+        for _ in range(200):
+            model.observe("api", 500)
+
+        assert model.estimate_ms("api", quantile=0.5) == pytest.approx(500, rel=0.02)
+
+    def test_invalid_alpha(self):
+        with pytest.raises(ValueError):
+            LatencyModel(alpha=0)
+
+
+class TestAnnotate:
+    def test_fills_missing_estimates_only(self):
+        model = LatencyModel()
+        model.observe("fetch", 250)
+        calls = [
+            spec("a", "fetch"),
+            spec("b", "fetch", metadata=ToolMetadata(est_ms=10, pool="web")),
+            spec("c", "unseen"),
+        ]
+
+        annotated = model.annotate(calls)
+
+        assert [c.metadata.est_ms for c in annotated] == [250, 10, None]
+        assert annotated[2] is calls[2]
+        assert calls[0].metadata.est_ms is None
+
+    def test_overwrite_and_timeouts(self):
+        model = LatencyModel()
+        for duration in range(1, 101):
+            model.observe("fetch", duration)
+        calls = [spec("a", "fetch", metadata=ToolMetadata(est_ms=1, pool="web"), timeout_ms=5)]
+
+        [call] = model.annotate(calls, quantile=0.5, timeout_quantile=0.99, timeout_headroom=1.0, overwrite=True)
+
+        assert call.metadata.est_ms == pytest.approx(50, rel=0.02)
+        assert call.metadata.pool == "web"
+        assert call.timeout_ms == pytest.approx(99, rel=0.02)
+
+    def test_learned_estimates_drive_deadline_skips(self):
+        """With the default estimate of 1000ms the report fits; with the learned 5s it does not."""
+        model = LatencyModel()
+        model.observe("report", 5000)
+        calls = [spec("r", "report")]
+        constraints = SchedulingConstraints(deadline_ms=3000)
+
+        assert GreedyDagScheduler().plan(calls, constraints).skip == ()
+        assert GreedyDagScheduler().plan(model.annotate(calls), constraints).skip == ("r",)
+
+    @pytest.mark.parametrize("scheduler_cls", [GreedyDagScheduler, CriticalPathScheduler])
+    def test_schedulers_fill_estimates_from_model(self, scheduler_cls):
+        model = LatencyModel()
+        model.observe("report", 5000)
+        calls = [spec("r", "report")]
+
+        scheduler = scheduler_cls(latency_model=model)
+        assert scheduler.plan(calls, SchedulingConstraints(deadline_ms=3000)).skip == ("r",)
+        assert calls[0].metadata.est_ms is None
+
+    @pytest.mark.parametrize("scheduler_cls", [GreedyDagScheduler, CriticalPathScheduler])
+    def test_schedulers_fill_timeouts_from_model(self, scheduler_cls):
+        model = LatencyModel()
+        for duration in range(1, 101):
+            model.observe("fetch", duration)
+        calls = [spec("a", "fetch"), spec("b", "fetch", timeout_ms=5)]
+
+        plan = scheduler_cls(latency_model=model, timeout_quantile=0.99).plan(calls, SchedulingConstraints())
+
+        assert plan.per_call_timeout_ms["a"] == pytest.approx(99 * 1.5, rel=0.02)
+        assert plan.per_call_timeout_ms["b"] == 5
+
+
+class TestPersistence:
+    def test_round_trip(self, tmp_path):
+        model = LatencyModel(alpha=0.3, by_arg_shape=True, min_shape_samples=1)
+        for duration in range(1, 51):
+            model.observe("search", duration, {"q": "x" * duration})
+        path = tmp_path / "state" / "latency.json"
+
+        model.save(path)
+        loaded = LatencyModel.load(path)
+
+        assert loaded.alpha == 0.3 and loaded.by_arg_shape
+        assert loaded.to_dict() == json.loads(json.dumps(model.to_dict()))
+        for q in (None, 0.5, 0.99):
+            assert loaded.estimate_ms("search", quantile=q) == model.estimate_ms("search", quantile=q)
+        assert loaded.estimate_ms("search", {"q": "x" * 40}) == model.estimate_ms("search", {"q": "x" * 40})
+        assert [p.name for p in path.parent.iterdir()] == ["latency.json"]
+
+    def test_missing_file_gives_empty_model(self, tmp_path):
+        model = LatencyModel.load(tmp_path / "missing.json", by_arg_shape=True)
+
+        assert model.tools() == []
+        assert model.by_arg_shape
+
+    @pytest.mark.parametrize("content", ["{not json", '{"version": 99}', '{"version": 1}'])
+    def test_unreadable_file_gives_empty_model(self, tmp_path, content):
+        path = tmp_path / "latency.json"
+        path.write_text(content)
+
+        assert LatencyModel.load(path).tools() == []
@@ -0,0 +1,248 @@
+"""
+Tests for PlanExecutor.
+
+Tests cover:
+- Releasing calls as soon as their own dependencies finish
+- Pool limits enforced as live semaphores
+- Per-call timeouts and run-time deadline skips
+- Skip propagation for planned skips and runtime failures
+- Cancelling outstanding calls when the consumer stops early
+"""
+
+import asyncio
+
+import pytest
+
+from chuk_tool_processor.models.tool_call import ToolCall
+from chuk_tool_processor.models.tool_result import ToolResult
+from chuk_tool_processor.scheduling import (
+    ExecutionPlan,
+    GreedyDagScheduler,
+    LatencyModel,
+    PlanExecutor,
+    SchedulingConstraints,
+    ToolCallSpec,
+    ToolMetadata,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeRunner:
+    """Sleeps for ``arguments["ms"]``, fails if ``arguments["fail"]``, and records concurrency."""
+
+    def __init__(self):
+        self.started: list[str] = []
+        self.timeouts: dict[str, float | None] = {}
+        self.running: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.cancelled: list[str] = []
+
+    async def __call__(self, call: ToolCall, timeout: float | None) -> ToolResult:
+        self.started.append(call.id)
+        self.timeouts[call.id] = timeout
+        pool = call.arguments.get("pool", "default")
+        self.running[pool] = self.running.get(pool, 0) + 1
+        self.peak[pool] = max(self.peak.get(pool, 0), self.running[pool])
+        try:
+            await asyncio.sleep(call.arguments.get("ms", 0) / 1000)
+        except asyncio.CancelledError:
+            self.cancelled.append(call.id)
+            raise
+        finally:
+            self.running[pool] -= 1
+        if call.arguments.get("fail"):
+            raise RuntimeError(f"{call.id} failed")
+        return ToolResult(tool=call.tool, result=call.id, call_id=call.id)
+
+
+def spec(call_id, ms=0, depends_on=(), pool="default", **kwargs):
+    metadata = kwargs.pop("metadata", None) or ToolMetadata(pool=pool, est_ms=ms or None)
+    return ToolCallSpec(
+        call_id=call_id,
+        tool_name="work",
+        args={"ms": ms, "pool": pool, **kwargs.pop("args", {})},
+        depends_on=tuple(depends_on),
+        metadata=metadata,
+        **kwargs,
+    )
+
+
+async def run(calls, constraints=None, runner=None, plan=None):
+    runner = runner or FakeRunner()
+    constraints = constraints or SchedulingConstraints()
+    plan = plan or GreedyDagScheduler().plan(calls, constraints)
+    return [r async for r in PlanExecutor(runner).run(plan, calls, constraints)], runner
+
+
+class TestPlanExecutor:
+    async def test_no_stage_barrier(self):
+        """A call only waits for its own dependency, not for the rest of its stage."""
+        calls = [spec("slow", ms=200), spec("fast", ms=10), spec("next", ms=10, depends_on=["fast"])]
+
+        results, _ = await run(calls)
+
+        assert [r.call_id for r in results] == ["fast", "next", "slow"]
+        assert all(r.is_success for r in results)
+
+    async def test_pool_limits_are_enforced(self):
+        calls = [spec(f"w{i}", ms=20, pool="web") for i in range(6)] + [spec("d", ms=20, pool="db")]
+        constraints = SchedulingConstraints(pool_limits={"web": 2})
+
+        results, runner = await run(calls, constraints)
+
+        assert len(results) == 7
+        assert runner.peak["web"] == 2
+        assert runner.peak["db"] == 1
+
+    async def test_zero_pool_limit_still_makes_progress(self):
+        calls = [spec("a", pool="blocked"), spec("b", pool="blocked")]
+
+        results, runner = await run(calls, SchedulingConstraints(pool_limits={"blocked": 0}))
+
+        assert all(r.is_success for r in results)
+        assert runner.peak["blocked"] == 1
+
+    async def test_plan_timeouts_are_applied(self):
+        calls = [spec("a", ms=10), spec("b", ms=10, timeout_ms=250)]
+        plan = ExecutionPlan(stages=(("a", "b"),), per_call_timeout_ms={"a": 500})
+
+        _, runner = await run(calls, plan=plan)
+
+        assert runner.timeouts == {"a": 0.5, "b": 0.25}
+
+    async def test_timeouts_are_capped_by_deadline(self):
+        calls = [spec("a", metadata=ToolMetadata(priority=1))]
+        plan = ExecutionPlan(stages=(("a",),), per_call_timeout_ms={"a": 60_000})
+
+        _, runner = await run(calls, SchedulingConstraints(deadline_ms=1_000), plan=plan)
+
+        assert 0.9 < runner.timeouts["a"] <= 1.0
+
+    async def test_deadline_skips_are_reevaluated_at_run_time(self):
+        """The planner expected 'first' to take 10ms; it took 150ms, so 'late' no longer fits."""
+        calls = [
+            spec("first", args={"ms": 150}, metadata=ToolMetadata(est_ms=10, priority=5)),
+            spec("late", depends_on=["first"], metadata=ToolMetadata(est_ms=100, priority=0)),
+            spec("important", depends_on=["first"], metadata=ToolMetadata(est_ms=100, priority=5)),
+        ]
+        constraints = SchedulingConstraints(deadline_ms=200)
+
+        results, runner = await run(calls, constraints)
+        by_id = {r.call_id: r for r in results}
+
+        assert "late" not in runner.started
+        assert by_id["late"].error_info.details["skip_reason"] == "deadline_exceeded"
+        assert not by_id["late"].retryable
+        assert by_id["important"].is_success
+
+    async def test_latency_model_estimates_are_used_at_run_time(self):
+        """'slow' has no est_ms, but the model has seen it take 5s."""
+        model = LatencyModel()
+        model.observe("work", 5_000)
+        calls = [spec("slow")]
+        plan = ExecutionPlan(stages=(("slow",),))
+        runner = FakeRunner()
+
+        results = [
+            r async for r in PlanExecutor(runner, model).run(plan, calls, SchedulingConstraints(deadline_ms=1_000))
+        ]
+
+        assert runner.started == []
+        assert results[0].error_info.details["skip_reason"] == "deadline_exceeded"
+        assert "estimated 5000ms" in results[0].error
+
+    async def test_nothing_starts_after_the_deadline(self):
+        calls = [
+            spec("first", args={"ms": 80}, metadata=ToolMetadata(est_ms=1, priority=5)),
+            spec("second", depends_on=["first"], metadata=ToolMetadata(priority=5)),
+        ]
+
+        results, runner = await run(calls, SchedulingConstraints(deadline_ms=50))
+
+        assert runner.started == ["first"]
+        assert results[-1].call_id == "second"
+        assert results[-1].error_info.details["skip_reason"] == "deadline_exceeded"
+
+    async def test_failure_skips_dependents_transitively(self):
+        calls = [
+            spec("a", args={"fail": True}),
+            spec("b", depends_on=["a"]),
+            spec("c", depends_on=["b"]),
+            spec("other"),
+        ]
+
+        results, runner = await run(calls)
+        by_id = {r.call_id: r for r in results}
+
+        ids = [r.call_id for r in results]
+        assert ids.index("b") == ids.index("a") + 1
+        assert ids.index("c") == ids.index("a") + 2
+        assert by_id["other"].is_success
+        assert "a failed" in by_id["a"].error
+        assert by_id["b"].error_info.details["skip_reason"] == "dependency_failed"
+        assert by_id["c"].error_info.details["skip_reason"] == "dependency_failed"
+        assert sorted(runner.started) == ["a", "other"]
+
+    async def test_planned_skips_are_reported_first(self):
+        calls = [
+            spec("keep", metadata=ToolMetadata(est_ms=10, priority=1)),
+            spec("drop", metadata=ToolMetadata(est_ms=10_000)),
+            spec("orphan", depends_on=["missing"], metadata=ToolMetadata(priority=1)),
+        ]
+
+        results, runner = await run(calls, SchedulingConstraints(deadline_ms=1_000))
+
+        assert [r.call_id for r in results] == ["drop", "orphan", "keep"]
+        assert results[0].error_info.details["skip_reason"] == "deadline_exceeded"
+        assert results[1].error_info.details["skip_reason"] == "not_scheduled"
+        assert runner.started == ["keep"]
+
+    async def test_every_call_gets_one_result(self):
+        calls = [spec(f"c{i}", ms=1, depends_on=[f"c{i // 2}"] if i else []) for i in range(30)]
+
+        results, _ = await run(calls, SchedulingConstraints(pool_limits={"default": 4}))
+
+        assert sorted(r.call_id for r in results) == sorted(c.call_id for c in calls)
+
+    async def test_stopping_early_cancels_running_calls(self):
+        calls = [spec("fast"), spec("slow", ms=5_000)]
+        runner = FakeRunner()
+        plan = GreedyDagScheduler().plan(calls, SchedulingConstraints())
+
+        stream = PlanExecutor(runner).run(plan, calls)
+        first = await anext(stream)
+        await stream.aclose()
+
+        assert first.call_id == "fast"
+        assert runner.cancelled == ["slow"]
+
+    async def test_pool_slots_follow_plan_order(self):
+        """'next' queues for the pool after 'filler' did, but the plan put it first."""
+        calls = [
+            spec("first", ms=50),
+            spec("quick", ms=5, pool="other"),
+            spec("next", ms=10, depends_on=["quick"]),
+            spec("filler", ms=10),
+        ]
+        plan = ExecutionPlan(stages=(("first", "quick"), ("next",), ("filler",)))
+
+        _, runner = await run(calls, SchedulingConstraints(pool_limits={"default": 1}), plan=plan)
+
+        assert runner.started == ["first", "quick", "next", "filler"]
+
+    async def test_cancelled_waiter_does_not_leak_a_slot(self):
+        calls = [spec("a", ms=5_000), spec("b"), spec("c")]
+        runner = FakeRunner()
+        plan = ExecutionPlan(stages=(("a", "b", "c"),))
+
+        stream = PlanExecutor(runner).run(plan, calls, SchedulingConstraints(pool_limits={"default": 1}))
+        task = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await stream.aclose()
+
+        assert runner.started == ["a"]
+        assert runner.cancelled == ["a"]
@@ -7,8 +7,12 @@ Tests cover:
 - SchedulingConstraints configuration
 - ExecutionPlan structure
 - GreedyDagScheduler planning logic
+- GreedyDagScheduler equivalence with a straightforward reference on random DAGs
 """
 
+import random
+from collections import defaultdict
+
 import pytest
 
 from chuk_tool_processor.scheduling import (
@@ -651,3 +655,127 @@ class TestSchedulerExplainability:
         assert plan.critical_path_ms is None
         assert plan.estimated_total_ms is None
         assert plan.pool_utilization == {}
+
+
+def _reference_order(scheduler, calls, call_map):
+    """Kahn's algorithm with a fully re-sorted ready list (the original implementation)."""
+    in_degree = defaultdict(int)
+    dependents = defaultdict(list)
+    for call in calls:
+        in_degree[call.call_id]
+        for dep in call.depends_on:
+            if dep in call_map:
+                dependents[dep].append(call.call_id)
+                in_degree[call.call_id] += 1
+
+    def sort_key(cid):
+        meta = call_map[cid].metadata
+        return (-meta.priority, meta.est_ms or scheduler.default_est_ms)
+
+    ready = sorted((cid for cid, deg in in_degree.items() if deg == 0), key=sort_key)
+    result = []
+    while ready:
+        current = ready.pop(0)
+        result.append(current)
+        for dep in dependents[current]:
+            in_degree[dep] -= 1
+            if in_degree[dep] == 0:
+                ready.append(dep)
+                ready.sort(key=sort_key)
+    return result if len(result) == len(call_map) else None
+
+
+def _reference_stages(scheduled_ids, call_map, constraints):
+    """Stage construction by rescanning every remaining call (the original implementation)."""
+    completed = set()
+    stages = []
+    remaining = list(scheduled_ids)
+    while remaining:
+        ready = [cid for cid in remaining if all(dep in completed for dep in call_map[cid].depends_on)]
+        if not ready:
+            break
+        stage = []
+        pool_counts = defaultdict(int)
+        for cid in ready:
+            pool = call_map[cid].metadata.pool
+            if pool_counts[pool] < constraints.pool_limits.get(pool, float("inf")):
+                stage.append(cid)
+                pool_counts[pool] += 1
+        if not stage:
+            stage.append(ready[0])
+        stages.append(stage)
+        completed.update(stage)
+        remaining = [cid for cid in remaining if cid not in completed]
+    return stages
+
+
+def _random_calls(rng, n):
+    calls = []
+    for i in range(n):
+        deps = [f"c{rng.randrange(i)}" for _ in range(rng.randint(0, 3))] if i else []
+        if rng.random() < 0.05:
+            deps.append("missing")
+        calls.append(
+            ToolCallSpec(
+                call_id=f"c{i}",
+                tool_name="t",
+                depends_on=tuple(deps),
+                metadata=ToolMetadata(
+                    pool=rng.choice(["a", "b", "c", "default"]),
+                    priority=rng.choice([-1, 0, 0, 1]),
+                    est_ms=rng.choice([None, 0, 10, 10, 50]),
+                    cost=rng.choice([0.0, 1.0]),
+                ),
+            )
+        )
+    rng.shuffle(calls)
+    return calls
+
+
+class TestGreedyDagSchedulerEquivalence:
+    """The heap-based scheduler must produce exactly the original plans."""
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_matches_reference_on_random_dags(self, seed):
+        rng = random.Random(seed)
+        scheduler = GreedyDagScheduler(default_est_ms=20)
+        calls = _random_calls(rng, rng.randint(1, 120))
+        call_map = {c.call_id: c for c in calls}
+        constraints = SchedulingConstraints(
+            deadline_ms=rng.choice([None, 500, 2000]),
+            max_cost=rng.choice([None, 20.0]),
+            pool_limits=rng.choice([{}, {"a": 1, "b": 3}, {"a": 0, "c": 2}]),
+        )
+
+        order = scheduler._topological_sort(calls, call_map)
+        assert order == _reference_order(scheduler, calls, call_map)
+
+        plan = scheduler.plan(calls, constraints)
+        skip_ids, _ = scheduler._determine_skips(order, call_map, constraints)
+        scheduled = [cid for cid in order if cid not in skip_ids]
+        expected = _reference_stages(scheduled, call_map, constraints)
+        assert [list(stage) for stage in plan.stages] == expected
+
+    def test_equal_keys_keep_arrival_order(self):
+        """Ties in (priority, est_ms) go to the call that became ready first."""
+        scheduler = GreedyDagScheduler()
+        calls = [
+            ToolCallSpec(call_id="z", tool_name="t"),
+            ToolCallSpec(call_id="y", tool_name="t"),
+            ToolCallSpec(call_id="b", tool_name="t", depends_on=("y",)),
+            ToolCallSpec(call_id="a", tool_name="t", depends_on=("z",)),
+        ]
+        call_map = {c.call_id: c for c in calls}
+
+        assert scheduler._topological_sort(calls, call_map) == ["z", "y", "a", "b"]
+
+    def test_large_plan(self):
+        """A 20k-call chain-heavy plan is scheduled without quadratic rescans."""
+        calls = [
+            ToolCallSpec(call_id=f"c{i}", tool_name="t", depends_on=(f"c{i - 1}",) if i % 100 else ())
+            for i in range(20_000)
+        ]
+        plan = GreedyDagScheduler().plan(calls, SchedulingConstraints(pool_limits={"default": 50}))
+
+        assert plan.total_stages == 400
+        assert len(plan.all_scheduled_calls) == 20_000
@@ -59,6 +59,18 @@ class TestFastJsonWithOrjson:
         result = fast_json.dumps({"key": "value"})
         assert result == '{"key": "value"}'
 
+    def test_dumps_bytes_basic(self, mock_orjson):
+        """Test dumps_bytes returns orjson's bytes unchanged."""
+        result = fast_json.dumps_bytes({"key": "value"})
+        assert result == b'{"key": "value"}'
+        mock_orjson.dumps.assert_called_once()
+
+    def test_dumps_bytes_fallback_on_error(self, mock_orjson):
+        """Test dumps_bytes falls back to compact stdlib json on orjson error."""
+        mock_orjson.dumps.side_effect = TypeError("Unsupported type")
+
+        assert fast_json.dumps_bytes({"key": "välue"}) == '{"key":"välue"}'.encode()
+
     def test_loads_basic(self, mock_orjson):
         """Test loads with orjson."""
         result = fast_json.loads('{"key": "value"}')
@@ -186,6 +198,10 @@ class TestFastJsonWithoutOrjson:
         assert '"key"' in result
         assert '"value"' in result
 
+    def test_dumps_bytes_without_orjson(self):
+        """Test dumps_bytes without orjson is compact UTF-8."""
+        assert fast_json.dumps_bytes({"key": ["välue", 1]}) == '{"key":["välue",1]}'.encode()
+
     def test_loads_without_orjson(self):
         """Test loads without orjson uses stdlib json."""
         result = fast_json.loads('{"key": "value"}')
@@ -242,6 +258,7 @@ class TestModuleExports:
 
         # Verify __all__
         assert "dumps" in fast_json.__all__
+        assert "dumps_bytes" in fast_json.__all__
         assert "loads" in fast_json.__all__
         assert "dump" in fast_json.__all__
         assert "load" in fast_json.__all__